@@ -18,7 +18,7 @@ import pandas as pd
 from sklearn.metrics import classification_report, f1_score
 from tqdm import tqdm
 
-from .infer import load_artefacts, predict_intent
+from .infer import load_artefacts, predict_intents
 
 
 def parse_args() -> argparse.Namespace:  # noqa: D401
@@ -37,17 +37,30 @@ def parse_args() -> argparse.Namespace:  # noqa: D401
         default="predictions.csv",
         help="Where to save CSV with added Predicted_Intent column.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=64,
+        help="Queries per model run (padded to the longest query in the batch).",
+    )
     return parser.parse_args()
 
 
-def run_inference(df: pd.DataFrame, cfg_path: Path) -> pd.DataFrame:
-    """Add a *Predicted_Intent* column to *df* by running the model."""
+def run_inference(df: pd.DataFrame, cfg_path: Path, batch_size: int = 64) -> pd.DataFrame:
+    """Add a *Predicted_Intent* column to *df* by running the model in batches."""
     cfg, tokenizer, model, label_encoder, device = load_artefacts(cfg_path)
 
+    queries = df["Query"].astype(str).tolist()
     preds: list[str] = []
-    for query in tqdm(df["Query"].tolist(), desc="Predicting", unit="q"):
-        intent = predict_intent(query, tokenizer, model, label_encoder, device, cfg)
-        preds.append(intent)
+    with tqdm(total=len(queries), desc="Predicting", unit="q") as progress:
+        for start in range(0, len(queries), batch_size):
+            chunk = queries[start : start + batch_size]
+            preds.extend(
+                predict_intents(
+                    chunk, tokenizer, model, label_encoder, device, cfg, batch_size=batch_size
+                )
+            )
+            progress.update(len(chunk))
 
     df = df.copy()
     df["Predicted_Intent"] = preds
@@ -66,7 +79,7 @@ def main() -> None:  # pragma: no cover
     if "Query" not in df.columns:
         raise ValueError("Input CSV must contain a 'Query' column.")
 
-    df_with_preds = run_inference(df, cfg_path)
+    df_with_preds = run_inference(df, cfg_path, batch_size=args.batch_size)
 
     # Save predictions CSV
     out_path = Path(args.output)
@@ -4,15 +4,20 @@ Example
 -------
 $ python src/infer.py "how many units do I need to transfer?"
 → unit_requirements_transfer
+
+Programmatic callers should prefer :func:`predict_intents` (one padded batch
+per model run) or :class:`MicroBatcher` (async request coalescing).
 """
 from __future__ import annotations
 
 import argparse
+import asyncio
+from functools import lru_cache, partial
 from pathlib import Path
 
 import joblib
 import json
-from typing import Any, Tuple
+from typing import Any, Sequence, Tuple
 
 import torch
 import yaml
@@ -23,8 +28,16 @@ import numpy as np
 # Utilities
 # ---------------------------------------------------------------------------
 
-def load_artefacts(config_path: Path):
+def load_artefacts(config_path: Path, output_dir: Path | None = None):
+    """Load config, tokenizer, model (ONNX session preferred) and label encoder.
+
+    *output_dir* overrides the config's (cwd-relative) ``output_dir`` so callers
+    outside ``QIC model/`` can point at the artefacts; the override is written
+    back into the returned config so ``predict_intent`` finds ``temperature.txt``.
+    """
     cfg = yaml.safe_load(config_path.read_text())
+    if output_dir is not None:
+        cfg["output_dir"] = str(output_dir)
     output_dir = Path(cfg.get("output_dir", "outputs"))
 
     if not output_dir.exists():
@@ -74,11 +87,103 @@ def load_artefacts(config_path: Path):
 
 
 def _softmax_np(logits: np.ndarray) -> np.ndarray:
-    """Numerically stable softmax for numpy arrays."""
-    e = np.exp(logits - logits.max())
+    """Numerically stable (row-wise) softmax for numpy arrays."""
+    e = np.exp(logits - logits.max(axis=-1, keepdims=True))
     return e / e.sum(axis=-1, keepdims=True)
 
 
+@lru_cache(maxsize=8)
+def _load_temperature(output_dir: str) -> float:
+    """Calibrated temperature from ``<output_dir>/temperature.txt`` (1.0 if absent).
+
+    Read once per output directory; restart the process after re-calibrating.
+    """
+    temp_path = Path(output_dir) / "temperature.txt"
+    if temp_path.exists():
+        try:
+            return float(temp_path.read_text().strip()) or 1.0
+        except Exception:
+            return 1.0
+    return 1.0
+
+
+def _batch_logits(
+    queries: Sequence[str], tokenizer, model_or_session: Any, device, max_length: int
+) -> np.ndarray:
+    """Return a ``(len(queries), n_labels)`` float32 logits matrix.
+
+    Queries are padded only to the longest sequence in the batch (dynamic
+    padding) and truncated at *max_length* tokens.
+    """
+    if device is None and hasattr(model_or_session, "run"):
+        # ONNX path
+        tokens = tokenizer(
+            list(queries),
+            return_tensors="np",
+            padding=True,
+            truncation=True,
+            max_length=max_length,
+        )
+        logits = model_or_session.run(None, {k: v for k, v in tokens.items()})[0]
+        return np.atleast_2d(np.asarray(logits, dtype=np.float32))
+
+    # PyTorch path
+    inputs = tokenizer(
+        list(queries),
+        return_tensors="pt",
+        padding=True,
+        truncation=True,
+        max_length=max_length,
+    ).to(device)
+
+    with torch.no_grad():
+        logits_t = model_or_session(**inputs).logits
+    return np.atleast_2d(logits_t.cpu().numpy().astype(np.float32))
+
+
+def predict_intents(
+    queries: Sequence[str],
+    tokenizer,
+    model_or_session: Any,
+    label_encoder,
+    device,
+    cfg: dict,
+    *,
+    batch_size: int = 32,
+    return_probs: bool = False,
+) -> list:
+    """Batched :func:`predict_intent` – one model run per *batch_size* queries.
+
+    Returns a list with one entry per query: the intent, or
+    ``(intent, confidence, probs)`` when *return_probs* is set.
+    """
+    queries = list(queries)
+    if not queries:
+        return []
+
+    temperature = _load_temperature(str(cfg.get("output_dir", "outputs")))
+    threshold = float(cfg.get("confidence_threshold", 0.65))
+    fallback = cfg.get("fallback_intent", "clarify")
+    max_length = int(cfg.get("max_length", 128))
+    classes = np.asarray(label_encoder.classes_)
+
+    results: list = []
+    for start in range(0, len(queries), batch_size):
+        chunk = queries[start : start + batch_size]
+
+        # 1️⃣  Logits → temperature scaling → softmax
+        logits = _batch_logits(chunk, tokenizer, model_or_session, device, max_length)
+        probs = _softmax_np(logits / temperature)
+        top_idx = probs.argmax(axis=-1)
+        top_prob = probs[np.arange(len(chunk)), top_idx]
+
+        # 2️⃣  Label lookup + threshold fallback
+        for row, (idx, prob) in enumerate(zip(top_idx, top_prob)):
+            intent = classes[idx].item() if prob >= threshold else fallback
+            results.append((intent, float(prob), probs[row]) if return_probs else intent)
+    return results
+
+
 def predict_intent(
     query: str,
     tokenizer,
@@ -93,67 +198,100 @@ def predict_intent(
 
     Works transparently for both PyTorch *and* ONNX inference sessions.
     """
+    return predict_intents(
+        [query], tokenizer, model_or_session, label_encoder, device, cfg, return_probs=return_probs
+    )[0]
 
-    # ------------------------------------------------------------------
-    # 1️⃣  Generate logits
-    # ------------------------------------------------------------------
-    if device is None and hasattr(model_or_session, "run"):
-        # ONNX path
-        tokens = tokenizer(
-            query,
-            return_tensors="np",
-            padding="max_length",
-            truncation=True,
-            max_length=128,
-        )
-        logits = model_or_session.run(None, {k: v for k, v in tokens.items()})[0].squeeze()
-        logits_np = logits.astype(np.float32)
-    else:
-        # PyTorch path
-        inputs = tokenizer(
-            query,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=128,
-        ).to(device)
 
-        with torch.no_grad():
-            logits_t = model_or_session(**inputs).logits.squeeze()
-        logits_np = logits_t.cpu().numpy()
+class MicroBatcher:
+    """Coalesce concurrent async requests into shared :func:`predict_intents` runs.
 
-    # ------------------------------------------------------------------
-    # 2️⃣  Temperature scaling (if calibrated)
-    # ------------------------------------------------------------------
-    temperature = 1.0
-    temp_path = Path(cfg.get("output_dir", "outputs")) / "temperature.txt"
-    if temp_path.exists():
-        try:
-            temperature = float(temp_path.read_text().strip()) or 1.0
-        except Exception:
-            temperature = 1.0
-
-    logits_np /= temperature
-
-    # ------------------------------------------------------------------
-    # 3️⃣  Softmax → probabilities
-    # ------------------------------------------------------------------
-    probs = _softmax_np(logits_np)
-    top_idx = int(probs.argmax())
-    top_prob = float(probs[top_idx])
-
-    predicted_intent = label_encoder.inverse_transform([top_idx])[0]
+    The first request of a batch waits up to *max_wait_ms* for others (or until
+    *max_batch_size* queries are queued); the batch then runs in the default
+    executor so the event loop is never blocked by the model.
 
-    # ------------------------------------------------------------------
-    # 4️⃣  Threshold fallback logic
-    # ------------------------------------------------------------------
-    threshold = float(cfg.get("confidence_threshold", 0.65))
-    if top_prob < threshold:
-        predicted_intent = cfg.get("fallback_intent", "clarify")
+    Example
+    -------
+    >>> batcher = MicroBatcher(tokenizer, model, label_encoder, device, cfg)
+    >>> intent, conf, _ = await batcher.predict("when is the UC deadline?")
+    """
 
-    if return_probs:
-        return predicted_intent, top_prob, probs  # type: ignore[return-value]
-    return predicted_intent  # type: ignore[return-value]
+    def __init__(
+        self,
+        tokenizer,
+        model_or_session: Any,
+        label_encoder,
+        device,
+        cfg: dict,
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        self._predict = partial(
+            predict_intents,
+            tokenizer=tokenizer,
+            model_or_session=model_or_session,
+            label_encoder=label_encoder,
+            device=device,
+            cfg=cfg,
+            batch_size=max_batch_size,
+            return_probs=True,
+        )
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.batches_run = 0
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def predict(self, query: str) -> Tuple[str, float, np.ndarray]:
+        """Return ``(intent, confidence, probs)`` for *query*."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, future))  # type: ignore[union-attr]
+        return await future
+
+    async def close(self) -> None:
+        """Stop the worker task (pending requests are cancelled)."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        assert queue is not None
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000.0
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            queries = [query for query, _ in batch]
+            try:
+                outputs = await loop.run_in_executor(None, self._predict, queries)
+            except Exception as exc:  # noqa: BLE001 – hand the error to every caller
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            self.batches_run += 1
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
 
 
 # ---------------------------------------------------------------------------
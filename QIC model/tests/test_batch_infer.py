@@ -0,0 +1,82 @@
+import asyncio
+
+import numpy as np
+from sklearn.preprocessing import LabelEncoder
+
+from src.infer import MicroBatcher, predict_intent, predict_intents
+
+
+class DummyTokenizer:
+    """Records padding settings; emits one 3-token row per query."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls.append((list(texts), kwargs))
+        n = len(texts)
+        return {
+            "input_ids": np.zeros((n, 3), dtype=np.int64),
+            "attention_mask": np.ones((n, 3), dtype=np.int64),
+        }
+
+
+class DummySession:
+    """ONNX-session stand-in: logits favour class ``len(query) % 2``."""
+
+    def __init__(self, tokenizer):
+        self._tokenizer = tokenizer
+        self.runs = 0
+
+    def run(self, _outputs, feeds):
+        self.runs += 1
+        texts = self._tokenizer.calls[-1][0]
+        logits = np.zeros((len(texts), 2), dtype=np.float32)
+        for i, text in enumerate(texts):
+            logits[i, len(text) % 2] = 5.0
+        return [logits]
+
+
+def _setup():
+    le = LabelEncoder()
+    le.fit(["even", "odd"])
+    tokenizer = DummyTokenizer()
+    session = DummySession(tokenizer)
+    cfg = {"confidence_threshold": 0.65, "fallback_intent": "clarify", "output_dir": "does-not-exist"}
+    return tokenizer, session, le, cfg
+
+
+def test_batch_matches_single_and_pads_dynamically():
+    tokenizer, session, le, cfg = _setup()
+    queries = ["ab", "abc", "abcd", "a"]
+
+    batched = predict_intents(queries, tokenizer, session, le, None, cfg, batch_size=3)
+    assert batched == ["even", "odd", "even", "odd"]
+    assert session.runs == 2
+    assert all(kwargs["padding"] is True for _, kwargs in tokenizer.calls)
+
+    singles = [predict_intent(q, tokenizer, session, le, None, cfg) for q in queries]
+    assert singles == batched
+
+
+def test_return_probs_shapes():
+    tokenizer, session, le, cfg = _setup()
+    (intent, conf, probs), = predict_intents(["abc"], tokenizer, session, le, None, cfg, return_probs=True)
+    assert intent == "odd"
+    assert probs.shape == (2,)
+    assert conf == float(probs.max())
+
+
+def test_micro_batcher_coalesces_requests():
+    tokenizer, session, le, cfg = _setup()
+
+    async def _run():
+        batcher = MicroBatcher(tokenizer, session, le, None, cfg, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.predict("x" * n) for n in range(1, 7)))
+        await batcher.close()
+        return batcher, results
+
+    batcher, results = asyncio.run(_run())
+    assert [intent for intent, _, _ in results] == ["odd", "even", "odd", "even", "odd", "even"]
+    assert batcher.batches_run == 1
+    assert session.runs == 1
@@ -3,7 +3,7 @@ from __future__ import annotations
 """LangGraph-powered execution pipeline for the TransferAI LLM Compiler.
 
 Nodes (linear, with retry loop):
-    1. planner   – agent.planner.get_plan
+    1. planner   – agent.planner.get_plan (or an agent.intent_router template)
     2. executor  – agent.executor.execute
     3. helper    – agent.helper.merge_results
     4. composer  – agent.composer.compose_from_execution
@@ -27,6 +27,7 @@ from agent import composer as composer_mod
 from agent import critic as critic_mod
 from agent import joiner as joiner_mod
 from agent import replanner as replanner_mod
+from agent import intent_router as intent_router_mod
 
 import asyncio
 
@@ -59,7 +60,9 @@ def planner_node(state: CompilerState) -> Dict[str, Any]:  # noqa: D401
         # Offline deterministic stub
         plan: List[Dict[str, Any]] = []
     else:
-        plan = planner_mod.get_plan(question)
+        # Simple, high-confidence intents skip the planner call entirely
+        templated = intent_router_mod.template_plan(question) if intent_router_mod.enabled() else None
+        plan = templated if templated is not None else planner_mod.get_plan(question)
     return {"plan": plan}
 
 
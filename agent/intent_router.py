@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+"""TransferAI Intent Router – skip the planner for simple questions.
+
+Every agent question normally pays for an ``o3`` planner call, even when the
+answer is a single tool lookup.  When the engine's ``intent_router`` config
+flag is set (``TRANSFERAI_INTENT_ROUTER``, see :mod:`llm.engine.config`),
+:func:`template_plan` first classifies the question with the shared
+in-process QIC intent service (:mod:`llm.services.intent_service`).  If the
+top intent has a plan template and its confidence clears the same
+``intent_confidence_threshold`` the engine routes on, the one-node plan is
+built locally and the planner is never called.
+
+Any other outcome returns *None* and the caller falls back to
+:func:`agent.planner.get_plan`.  The outcomes are a disabled router, an
+unknown or low-confidence intent, a template whose arguments cannot be
+filled (for example no single known course code), or a model that is
+unavailable.
+
+Example
+-------
+>>> from agent.intent_router import template_plan
+>>> template_plan("What are the prereqs for MATH 7?")  # doctest: +SKIP
+[{'id': 'course_detail#1', 'tool': 'course_detail', 'args': {'course_code': 'MATH 7'}, 'depends_on': []}]
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Ensure project root on sys.path for standalone execution
+if __package__ is None or __package__ == "":  # pragma: no cover
+    import sys
+
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from tools.catalog_store import get_catalog_store, normalise_code  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+_COURSE_CODE_RE = re.compile(r"\b([A-Z]{2,8})\s*-?\s*(\d{1,3}[A-Z]{0,2})\b")
+
+# ---------------------------------------------------------------------------
+# Template argument builders
+# ---------------------------------------------------------------------------
+
+
+def _single_course_args(question: str) -> Optional[Dict[str, Any]]:
+    """``{"course_code": ...}`` when the question names exactly one catalogue course."""
+
+    store = get_catalog_store()
+    codes = {
+        normalise_code(f"{prefix} {number}")
+        for prefix, number in _COURSE_CODE_RE.findall(question.upper())
+    }
+    known = [code for code in codes if store.get(code) is not None]
+    if len(known) != 1:
+        return None
+    return {"course_code": known[0]}
+
+
+def _query_args(question: str) -> Optional[Dict[str, Any]]:
+    return {"query": question}
+
+
+# intent → (tool, args builder); the builder returns None when it cannot fill the args
+PLAN_TEMPLATES: Dict[str, Tuple[str, Callable[[str], Optional[Dict[str, Any]]]]] = {
+    "course_prerequisite": ("course_detail", _single_course_args),
+    "course_schedule_details": ("section_lookup", _single_course_args),
+    "application_deadline": ("deadline_lookup", _query_args),
+    "transfer_application_timeline": ("deadline_lookup", _query_args),
+    "term_definition": ("glossary_search", _query_args),
+}
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def _engine_config() -> Any:
+    """The engine's shared config – one switch and threshold for both routers."""
+
+    from llm.engine.config import get_config
+
+    return get_config()
+
+
+def enabled() -> bool:  # noqa: D401
+    """True when the engine's ``intent_router`` config flag is set."""
+
+    try:
+        config = _engine_config()
+    except ImportError as exc:  # engine stack not installed – nothing to route with
+        logger.debug("Intent router disabled, engine config unavailable: %s", exc)
+        return False
+    return bool(config.get("intent_router", False))
+
+
+def _threshold() -> float:
+    return float(_engine_config().get("intent_confidence_threshold", 0.8))
+
+
+def template_plan(
+    question: str, *, service: Any = None, threshold: Optional[float] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """Return a templated DAG for *question*, or *None* to defer to the planner.
+
+    Args:
+        question: The student's question.
+        service: Object with ``classify(texts)`` (defaults to the shared
+            :class:`llm.services.intent_service.IntentService`).
+        threshold: Minimum intent confidence (defaults to the
+            ``intent_confidence_threshold`` config value).
+    """
+
+    if service is None:
+        from llm.services.intent_service import get_intent_service
+
+        service = get_intent_service()
+    threshold = _threshold() if threshold is None else threshold
+
+    try:
+        prediction = service.classify([question])[0]
+    except Exception as exc:  # noqa: BLE001 – router must never break planning
+        logger.warning("Intent router unavailable, using planner: %s", exc)
+        return None
+
+    template = PLAN_TEMPLATES.get(prediction.intent)
+    if template is None or prediction.confidence < threshold:
+        return None
+
+    tool, build_args = template
+    args = build_args(question)
+    if args is None:
+        return None
+
+    logger.info("Intent router: %s (%.2f) → %s template", prediction.intent, prediction.confidence, tool)
+    return [{"id": f"{tool}#1", "tool": tool, "args": args, "depends_on": []}]
+
+
+__all__ = ["PLAN_TEMPLATES", "enabled", "template_plan"]
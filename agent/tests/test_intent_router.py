@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from agent import intent_router  # noqa: E402
+
+
+class _FakeService:
+    def __init__(self, intent: str, confidence: float):
+        self.intent = intent
+        self.confidence = confidence
+        self.calls = 0
+
+    def classify(self, texts):
+        self.calls += 1
+        return [SimpleNamespace(text=t, intent=self.intent, confidence=self.confidence) for t in texts]
+
+
+class _BrokenService:
+    def classify(self, texts):
+        raise RuntimeError("QIC model unavailable")
+
+
+def test_prerequisite_template_uses_catalogue_code():
+    service = _FakeService("course_prerequisite", 0.97)
+    plan = intent_router.template_plan("What are the prereqs for cs-17?", service=service, threshold=0.85)
+    assert plan == [
+        {"id": "course_detail#1", "tool": "course_detail", "args": {"course_code": "CS 17"}, "depends_on": []}
+    ]
+
+
+def test_deadline_template_passes_question_through():
+    question = "When is the UC application deadline?"
+    plan = intent_router.template_plan(question, service=_FakeService("application_deadline", 0.9), threshold=0.85)
+    assert plan is not None
+    assert plan[0]["tool"] == "deadline_lookup"
+    assert plan[0]["args"] == {"query": question}
+
+
+def test_defers_to_planner():
+    question = "What are the prereqs for CS 17?"
+    # Low confidence
+    assert intent_router.template_plan(question, service=_FakeService("course_prerequisite", 0.5), threshold=0.85) is None
+    # Intent without a template
+    assert intent_router.template_plan(question, service=_FakeService("major_requirements", 0.99), threshold=0.85) is None
+    # Two course codes – ambiguous for a single-node template
+    assert (
+        intent_router.template_plan("Prereqs for CS 17 and MATH 7?", service=_FakeService("course_prerequisite", 0.99), threshold=0.85)
+        is None
+    )
+    # Model unavailable
+    assert intent_router.template_plan(question, service=_BrokenService(), threshold=0.85) is None
+
+
+def test_switch_and_threshold_follow_engine_config(monkeypatch):
+    settings = {"intent_router": False, "intent_confidence_threshold": 0.8}
+    monkeypatch.setattr(intent_router, "_engine_config", lambda: SimpleNamespace(get=settings.get))
+    assert not intent_router.enabled()
+
+    settings["intent_router"] = True
+    assert intent_router.enabled()
+
+    question = "When is the UC application deadline?"
+    assert intent_router.template_plan(question, service=_FakeService("application_deadline", 0.82)) is not None
+    settings["intent_confidence_threshold"] = 0.9
+    assert intent_router.template_plan(question, service=_FakeService("application_deadline", 0.82)) is None
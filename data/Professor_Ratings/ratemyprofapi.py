@@ -1,35 +1,104 @@
+"""
+RateMyProfessors GraphQL clients.
+
+``RateMyProfessorScraper`` is the original blocking client. ``AsyncRateMyProfessorClient``
+runs on the shared async fetcher (``data.scraping``): pooled connections, bounded
+concurrency, a raw response cache, and cursor pagination with pages prefetched
+while earlier ones are processed.
+"""
+
 import requests
 import json
 import re
-from typing import List, Dict
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from data.scraping import AsyncFetcher, Page, paginate, relay_cursor_predictor  # noqa: E402
+
+GRAPHQL_URL = "https://www.ratemyprofessors.com/graphql"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+SCHOOL_SEARCH_QUERY = """
+query NewSearchSchoolsQuery($query: SchoolSearchQuery!) {
+  search: newSearch {
+    schools(query: $query, first: 40) {
+      edges {
+        node {
+          id
+          name
+          city
+          state
+        }
+      }
+    }
+  }
+}
+"""
+
+TEACHER_PAGE_QUERY = """
+query TeacherSearchPaginationQuery($query: TeacherSearchQuery!, $count: Int!, $cursor: String) {
+  search: newSearch {
+    teachers(query: $query, first: $count, after: $cursor) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      edges {
+        node {
+          id
+          firstName
+          lastName
+          department
+          avgRating
+          numRatings
+          wouldTakeAgainPercent
+          avgDifficulty
+          school {
+            name
+            id
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def professor_from_node(prof: Dict) -> Dict:
+    """Flatten a GraphQL teacher node into a professor record."""
+    return {
+        'id': prof.get('id', ''),
+        'name': f"{prof.get('firstName', '')} {prof.get('lastName', '')}".strip(),
+        'first_name': prof.get('firstName', ''),
+        'last_name': prof.get('lastName', ''),
+        'department': prof.get('department', 'Unknown'),
+        'rating': prof.get('avgRating'),
+        'num_ratings': prof.get('numRatings'),
+        'would_take_again': prof.get('wouldTakeAgainPercent'),
+        'difficulty': prof.get('avgDifficulty'),
+        'school_name': prof.get('school', {}).get('name', '') if prof.get('school') else '',
+        'school_id': prof.get('school', {}).get('id', '') if prof.get('school') else ''
+    }
+
 
 class RateMyProfessorScraper:
     def __init__(self):
-        self.base_url = "https://www.ratemyprofessors.com/graphql"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        self.base_url = GRAPHQL_URL
+        self.headers = dict(HEADERS)
 
     def search_schools(self, school_name: str) -> List[Dict]:
         """Search for schools by name"""
-        query = """
-        query NewSearchSchoolsQuery($query: SchoolSearchQuery!) {
-          search: newSearch {
-            schools(query: $query, first: 40) {
-              edges {
-                node {
-                  id
-                  name
-                  city
-                  state
-                }
-              }
-            }
-          }
-        }
-        """
+        query = SCHOOL_SEARCH_QUERY
         
         variables = {
             "query": {
@@ -139,18 +208,7 @@ class RateMyProfessorScraper:
                         if edges:
                             for edge in edges:
                                 if edge and 'node' in edge and edge['node']:
-                                    prof = edge['node']
-                                    professors.append({
-                                        'id': prof.get('id', ''),
-                                        'name': f"{prof.get('firstName', '')} {prof.get('lastName', '')}".strip(),
-                                        'department': prof.get('department', 'Unknown'),
-                                        'rating': prof.get('avgRating'),
-                                        'num_ratings': prof.get('numRatings'),
-                                        'would_take_again': prof.get('wouldTakeAgainPercent'),
-                                        'difficulty': prof.get('avgDifficulty'),
-                                        'school_name': prof.get('school', {}).get('name', '') if prof.get('school') else '',
-                                        'school_id': prof.get('school', {}).get('id', '') if prof.get('school') else ''
-                                    })
+                                    professors.append(professor_from_node(edge['node']))
                         
                         if professors:
                             print(f"   ✅ Successfully fetched {len(professors)} professors (limit: {attempt_limit})")
@@ -186,6 +244,67 @@ class RateMyProfessorScraper:
         
         return []
 
+class AsyncRateMyProfessorClient:
+    """RateMyProfessors GraphQL over a shared :class:`~data.scraping.AsyncFetcher`."""
+
+    def __init__(self, fetcher: AsyncFetcher, base_url: str = GRAPHQL_URL):
+        self.fetcher = fetcher
+        self.base_url = base_url
+
+    async def _query(self, query: str, variables: Dict[str, Any]) -> Dict:
+        response = await self.fetcher.post_json(self.base_url, {"query": query, "variables": variables})
+        response.raise_for_status()
+        return response.json()
+
+    async def search_schools(self, school_name: str) -> List[Dict]:
+        """Search for schools by name"""
+        data = await self._query(SCHOOL_SEARCH_QUERY, {"query": {"text": school_name}})
+        edges = (((data.get('data') or {}).get('search') or {}).get('schools') or {}).get('edges') or []
+        return [
+            {key: edge['node'][key] for key in ('id', 'name', 'city', 'state')}
+            for edge in edges if edge and edge.get('node')
+        ]
+
+    async def professor_page(self, school_id: str, cursor: Optional[str] = None, page_size: int = 1000) -> Page:
+        """One page of a school's professors, requested after *cursor*."""
+        variables: Dict[str, Any] = {"query": {"schoolID": school_id, "fallback": True}, "count": page_size}
+        if cursor:
+            variables["cursor"] = cursor
+        data = await self._query(TEACHER_PAGE_QUERY, variables)
+
+        teachers = ((data.get('data') or {}).get('search') or {}).get('teachers')
+        if teachers is None:
+            return Page(items=[], has_next=False, end_cursor=None)
+        page_info = teachers.get('pageInfo') or {}
+        return Page(
+            items=[professor_from_node(edge['node']) for edge in teachers.get('edges') or [] if edge and edge.get('node')],
+            has_next=bool(page_info.get('hasNextPage')),
+            end_cursor=page_info.get('endCursor'),
+        )
+
+    def professor_pages(self, school_id: str, page_size: int = 1000, prefetch: int = 3):
+        """
+        Async iterator over a school's professor pages, in order.
+
+        RateMyProfessors uses Relay offset cursors, so up to *prefetch* later pages
+        are requested while the current one is processed.
+        """
+        return paginate(
+            lambda cursor: self.professor_page(school_id, cursor, page_size),
+            prefetch=prefetch,
+            predict=relay_cursor_predictor(page_size),
+        )
+
+    async def get_all_professors(self, school_id: str, page_size: int = 1000, prefetch: int = 3) -> List[Dict]:
+        """Get ALL professors from a school using pagination"""
+        professors: List[Dict] = []
+        async for page in self.professor_pages(school_id, page_size, prefetch):
+            if not page.items:
+                break
+            professors.extend(page.items)
+        return professors
+
+
 def test_scraper():
     print("🚀 Testing custom Rate My Professor scraper...")
     
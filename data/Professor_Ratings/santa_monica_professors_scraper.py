@@ -1,209 +1,52 @@
-import requests
+"""
+Scrape every Santa Monica College professor from RateMyProfessors into a RAG JSON file.
+
+Requests go through the shared async fetcher. Pages of professors are prefetched
+while earlier ones are processed, and every raw GraphQL response is kept in an
+on-disk cache, so ``--offline`` rebuilds the JSON without any network access.
+
+Usage:
+    python data/Professor_Ratings/santa_monica_professors_scraper.py [--offline] [--refresh]
+"""
+
+import argparse
+import asyncio
 import json
-import time
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 
-class RateMyProfessorScraper:
-    def __init__(self):
-        self.base_url = "https://www.ratemyprofessors.com/graphql"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+from ratemyprofapi import HEADERS, AsyncRateMyProfessorClient  # also puts the repository root on sys.path
+from data.scraping import AsyncFetcher, ResponseCache
 
-    def search_schools(self, school_name: str) -> List[Dict]:
-        """Search for schools by name"""
-        query = """
-        query NewSearchSchoolsQuery($query: SchoolSearchQuery!) {
-          search: newSearch {
-            schools(query: $query, first: 10) {
-              edges {
-                node {
-                  id
-                  name
-                  city
-                  state
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        variables = {
-            "query": {
-                "text": school_name
-            }
-        }
-        
-        try:
-            response = requests.post(
-                self.base_url,
-                json={"query": query, "variables": variables},
-                headers=self.headers,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                schools = []
-                
-                if 'data' in data and data['data']['search']['schools']['edges']:
-                    for edge in data['data']['search']['schools']['edges']:
-                        school = edge['node']
-                        schools.append({
-                            'id': school['id'],
-                            'name': school['name'],
-                            'city': school['city'],
-                            'state': school['state']
-                        })
-                
-                return schools
-            else:
-                print(f"Failed to search schools: {response.status_code}")
-                return []
-                
-        except Exception as e:
-            print(f"Error searching schools: {e}")
-            return []
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / "raw_cache"
 
-    def get_professors_batch(self, school_id: str, after_cursor: str = None, limit: int = 1000) -> Dict:
-        """Get a batch of professors from a school"""
-        query = """
-        query TeacherSearchPaginationQuery($query: TeacherSearchQuery!, $count: Int!, $cursor: String) {
-          search: newSearch {
-            teachers(query: $query, first: $count, after: $cursor) {
-              pageInfo {
-                hasNextPage
-                endCursor
-              }
-              edges {
-                node {
-                  id
-                  firstName
-                  lastName
-                  department
-                  avgRating
-                  numRatings
-                  wouldTakeAgainPercent
-                  avgDifficulty
-                  school {
-                    name
-                    id
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        variables = {
-            "query": {
-                "schoolID": school_id,
-                "fallback": True
-            },
-            "count": limit
-        }
-        
-        if after_cursor:
-            variables["cursor"] = after_cursor
-        
-        try:
-            response = requests.post(
-                self.base_url,
-                json={"query": query, "variables": variables},
-                headers=self.headers,
-                timeout=15
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if ('data' in data and 
-                    data['data'] is not None and 
-                    'search' in data['data'] and 
-                    data['data']['search'] is not None and
-                    'teachers' in data['data']['search'] and
-                    data['data']['search']['teachers'] is not None):
-                    
-                    teachers_data = data['data']['search']['teachers']
-                    professors = []
-                    
-                    if 'edges' in teachers_data and teachers_data['edges']:
-                        for edge in teachers_data['edges']:
-                            if edge and 'node' in edge and edge['node']:
-                                prof = edge['node']
-                                professors.append({
-                                    'id': prof.get('id', ''),
-                                    'name': f"{prof.get('firstName', '')} {prof.get('lastName', '')}".strip(),
-                                    'first_name': prof.get('firstName', ''),
-                                    'last_name': prof.get('lastName', ''),
-                                    'department': prof.get('department', 'Unknown'),
-                                    'rating': prof.get('avgRating'),
-                                    'num_ratings': prof.get('numRatings'),
-                                    'would_take_again': prof.get('wouldTakeAgainPercent'),
-                                    'difficulty': prof.get('avgDifficulty'),
-                                    'school_name': prof.get('school', {}).get('name', '') if prof.get('school') else '',
-                                    'school_id': prof.get('school', {}).get('id', '') if prof.get('school') else ''
-                                })
-                    
-                    # Get pagination info
-                    page_info = teachers_data.get('pageInfo', {})
-                    has_next_page = page_info.get('hasNextPage', False)
-                    end_cursor = page_info.get('endCursor')
-                    
-                    return {
-                        'professors': professors,
-                        'has_next_page': has_next_page,
-                        'end_cursor': end_cursor
-                    }
-                
-            print(f"Failed to get professors batch: {response.status_code}")
-            return {'professors': [], 'has_next_page': False, 'end_cursor': None}
-                
-        except Exception as e:
-            print(f"Error getting professors batch: {e}")
-            return {'professors': [], 'has_next_page': False, 'end_cursor': None}
 
-    def get_all_professors(self, school_id: str, school_name: str) -> List[Dict]:
-        """Get ALL professors from a school using pagination"""
-        all_professors = []
-        cursor = None
-        batch_number = 1
-        
-        print(f"🎓 Starting to fetch all professors from {school_name}...")
+async def get_all_professors(client: AsyncRateMyProfessorClient, school_id: str, school_name: str, prefetch: int = 3) -> List[Dict]:
+    """Get ALL professors from a school using pagination (later pages are prefetched)"""
+    all_professors = []
+    batch_number = 0
+    
+    print(f"🎓 Starting to fetch all professors from {school_name}...")
+    
+    async for page in client.professor_pages(school_id, page_size=1000, prefetch=prefetch):
+        batch_number += 1
+        batch_professors = page.items
         
-        while True:
-            print(f"   📚 Fetching batch {batch_number}...")
-            
-            # Get current batch
-            batch_result = self.get_professors_batch(school_id, cursor, 1000)
-            batch_professors = batch_result['professors']
-            
-            if batch_professors:
-                all_professors.extend(batch_professors)
-                print(f"   ✅ Batch {batch_number}: Found {len(batch_professors)} professors")
-                print(f"   📊 Total so far: {len(all_professors)} professors")
-            else:
-                print(f"   ❌ Batch {batch_number}: No professors found")
-                break
-            
-            # Check if there are more pages
-            if not batch_result['has_next_page']:
-                print(f"   🏁 Reached end of results")
-                break
-            
-            # Prepare for next batch
-            cursor = batch_result['end_cursor']
-            batch_number += 1
-            
-            # Rate limiting - be nice to the API
-            time.sleep(1)
+        if batch_professors:
+            all_professors.extend(batch_professors)
+            print(f"   ✅ Batch {batch_number}: Found {len(batch_professors)} professors")
+            print(f"   📊 Total so far: {len(all_professors)} professors")
+        else:
+            print(f"   ❌ Batch {batch_number}: No professors found")
+            break
         
-        print(f"🎉 Completed! Total professors fetched: {len(all_professors)}")
-        return all_professors
+        # Check if there are more pages
+        if not page.has_next:
+            print(f"   🏁 Reached end of results")
+    
+    print(f"🎉 Completed! Total professors fetched: {len(all_professors)}")
+    return all_professors
+
 
 def create_rag_json(professors: List[Dict], school_info: Dict, output_file: str):
     """Create a JSON file formatted for RAG purposes"""
@@ -264,40 +107,76 @@ def create_rag_json(professors: List[Dict], school_info: Dict, output_file: str)
     print(f"💾 RAG JSON file saved: {output_file}")
     print(f"📊 Contains {len(professors)} professors from {school_info['name']}")
 
-def main():
-    scraper = RateMyProfessorScraper()
-    
-    # Search for Santa Monica College
-    print("🔍 Searching for Santa Monica College...")
-    schools = scraper.search_schools("Santa Monica College")
-    
-    if not schools:
-        print("❌ Santa Monica College not found")
-        return
-    
-    # Find the exact match for Santa Monica College
-    smc = None
-    for school in schools:
-        print(f"   Found: {school['name']} ({school['city']}, {school['state']})")
-        if "Santa Monica" in school['name'] and school['city'].lower() == "santa monica":
-            smc = school
-            break
+
+async def fetch_smc_professors(args: argparse.Namespace) -> Optional[Tuple[Dict, List[Dict]]]:
+    """Find Santa Monica College and fetch its professors; ``None`` if either step fails."""
+    fetcher = AsyncFetcher(
+        ResponseCache(args.cache_dir),
+        namespace="ratemyprofessors",
+        concurrency=args.concurrency,
+        rate=args.rate,
+        headers=HEADERS,
+        refresh=args.refresh,
+        offline=args.offline,
+    )
+    async with fetcher:
+        client = AsyncRateMyProfessorClient(fetcher)
+        
+        # Search for Santa Monica College
+        print("🔍 Searching for Santa Monica College...")
+        schools = await client.search_schools("Santa Monica College")
+        
+        if not schools:
+            print("❌ Santa Monica College not found")
+            return None
+        
+        # Find the exact match for Santa Monica College
+        smc = None
+        for school in schools:
+            print(f"   Found: {school['name']} ({school['city']}, {school['state']})")
+            if "Santa Monica" in school['name'] and school['city'].lower() == "santa monica":
+                smc = school
+                break
+        
+        if not smc:
+            print("❌ Could not find exact match for Santa Monica College")
+            return None
+        
+        print(f"✅ Selected: {smc['name']} (ID: {smc['id']})")
+        
+        # Get all professors
+        all_professors = await get_all_professors(client, smc['id'], smc['name'], args.prefetch)
     
-    if not smc:
-        print("❌ Could not find exact match for Santa Monica College")
+    print(f"   🌐 {fetcher.stats.summary()}")
+    return smc, all_professors
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scrape Santa Monica College professors from RateMyProfessors")
+    parser.add_argument("--output", default="data/santa_monica_college_professors_rag.json", help="RAG JSON file to write")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="Raw GraphQL response cache")
+    parser.add_argument("--refresh", action="store_true", help="Re-fetch even when a response is cached")
+    parser.add_argument("--offline", action="store_true", help="Only use cached responses")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight at once")
+    parser.add_argument("--rate", type=float, default=2.0, help="Requests per second")
+    parser.add_argument("--prefetch", type=int, default=3, help="Pages requested ahead of the one being processed")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    result = asyncio.run(fetch_smc_professors(args))
+    if result is None:
         return
-    
-    print(f"✅ Selected: {smc['name']} (ID: {smc['id']})")
-    
-    # Get all professors
-    all_professors = scraper.get_all_professors(smc['id'], smc['name'])
+    smc, all_professors = result
     
     if not all_professors:
         print("❌ No professors found")
         return
     
     # Create RAG JSON file
-    output_file = "data/santa_monica_college_professors_rag.json"
+    output_file = args.output
     create_rag_json(all_professors, smc, output_file)
     
     # Print some statistics
@@ -2,44 +2,80 @@
 """
 SMC FAQ Scraper that creates separate RAG files for each FAQ page
 and extracts links from answers
+
+Pages are fetched concurrently over pooled connections (``data.scraping``) and
+every raw page is kept in an on-disk cache, so re-parsing never re-fetches.
+Chrome is only started for pages whose FAQ accordions are missing from the
+static HTML. It waits on page state (elements present, panels expanded)
+rather than sleeping.
 """
 
+import argparse
+import asyncio
 import json
-import time
 import re
+import sys
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.chrome.options import Options
+from pathlib import Path
+from typing import Dict, Optional
 from bs4 import BeautifulSoup
 import logging
-import os
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.chrome.options import Options
+except ImportError:  # Only needed for pages whose FAQs are rendered by JavaScript
+    webdriver = None
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from data.scraping import AsyncFetcher, FetchError, Response, ResponseCache  # noqa: E402
+
+SMC_BASE_URL = "https://www.smc.edu"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / "raw_cache"
+# Tags a browser lays out as separate blocks (their text must not run together)
+BLOCK_TAGS = ['p', 'div', 'br', 'li', 'ul', 'ol', 'dt', 'dd', 'tr', 'td', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+# Screen-reader-only text such as "(opens in new window)", which a browser does not show
+HIDDEN_SELECTOR = '.sr-only, .visually-hidden, .screen-reader-text, [hidden], script, style'
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class SMCSeparateFAQScraper:
-    def __init__(self, headless=True):
-        """Initialize the scraper with Chrome options"""
-        self.options = Options()
-        if headless:
-            self.options.add_argument('--headless')
-        self.options.add_argument('--no-sandbox')
-        self.options.add_argument('--disable-dev-shm-usage')
-        self.options.add_argument('--disable-gpu')
-        self.options.add_argument('--window-size=1920,1080')
-        self.options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
+    def __init__(self, headless=True, cache_dir=DEFAULT_CACHE_DIR, output_dir=".", refresh=False,
+                 offline=False, render=False, base_url=SMC_BASE_URL):
+        """
+        Initialize the scraper
+
+        Args:
+            headless: Run Chrome without a window (when it is needed at all)
+            cache_dir: Raw page cache
+            output_dir: Where the RAG JSON and markdown files are written
+            refresh: Re-fetch pages even when they are cached
+            offline: Only parse cached pages
+            render: Always render pages in Chrome instead of using the static HTML
+            base_url: SMC web site (overridable for testing)
+        """
+        self.headless = headless
+        self.cache = ResponseCache(cache_dir)
+        self.output_dir = Path(output_dir)
+        self.refresh = refresh
+        self.offline = offline
+        self.render = render
         self.driver = None
         
         # Define pages to scrape with their specific configurations
         self.pages_config = {
             "international": {
-                "url": "https://www.smc.edu/student-support/international-education/counseling/faq.php",
+                "url": f"{base_url}/student-support/international-education/counseling/faq.php",
                 "title": "International Education FAQ",
                 "output_rag": "smc_international_faq_rag.json",
                 "output_md": "smc_international_faq.md",
@@ -51,7 +87,7 @@ class SMCSeparateFAQScraper:
                 }
             },
             "student": {
-                "url": "https://www.smc.edu/academics/online-learning/students/student-faq.php",
+                "url": f"{base_url}/academics/online-learning/students/student-faq.php",
                 "title": "Online Learning Student FAQ",
                 "output_rag": "smc_online_learning_faq_rag.json",
                 "output_md": "smc_online_learning_faq.md",
@@ -67,15 +103,25 @@ class SMCSeparateFAQScraper:
     
     def start_driver(self):
         """Start the Chrome WebDriver"""
+        if webdriver is None:
+            raise RuntimeError("selenium is required to render JavaScript FAQ pages (pip install selenium)")
+        options = Options()
+        if self.headless:
+            options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+        options.add_argument(f'--user-agent={USER_AGENT}')
         try:
             # Try to use webdriver-manager if available
             try:
                 from webdriver_manager.chrome import ChromeDriverManager
                 from selenium.webdriver.chrome.service import Service
                 service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=self.options)
+                self.driver = webdriver.Chrome(service=service, options=options)
             except ImportError:
-                self.driver = webdriver.Chrome(options=self.options)
+                self.driver = webdriver.Chrome(options=options)
             
             logger.info("Chrome driver started successfully")
         except Exception as e:
@@ -86,37 +132,114 @@ class SMCSeparateFAQScraper:
         """Close the WebDriver"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("Chrome driver closed")
     
     def wait_and_expand_content(self, config):
-        """Expand all collapsible content on the page"""
+        """Expand all collapsible content on the page, waiting on page state instead of sleeping"""
+        selectors = config["selectors"]["expand_buttons"]
         try:
-            # Wait for page to load
-            time.sleep(2)
-            
-            # Try each selector type for expand buttons
-            for selector in config["selectors"]["expand_buttons"]:
+            # Wait for the accordions to be rendered
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: any(driver.find_elements(By.CSS_SELECTOR, selector) for selector in selectors)
+            )
+        except TimeoutException:
+            logger.info("No expandable elements found")
+            return
+        
+        # Try each selector type for expand buttons
+        for selector in selectors:
+            buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            if not buttons:
+                continue
+            logger.info(f"Found {len(buttons)} expandable elements using selector: {selector}")
+            for button in buttons:
                 try:
-                    buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if buttons:
-                        logger.info(f"Found {len(buttons)} expandable elements using selector: {selector}")
-                        for idx, button in enumerate(buttons):
-                            try:
-                                # Check if already expanded
-                                is_expanded = button.get_attribute("aria-expanded")
-                                if is_expanded == "false" or not is_expanded:
-                                    self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                                    time.sleep(0.1)
-                                    self.driver.execute_script("arguments[0].click();", button)
-                                    time.sleep(0.2)
-                            except Exception as e:
-                                continue
-                        break  # Found and processed buttons, exit loop
-                except Exception as e:
+                    # Check if already expanded
+                    is_expanded = button.get_attribute("aria-expanded")
+                    if is_expanded == "false" or not is_expanded:
+                        self.driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", button)
+                        if is_expanded == "false":
+                            # Wait for this panel to report itself open
+                            WebDriverWait(self.driver, 2).until(
+                                lambda driver: button.get_attribute("aria-expanded") == "true"
+                            )
+                except (TimeoutException, WebDriverException):
                     continue
-                    
+            break  # Found and processed buttons, exit loop
+        
+        try:
+            # Wait until no panel is still collapsed (e.g. while expand animations finish)
+            WebDriverWait(self.driver, 5).until(
+                lambda driver: not driver.find_elements(By.CSS_SELECTOR, '[aria-expanded="false"]')
+            )
+        except TimeoutException:
+            logger.warning("Some panels did not expand")
+    
+    async def _fetch_pages(self) -> Dict[str, Optional[str]]:
+        fetcher = AsyncFetcher(
+            self.cache,
+            namespace="smc_faq",
+            concurrency=len(self.pages_config),
+            headers={"User-Agent": USER_AGENT},
+            refresh=self.refresh,
+            offline=self.offline,
+        )
+        async with fetcher:
+            async def fetch(config):
+                try:
+                    response = await fetcher.get(config["url"])
+                    response.raise_for_status()
+                    return response.text
+                except FetchError as e:
+                    logger.error(f"Failed to fetch {config['url']}: {e}")
+                    return None
+            
+            pages = await asyncio.gather(*(fetch(config) for config in self.pages_config.values()))
+        logger.info(f"Fetched FAQ pages: {fetcher.stats.summary()}")
+        return dict(zip(self.pages_config, pages))
+    
+    def fetch_pages(self) -> Dict[str, Optional[str]]:
+        """Fetch the static HTML of every configured page concurrently (served from the cache when present)"""
+        return asyncio.run(self._fetch_pages())
+    
+    def find_faq_items(self, soup, config):
+        """FAQ items found with the first accordion selector that matches anything"""
+        for selector in config["selectors"]["accordion_items"]:
+            items = soup.select(selector)
+            if items:
+                logger.info(f"Found {len(items)} FAQ items using selector: {selector}")
+                return items
+        return []
+    
+    def render_page(self, page_key) -> Optional[str]:
+        """Render a page in Chrome with its accordions expanded; the HTML is cached like fetched pages"""
+        config = self.pages_config[page_key]
+        url = config["url"]
+        if not self.refresh:
+            cached = self.cache.get("smc_faq_rendered", "GET", url)
+            if cached is not None:
+                return cached.text
+        if self.offline or webdriver is None:
+            return None
+        
+        try:
+            if self.driver is None:
+                self.start_driver()
+            self.driver.get(url)
+            
+            # Wait for content to load
+            WebDriverWait(self.driver, 20).until(EC.presence_of_element_located((By.TAG_NAME, "main")))
+            
+            # Expand all content
+            self.wait_and_expand_content(config)
+            html = self.driver.page_source
         except Exception as e:
-            logger.warning(f"Error expanding content: {str(e)}")
+            logger.error(f"Error rendering {url}: {str(e)}")
+            return None
+        
+        self.cache.put("smc_faq_rendered", "GET", url, None, Response(url, 200, {}, html))
+        return html
     
     def extract_links_from_html(self, html_element):
         """Extract all links from an HTML element"""
@@ -146,6 +269,15 @@ class SMCSeparateFAQScraper:
         text = text.replace('&nbsp;', ' ').replace('&amp;', '&')
         return text
     
+    def element_text(self, element):
+        """Text of an element as a browser shows it: blocks are separated, inline tags are not"""
+        for hidden in element.select(HIDDEN_SELECTOR):
+            hidden.decompose()
+        for block in element.find_all(BLOCK_TAGS):
+            block.insert_before(' ')
+            block.insert_after(' ')
+        return self.clean_text(element.get_text())
+    
     def extract_category(self, question, page_type):
         """Extract category based on question content and page type"""
         question_lower = question.lower()
@@ -205,14 +337,14 @@ class SMCSeparateFAQScraper:
         
         return keywords[:15]
     
-    def scrape_page(self, page_key):
-        """Scrape a single FAQ page and create its RAG file"""
+    def scrape_page(self, page_key, html):
+        """Parse a single FAQ page's HTML and create its RAG file"""
         config = self.pages_config[page_key]
         url = config["url"]
         title = config["title"]
         
         logger.info(f"\n{'='*60}")
-        logger.info(f"Scraping: {title}")
+        logger.info(f"Parsing: {title}")
         logger.info(f"URL: {url}")
         logger.info(f"{'='*60}")
         
@@ -230,32 +362,14 @@ class SMCSeparateFAQScraper:
         }
         
         try:
-            self.driver.get(url)
-            wait = WebDriverWait(self.driver, 20)
-            
-            # Wait for content to load
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "main")))
-            
-            # Expand all content
-            self.wait_and_expand_content(config)
-            
-            # Additional wait after expansion
-            time.sleep(2)
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Try to find FAQ items using different selectors
-            faq_items = []
-            for selector in config["selectors"]["accordion_items"]:
-                items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if items:
-                    faq_items = items
-                    logger.info(f"Found {len(items)} FAQ items using selector: {selector}")
-                    break
+            faq_items = self.find_faq_items(soup, config)
             
             if not faq_items:
                 logger.warning("No FAQ items found with accordion selectors, trying alternative parsing...")
-                # Get the entire page HTML for alternative parsing
-                page_html = self.driver.page_source
-                return self.parse_alternative_format(page_html, faq_data, page_key)
+                faq_data = self.parse_alternative_format(html, faq_data, page_key)
             
             # Extract FAQ content
             faq_id = 1
@@ -264,33 +378,28 @@ class SMCSeparateFAQScraper:
                     # Find question
                     question_text = None
                     for q_selector in config["selectors"]["question"]:
-                        try:
-                            q_elem = item.find_element(By.CSS_SELECTOR, q_selector)
-                            question_text = self.clean_text(q_elem.text)
+                        q_elem = item.select_one(q_selector)
+                        if q_elem is not None:
+                            question_text = self.element_text(q_elem)
                             if question_text:
                                 break
-                        except:
-                            continue
                     
                     if not question_text:
                         continue
                     
                     # Find answer
                     answer_text = None
-                    answer_html = None
                     links = []
                     
                     for a_selector in config["selectors"]["answer"]:
-                        try:
-                            a_elem = item.find_element(By.CSS_SELECTOR, a_selector)
-                            answer_text = self.clean_text(a_elem.text)
-                            answer_html = a_elem.get_attribute('innerHTML')
+                        a_elem = item.select_one(a_selector)
+                        if a_elem is not None:
+                            answer_html = a_elem.decode_contents()
+                            answer_text = self.element_text(a_elem)
                             if answer_text:
                                 # Extract links from the answer
                                 links = self.extract_links_from_html(answer_html)
                                 break
-                        except:
-                            continue
                     
                     if not answer_text or len(answer_text) < 10:
                         continue
@@ -337,9 +446,11 @@ class SMCSeparateFAQScraper:
             logger.info(f"Successfully extracted {len(faq_data['faqs'])} FAQs from {title}")
             
         except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
+            logger.error(f"Error parsing {url}: {str(e)}")
             # Save what we have
             self.save_rag_json(faq_data, config["output_rag"])
+        
+        return faq_data
     
     def parse_alternative_format(self, html_content, faq_data, page_key):
         """Alternative parsing method for pages without standard accordion structure"""
@@ -510,7 +621,7 @@ class SMCSeparateFAQScraper:
     def save_rag_json(self, faq_data, output_file):
         """Save FAQ data to RAG JSON file"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(self.output_dir / output_file, 'w', encoding='utf-8') as f:
                 json.dump(faq_data, f, indent=2, ensure_ascii=False)
             logger.info(f"RAG JSON saved to {output_file}")
         except Exception as e:
@@ -519,7 +630,7 @@ class SMCSeparateFAQScraper:
     def create_markdown(self, faq_data, output_file):
         """Create markdown version of FAQs"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(self.output_dir / output_file, 'w', encoding='utf-8') as f:
                 f.write(f"# {faq_data['metadata']['title']}\n\n")
                 f.write(f"*Last updated: {faq_data['metadata']['scraped_at']}*\n\n")
                 f.write(f"**Total FAQs:** {faq_data['metadata']['total_faqs']}\n\n")
@@ -565,12 +676,18 @@ class SMCSeparateFAQScraper:
     def run_scraping(self):
         """Run the complete scraping process"""
         try:
-            self.start_driver()
+            pages = self.fetch_pages()
             
             # Scrape each page
-            for page_key in self.pages_config:
-                self.scrape_page(page_key)
-                time.sleep(2)  # Be respectful between pages
+            for page_key, config in self.pages_config.items():
+                html = pages.get(page_key)
+                if self.render or not html or not self.find_faq_items(BeautifulSoup(html, 'html.parser'), config):
+                    # Accordions are built by JavaScript: render the page in Chrome
+                    html = self.render_page(page_key) or html
+                if not html:
+                    logger.error(f"No HTML for {config['url']}, skipping")
+                    continue
+                self.scrape_page(page_key, html)
             
             logger.info("\n" + "="*60)
             logger.info("SCRAPING COMPLETED!")
@@ -589,19 +706,26 @@ class SMCSeparateFAQScraper:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="SMC FAQ Scraper - Creating Separate RAG Files")
+    parser.add_argument("--visible", "--no-headless", dest="visible", action="store_true", help="Show the Chrome window")
+    parser.add_argument("--render", action="store_true", help="Always render pages in Chrome")
+    parser.add_argument("--refresh", action="store_true", help="Re-fetch pages even when they are cached")
+    parser.add_argument("--offline", action="store_true", help="Only parse cached pages")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="Raw page cache")
+    args = parser.parse_args()
+    
     print("\nSMC FAQ Scraper - Creating Separate RAG Files")
     print("="*60)
     
-    headless = True
-    if len(os.sys.argv) > 1 and os.sys.argv[1].lower() in ['--visible', '--no-headless']:
-        headless = False
+    if args.visible:
         print("Running with visible Chrome browser...")
     else:
         print("Running in headless mode...")
         print("Use 'python script.py --visible' to see the browser")
     
-    scraper = SMCSeparateFAQScraper(headless=headless)
+    scraper = SMCSeparateFAQScraper(headless=not args.visible, cache_dir=args.cache_dir, refresh=args.refresh,
+                                    offline=args.offline, render=args.render)
     scraper.run_scraping()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,7 +1,11 @@
+import argparse
 import re
 import json
 import os
-from typing import Dict, List, Optional, Tuple
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -61,12 +65,404 @@ class Program:
 
 
 class SMCCatalogParser:
-    def __init__(self, text_file_path: str, output_dir: str = "parsed_programs"):
+    # Regexes are compiled once here: parsing applies them to every line, note and
+    # description of the catalog, and program sections are parsed in worker processes.
+
+    # Document structure
+    PROGRAM_MARKER_RE = re.compile(r'\n([=~])([^=~\n]+)\n')  # "=PROGRAM" and "~Small header" lines
+    COURSE_HEADER_RE = re.compile(r'^((?:[A-Z]+\s+)?[A-Z]+(?:\s+ST)?\s+[A-Z]*[0-9]+[A-Z]*)\s*,\s+(.+)')
+    COURSE_START_RE = re.compile(r'^[A-Z]+ \d+,')
+    SUPPORT_COURSE_RE = re.compile(r'^([A-Z]+\s+\d+[A-Z]),')  # "MATH 4C, CONCURRENT SUPPORT ..."
+    UNITS_RE = re.compile(r'(\d+(?:\.\d+)?\s+UNITS?)(?:\s|$)')
+    SECTION_NUMBER_RE = re.compile(r'^\d{4}\s+')
+    SECTION_LINE_RE = re.compile(r'^(\d{4})\s+(.+)')
+    WHITESPACE_RE = re.compile(r'\s+')
+    LOWERCASE_RE = re.compile(r'[a-z]')
+
+    # Real section lines typically have time patterns, "Arrange", or specific keywords
+    SECTION_INDICATOR_RES = tuple(re.compile(p) for p in (
+        r'\d{1,2}:\d{2}[ap]\.m\.',  # Time patterns
+        r'Arrange',                  # Arranged schedules
+        r'[MTWRFSU]{1,7}\s',        # Day patterns followed by space
+        r'ONLINE',                   # Online courses
+        r'TBA'                       # To be announced
+    ))
+    # Common false positive section lines (addresses, years, etc.)
+    SECTION_FALSE_POSITIVE_RES = tuple(re.compile(p) for p in (
+        r'^\d{4}\s+[A-Z][a-z]+\s+Street',      # "1660 Stewart Street"
+        r'^\d{4}\s+[A-Z][a-z]+\s+Avenue',      # "1234 Main Avenue"
+        r'^\d{4}\s+[A-Z][a-z]+\s+Boulevard',   # "1234 Oak Boulevard"
+        r'^\d{4}\s+[A-Z][a-z]+\s+Drive',       # "1234 Park Drive"
+        r'^\d{4}\s+[A-Z][a-z]+\s+Road',        # "1234 Park Road"
+        r'^\d{4}\s+[A-Z][a-z]+\s+Lane',        # "1234 Oak Lane"
+        r'^\d{4}\s*-\s*\d{4}',                 # Year ranges like "2020-2024"
+        r'^\d{4}\s+to\s+\d{4}',               # "2020 to 2024"
+    ))
+
+    # Course titles starting with articles often follow certain patterns
+    ARTICLE_TITLE_RES = tuple(re.compile(p) for p in (
+        # "THE X OF Y" patterns common in academic course titles
+        r'^the\s+\w+\s+of\s+\w+',
+        r'^the\s+\w+\s+\w+',  # "THE MODERN WORLD", "THE HUMAN CONDITION"
+        r'^a\s+\w+\s+to\s+\w+',  # "A GUIDE TO X", "AN INTRODUCTION TO Y"
+        r'^an\s+\w+\s+to\s+\w+',
+        # Common course title starters
+        r'^the\s+(history|culture|art|science|study|world|modern|ancient|contemporary)',
+        r'^a\s+(survey|study|guide|history|introduction)',
+        r'^an\s+(introduction|overview|analysis)',
+    ))
+    # Title continuation lines that should always be skipped
+    TITLE_CONTINUATION_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'^LAB\s+[\d.]+\s+UNITS?$',           # "LAB 2.5 UNITS"
+        r'^CONCEPTS\s+\d+\s+[\d.]+\s+UNITS?$', # "CONCEPTS 2 2.5 UNITS"
+        r'^WITH\s+LAB\s+[\d.]+\s+UNITS?$',    # "WITH LAB X UNITS"
+        r'^[A-Z]+\s+\d+\s+[\d.]+\s+UNITS?$', # Generic "WORD NUMBER X.X UNITS"
+    ))
+
+    # Sections and schedules
+    # Updated to handle "Th" for Thursday - must come before single chars to avoid matching T+h separately
+    TIMED_SCHEDULE_RE = re.compile(r'(\d{1,2}:\d{2}[ap]\.m\.-\d{1,2}:\d{2}[ap]\.m\.)\s+((?:Th|[MTWRFSU])+)\s+(.+)$')
+    ARRANGED_SCHEDULE_RE = re.compile(r'^(Arrange-[\d.]+ Hours?)\s+(.+)$')
+    DURATION_RE = re.compile(r'meets for (\d+ weeks, .+?)(?:\.|,\s*(?:and|at))')
+    MODALITY_RE = re.compile(r'modality is ([^.]+)')
+    # Notes that imply a modality without saying "modality is", tried in order
+    MODALITY_CUES = tuple((re.compile(p, re.IGNORECASE), modality) for p, modality in (
+        (r'is a hybrid class', 'Hybrid'),
+        (r'is an? online class', 'Online'),
+        (r'hybrid class taught', 'Hybrid'),                  # "hybrid class taught on campus and online"
+        (r'taught on campus and online', 'Hybrid'),          # without "hybrid" but with both
+        (r'fully on ground', 'On Ground'),
+        (r'(?:will be )?taught in person', 'On Ground'),
+    ))
+    CO_ENROLLMENT_RE = re.compile(r'requires co-enrollment in .+? section (\d{4})')
+    ESL_TRAILING_SUBHEADER_RE = re.compile(r'\s+Intensive English\s*$')
+    TRAILING_PERIOD_RE = re.compile(r'\.\s*$')
+    TRAILING_MODALITY_NOTE_RE = re.compile(r'Above section modality is [^.]+\.\s*$')
+
+    # Location keywords that help identify location/instructor boundaries
+    SCHEDULE_LOCATION_KEYWORDS = [
+        'ONLINE', 'TBA', 'ZOOM', 'REMOTE', 'CAMPUS', 'STUDIO', 'LAB', 'ROOM',
+        'DRSCHR', 'BUS', 'SCI', 'TECH', 'ART', 'MUSIC', 'THEATER', 'GYM'
+    ]
+    # Instructor name patterns working backwards from the end of a schedule line:
+    # - "Smith J" (last + initial)
+    # - "Smith John" (last + first)
+    # - "Smith J A" (last + multiple initials)
+    # - "Smith John A" (last + first + middle initial)
+    # - "Williams V J" (last + spaced initials)
+    INSTRUCTOR_SUFFIX_RES = tuple(re.compile(p) for p in (
+        r'([A-Z][a-z]+(?:\s+[A-Z](?:\s+[A-Z])*)*)\s*$',  # Last name + spaced initials: "Williams V J"
+        r'([A-Z][a-z]+(?:\s+[A-Z][A-Z]*)*)\s*$',        # Last name + initials: "Smith JA" or "Smith J A"
+        r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z])*)\s*$', # Last + First + optional initials: "Smith John A"
+    ))
+    LOCATION_PREFIX_RES = tuple(re.compile(p) for p in (
+        r'^((?:' + '|'.join(SCHEDULE_LOCATION_KEYWORDS) + r')(?:\s+\d+)?)\s+(.+)$',  # Known location keywords + optional room number
+        r'^([A-Z]{2,}(?:\s+[A-Z0-9]+)*)\s+([A-Z][a-z].*)$',               # All caps location + instructor starting with proper case
+        r'^([A-Z]+\s+\d+)\s+([A-Z][a-z].*)$',                            # Building + room number pattern
+    ))
+    # Enhanced patterns to handle names like "De Stefano J D"
+    INSTRUCTOR_NAME_RES = tuple(re.compile(p) for p in (
+        # Last name + multiple initials: "Smith J A", "Williams V J"
+        r'^[A-Z][a-z]+(?:\s+[A-Z]){1,3}\s*$',
+        # Last name + first name + optional initials: "Smith John", "Smith John A"
+        r'^[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z])*\s*$',
+        # Two-part last name + initials: "De Stefano J D", "Van Der Berg A B"  
+        r'^[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z]){1,3}\s*$',
+        # Three-part names: "De La Cruz J", "Van Der Berg A"
+        r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z])*\s*$',
+    ))
+
+    # Description clean-up
+    SAME_AS_RES = tuple(re.compile(p) for p in (
+        # Allow department codes with multiple uppercase words (e.g. "TH ART", "VAR PE")
+        r'([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)\s+is the same (?:course|class) as\s+([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)',
+        r'([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)\s+is the same as\s+([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)',
+    ))
+    # "Prerequisites: COURSE 1 and COURSE 2." at the beginning of a description
+    DESCRIPTION_PREREQUISITE_RE = re.compile(r'^(Prerequisites?:\s*[^.]+\.)\s*')
+    # Asterisk notes in descriptions and where they belong
+    ASTERISK_NOTE_PATTERNS = tuple((re.compile(p), note_type) for p, note_type in (
+        # Credit limitations and restrictions (should go to special_notes)
+        # Generic asterisk credit limitation sentence (captures up to the first period)
+        (r'(\*Maximum (?:UC )?credit (?:allowed )?for [^\.]+\.)', 'special'),
+        (r'(\*No UC (?:transfer )?credit for [A-Z]+ \d+[A-Z]?(?: if taken [^.]*)?\.)', 'special'),
+        (r'(\*Total of [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? combined[^.]*\.)', 'special'),
+        (r'(\*UC gives no credit for [A-Z]+ \d+[A-Z]? if [^.]*\.)', 'special'),
+        # Handle ESL-style combined credit patterns
+        (r'(\*[A-Z]+ \d+[A-Z]?,\s*[A-Z]+ \d+[A-Z]?[^:]*:\s*maximum credit[^.]*\.)', 'special'),
+
+        # Specific patterns for courses that start with asterisk notes
+        (r'(\*No UC credit given for [A-Z]+ \d+[A-Z]? if taken after [^.]+\.)', 'special'),
+        (r'(\*Total of four units credit for [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? is transferable\.)', 'special'),
+        (r'(\*No UC credit for [A-Z]+ \d+[A-Z]? or \d+[A-Z]? if taken after [A-Z]+ \d+[A-Z]*\.)', 'special'),
+        # Pattern for multiple course credit restrictions
+        (r'(\*No UC credit for [A-Z]+ \d+[A-Z]?, [A-Z]+ \d+[A-Z]? or [A-Z]+ \d+[A-Z]? if taken after [^.]+\.)', 'special'),
+
+        # Prerequisite explanations (should go to prerequisite_notes)
+        (r'(\*The prerequisite for this course[^.]*)', 'prerequisite'),
+
+        # Advisory explanations (should go to advisory_notes)
+        (r'(\*The advisory for this course[^.]*)', 'advisory'),
+    ))
+    # Known description fragments and their repaired text
+    FRAGMENT_FIXES = {
+        # CHEM 11: Missing beginning of transfer credit note
+        'CHEM 11': {
+            'pattern': re.compile(r'^students must complete both CHEM 11 and CHEM 12\.'),
+            'replacement': 'To receive transfer credit, students must complete both CHEM 11 and CHEM 12.'
+        },
+        # CIS 1: Missing beginning of credit limitation note
+        'CIS 1': {
+            'pattern': re.compile(r'^or 4 if taken after CS 3\.'),
+            'replacement': '*Maximum UC credit for CIS 1 or 4 if taken after CS 3.',
+            'move_to_special': True
+        },
+        # BIOL 33: Missing beginning of sentence
+        'BIOL 33': {
+            'pattern': re.compile(r'^work-ready skills in a bioscience research and biotechnology industry career\.'),
+            'replacement': 'This course provides work-ready skills in a bioscience research and biotechnology industry career.'
+        },
+        # ACCTG 10A: Missing beginning of advisory sentence
+        'ACCTG 10A': {
+            'pattern': re.compile(r'^carefully, and reach out to your counselor if you have questions!'),
+            'replacement': 'Please read degree requirements carefully, and reach out to your counselor if you have questions!'
+        },
+        # KIN PE 51A: Missing beginning of prerequisite check sentence
+        'KIN PE 51A': {
+            'pattern': re.compile(r'^on Day 1 of class: student must be able to swim'),
+            'replacement': 'Prerequisites will be checked on Day 1 of class: student must be able to swim'
+        },
+        # COSM 95B, 95C, 95D: Missing beginning of experience description
+        'COSM 95B': {
+            'pattern': re.compile(r'^supervision of faculty\.'),
+            'replacement': 'This course provides hands-on salon experience under the supervision of faculty.'
+        },
+        'COSM 95C': {
+            'pattern': re.compile(r'^supervision of faculty\.'),
+            'replacement': 'This course provides hands-on salon experience under the supervision of faculty.'
+        },
+        'COSM 95D': {
+            'pattern': re.compile(r'^supervision of faculty\.'),
+            'replacement': 'This course provides hands-on salon experience under the supervision of faculty.'
+        }
+    }
+    # Credit-related continuation sentences (without asterisks)
+    CREDIT_CONTINUATION_RES = tuple(re.compile(p) for p in (
+        # Maximum credit patterns
+        r'(Maximum (?:UC )?credit for [A-Z]+ \d+[A-Z]?(?: and \d+[A-Z]?)* combined is [^.]+\.)',
+        r'(Maximum (?:UC )?credit for [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? combined is [^.]+\.)',
+        # Total credit patterns  
+        r'(Total of [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? combined[^.]+\.)',
+        # No credit patterns
+        r'(No (?:UC )?credit for [A-Z]+ \d+[A-Z]? if taken [^.]+\.)',
+        # UC gives patterns
+        r'(UC gives no credit for [A-Z]+ \d+[A-Z]? if [^.]+\.)',
+    ))
+    # "See also" statements at the start of a description
+    SEE_ALSO_RES = tuple(re.compile(p) for p in (
+        # "See also COURSE 123." at the beginning of description
+        r'^(See also [^.]+\.)\s*',
+        # "See also COURSE 123 and COURSE 456." patterns
+        r'^(See also [^.]+and[^.]+\.)\s*',
+        # Handle cases without periods (less common but possible)
+        r'^(See also [A-Z]+\s+\d+[A-Z]*(?:\s+and\s+[A-Z]+\s+\d+[A-Z]*)*)\s*(?=\.|This|Students|The|In)',
+    ))
+    LEADING_PUNCTUATION_RE = re.compile(r'^[.\s,;:]+')
+    FIRST_SENTENCE_RE = re.compile(r'^([^.]+\.)')
+    LEADING_SENTENCE_RE = re.compile(r'^([^\.]*\.)\s*')  # first sentence plus following whitespace
+    RECEIVE_CREDIT_RE = re.compile(r'students?\s+will\s+receive\s+credit')
+    COMBINED_CREDIT_RE = re.compile(
+        r'PHYSCS\s+[0-9A-Z,\s]+(?:or\s+PHYSCS\s+[0-9A-Z,\s]+)*\s+combined:\s+maximum\s+UC\s+credit,\s+1\s+series\.\s*',
+        re.IGNORECASE,
+    )
+    LEADING_UNITS_RES = tuple(re.compile(p) for p in (
+        # Redundant "WITH LAB X UNITS" that sometimes gets included
+        r'^WITH\s+LAB\s+\d+\s+UNITS\s+',
+        r'^\d+\s+UNITS\s+',
+        # Redundant course name patterns at the beginning
+        r'^PHYSICS\s+\d+\s+UNITS\s+',
+        r'^[A-Z]+\s+\d+\s+UNITS\s+',
+    ))
+    PREREQUISITE_WORD_RE = re.compile(r'prerequisite', re.IGNORECASE)
+    SENTENCE_BREAK_RE = re.compile(r'(?<=\.)\s+')
+    # "PREREQ. [Description starting with capital letter]..." in the prerequisites field
+    PREREQUISITE_DESCRIPTION_RES = tuple(re.compile(p, re.DOTALL) for p in (
+        # Pattern for descriptions starting with "Basic pronouncements"
+        r'^([A-Z]+\s+\d+[A-Z]*\.)\s+(Basic pronouncements.+?)$',
+        # Pattern for other descriptive sentences that don't start with prerequisite indicators
+        r'^([A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*(?:\s+(?:and|or)\s+[A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*)*\.)\s+([A-Z][^.]*(?:course|students|topics|emphasis|study|analysis|principles|concepts|methods|techniques|applications|overview|introduction|examination|exploration|development|understanding|knowledge|skills|preparation|training|instruction|education|learning).+?)$'
+    ))
+    # Prerequisite followed by explanatory sentences about prerequisites
+    PREREQUISITE_NOTE_RES = tuple(re.compile(p, re.DOTALL) for p in (
+        # Pattern for waiver/challenge exam explanations
+        r'^([^.]+\.)\s+(Students seeking waiver[^.]+\.)\s*(.*?)$',
+        # Pattern for general prerequisite explanations
+        r'^([^.]+\.)\s+(Students taking [^.]+must[^.]+\.)\s*(.*?)$',
+        # Pattern for other prerequisite-related explanations
+        r'^([^.]+\.)\s+((?:Students|Note:|Please note:)[^.]*(?:prerequisite|requirement|waiver|challenge|exam)[^.]*\.)\s*(.*?)$'
+    ))
+    # "PREREQ. This [word] course..."; handles prerequisites with multiple sentences
+    PREREQUISITE_THIS_COURSE_RE = re.compile(
+        r'^([A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*(?:\s+(?:and|or)\s+[A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*)*\.)\s+(This\s+\w+(?:[-‐]\w+)*\s+course.+?)$',
+        re.DOTALL,
+    )
+    INDEPENDENT_STUDIES_PLACEHOLDER_RE = re.compile(r'^Please\s+see.+Independent\s+Studies.+section\.?.*$', re.IGNORECASE)
+    INTERNSHIPS_PLACEHOLDER_RE = re.compile(r'^Please\s+see.+Internships.+section\.?.*$', re.IGNORECASE)
+
+    # URL spacing fixes, applied in order
+    URL_SPACING_FIXES = tuple((re.compile(p), r) for p, r in (
+        (r'smc\.edu/\s+([a-zA-Z])', r'smc.edu/\1'),              # all "smc.edu/ path" patterns (space after slash)
+        (r'go to smc\.edu/\s+([a-zA-Z])', r'go to smc.edu/\1'),
+        (r'or smc\.edu/\s+([a-zA-Z])', r'or smc.edu/\1'),
+        (r'visit smc\.edu/\s+([a-zA-Z])', r'visit smc.edu/\1'),
+        (r'see smc\.edu/\s+([a-zA-Z])', r'see smc.edu/\1'),
+    ))
+
+    # Output file names, cross references and course ids
+    FILENAME_DROP_RE = re.compile(r'[^\w\s-]')
+    FILENAME_SEPARATOR_RE = re.compile(r'[-\s]+')
+    # e.g. 'Please see listing under "Biological Sciences."'
+    CROSS_REFERENCE_TARGET_RE = re.compile(r'under\s+["\"\']?([^.]+?)\.', re.IGNORECASE)
+    COURSE_ID_DROP_RE = re.compile(r'[^A-Za-z0-9\-]')
+    UNITS_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+    WITH_COURSE_RE = re.compile(r'WITH\s+([A-Z]+\s+\d+[A-Z]*)', re.IGNORECASE)
+
+    # Hyphenation
+    HYPHEN_NEWLINE_RE = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+    HYPHEN_SPACE_RE = re.compile(r'(\w+)-\s+([a-z]\w+)')
+    # Common specific hyphenation patterns that we know are wrong
+    HYPHENATION_FIXES = {
+        # Entertainment industry terms
+        r'enter-\s*tainment': 'entertainment',
+        r'entertain-\s*ment': 'entertainment',
+        
+        # Common academic/technical terms
+        r'require-\s*ments': 'requirements',
+        r'develop-\s*ment': 'development',
+        r'manage-\s*ment': 'management',
+        r'achieve-\s*ment': 'achievement',
+        r'establish-\s*ment': 'establishment',
+        r'environ-\s*ment': 'environment',
+        r'govern-\s*ment': 'government',
+        r'improve-\s*ment': 'improvement',
+        r'involve-\s*ment': 'involvement',
+        r'move-\s*ment': 'movement',
+        r'place-\s*ment': 'placement',
+        r'state-\s*ment': 'statement',
+        r'treat-\s*ment': 'treatment',
+        
+        # Common education/course terms
+        r'comple-\s*tion': 'completion',
+        r'instruc-\s*tion': 'instruction',
+        r'prepara-\s*tion': 'preparation',
+        r'applica-\s*tion': 'application',
+        r'informa-\s*tion': 'information',
+        r'educa-\s*tion': 'education',
+        r'organiza-\s*tion': 'organization',
+        r'presenta-\s*tion': 'presentation',
+        r'demonstra-\s*tion': 'demonstration',
+        r'concentra-\s*tion': 'concentration',
+        r'investiga-\s*tion': 'investigation',
+        
+        # Technology/computer terms
+        r'compu-\s*ter': 'computer',
+        r'tech-\s*nology': 'technology',
+        r'program-\s*ming': 'programming',
+        r'develop-\s*ing': 'developing',
+        r'proces-\s*sing': 'processing',
+        
+        # Science terms
+        r'labora-\s*tory': 'laboratory',
+        r'experi-\s*ment': 'experiment',
+        r'analy-\s*sis': 'analysis',
+        r'synthe-\s*sis': 'synthesis',
+        r'hypothe-\s*sis': 'hypothesis',
+        
+        # Common words
+        r'impor-\s*tant': 'important',
+        r'differ-\s*ent': 'different',
+        r'inter-\s*est': 'interest',
+        r'consis-\s*tent': 'consistent',
+        r'expe-\s*rience': 'experience',
+        r'knowl-\s*edge': 'knowledge',
+        r'under-\s*stand': 'understand',
+        r'communi-\s*cation': 'communication',
+        r'profes-\s*sional': 'professional',
+        r'oppor-\s*tunity': 'opportunity',
+        r'neces-\s*sary': 'necessary',
+        r'particu-\s*lar': 'particular',
+        r'success-\s*ful': 'successful',
+        r'effec-\s*tive': 'effective',
+        r'crea-\s*tive': 'creative',
+        r'compre-\s*hensive': 'comprehensive',
+        r'cov-\s*ered': 'covered',
+        r'discov-\s*ered': 'discovered',
+        r'recov-\s*ered': 'recovered',
+        r'consid-\s*ered': 'considered',
+        r'deliv-\s*ered': 'delivered',
+        r'remem-\s*bered': 'remembered',
+        r'numb-\s*ered': 'numbered',
+        r'advanc-\s*ed': 'advanced',
+        r'balanc-\s*ed': 'balanced',
+        r'reduc-\s*ed': 'reduced',
+        r'produc-\s*ed': 'produced',
+        r'introduc-\s*ed': 'introduced',
+        r'work-\s*shop': 'workshop',
+        r'commen-\s*surate': 'commensurate',
+        
+        # Previously handled cases (keep for backward compatibility)
+        r'fur-\s*ther': 'further',
+        r'col-\s*lege': 'college',
+        r'stu-\s*dents': 'students',
+        
+        # New hyphenation errors found in the parsed JSON files
+        r'chem-\s*istry': 'chemistry',
+        r'sci-\s*entific': 'scientific',
+        r'interchange-\s*able-lens': 'interchangeable-lens',
+        r'avail-\s*able': 'available',
+        r'platform-\s*independent': 'platform-independent',
+        r'sci-\s*ence': 'science',
+        r'neonatal-pedi-\s*atric': 'neonatal-pediatric',
+        r'profession-\s*alism': 'professionalism',
+        r'self-\s*expression': 'self-expression',
+        r'consider-\s*ations': 'considerations',
+        r'human-\s*environment': 'human-environment',
+        r'prob-\s*ability': 'probability',
+        r'socio-polit-\s*ical': 'socio-political',
+        r'influ-\s*ences': 'influences',
+        r'indig-\s*enous': 'indigenous',
+        r'devel-\s*oping': 'developing',
+        r'audi-\s*ence': 'audience',
+        r'dem-\s*onstrate': 'demonstrate',
+        r'antigen-\s*antibody': 'antigen-antibody',
+        r'devel-\s*oped': 'developed',
+        r'lit-\s*erature': 'literature',
+        r'prereq-\s*uisite': 'prerequisite',
+        r'relax-\s*ation': 'relaxation',
+        r'insur-\s*ance': 'insurance',
+        r'devel-\s*opmental': 'developmental',
+    }
+    # (literal stem, regex, replacement): every pattern begins with a lowercase stem
+    # such as "enter-", so a fix is only run where its stem occurs
+    HYPHENATION_FIX_RES = tuple(
+        (p.split(r'\s*')[0], re.compile(p, re.IGNORECASE), r) for p, r in HYPHENATION_FIXES.items()
+    )
+    # "pre- requisite" -> "prerequisite" for common prefixes
+    HYPHEN_PREFIXES = ['pre', 'pro', 'anti', 'auto', 'co', 're', 'un', 'non', 'over', 'under', 'out', 'up']
+    HYPHEN_PREFIX_RES = tuple(
+        (f'{prefix}-', re.compile(rf'\b{prefix}-\s+([a-z]\w+)', re.IGNORECASE), rf'{prefix}\1')
+        for prefix in HYPHEN_PREFIXES
+    )
+
+    def __init__(self, text_file_path: str, output_dir: str = "parsed_programs", quiet: bool = False):
         self.text_file_path = text_file_path
         self.output_dir = output_dir
+        self.quiet = quiet  # Collect warnings without printing them (worker processes)
         self.programs = []
         self.small_headers = []  # Track smaller program headers marked with ~
         self.parsing_warnings = []  # Track potential parsing issues
+        self.timings: Dict[str, float] = {}  # Seconds per parse phase
+        self.program_timings: List[Tuple[str, float]] = []  # Seconds per program section
         
         # Directory to hold rarely-used or archived reference JSON files (e.g. Independent Studies)
         self.archived_dir = os.path.join(output_dir, "extra_refs")
@@ -75,7 +471,8 @@ class SMCCatalogParser:
     def add_warning(self, warning: str):
         """Add a parsing warning for later review"""
         self.parsing_warnings.append(warning)
-        print(f"WARNING: {warning}")
+        if not self.quiet:
+            print(f"WARNING: {warning}")
     
     def is_valid_section_line(self, potential_section_num: str, rest_of_line: str) -> bool:
         """
@@ -89,33 +486,14 @@ class SMCCatalogParser:
         
         # Additional validation patterns for section lines
         # Real section lines typically have time patterns, "Arrange", or specific keywords
-        section_indicators = [
-            r'\d{1,2}:\d{2}[ap]\.m\.',  # Time patterns
-            r'Arrange',                  # Arranged schedules
-            r'[MTWRFSU]{1,7}\s',        # Day patterns followed by space
-            r'ONLINE',                   # Online courses
-            r'TBA'                       # To be announced
-        ]
-        
-        for pattern in section_indicators:
-            if re.search(pattern, rest_of_line):
+        for pattern in self.SECTION_INDICATOR_RES:
+            if pattern.search(rest_of_line):
                 return True
         
         # Check for common false positive patterns (addresses, years, etc.)
-        false_positive_patterns = [
-            r'^\d{4}\s+[A-Z][a-z]+\s+Street',      # "1660 Stewart Street"
-            r'^\d{4}\s+[A-Z][a-z]+\s+Avenue',      # "1234 Main Avenue"
-            r'^\d{4}\s+[A-Z][a-z]+\s+Boulevard',   # "1234 Oak Boulevard"
-            r'^\d{4}\s+[A-Z][a-z]+\s+Drive',       # "1234 Park Drive"
-            r'^\d{4}\s+[A-Z][a-z]+\s+Road',        # "1234 Park Road"
-            r'^\d{4}\s+[A-Z][a-z]+\s+Lane',        # "1234 Oak Lane"
-            r'^\d{4}\s*-\s*\d{4}',                 # Year ranges like "2020-2024"
-            r'^\d{4}\s+to\s+\d{4}',               # "2020 to 2024"
-        ]
-        
         full_line = potential_section_num + " " + rest_of_line
-        for pattern in false_positive_patterns:
-            if re.match(pattern, full_line):
+        for pattern in self.SECTION_FALSE_POSITIVE_RES:
+            if pattern.match(full_line):
                 self.add_warning(f"Rejected potential section '{potential_section_num}' - appears to be address/year: '{full_line.strip()}'")
                 return False
         
@@ -158,141 +536,67 @@ class SMCCatalogParser:
         Comprehensively fix words that are hyphenated across lines or improperly split.
         This handles both newline-based hyphenation and space-based hyphenation artifacts.
         """
+        # Every fix below removes a hyphen, so text without one is already clean
+        if '-' not in text:
+            return text
+
         # First, handle hyphenation across newlines (original pattern)
-        text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+        text = self.HYPHEN_NEWLINE_RE.sub(r'\1\2', text)
         
         # Handle hyphenation with spaces (common in parsed text where newlines became spaces)
         # Pattern: word + dash + space + lowercase word (likely continuation)
         # Be careful not to break legitimate hyphenated words or compounds
-        text = re.sub(r'(\w+)-\s+([a-z]\w+)', self._fix_hyphen_with_space, text)
-        
-        # Fix common specific hyphenation patterns that we know are wrong
-        hyphenation_fixes = {
-            # Entertainment industry terms
-            r'enter-\s*tainment': 'entertainment',
-            r'entertain-\s*ment': 'entertainment',
-            
-            # Common academic/technical terms
-            r'require-\s*ments': 'requirements',
-            r'develop-\s*ment': 'development',
-            r'manage-\s*ment': 'management',
-            r'achieve-\s*ment': 'achievement',
-            r'establish-\s*ment': 'establishment',
-            r'environ-\s*ment': 'environment',
-            r'govern-\s*ment': 'government',
-            r'improve-\s*ment': 'improvement',
-            r'involve-\s*ment': 'involvement',
-            r'move-\s*ment': 'movement',
-            r'place-\s*ment': 'placement',
-            r'state-\s*ment': 'statement',
-            r'treat-\s*ment': 'treatment',
-            
-            # Common education/course terms
-            r'comple-\s*tion': 'completion',
-            r'instruc-\s*tion': 'instruction',
-            r'prepara-\s*tion': 'preparation',
-            r'applica-\s*tion': 'application',
-            r'informa-\s*tion': 'information',
-            r'educa-\s*tion': 'education',
-            r'organiza-\s*tion': 'organization',
-            r'presenta-\s*tion': 'presentation',
-            r'demonstra-\s*tion': 'demonstration',
-            r'concentra-\s*tion': 'concentration',
-            r'investiga-\s*tion': 'investigation',
-            
-            # Technology/computer terms
-            r'compu-\s*ter': 'computer',
-            r'tech-\s*nology': 'technology',
-            r'program-\s*ming': 'programming',
-            r'develop-\s*ing': 'developing',
-            r'proces-\s*sing': 'processing',
-            
-            # Science terms
-            r'labora-\s*tory': 'laboratory',
-            r'experi-\s*ment': 'experiment',
-            r'analy-\s*sis': 'analysis',
-            r'synthe-\s*sis': 'synthesis',
-            r'hypothe-\s*sis': 'hypothesis',
-            
-            # Common words
-            r'impor-\s*tant': 'important',
-            r'differ-\s*ent': 'different',
-            r'inter-\s*est': 'interest',
-            r'consis-\s*tent': 'consistent',
-            r'expe-\s*rience': 'experience',
-            r'knowl-\s*edge': 'knowledge',
-            r'under-\s*stand': 'understand',
-            r'communi-\s*cation': 'communication',
-            r'profes-\s*sional': 'professional',
-            r'oppor-\s*tunity': 'opportunity',
-            r'neces-\s*sary': 'necessary',
-            r'particu-\s*lar': 'particular',
-            r'success-\s*ful': 'successful',
-            r'effec-\s*tive': 'effective',
-            r'crea-\s*tive': 'creative',
-            r'compre-\s*hensive': 'comprehensive',
-            r'cov-\s*ered': 'covered',
-            r'discov-\s*ered': 'discovered',
-            r'recov-\s*ered': 'recovered',
-            r'consid-\s*ered': 'considered',
-            r'deliv-\s*ered': 'delivered',
-            r'remem-\s*bered': 'remembered',
-            r'numb-\s*ered': 'numbered',
-            r'advanc-\s*ed': 'advanced',
-            r'balanc-\s*ed': 'balanced',
-            r'reduc-\s*ed': 'reduced',
-            r'produc-\s*ed': 'produced',
-            r'introduc-\s*ed': 'introduced',
-            r'work-\s*shop': 'workshop',
-            r'commen-\s*surate': 'commensurate',
-            
-            # Previously handled cases (keep for backward compatibility)
-            r'fur-\s*ther': 'further',
-            r'col-\s*lege': 'college',
-            r'stu-\s*dents': 'students',
-            
-            # New hyphenation errors found in the parsed JSON files
-            r'chem-\s*istry': 'chemistry',
-            r'sci-\s*entific': 'scientific',
-            r'interchange-\s*able-lens': 'interchangeable-lens',
-            r'avail-\s*able': 'available',
-            r'platform-\s*independent': 'platform-independent',
-            r'sci-\s*ence': 'science',
-            r'neonatal-pedi-\s*atric': 'neonatal-pediatric',
-            r'profession-\s*alism': 'professionalism',
-            r'self-\s*expression': 'self-expression',
-            r'consider-\s*ations': 'considerations',
-            r'human-\s*environment': 'human-environment',
-            r'prob-\s*ability': 'probability',
-            r'socio-polit-\s*ical': 'socio-political',
-            r'influ-\s*ences': 'influences',
-            r'indig-\s*enous': 'indigenous',
-            r'devel-\s*oping': 'developing',
-            r'audi-\s*ence': 'audience',
-            r'dem-\s*onstrate': 'demonstrate',
-            r'antigen-\s*antibody': 'antigen-antibody',
-            r'devel-\s*oped': 'developed',
-            r'lit-\s*erature': 'literature',
-            r'prereq-\s*uisite': 'prerequisite',
-            r'relax-\s*ation': 'relaxation',
-            r'insur-\s*ance': 'insurance',
-            r'devel-\s*opmental': 'developmental',
-        }
+        text = self.HYPHEN_SPACE_RE.sub(self._fix_hyphen_with_space, text)
         
-        # Apply all the specific fixes
-        for pattern, replacement in hyphenation_fixes.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        # Apply all the specific fixes (in order)
+        text = self._apply_stem_fixes(text, self.HYPHENATION_FIX_RES)
         
         # Additional cleanup for any remaining obvious hyphenation artifacts
         # Handle cases like "pre- requisite" -> "prerequisite" for common prefixes
-        common_prefixes = ['pre', 'pro', 'anti', 'auto', 'co', 're', 'un', 'non', 'over', 'under', 'out', 'up']
-        for prefix in common_prefixes:
-            # Pattern: prefix + dash + space + word starting with lowercase
-            pattern = rf'\b{prefix}-\s+([a-z]\w+)'
-            text = re.sub(pattern, rf'{prefix}\1', text, flags=re.IGNORECASE)
+        text = self._apply_stem_fixes(text, self.HYPHEN_PREFIX_RES)
         
         return text
     
+    @staticmethod
+    def _apply_stem_fixes(text: str, fixes) -> str:
+        """
+        Apply (stem, regex, replacement) fixes in order, like ``regex.sub`` would.
+        A fix can only match where its lowercase stem occurs, so the regex is tried at
+        those offsets instead of scanning the whole catalog case-insensitively.
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):  # Lowercasing changed offsets; fall back to plain substitution
+            for _, pattern, replacement in fixes:
+                text = pattern.sub(replacement, text)
+            return text
+        
+        for stem, pattern, replacement in fixes:
+            pos = lowered.find(stem)
+            parts = []
+            last = 0
+            while pos >= 0:
+                match = pattern.match(text, pos)
+                if match:
+                    parts.append(text[last:pos])
+                    parts.append(match.expand(replacement))
+                    last = match.end()
+                    pos = lowered.find(stem, last)
+                else:
+                    pos = lowered.find(stem, pos + 1)
+            if parts:
+                parts.append(text[last:])
+                text = ''.join(parts)
+                lowered = text.lower()
+        return text
+    
+    def fix_url_spacing(self, text: str) -> str:
+        """Remove the space PDF extraction leaves after "smc.edu/" (e.g. "smc.edu/ scholars")."""
+        if 'smc.edu/' not in text:
+            return text
+        for pattern, replacement in self.URL_SPACING_FIXES:
+            text = pattern.sub(replacement, text)
+        return text
+    
     def _parse_multiline_bullet(self, lines: List[str], start_idx: int) -> Tuple[str, int]:
         """
         Parse a bullet point that might span multiple lines.
@@ -324,8 +628,8 @@ class SMCCatalogParser:
                 next_line.startswith('Corequisite:') or
                 next_line.startswith('Advisory:') or
                 next_line.startswith('Formerly') or
-                re.match(r'^\d{4}\s+', next_line) or  # Section numbers
-                re.match(r'^[A-Z]+ \d+,', next_line)):  # New course starting
+                self.SECTION_NUMBER_RE.match(next_line) or  # Section numbers
+                self.COURSE_START_RE.match(next_line)):  # New course starting
                 break
             
             # Stop if the next line looks like the start of a course description
@@ -382,8 +686,8 @@ class SMCCatalogParser:
                 next_line.startswith('Cal-GETC') or
                 next_line.startswith('Advisory:') or
                 next_line.startswith('Formerly') or
-                re.match(r'^\d{4}\s+', next_line) or  # Section numbers
-                re.match(r'^[A-Z]+ \d+,', next_line)):  # New course starting
+                self.SECTION_NUMBER_RE.match(next_line) or  # Section numbers
+                self.COURSE_START_RE.match(next_line)):  # New course starting
                 break
             
             # Stop if the next line looks like the start of a course description
@@ -487,80 +791,122 @@ class SMCCatalogParser:
         # Otherwise, combine them
         return first_part + second_part
     
-    def parse(self):
-        with open(self.text_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    @contextmanager
+    def _timed(self, phase: str):
+        """Record the wall-clock time of a parse phase in ``self.timings``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = time.perf_counter() - start
+    
+    def parse(self, workers: int = 1):
+        """
+        Parse the catalog and write one JSON file per program.
+
+        Program sections are independent until course ids are assigned, so with
+        ``workers > 1`` they are parsed in a process pool. Their warnings are replayed
+        in catalog order, so the console output is the same for any number of workers.
+        """
+        with self._timed('read'):
+            with open(self.text_file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
         
         # Fix hyphenation issues first
-        content = self.fix_hyphenation(content)
+        with self._timed('hyphenation'):
+            content = self.fix_hyphenation(content)
         
         # Split by both program markers: = for main programs, ~ for small headers
         # We'll process them in order to maintain proper organization
-        sections = re.split(r'\n([=~])([^=~\n]+)\n', content)
+        with self._timed('split'):
+            sections = self.PROGRAM_MARKER_RE.split(content)
+            entries = []  # (marker, header name, section content) in catalog order
+            i = 1
+            while i < len(sections):
+                if i + 2 < len(sections):
+                    entries.append((sections[i], sections[i + 1].strip(), sections[i + 2]))
+                    i += 3
+                else:
+                    i += 1
         
         # Process each section
-        i = 1
-        while i < len(sections):
-            if i + 2 < len(sections):
-                marker = sections[i]      # = or ~
-                header_name = sections[i + 1].strip()
-                section_content = sections[i + 2] if i + 2 < len(sections) else ""
-                
+        with self._timed('programs'):
+            program_sections = [(name, body) for marker, name, body in entries if marker == '=' and body.strip()]
+            parsed_programs = iter(self._parse_programs(program_sections, workers))
+            for marker, header_name, section_content in entries:
                 if marker == '=':
                     # Main program header
                     if section_content.strip():
-                        program = self.parse_program(header_name, section_content)
+                        program, warnings, seconds = next(parsed_programs)
+                        for warning in warnings:
+                            self.add_warning(warning)
+                        self.program_timings.append((program.program_name, seconds))
                         self.programs.append(program)
                 elif marker == '~':
-                    # Small header - extract just the description (usually one line)
-                    description_lines = []
-                    lines = section_content.split('\n')
-                    
-                    # Take content until we hit another header or end
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        # Stop if we hit the start of another section (=HEADER or ~HEADER pattern)
-                        if line.startswith('=') or line.startswith('~'):
-                            break
-                        description_lines.append(line)
-                        # For small headers, take multiple lines if needed to capture complete descriptions
-                        # Continue until we have a reasonably complete description or hit specific markers
-                        full_description = ' '.join(description_lines)
-                        # Stop if we reach a reasonable length and end with proper punctuation
-                        if (len(full_description) > 50 and 
-                            (full_description.endswith('.') or 
-                             full_description.endswith('"') or
-                             'listed under name of specific language' in full_description)):
-                            break
-                    
-                    description = ' '.join(description_lines).strip()
-                    if description:
-                        small_header = SmallHeader(
-                            header_name=header_name,
-                            description=description
-                        )
+                    small_header = self._parse_small_header(header_name, section_content)
+                    if small_header:
                         self.small_headers.append(small_header)
-                
-                i += 3
-            else:
-                i += 1
         
         # After all programs have been parsed, generate unique course IDs and then
         # persist each program to disk.  Generating IDs *after* all courses are known
         # allows us to reliably detect duplicates across different programs.
-        self.assign_course_ids()
+        with self._timed('post-process'):
+            self.assign_course_ids()
 
-        # NEW: Replace placeholder "Independent Studies" references in course descriptions
-        self._replace_independent_studies_descriptions()
+            # NEW: Replace placeholder "Independent Studies" references in course descriptions
+            self._replace_independent_studies_descriptions()
 
-        for program in self.programs:
-            self.save_program_json(program)
+        with self._timed('write'):
+            for program in self.programs:
+                self.save_program_json(program)
 
-        # Save small headers to separate JSON file
-        if self.small_headers:
-            self.save_small_headers_json()
+            # Save small headers to separate JSON file
+            if self.small_headers:
+                self.save_small_headers_json()
+    
+    def _parse_programs(self, program_sections: List[Tuple[str, str]], workers: int) -> Iterable[Tuple[Program, List[str], float]]:
+        """Parse (name, content) program sections into (program, warnings, seconds), in input order."""
+        jobs = [(self.text_file_path, self.output_dir, name, content) for name, content in program_sections]
+        if workers <= 1 or len(jobs) <= 1:
+            return map(_parse_program_job, jobs)
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Largest sections first, so a big program is not left running on its own at the end
+            by_size = sorted(range(len(jobs)), key=lambda k: len(jobs[k][3]), reverse=True)
+            futures = {k: pool.submit(_parse_program_job, jobs[k]) for k in by_size}
+            return [futures[k].result() for k in range(len(jobs))]
+    
+    def _parse_small_header(self, header_name: str, section_content: str) -> Optional[SmallHeader]:
+        """Small header - extract just the description (usually one line)"""
+        description_lines = []
+        lines = section_content.split('\n')
+        
+        # Take content until we hit another header or end
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            # Stop if we hit the start of another section (=HEADER or ~HEADER pattern)
+            if line.startswith('=') or line.startswith('~'):
+                break
+            description_lines.append(line)
+            # For small headers, take multiple lines if needed to capture complete descriptions
+            # Continue until we have a reasonably complete description or hit specific markers
+            full_description = ' '.join(description_lines)
+            # Stop if we reach a reasonable length and end with proper punctuation
+            if (len(full_description) > 50 and 
+                (full_description.endswith('.') or 
+                 full_description.endswith('"') or
+                 'listed under name of specific language' in full_description)):
+                break
+        
+        description = ' '.join(description_lines).strip()
+        if not description:
+            return None
+        return SmallHeader(
+            header_name=header_name,
+            description=description
+        )
     
     def is_legitimate_course_title(self, title: str) -> bool:
         """
@@ -604,24 +950,10 @@ class SMCCatalogParser:
         if len(words) > 15 and 'CONCURRENT SUPPORT' not in title_lower:  # Very long titles are suspicious
             return False
         
-        # Check for legitimate course title patterns that start with articles
-        # Course titles starting with articles often follow certain patterns:
-        legitimate_article_patterns = [
-            # "THE X OF Y" patterns common in academic course titles
-            r'^the\s+\w+\s+of\s+\w+',
-            r'^the\s+\w+\s+\w+',  # "THE MODERN WORLD", "THE HUMAN CONDITION"
-            r'^a\s+\w+\s+to\s+\w+',  # "A GUIDE TO X", "AN INTRODUCTION TO Y"
-            r'^an\s+\w+\s+to\s+\w+',
-            # Common course title starters
-            r'^the\s+(history|culture|art|science|study|world|modern|ancient|contemporary)',
-            r'^a\s+(survey|study|guide|history|introduction)',
-            r'^an\s+(introduction|overview|analysis)',
-        ]
-        
-        # If it starts with an article, check if it matches legitimate patterns
+        # If it starts with an article, check if it matches legitimate course title patterns
         if title_lower.startswith(('the ', 'a ', 'an ')):
-            for pattern in legitimate_article_patterns:
-                if re.match(pattern, title_lower):
+            for pattern in self.ARTICLE_TITLE_RES:
+                if pattern.match(title_lower):
                     return True
             
             # If it doesn't match legitimate patterns but is short enough, be more lenient
@@ -657,7 +989,7 @@ class SMCCatalogParser:
             # catalog lines (e.g. "TH ART 14 , BEGINNING STAGE COMBAT 2 UNITS") contain a stray space before
             # the comma which previously prevented them from matching. The updated pattern makes that space
             # optional and therefore captures such cases.
-            course_match = re.match(r'^((?:[A-Z]+\s+)?[A-Z]+(?:\s+ST)?\s+[A-Z]*[0-9]+[A-Z]*)\s*,\s+(.+)', line)
+            course_match = self.COURSE_HEADER_RE.match(line)
             if course_match:
                 course_code = course_match.group(1).strip()
                 title_start = course_match.group(2)
@@ -677,14 +1009,14 @@ class SMCCatalogParser:
                     combined_title = title_start + ' ' + next_line
                     
                     # Extract the C course code from the next line for tracking
-                    c_course_match = re.match(r'^([A-Z]+\s+\d+[A-Z]),', next_line)
+                    c_course_match = self.SUPPORT_COURSE_RE.match(next_line)
                     if c_course_match:
                         c_course_code = c_course_match.group(1)
                         combined_courses_found.add(c_course_code)
                         consumed_lines.add(i + 1)  # Mark the next line as consumed
                     
                     # Look for units in the combined title or subsequent lines
-                    units_match = re.search(r'(\d+(?:\.\d+)?\s+UNITS?)(?:\s|$)', combined_title)
+                    units_match = self.UNITS_RE.search(combined_title)
                     if units_match:
                         # Extract title without units
                         title_only = combined_title[:units_match.start()].strip()
@@ -706,7 +1038,7 @@ class SMCCatalogParser:
                                 j += 1
                                 continue
                             
-                            units_match = re.search(r'(\d+(?:\.\d+)?\s+UNITS?)(?:\s|$)', units_line)
+                            units_match = self.UNITS_RE.search(units_line)
                             if units_match:
                                 before_units = units_line[:units_match.start()].strip()
                                 if before_units:
@@ -715,7 +1047,7 @@ class SMCCatalogParser:
                                 consumed_lines.add(j)  # Mark this line as consumed too
                                 break
                             elif (units_line.startswith(('Transfer:', 'C-ID:', 'Cal-GETC', '•')) or
-                                  re.match(r'^\d{4}\s+', units_line)):
+                                  self.SECTION_NUMBER_RE.match(units_line)):
                                 break
                             else:
                                 combined_title += ' ' + units_line
@@ -753,7 +1085,7 @@ class SMCCatalogParser:
                 
                 # Check if the units are already on this line (single-line case)
                 # Updated to handle decimal units like "2.5 UNITS"
-                units_match = re.search(r'(\d+(?:\.\d+)?\s+UNITS?)(?:\s|$)', title_start)
+                units_match = self.UNITS_RE.search(title_start)
                 if units_match:
                     # Single-line case: course code, title, and units all on one line
                     title_only = title_start[:units_match.start()].strip()
@@ -783,7 +1115,7 @@ class SMCCatalogParser:
                         
                         # Check if this line contains the units
                         # Updated to handle decimal units like "2.5 UNITS"
-                        units_match = re.search(r'(\d+(?:\.\d+)?\s+UNITS?)(?:\s|$)', next_line)
+                        units_match = self.UNITS_RE.search(next_line)
                         if units_match:
                             # Extract title part before units (if any) and units
                             before_units = next_line[:units_match.start()].strip()
@@ -795,7 +1127,7 @@ class SMCCatalogParser:
                         # Check if this line starts with something that indicates it's not part of the title
                         # (like "Transfer:", bullet points, course descriptions, etc.)
                         if (next_line.startswith(('Transfer:', 'C-ID:', 'Cal-GETC', '•', 'This course', 'Physics ')) or
-                            re.match(r'^\d{4}\s+', next_line) or  # Section numbers
+                            self.SECTION_NUMBER_RE.match(next_line) or  # Section numbers
                             next_line.lower().startswith(('formerly', 'please see', 'maximum credit'))):
                             # This indicates the title ended on the previous line
                             break
@@ -807,7 +1139,7 @@ class SMCCatalogParser:
                     if units:
                         # Clean up the title
                         full_title = ' '.join(full_title_parts).strip()
-                        full_title = re.sub(r'\s+', ' ', full_title)
+                        full_title = self.WHITESPACE_RE.sub(' ', full_title)
                         
                         # Use improved validation logic
                         if not self.is_legitimate_course_title(full_title):
@@ -835,7 +1167,7 @@ class SMCCatalogParser:
         if not course_boundaries:
             # No courses found, return program with description only
             description = ' '.join(line.strip() for line in lines if line.strip())
-            description = re.sub(r'\s+', ' ', description)
+            description = self.WHITESPACE_RE.sub(' ', description)
             return Program(
                 program_name=name,
                 program_description=description,
@@ -850,21 +1182,12 @@ class SMCCatalogParser:
                 description_lines.append(lines[i].strip())
         
         description = ' '.join(description_lines)
-        description = re.sub(r'\s+', ' ', description)
+        description = self.WHITESPACE_RE.sub(' ', description)
         # Apply hyphenation fixes to program description
         description = self.fix_hyphenation(description)
         
         # Fix URL spacing issues in program descriptions - handle cases like "smc.edu/ designtech" -> "smc.edu/designtech"
-        # Handle all "smc.edu/ path" patterns (space after slash)
-        description = re.sub(r'smc\.edu/\s+([a-zA-Z])', r'smc.edu/\1', description)
-        # Handle "go to smc.edu/ path" patterns
-        description = re.sub(r'go to smc\.edu/\s+([a-zA-Z])', r'go to smc.edu/\1', description)
-        # Handle "or smc.edu/ path" patterns
-        description = re.sub(r'or smc\.edu/\s+([a-zA-Z])', r'or smc.edu/\1', description)
-        # Handle "visit smc.edu/ path" patterns
-        description = re.sub(r'visit smc\.edu/\s+([a-zA-Z])', r'visit smc.edu/\1', description)
-        # Handle "see smc.edu/ path" patterns
-        description = re.sub(r'see smc\.edu/\s+([a-zA-Z])', r'see smc.edu/\1', description)
+        description = self.fix_url_spacing(description)
         
         # Parse each course
         courses = []
@@ -910,7 +1233,7 @@ class SMCCatalogParser:
         if not course_boundaries:
             # No courses found, return program with description only
             description = ' '.join(line.strip() for line in lines if line.strip())
-            description = re.sub(r'\s+', ' ', description)
+            description = self.WHITESPACE_RE.sub(' ', description)
             return Program(
                 program_name=name,
                 program_description=description,
@@ -925,20 +1248,16 @@ class SMCCatalogParser:
                 description_lines.append(lines[i].strip())
         
         description = ' '.join(description_lines)
-        description = re.sub(r'\s+', ' ', description)
+        description = self.WHITESPACE_RE.sub(' ', description)
         # Apply hyphenation fixes to program description
         description = self.fix_hyphenation(description)
         
         # Clean up subheader fragments from description
         # Remove "Intensive English" if it appears at the end without proper context
-        description = re.sub(r'\s+Intensive English\s*$', '', description).strip()
+        description = self.ESL_TRAILING_SUBHEADER_RE.sub('', description).strip()
         
         # Fix URL spacing issues in program descriptions
-        description = re.sub(r'smc\.edu/\s+([a-zA-Z])', r'smc.edu/\1', description)
-        description = re.sub(r'go to smc\.edu/\s+([a-zA-Z])', r'go to smc.edu/\1', description)
-        description = re.sub(r'or smc\.edu/\s+([a-zA-Z])', r'or smc.edu/\1', description)
-        description = re.sub(r'visit smc\.edu/\s+([a-zA-Z])', r'visit smc.edu/\1', description)
-        description = re.sub(r'see smc\.edu/\s+([a-zA-Z])', r'see smc.edu/\1', description)
+        description = self.fix_url_spacing(description)
         
         # Parse all courses and track subheader assignments
         courses = []
@@ -982,8 +1301,8 @@ class SMCCatalogParser:
                             # Remove the subheader from the end, but keep other content
                             cleaned_note = cleaned_note.replace(subheader, "").strip()
                             # Clean up any trailing punctuation or "Above section" artifacts
-                            cleaned_note = re.sub(r'\.\s*$', '', cleaned_note)
-                            cleaned_note = re.sub(r'Above section modality is [^.]+\.\s*$', lambda m: m.group(0).replace(subheader, ''), cleaned_note)
+                            cleaned_note = self.TRAILING_PERIOD_RE.sub('', cleaned_note)
+                            cleaned_note = self.TRAILING_MODALITY_NOTE_RE.sub(lambda m: m.group(0).replace(subheader, ''), cleaned_note)
                     
                     if cleaned_note.strip():
                         cleaned_notes.append(cleaned_note)
@@ -1056,7 +1375,7 @@ class SMCCatalogParser:
             # IMPROVED: Detect and skip title continuation lines
             # These are lines that contain parts of the already-extracted course title + units
             # Check if this line looks like a title continuation with units
-            units_match = re.search(r'(\d+(?:\.\d+)?\s+UNITS?)(?:\s|$)', line)
+            units_match = self.UNITS_RE.search(line)
             if units_match:
                 # Extract the part before units
                 before_units = line[:units_match.start()].strip()
@@ -1080,15 +1399,8 @@ class SMCCatalogParser:
                 # ENHANCED: Also check for common title continuation patterns that should always be skipped
                 # This catches cases like "LAB 2.5 UNITS" where LAB might not match title due to extraction issues
                 if extracted_units == units:
-                    continuation_patterns = [
-                        r'^LAB\s+[\d.]+\s+UNITS?$',           # "LAB 2.5 UNITS"
-                        r'^CONCEPTS\s+\d+\s+[\d.]+\s+UNITS?$', # "CONCEPTS 2 2.5 UNITS"
-                        r'^WITH\s+LAB\s+[\d.]+\s+UNITS?$',    # "WITH LAB X UNITS"
-                        r'^[A-Z]+\s+\d+\s+[\d.]+\s+UNITS?$', # Generic "WORD NUMBER X.X UNITS"
-                    ]
-                    
-                    for pattern in continuation_patterns:
-                        if re.match(pattern, line, re.IGNORECASE):
+                    for pattern in self.TITLE_CONTINUATION_RES:
+                        if pattern.match(line):
                             self.add_warning(f"Skipping title continuation line (pattern match): '{line}' for {course_code}")
                             i += 1
                             continue
@@ -1231,7 +1543,7 @@ class SMCCatalogParser:
                 continue
             
             # IMPROVED: Check for section number with validation
-            section_match = re.match(r'^(\d{4})\s+(.+)', line)
+            section_match = self.SECTION_LINE_RE.match(line)
             if section_match:
                 potential_section_num = section_match.group(1)
                 rest_of_line = section_match.group(2)
@@ -1302,7 +1614,7 @@ class SMCCatalogParser:
                     line.startswith('Advisory:') or
                     line.startswith('Formerly') or
                     line.startswith('•') or
-                    re.match(r'^[A-Z]+ \d+,', line)):  # New course starting
+                    self.COURSE_START_RE.match(line)):  # New course starting
                     # This line belongs to course metadata, not section notes
                     # Reset section mode and reprocess this line
                     if current_section:
@@ -1320,15 +1632,15 @@ class SMCCatalogParser:
                         any(word in line.lower() for word in ['course', 'students', 'study', 'topics', 'introduction'])):
                     current_section.notes.append(line)
                     # Extract duration if present
-                    duration_match = re.search(r'meets for (\d+ weeks, .+?)(?:\.|,\s*(?:and|at))', line)
+                    duration_match = self.DURATION_RE.search(line)
                     if duration_match:
                         current_section.duration = duration_match.group(1)
                     # Extract modality if present - search anywhere in the line
-                    modality_match = re.search(r'modality is ([^.]+)', line)
+                    modality_match = self.MODALITY_RE.search(line)
                     if modality_match:
                         modality_value = modality_match.group(1).strip()
                         # Clean up any line break artifacts or extra whitespace
-                        modality_value = re.sub(r'\s+', ' ', modality_value).strip()
+                        modality_value = self.WHITESPACE_RE.sub(' ', modality_value).strip()
                         current_section.modality = modality_value
                     i += 1
                     continue
@@ -1344,15 +1656,9 @@ class SMCCatalogParser:
             # If not in section or couldn't parse as section content, it's description
             if not in_section:
                 # Check for "same as" pattern - handle both "course" and "class" variations
-                same_as_patterns = [
-                    # Allow department codes with multiple uppercase words (e.g. "TH ART", "VAR PE")
-                    r'([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)\s+is the same (?:course|class) as\s+([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)',
-                    r'([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)\s+is the same as\s+([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)',
-                ]
-                
                 same_as_found = False
-                for pattern in same_as_patterns:
-                    same_as_match = re.search(pattern, line)
+                for pattern in self.SAME_AS_RES:
+                    same_as_match = pattern.search(line)
                     if same_as_match:
                         course.same_as = same_as_match.group(2)
                         # Preserve the entire equivalency sentence as a note
@@ -1414,31 +1720,18 @@ class SMCCatalogParser:
             section.notes = [self.fix_hyphenation(note) for note in section.notes]
             
             # Fix URL spacing issues - handle cases like "smc.edu/ scholars" -> "smc.edu/scholars"
-            for i, note in enumerate(section.notes):
-                # Fix common URL spacing issues
-                fixed_note = note
-                # Handle all "smc.edu/ path" patterns (space after slash)
-                fixed_note = re.sub(r'smc\.edu/\s+([a-zA-Z])', r'smc.edu/\1', fixed_note)
-                # Handle "go to smc.edu/ path" patterns
-                fixed_note = re.sub(r'go to smc\.edu/\s+([a-zA-Z])', r'go to smc.edu/\1', fixed_note)
-                # Handle "or smc.edu/ path" patterns
-                fixed_note = re.sub(r'or smc\.edu/\s+([a-zA-Z])', r'or smc.edu/\1', fixed_note)
-                # Handle "visit smc.edu/ path" patterns
-                fixed_note = re.sub(r'visit smc\.edu/\s+([a-zA-Z])', r'visit smc.edu/\1', fixed_note)
-                # Handle "see smc.edu/ path" patterns
-                fixed_note = re.sub(r'see smc\.edu/\s+([a-zA-Z])', r'see smc.edu/\1', fixed_note)
-                section.notes[i] = fixed_note
+            section.notes = [self.fix_url_spacing(note) for note in section.notes]
             
             # Extract modality from any note containing "modality is"
             # Also check if modality is incomplete (just "On" without "Ground")
             if not section.modality or section.modality == "On":
                 # First, try the joined notes approach to handle split patterns
                 all_notes_joined = ' '.join(section.notes)
-                modality_match = re.search(r'modality is ([^.]+)', all_notes_joined)
+                modality_match = self.MODALITY_RE.search(all_notes_joined)
                 if modality_match:
                     modality_value = modality_match.group(1).strip()
                     # Clean up any line break artifacts or extra whitespace
-                    modality_value = re.sub(r'\s+', ' ', modality_value).strip()
+                    modality_value = self.WHITESPACE_RE.sub(' ', modality_value).strip()
                     section.modality = modality_value
                 
                 # If we still don't have modality, try individual notes and alternative patterns
@@ -1446,43 +1739,20 @@ class SMCCatalogParser:
                     for note in section.notes:
                         # Primary pattern: "modality is [value]" - stop at first period or end of sentence
                         # Handle cases where the modality value might have been split across lines
-                        modality_match = re.search(r'modality is ([^.]+)', note)
+                        modality_match = self.MODALITY_RE.search(note)
                         if modality_match:
                             modality_value = modality_match.group(1).strip()
                             # Clean up any line break artifacts or extra whitespace
-                            modality_value = re.sub(r'\s+', ' ', modality_value).strip()
+                            modality_value = self.WHITESPACE_RE.sub(' ', modality_value).strip()
                             section.modality = modality_value
                             break
                         
-                        # IMPROVED: Additional modality patterns
-                        # "is a hybrid class"
-                        if re.search(r'is a hybrid class', note, re.IGNORECASE):
-                            section.modality = 'Hybrid'
-                            break
-                        
-                        # "is an online class"  
-                        if re.search(r'is an? online class', note, re.IGNORECASE):
-                            section.modality = 'Online'
-                            break
-                        
-                        # "hybrid class taught on campus and online"
-                        if re.search(r'hybrid class taught', note, re.IGNORECASE):
-                            section.modality = 'Hybrid'
-                            break
-                        
-                        # "taught on campus and online" (without "hybrid" but with both)
-                        if re.search(r'taught on campus and online', note, re.IGNORECASE):
-                            section.modality = 'Hybrid'
-                            break
-                        
-                        # "fully on ground" - indicates on ground modality
-                        if re.search(r'fully on ground', note, re.IGNORECASE):
-                            section.modality = 'On Ground'
-                            break
-                        
-                        # "taught in person" - indicates on ground modality
-                        if re.search(r'(?:will be )?taught in person', note, re.IGNORECASE):
-                            section.modality = 'On Ground'
+                        # IMPROVED: Additional modality patterns, tried in order
+                        cue_modality = next(
+                            (modality for pattern, modality in self.MODALITY_CUES if pattern.search(note)), None
+                        )
+                        if cue_modality:
+                            section.modality = cue_modality
                             break
         
         # Post-process to establish co-enrollment relationships
@@ -1509,32 +1779,26 @@ class SMCCatalogParser:
         
         # Clean up description and fix hyphenation
         if course.description:
-            course.description = re.sub(r'\s+', ' ', course.description).strip()
+            course.description = self.WHITESPACE_RE.sub(' ', course.description).strip()
             # Apply hyphenation fixes to description
             course.description = self.fix_hyphenation(course.description)
             
             # IMPROVED: Extract prerequisites from description if they got misplaced there
             # Handle patterns like "Prerequisites: COURSE 1 and COURSE 2." at the beginning of description
-            prereq_pattern = r'^(Prerequisites?:\s*[^.]+\.)\s*'
-            prereq_match = re.match(prereq_pattern, course.description)
+            prereq_match = self.DESCRIPTION_PREREQUISITE_RE.match(course.description)
             if prereq_match and not course.prerequisites:
                 prereq_text = prereq_match.group(1)
                 # Extract just the prerequisite content without the label
                 course.prerequisites = prereq_text.replace('Prerequisites:', '').replace('Prerequisite:', '').strip().rstrip('.')
                 # Remove from description
-                course.description = re.sub(prereq_pattern, '', course.description).strip()
+                course.description = self.DESCRIPTION_PREREQUISITE_RE.sub('', course.description).strip()
                 self.add_warning(f"Extracted prerequisites from description for {course_code}: {course.prerequisites}")
             
             # IMPROVED: Extract "same as" information from description if not already set
             if not course.same_as:
                 # Expanded patterns to handle variations: "is the same course as", "is the same class as"
-                same_as_patterns = [
-                    r'([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)\s+is the same (?:course|class) as\s+([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)',
-                    r'([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)\s+is the same as\s+([A-Z]+(?:\s+[A-Z]+)*\s+[A-Z]*\d+[A-Z]*)',
-                ]
-                
-                for pattern in same_as_patterns:
-                    same_as_match = re.search(pattern, course.description)
+                for pattern in self.SAME_AS_RES:
+                    same_as_match = pattern.search(course.description)
                     if same_as_match:
                         course.same_as = same_as_match.group(2)
                         # Remove the "same as" clause from description
@@ -1546,39 +1810,15 @@ class SMCCatalogParser:
                             if course.special_notes is None:
                                 course.special_notes = []
                             course.special_notes.append(full_sentence)
-                            course.description = re.sub(re.escape(full_sentence), '', course.description).strip()
+                            course.description = course.description.replace(full_sentence, '').strip()
                             # Clean up any double spaces or periods
-                            course.description = re.sub(r'\s+', ' ', course.description).strip()
+                            course.description = self.WHITESPACE_RE.sub(' ', course.description).strip()
                         self.add_warning(f"Extracted same_as from description for {course_code}: {course.same_as}")
                         break
             
             # IMPROVED: Extract all asterisk notes from description and categorize them
-            asterisk_patterns = [
-                # Credit limitations and restrictions (should go to special_notes)
-                # Generic asterisk credit limitation sentence (captures up to the first period)
-                (r'(\*Maximum (?:UC )?credit (?:allowed )?for [^\.]+\.)', 'special'),
-                (r'(\*No UC (?:transfer )?credit for [A-Z]+ \d+[A-Z]?(?: if taken [^.]*)?\.)', 'special'),
-                (r'(\*Total of [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? combined[^.]*\.)', 'special'),
-                (r'(\*UC gives no credit for [A-Z]+ \d+[A-Z]? if [^.]*\.)', 'special'),
-                # Handle ESL-style combined credit patterns
-                (r'(\*[A-Z]+ \d+[A-Z]?,\s*[A-Z]+ \d+[A-Z]?[^:]*:\s*maximum credit[^.]*\.)', 'special'),
-                
-                # Specific patterns for courses that start with asterisk notes
-                (r'(\*No UC credit given for [A-Z]+ \d+[A-Z]? if taken after [^.]+\.)', 'special'),
-                (r'(\*Total of four units credit for [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? is transferable\.)', 'special'),
-                (r'(\*No UC credit for [A-Z]+ \d+[A-Z]? or \d+[A-Z]? if taken after [A-Z]+ \d+[A-Z]*\.)', 'special'),
-                # Pattern for multiple course credit restrictions
-                (r'(\*No UC credit for [A-Z]+ \d+[A-Z]?, [A-Z]+ \d+[A-Z]? or [A-Z]+ \d+[A-Z]? if taken after [^.]+\.)', 'special'),
-                
-                # Prerequisite explanations (should go to prerequisite_notes)
-                (r'(\*The prerequisite for this course[^.]*)', 'prerequisite'),
-                
-                # Advisory explanations (should go to advisory_notes)
-                (r'(\*The advisory for this course[^.]*)', 'advisory'),
-            ]
-            
-            for pattern, note_type in asterisk_patterns:
-                match = re.search(pattern, course.description)
+            for pattern, note_type in self.ASTERISK_NOTE_PATTERNS:
+                match = pattern.search(course.description)
                 if match:
                     asterisk_note = match.group(1)
                     
@@ -1598,69 +1838,26 @@ class SMCCatalogParser:
                         self.add_warning(f"Extracted advisory explanation from description for {course_code}: {asterisk_note}")
                     
                     # Remove from description
-                    course.description = re.sub(pattern, '', course.description).strip()
+                    course.description = pattern.sub('', course.description).strip()
             
             # Clean up any orphaned punctuation at the beginning of description
-            course.description = re.sub(r'^[.\s,;:]+', '', course.description).strip()
+            course.description = self.LEADING_PUNCTUATION_RE.sub('', course.description).strip()
             
             # NEW: Fix specific fragment issues found in test results
-            fragment_fixes = {
-                # CHEM 11: Missing beginning of transfer credit note
-                'CHEM 11': {
-                    'pattern': r'^students must complete both CHEM 11 and CHEM 12\.',
-                    'replacement': 'To receive transfer credit, students must complete both CHEM 11 and CHEM 12.'
-                },
-                # CIS 1: Missing beginning of credit limitation note
-                'CIS 1': {
-                    'pattern': r'^or 4 if taken after CS 3\.',
-                    'replacement': '*Maximum UC credit for CIS 1 or 4 if taken after CS 3.',
-                    'move_to_special': True
-                },
-                # BIOL 33: Missing beginning of sentence
-                'BIOL 33': {
-                    'pattern': r'^work-ready skills in a bioscience research and biotechnology industry career\.',
-                    'replacement': 'This course provides work-ready skills in a bioscience research and biotechnology industry career.'
-                },
-                # ACCTG 10A: Missing beginning of advisory sentence
-                'ACCTG 10A': {
-                    'pattern': r'^carefully, and reach out to your counselor if you have questions!',
-                    'replacement': 'Please read degree requirements carefully, and reach out to your counselor if you have questions!'
-                },
-                # KIN PE 51A: Missing beginning of prerequisite check sentence
-                'KIN PE 51A': {
-                    'pattern': r'^on Day 1 of class: student must be able to swim',
-                    'replacement': 'Prerequisites will be checked on Day 1 of class: student must be able to swim'
-                },
-                # COSM 95B, 95C, 95D: Missing beginning of experience description
-                'COSM 95B': {
-                    'pattern': r'^supervision of faculty\.',
-                    'replacement': 'This course provides hands-on salon experience under the supervision of faculty.'
-                },
-                'COSM 95C': {
-                    'pattern': r'^supervision of faculty\.',
-                    'replacement': 'This course provides hands-on salon experience under the supervision of faculty.'
-                },
-                'COSM 95D': {
-                    'pattern': r'^supervision of faculty\.',
-                    'replacement': 'This course provides hands-on salon experience under the supervision of faculty.'
-                }
-            }
-            
-            # Apply fragment fixes if applicable
-            if course.course_code in fragment_fixes:
-                fix_info = fragment_fixes[course.course_code]
+            if course.course_code in self.FRAGMENT_FIXES:
+                fix_info = self.FRAGMENT_FIXES[course.course_code]
                 pattern = fix_info['pattern']
                 replacement = fix_info['replacement']
                 
-                if re.search(pattern, course.description):
-                    course.description = re.sub(pattern, replacement, course.description)
+                if pattern.search(course.description):
+                    course.description = pattern.sub(replacement, course.description)
                     
                     # If this should be moved to special_notes instead
                     if fix_info.get('move_to_special', False):
                         if course.special_notes is None:
                             course.special_notes = []
                         # Extract the fixed sentence and move to special_notes
-                        sentence_match = re.match(r'^([^.]+\.)', course.description)
+                        sentence_match = self.FIRST_SENTENCE_RE.match(course.description)
                         if sentence_match:
                             special_note = sentence_match.group(1)
                             course.special_notes.append(special_note)
@@ -1670,46 +1867,25 @@ class SMCCatalogParser:
             
             # IMPROVED: Extract credit-related continuation sentences (without asterisks)
             # These often follow asterisk notes and provide additional credit information
-            credit_continuation_patterns = [
-                # Maximum credit patterns
-                r'(Maximum (?:UC )?credit for [A-Z]+ \d+[A-Z]?(?: and \d+[A-Z]?)* combined is [^.]+\.)',
-                r'(Maximum (?:UC )?credit for [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? combined is [^.]+\.)',
-                # Total credit patterns  
-                r'(Total of [A-Z]+ \d+[A-Z]? and [A-Z]+ \d+[A-Z]? combined[^.]+\.)',
-                # No credit patterns
-                r'(No (?:UC )?credit for [A-Z]+ \d+[A-Z]? if taken [^.]+\.)',
-                # UC gives patterns
-                r'(UC gives no credit for [A-Z]+ \d+[A-Z]? if [^.]+\.)',
-            ]
-            
             # Only look for these if we already have special_notes (indicates this course has credit restrictions)
             if course.special_notes:
-                for pattern in credit_continuation_patterns:
-                    continuation_match = re.search(pattern, course.description)
+                for pattern in self.CREDIT_CONTINUATION_RES:
+                    continuation_match = pattern.search(course.description)
                     if continuation_match:
                         continuation_note = continuation_match.group(1)
                         course.special_notes.append(continuation_note)
                         # Remove from description
-                        course.description = re.sub(re.escape(continuation_note), '', course.description).strip()
+                        course.description = course.description.replace(continuation_note, '').strip()
                         # Clean up any double spaces
-                        course.description = re.sub(r'\s+', ' ', course.description).strip()
+                        course.description = self.WHITESPACE_RE.sub(' ', course.description).strip()
                         self.add_warning(f"Extracted credit continuation note from description for {course_code}: {continuation_note}")
             
             # Clean up any orphaned punctuation at the beginning of description after all extractions
-            course.description = re.sub(r'^[.\s,;:]+', '', course.description).strip()
+            course.description = self.LEADING_PUNCTUATION_RE.sub('', course.description).strip()
             
             # IMPROVED: Extract "See also" statements from description and move to special_notes
-            see_also_patterns = [
-                # "See also COURSE 123." at the beginning of description
-                r'^(See also [^.]+\.)\s*',
-                # "See also COURSE 123 and COURSE 456." patterns
-                r'^(See also [^.]+and[^.]+\.)\s*',
-                # Handle cases without periods (less common but possible)
-                r'^(See also [A-Z]+\s+\d+[A-Z]*(?:\s+and\s+[A-Z]+\s+\d+[A-Z]*)*)\s*(?=\.|This|Students|The|In)',
-            ]
-            
-            for pattern in see_also_patterns:
-                see_also_match = re.match(pattern, course.description)
+            for pattern in self.SEE_ALSO_RES:
+                see_also_match = pattern.match(course.description)
                 if see_also_match:
                     see_also_text = see_also_match.group(1).strip()
                     # Ensure it ends with a period
@@ -1722,7 +1898,7 @@ class SMCCatalogParser:
                     course.special_notes.append(see_also_text)
                     
                     # Remove from description
-                    course.description = re.sub(pattern, '', course.description).strip()
+                    course.description = pattern.sub('', course.description).strip()
                     self.add_warning(f"Extracted 'See also' note from description for {course_code}: {see_also_text}")
                     break  # Only process the first match
             
@@ -1731,13 +1907,13 @@ class SMCCatalogParser:
             # matches either "equivalent to" or "Students will receive credit for..." patterns.
             advisory_sentences: List[str] = []
             while True:
-                sentence_match = re.match(r'^([^\.]*\.)\s*', course.description)
+                sentence_match = self.LEADING_SENTENCE_RE.match(course.description)
                 if not sentence_match:
                     break
                 first_sentence = sentence_match.group(1).strip()
                 first_lower = first_sentence.lower()
                 if ('equivalent to' in first_lower or
-                        re.match(r'students?\s+will\s+receive\s+credit', first_lower)):
+                        self.RECEIVE_CREDIT_RE.match(first_lower)):
                     advisory_sentences.append(first_sentence)
                     # Remove this sentence (and following whitespace) from description
                     course.description = course.description[sentence_match.end():].lstrip()
@@ -1784,20 +1960,10 @@ class SMCCatalogParser:
                     self.add_warning(f"Split advisory into advisory and advisory_notes for {course_code}")
 
             # Fix URL spacing issues in descriptions - handle cases like "smc.edu/ scholars" -> "smc.edu/scholars"
-            # Handle all "smc.edu/ path" patterns (space after slash)
-            course.description = re.sub(r'smc\.edu/\s+([a-zA-Z])', r'smc.edu/\1', course.description)
-            # Handle "go to smc.edu/ path" patterns
-            course.description = re.sub(r'go to smc\.edu/\s+([a-zA-Z])', r'go to smc.edu/\1', course.description)
-            # Handle "or smc.edu/ path" patterns
-            course.description = re.sub(r'or smc\.edu/\s+([a-zA-Z])', r'or smc.edu/\1', course.description)
-            # Handle "visit smc.edu/ path" patterns
-            course.description = re.sub(r'visit smc\.edu/\s+([a-zA-Z])', r'visit smc.edu/\1', course.description)
-            # Handle "see smc.edu/ path" patterns
-            course.description = re.sub(r'see smc\.edu/\s+([a-zA-Z])', r'see smc.edu/\1', course.description)
+            course.description = self.fix_url_spacing(course.description)
             
             # Extract and move "combined credit" statements to special_notes
-            combined_credit_pattern = r'PHYSCS\s+[0-9A-Z,\s]+(?:or\s+PHYSCS\s+[0-9A-Z,\s]+)*\s+combined:\s+maximum\s+UC\s+credit,\s+1\s+series\.\s*'
-            combined_match = re.search(combined_credit_pattern, course.description, re.IGNORECASE)
+            combined_match = self.COMBINED_CREDIT_RE.search(course.description)
             if combined_match:
                 combined_text = combined_match.group(0).strip()
                 # Add to special_notes if not already there
@@ -1806,15 +1972,11 @@ class SMCCatalogParser:
                 if combined_text not in course.special_notes:
                     course.special_notes.append(combined_text)
                 # Remove from description
-                course.description = re.sub(combined_credit_pattern, '', course.description, flags=re.IGNORECASE).strip()
+                course.description = self.COMBINED_CREDIT_RE.sub('', course.description).strip()
             
             # Clean up any leftover formatting issues in description
-            # Remove redundant "WITH LAB X UNITS" that sometimes gets included
-            course.description = re.sub(r'^WITH\s+LAB\s+\d+\s+UNITS\s+', '', course.description).strip()
-            course.description = re.sub(r'^\d+\s+UNITS\s+', '', course.description).strip()
-            # Remove redundant course name patterns at the beginning
-            course.description = re.sub(r'^PHYSICS\s+\d+\s+UNITS\s+', '', course.description).strip()
-            course.description = re.sub(r'^[A-Z]+\s+\d+\s+UNITS\s+', '', course.description).strip()
+            for pattern in self.LEADING_UNITS_RES:
+                course.description = pattern.sub('', course.description).strip()
         
         # Apply hyphenation fixes to other text fields
         if course.prerequisites:
@@ -1847,29 +2009,17 @@ class SMCCatalogParser:
             course.special_notes = remaining_special_notes
             
             # Also fix URL spacing issues in special_notes
-            for i, note in enumerate(course.special_notes):
-                fixed_note = note
-                # Handle all "smc.edu/ path" patterns (space after slash)
-                fixed_note = re.sub(r'smc\.edu/\s+([a-zA-Z])', r'smc.edu/\1', fixed_note)
-                # Handle "go to smc.edu/ path" patterns
-                fixed_note = re.sub(r'go to smc\.edu/\s+([a-zA-Z])', r'go to smc.edu/\1', fixed_note)
-                # Handle "or smc.edu/ path" patterns
-                fixed_note = re.sub(r'or smc\.edu/\s+([a-zA-Z])', r'or smc.edu/\1', fixed_note)
-                # Handle "visit smc.edu/ path" patterns
-                fixed_note = re.sub(r'visit smc\.edu/\s+([a-zA-Z])', r'visit smc.edu/\1', fixed_note)
-                # Handle "see smc.edu/ path" patterns
-                fixed_note = re.sub(r'see smc\.edu/\s+([a-zA-Z])', r'see smc.edu/\1', fixed_note)
-                course.special_notes[i] = fixed_note
+            course.special_notes = [self.fix_url_spacing(note) for note in course.special_notes]
         
         if course.advisory_notes:
             course.advisory_notes = self.fix_hyphenation(course.advisory_notes)
 
             # MOVE sentences that mention "prerequisite" into prerequisite_notes
-            if re.search(r'prerequisite', course.advisory_notes, re.IGNORECASE):
-                sentences = re.split(r'(?<=\.)\s+', course.advisory_notes.strip())
+            if self.PREREQUISITE_WORD_RE.search(course.advisory_notes):
+                sentences = self.SENTENCE_BREAK_RE.split(course.advisory_notes.strip())
                 remaining_adv = []
                 for sent in sentences:
-                    if re.search(r'prerequisite', sent, re.IGNORECASE):
+                    if self.PREREQUISITE_WORD_RE.search(sent):
                         sent_clean = sent.strip()
                         if sent_clean:
                             if course.prerequisite_notes:
@@ -1996,8 +2146,7 @@ class SMCCatalogParser:
         # Standard time pattern - improved to handle various location/instructor formats
         # Look for time, days, then capture everything else to split manually
         # Updated to handle "Th" for Thursday - must come before single chars to avoid matching T+h separately
-        time_pattern = r'(\d{1,2}:\d{2}[ap]\.m\.-\d{1,2}:\d{2}[ap]\.m\.)\s+((?:Th|[MTWRFSU])+)\s+(.+)$'
-        time_match = re.match(time_pattern, line)
+        time_match = self.TIMED_SCHEDULE_RE.match(line)
         
         if time_match:
             time = time_match.group(1)
@@ -2014,8 +2163,7 @@ class SMCCatalogParser:
             )
         
         # Arrange pattern - improved to use robust location/instructor parsing
-        arrange_pattern = r'^(Arrange-[\d.]+ Hours?)\s+(.+)$'
-        arrange_match = re.match(arrange_pattern, line)
+        arrange_match = self.ARRANGED_SCHEDULE_RE.match(line)
         
         if arrange_match:
             time = arrange_match.group(1)
@@ -2057,12 +2205,6 @@ class SMCCatalogParser:
         """
         rest = rest.strip()
         
-        # Common location keywords that help identify boundaries
-        location_keywords = [
-            'ONLINE', 'TBA', 'ZOOM', 'REMOTE', 'CAMPUS', 'STUDIO', 'LAB', 'ROOM',
-            'DRSCHR', 'BUS', 'SCI', 'TECH', 'ART', 'MUSIC', 'THEATER', 'GYM'
-        ]
-        
         # ENHANCED: Handle specific case for "N Staff" in arrange schedules
         # "N" represents no specific day/location, "Staff" is the instructor
         if rest == "N Staff":
@@ -2078,20 +2220,8 @@ class SMCCatalogParser:
             return 'TBA', rest
         
         # Method 1: Look for instructor name patterns working backwards from the end
-        # Improved instructor patterns to handle various name formats:
-        # - "Smith J" (last + initial)
-        # - "Smith John" (last + first)  
-        # - "Smith J A" (last + multiple initials)
-        # - "Smith John A" (last + first + middle initial)
-        # - "Williams V J" (last + spaced initials)
-        instructor_patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z](?:\s+[A-Z])*)*)\s*$',  # Last name + spaced initials: "Williams V J"
-            r'([A-Z][a-z]+(?:\s+[A-Z][A-Z]*)*)\s*$',        # Last name + initials: "Smith JA" or "Smith J A"
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z])*)\s*$', # Last + First + optional initials: "Smith John A"
-        ]
-        
-        for pattern in instructor_patterns:
-            instructor_match = re.search(pattern, rest)
+        for pattern in self.INSTRUCTOR_SUFFIX_RES:
+            instructor_match = pattern.search(rest)
             if instructor_match:
                 instructor = instructor_match.group(1).strip()
                 location_part = rest[:instructor_match.start()].strip()
@@ -2102,20 +2232,14 @@ class SMCCatalogParser:
         
         # Method 2: Look for location patterns from the beginning
         # Match common location patterns and capture the instructor after
-        location_patterns = [
-            r'^((?:' + '|'.join(location_keywords) + r')(?:\s+\d+)?)\s+(.+)$',  # Known location keywords + optional room number
-            r'^([A-Z]{2,}(?:\s+[A-Z0-9]+)*)\s+([A-Z][a-z].*)$',               # All caps location + instructor starting with proper case
-            r'^([A-Z]+\s+\d+)\s+([A-Z][a-z].*)$',                            # Building + room number pattern
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.match(pattern, rest)
+        for pattern in self.LOCATION_PREFIX_RES:
+            location_match = pattern.match(rest)
             if location_match:
                 location = location_match.group(1).strip()
                 instructor = location_match.group(2).strip()
                 
                 # Additional validation: instructor should contain lowercase
-                if re.search(r'[a-z]', instructor) and not self._looks_like_location(instructor):
+                if self.LOWERCASE_RE.search(instructor) and not self._looks_like_location(instructor):
                     return location, instructor
         
         # Method 3: Split by detecting transition from all-caps to mixed case
@@ -2125,7 +2249,7 @@ class SMCCatalogParser:
             boundary_idx = None
             for i, word in enumerate(words):
                 # If this word contains lowercase and isn't a known location fragment
-                if re.search(r'[a-z]', word) and not self._looks_like_location(word):
+                if self.LOWERCASE_RE.search(word) and not self._looks_like_location(word):
                     boundary_idx = i
                     break
             
@@ -2134,7 +2258,7 @@ class SMCCatalogParser:
                 instructor = ' '.join(words[boundary_idx:])
                 
                 # Final validation
-                if self._is_valid_location(location) and re.search(r'[a-z]', instructor):
+                if self._is_valid_location(location) and self.LOWERCASE_RE.search(instructor):
                     return location, instructor
         
         # Method 4: Fallback - use heuristics based on common patterns
@@ -2164,7 +2288,7 @@ class SMCCatalogParser:
             return False
         
         # Must contain lowercase letters (instructor names are mixed case)
-        if not re.search(r'[a-z]', text):
+        if not self.LOWERCASE_RE.search(text):
             return False
         
         # Must NOT contain obvious location keywords
@@ -2176,26 +2300,14 @@ class SMCCatalogParser:
                 return False
         
         # Check if it matches instructor name patterns
-        # Enhanced patterns to handle names like "De Stefano J D"
-        instructor_patterns = [
-            # Last name + multiple initials: "Smith J A", "Williams V J"
-            r'^[A-Z][a-z]+(?:\s+[A-Z]){1,3}\s*$',
-            # Last name + first name + optional initials: "Smith John", "Smith John A"
-            r'^[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z])*\s*$',
-            # Two-part last name + initials: "De Stefano J D", "Van Der Berg A B"  
-            r'^[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z]){1,3}\s*$',
-            # Three-part names: "De La Cruz J", "Van Der Berg A"
-            r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z])*\s*$',
-        ]
-        
-        for pattern in instructor_patterns:
-            if re.match(pattern, text):
+        for pattern in self.INSTRUCTOR_NAME_RES:
+            if pattern.match(text):
                 return True
         
         # Additional heuristic: if all words start with uppercase but contain lowercase,
         # and none of the words are typical location words, it's likely an instructor name
         all_words_proper_case = all(
-            word[0].isupper() and re.search(r'[a-z]', word) 
+            word[0].isupper() and self.LOWERCASE_RE.search(word) 
             for word in words 
             if len(word) > 1  # Skip single letters (initials)
         )
@@ -2244,8 +2356,8 @@ class SMCCatalogParser:
     
     def save_program_json(self, program: Program):
         # Create filename from program name
-        filename = re.sub(r'[^\w\s-]', '', program.program_name)
-        filename = re.sub(r'[-\s]+', '_', filename).lower()
+        filename = self.FILENAME_DROP_RE.sub('', program.program_name)
+        filename = self.FILENAME_SEPARATOR_RE.sub('_', filename).lower()
 
         # Independent Studies, Internships, and similar reference programs are written to the extra_refs folder
         if program.program_name.strip().lower().startswith(("independent studies", "internships")):
@@ -2301,9 +2413,9 @@ class SMCCatalogParser:
             
             program_dict["courses"].append(course_dict)
         
-        # Save to JSON file
+        # Save to JSON file (serialized first: one write instead of one per token)
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(program_dict, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(program_dict, indent=2, ensure_ascii=False))
         
         print(f"Saved {program.program_name} to {filepath}")
     
@@ -2321,7 +2433,7 @@ class SMCCatalogParser:
             # Attempt to extract the referenced program from patterns like:
             # "Please see listing under "Biological Sciences."" or
             # "Please see listing under \"Kinesiology/Physical Education.\""
-            target_match = re.search(r'under\s+["\"\']?([^.]+?)\.', desc, re.IGNORECASE)
+            target_match = self.CROSS_REFERENCE_TARGET_RE.search(desc)
             if target_match:
                 target_program = target_match.group(1).strip()
                 cross_ref_map[header.header_name] = target_program
@@ -2343,7 +2455,7 @@ class SMCCatalogParser:
             all_notes = ' '.join(section.notes)
             
             # Look for co-enrollment requirements in the combined notes
-            co_enroll_match = re.search(r'requires co-enrollment in .+? section (\d{4})', all_notes)
+            co_enroll_match = self.CO_ENROLLMENT_RE.search(all_notes)
             if co_enroll_match:
                 section.co_enrollment_with = co_enroll_match.group(1)
     
@@ -2582,17 +2694,9 @@ class SMCCatalogParser:
         # TARGETED FIX 0.6: Extract descriptions that start with other patterns from prerequisites
         # Handle cases like "ACCTG 2. Basic pronouncements of the Financial Accounting Standards Board..."
         if course.prerequisites and not course.description:
-            # Pattern to match "PREREQ. [Description starting with capital letter]..."
             # Look for prerequisite followed by description that doesn't start with common prerequisite words
-            desc_patterns = [
-                # Pattern for descriptions starting with "Basic pronouncements"
-                r'^([A-Z]+\s+\d+[A-Z]*\.)\s+(Basic pronouncements.+?)$',
-                # Pattern for other descriptive sentences that don't start with prerequisite indicators
-                r'^([A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*(?:\s+(?:and|or)\s+[A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*)*\.)\s+([A-Z][^.]*(?:course|students|topics|emphasis|study|analysis|principles|concepts|methods|techniques|applications|overview|introduction|examination|exploration|development|understanding|knowledge|skills|preparation|training|instruction|education|learning).+?)$'
-            ]
-            
-            for pattern in desc_patterns:
-                match = re.search(pattern, course.prerequisites, re.DOTALL)
+            for pattern in self.PREREQUISITE_DESCRIPTION_RES:
+                match = pattern.search(course.prerequisites)
                 if match:
                     prereq_only = match.group(1).strip()
                     description_text = match.group(2).strip()
@@ -2607,18 +2711,9 @@ class SMCCatalogParser:
         # TARGETED FIX 0.7: Extract prerequisite explanatory notes from prerequisites field
         # Handle cases like "CHEM 10 and MATH 20. Students seeking waiver of the CHEM 10 prerequisite should take..."
         if course.prerequisites and not course.prerequisite_notes:
-            # Pattern to match prerequisite followed by explanatory sentences about prerequisites
-            prereq_note_patterns = [
-                # Pattern for waiver/challenge exam explanations
-                r'^([^.]+\.)\s+(Students seeking waiver[^.]+\.)\s*(.*?)$',
-                # Pattern for general prerequisite explanations
-                r'^([^.]+\.)\s+(Students taking [^.]+must[^.]+\.)\s*(.*?)$',
-                # Pattern for other prerequisite-related explanations
-                r'^([^.]+\.)\s+((?:Students|Note:|Please note:)[^.]*(?:prerequisite|requirement|waiver|challenge|exam)[^.]*\.)\s*(.*?)$'
-            ]
-            
-            for pattern in prereq_note_patterns:
-                match = re.search(pattern, course.prerequisites, re.DOTALL)
+            # Look for prerequisite followed by explanatory sentences about prerequisites
+            for pattern in self.PREREQUISITE_NOTE_RES:
+                match = pattern.search(course.prerequisites)
                 if match:
                     prereq_only = match.group(1).strip()
                     prereq_note = match.group(2).strip()
@@ -2850,10 +2945,8 @@ class SMCCatalogParser:
         # TARGETED FIX 14.6: General pattern for descriptions starting with "This [word] course" in prerequisites
         # This handles cases where the prerequisite field contains the prerequisite followed by the description
         if course.prerequisites and not course.description:
-            # Pattern to match "PREREQ. This [word] course..." where [word] is any single word
-            # More flexible pattern that can handle prerequisites with multiple sentences
-            desc_in_prereq_pattern = r'^([A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*(?:\s+(?:and|or)\s+[A-Z]+(?:\s+[A-Z]+)*\s+\d+[A-Z]*)*\.)\s+(This\s+\w+(?:[-‐]\w+)*\s+course.+?)$'
-            match = re.search(desc_in_prereq_pattern, course.prerequisites, re.DOTALL)
+            # Match "PREREQ. This [word] course..." where [word] is any single word
+            match = self.PREREQUISITE_THIS_COURSE_RE.search(course.prerequisites)
             if match:
                 prereq_only = match.group(1).strip()
                 description_text = match.group(2).strip()
@@ -3014,8 +3107,8 @@ class SMCCatalogParser:
         assigned_ids = set()
 
         for code, course_list in code_to_courses.items():
-            base_id = re.sub(r'\s+', '-', code.strip())            # spaces → dash
-            base_id = re.sub(r'[^A-Za-z0-9\-]', '', base_id).upper()  # keep A-Z,0-9 and '-'
+            base_id = self.WHITESPACE_RE.sub('-', code.strip())            # spaces → dash
+            base_id = self.COURSE_ID_DROP_RE.sub('', base_id).upper()  # keep A-Z,0-9 and '-'
 
             if len(course_list) > 1:
                 self.add_warning(f"Duplicate course_code detected: '{code}' appears {len(course_list)} times.")
@@ -3025,13 +3118,13 @@ class SMCCatalogParser:
 
                 # Append units token if present (e.g. 4unit, 6unit, 2.5unit)
                 if course.units:
-                    m = re.match(r'(\d+(?:\.\d+)?)', course.units)
+                    m = self.UNITS_NUMBER_RE.match(course.units)
                     if m:
                         num_units = m.group(1).rstrip('0').rstrip('.') if '.' in m.group(1) else m.group(1)
                         components.append(f"{num_units}UNIT")
 
                 # Append co-enrolment token if title contains "WITH XXX"
-                with_match = re.search(r'WITH\s+([A-Z]+\s+\d+[A-Z]*)', course.course_title, re.IGNORECASE)
+                with_match = self.WITH_COURSE_RE.search(course.course_title)
                 if with_match:
                     with_code = with_match.group(1).replace(' ', '')
                     components.append(f"WITH-{with_code}")
@@ -3076,7 +3169,7 @@ class SMCCatalogParser:
                 "upon an evaluation of the course outline by a UC campus."
             )
 
-        placeholder_re = re.compile(r'^Please\s+see.+Independent\s+Studies.+section\.?.*$', re.IGNORECASE)
+        placeholder_re = self.INDEPENDENT_STUDIES_PLACEHOLDER_RE
 
         for prog in self.programs:
             for course in prog.courses:
@@ -3111,8 +3204,8 @@ class SMCCatalogParser:
             )
 
         replacement_rules = [
-            (re.compile(r'^Please\s+see.+Independent\s+Studies.+section\.?.*$', re.IGNORECASE), independent_desc),
-            (re.compile(r'^Please\s+see.+Internships.+section\.?.*$', re.IGNORECASE), internship_desc),
+            (self.INDEPENDENT_STUDIES_PLACEHOLDER_RE, independent_desc),
+            (self.INTERNSHIPS_PLACEHOLDER_RE, internship_desc),
         ]
 
         for prog in self.programs:
@@ -3130,9 +3223,28 @@ class SMCCatalogParser:
 
 
 # Example usage
+def _parse_program_job(job: Tuple[str, str, str, str]) -> Tuple[Program, List[str], float]:
+    """Parse one program section (in a worker process); warnings are returned, not printed."""
+    text_file_path, output_dir, name, content = job
+    parser = SMCCatalogParser(text_file_path, output_dir, quiet=True)
+    start = time.perf_counter()
+    program = parser.parse_program(name, content)
+    return program, parser.parsing_warnings, time.perf_counter() - start
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Parse the SMC catalog into one JSON file per program")
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 8),
+                        help="Processes used to parse program sections (1 = serial)")
+    parser.add_argument("--profile", action="store_true", help="Print per-phase and slowest-program timings")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     parser = SMCCatalogParser(os.path.join(os.path.dirname(__file__), "catalog_cleaned.txt"), os.path.join(os.path.dirname(__file__), "parsed_programs"))
-    parser.parse()
+    parser.parse(workers=args.workers)
     print(f"\nParsed {len(parser.programs)} programs and {len(parser.small_headers)} small headers")
     
     # Print parsing warnings summary
@@ -3150,4 +3262,13 @@ if __name__ == "__main__":
     
     print(f"\n=== SMALL HEADERS ({len(parser.small_headers)}) ===")
     for small_header in parser.small_headers:
-        print(f"  {small_header.header_name}: {small_header.description}")
\ No newline at end of file
+        print(f"  {small_header.header_name}: {small_header.description}")
+
+    if args.profile:
+        print(f"\n=== TIMINGS ({args.workers} workers) ===")
+        for phase, seconds in parser.timings.items():
+            print(f"  {phase:<13}{seconds:8.3f}s")
+        print(f"  {'total':<13}{sum(parser.timings.values()):8.3f}s")
+        print("\n  Slowest programs (parse time in worker):")
+        for name, seconds in sorted(parser.program_timings, key=lambda t: t[1], reverse=True)[:10]:
+            print(f"    {seconds:7.3f}s  {name}")
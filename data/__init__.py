@@ -0,0 +1 @@
+"""TransferAI data sources, generation scripts and the incremental build (``data.build``)."""
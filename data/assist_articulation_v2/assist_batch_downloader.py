@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Concurrent, rate-limited ASSIST agreement downloader with a resumable manifest.
+
+Download operations from a batch config are fetched on a thread pool. Each
+worker thread reuses a pooled ``requests.Session``, and all of them share a
+token-bucket rate limiter so ASSIST sees a steady request rate no matter how
+many workers run. Transient failures (connection errors, 429 and 5xx) are
+retried with exponential backoff, and ``Retry-After`` is honoured.
+
+Completed downloads are appended to a JSONL manifest keyed by agreement key.
+An interrupted batch resumes where it stopped. With ``refresh=True``, completed
+agreements are re-checked with conditional requests (``If-None-Match`` /
+``If-Modified-Since``), so unchanged agreements cost a 304 and are not rewritten.
+
+Example:
+    downloader = BatchDownloader(Path("json/download_manifest.jsonl"), rate=2, max_workers=4)
+    report = downloader.download_all(config["operations"])
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from assist_json_downloader import (
+    ASSIST_BASE_URL,
+    DEFAULT_HEADERS,
+    agreement_key,
+    agreement_url,
+    save_agreement_json,
+)
+
+# Status codes worth retrying
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class DownloadManifest:
+    """
+    Append-only JSONL record of finished downloads, keyed by agreement key.
+
+    The last line for a key wins, so re-fetches simply append a newer entry.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with open(self.path) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # a torn final line from an interrupted run
+                    self._entries[entry["key"]] = entry
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def is_complete(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return bool(entry and Path(entry.get("path", "")).exists())
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """Append an entry and flush it to disk immediately."""
+        with self._lock:
+            self._entries[entry["key"]] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class DownloadReport:
+    """Outcome of a batch download."""
+
+    downloaded: List[str] = field(default_factory=list)
+    not_modified: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.downloaded)} downloaded, {len(self.not_modified)} not modified, "
+            f"{len(self.skipped)} already complete, {len(self.failed)} failed "
+            f"in {self.elapsed:.1f}s"
+        )
+
+
+class BatchDownloader:
+    """Download many ASSIST agreements concurrently under a shared rate limit."""
+
+    def __init__(
+        self,
+        manifest_path: Path,
+        *,
+        rate: float = 1.0,
+        max_workers: int = 4,
+        max_retries: int = 4,
+        backoff: float = 1.0,
+        base_url: str = ASSIST_BASE_URL,
+        timeout: float = 60.0,
+    ):
+        """
+        Args:
+            manifest_path: JSONL manifest of completed downloads
+            rate: Requests per second across all workers
+            max_workers: Concurrent downloads
+            max_retries: Retries per agreement after the first attempt
+            backoff: Base delay in seconds, doubled on each retry
+            base_url: ASSIST host (overridable for testing)
+            timeout: Per-request timeout in seconds
+        """
+        self.manifest = DownloadManifest(manifest_path)
+        self.bucket = TokenBucket(rate)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.base_url = base_url
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """One pooled session per worker thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+        return session
+
+    def _get(self, url: str, headers: Dict[str, str]) -> requests.Response:
+        """Rate-limited GET with retry and exponential backoff."""
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                response = self._session().get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS and attempt < self.max_retries:
+                retry_after = response.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt
+                time.sleep(delay)
+                continue
+            return response
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def fetch(self, op: Dict[str, Any], refresh: bool = False) -> str:
+        """
+        Download one agreement described by a batch "download" operation.
+
+        Returns:
+            "downloaded", "not_modified" or "skipped"
+        """
+        key = agreement_key(op["year_id"], op["sending_id"], op["receiving_id"], op["major_key"])
+        previous = self.manifest.get(key)
+        if not refresh and self.manifest.is_complete(key):
+            return "skipped"
+
+        headers: Dict[str, str] = {}
+        if previous and self.manifest.is_complete(key):
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        url = agreement_url(op["year_id"], op["sending_id"], op["receiving_id"], op["major_key"], self.base_url)
+        response = self._get(url, headers)
+
+        if response.status_code == 304:
+            self.manifest.record({**previous, "checked_at": time.time()})
+            return "not_modified"
+        response.raise_for_status()
+
+        path = save_agreement_json(response.json(), Path(op.get("output_dir", "./json")))
+        self.manifest.record({
+            "key": key,
+            "path": str(path),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "checked_at": time.time(),
+        })
+        return "downloaded"
+
+    def download_all(self, operations: Iterable[Dict[str, Any]], refresh: bool = False) -> DownloadReport:
+        """
+        Fetch every download operation concurrently.
+
+        Args:
+            operations: Batch config operations (non-download ones are ignored)
+            refresh: Re-check completed agreements with conditional requests
+
+        Returns:
+            DownloadReport grouping agreement keys by outcome
+        """
+        ops = [op for op in operations if op.get("type") == "download"]
+        report = DownloadReport()
+        start = time.perf_counter()
+
+        def run(op: Dict[str, Any]):
+            key = agreement_key(op.get("year_id"), op.get("sending_id"), op.get("receiving_id"), op.get("major_key"))
+            if not all(op.get(k) for k in ("year_id", "sending_id", "receiving_id", "major_key")):
+                return key, "failed", "missing required parameters"
+            try:
+                return key, self.fetch(op, refresh=refresh), None
+            except Exception as e:
+                return key, "failed", str(e)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for i, (key, outcome, error) in enumerate(pool.map(run, ops), 1):
+                if outcome == "failed":
+                    report.failed[key] = error
+                    print(f"[{i}/{len(ops)}] ❌ {key}: {error}")
+                else:
+                    getattr(report, outcome).append(key)
+                    print(f"[{i}/{len(ops)}] ✅ {key}: {outcome.replace('_', ' ')}")
+
+        report.elapsed = time.perf_counter() - start
+        return report
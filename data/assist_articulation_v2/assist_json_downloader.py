@@ -1,9 +1,18 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import Any, Dict, Optional
 import json
+import os
 import requests
 import re # Added for slugify
 
+ASSIST_BASE_URL = "https://assist.org"
+
+# Browser-like User-Agent; ASSIST rejects the default python-requests one
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+}
+
 def slugify(name: str) -> str:
     """Convert a string to a URL-friendly slug."""
     name = name.lower().replace('&', 'and')
@@ -11,12 +20,74 @@ def slugify(name: str) -> str:
     name = re.sub(r'[^a-z0-9]+', '_', name)
     return re.sub(r'_+', '_', name).strip('_')
 
+def agreement_key(year_id: str, sending_id: str, receiving_id: str, major_key: str) -> str:
+    """ASSIST agreement key, e.g. ``75/137/to/7/Major/<major_key>``."""
+    return f"{year_id}/{sending_id}/to/{receiving_id}/Major/{major_key}"
+
+def agreement_url(
+    year_id: str,
+    sending_id: str,
+    receiving_id: str,
+    major_key: str,
+    base_url: str = ASSIST_BASE_URL,
+) -> str:
+    """Direct ASSIST API URL for one agreement."""
+    return f"{base_url}/api/articulation/Agreements?Key={agreement_key(year_id, sending_id, receiving_id, major_key)}"
+
+def agreement_output_path(data: Dict[str, Any], out_dir: Path) -> Path:
+    """
+    Path an agreement is saved to: ``out_dir/<sending>/<receiving>/<major>.json``.
+
+    Args:
+        data: Parsed agreement JSON as returned by the ASSIST API
+        out_dir: Base output directory (e.g. "json")
+    """
+    # Extract information for the filename
+    sending_name_raw = data["result"]["sendingInstitution"]
+    receiving_name_raw = data["result"]["receivingInstitution"]
+    major_name_raw = data["result"]["name"]
+
+    # Clean up the names for the filename
+    sending_name_full = sending_name_raw.split('"name":"')[1].split('"')[0] if '"name":"' in sending_name_raw else "Unknown_Sending_Institution"
+    receiving_name_full = receiving_name_raw.split('"name":"')[1].split('"')[0] if '"name":"' in receiving_name_raw else "Unknown_Receiving_Institution"
+
+    # Slugify names for path components
+    sending_slug = slugify(sending_name_full)
+    receiving_slug = slugify(receiving_name_full)
+    major_slug = slugify(major_name_raw)
+
+    # The 'out_dir' parameter serves as the base (e.g., "json")
+    return Path(out_dir) / sending_slug / receiving_slug / f"{major_slug}.json"
+
+def save_agreement_json(data: Dict[str, Any], out_dir: Path) -> Path:
+    """
+    Write an agreement to its nested output path atomically.
+
+    Args:
+        data: Parsed agreement JSON
+        out_dir: Base output directory
+
+    Returns:
+        Path to the saved JSON file
+    """
+    filename = agreement_output_path(data, out_dir)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a sibling temp file and rename, so readers never see partial JSON
+    tmp_path = filename.with_name(f".{filename.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, filename)
+    return filename
+
 def download_agreement_json(
     year_id: str,
     sending_id: str,
     receiving_id: str,
     major_key: str,
     out_dir: Path,
+    session: Optional[requests.Session] = None,
+    base_url: str = ASSIST_BASE_URL,
 ) -> Path:
     """
     Download a single ASSIST agreement JSON using the direct URL pattern.
@@ -27,56 +98,20 @@ def download_agreement_json(
         receiving_id: Receiving institution ID (e.g., "7" for UCSD)
         major_key: Major key/ID (e.g., "0a3e674e-b9e8-4340-6726-08dca807bc66" for CS)
         out_dir: Directory to save the JSON file
+        session: Optional requests.Session to reuse connections across calls
+        base_url: ASSIST host (overridable for testing)
 
     Returns:
         Path to the saved JSON file
     """
-    # Create the URL using the pattern we discovered
-    url = f"https://assist.org/api/articulation/Agreements?Key={year_id}/{sending_id}/to/{receiving_id}/Major/{major_key}"
-    
+    url = agreement_url(year_id, sending_id, receiving_id, major_key, base_url)
+
     print(f"Downloading from: {url}")
-    
-    # Make the request
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    }
-    
-    response = requests.get(url, headers=headers)
+
+    response = (session or requests).get(url, headers=DEFAULT_HEADERS, timeout=60)
     response.raise_for_status()
-    
-    # Parse the JSON data
-    data = response.json()
-    
-    # Create the output directory if it doesn't exist
-    # out_dir.mkdir(parents=True, exist_ok=True) # Will be handled by specific path creation
-    
-    # Extract information for the filename
-    sending_name_raw = data["result"]["sendingInstitution"]
-    receiving_name_raw = data["result"]["receivingInstitution"]
-    major_name_raw = data["result"]["name"]
-    
-    # Clean up the names for the filename
-    sending_name_full = sending_name_raw.split('"name":"')[1].split('"')[0] if '"name":"' in sending_name_raw else "Unknown_Sending_Institution"
-    receiving_name_full = receiving_name_raw.split('"name":"')[1].split('"')[0] if '"name":"' in receiving_name_raw else "Unknown_Receiving_Institution"
-    # major_name_clean = major_name_raw.replace(" ", "_").replace(",", "").replace(".", "") # Old way
 
-    # Slugify names for path components
-    sending_slug = slugify(sending_name_full)
-    receiving_slug = slugify(receiving_name_full)
-    major_slug = slugify(major_name_raw)
+    filename = save_agreement_json(response.json(), Path(out_dir))
 
-    # Create the nested output path
-    # The 'out_dir' parameter now serves as the base (e.g., "json")
-    specific_out_dir = out_dir / sending_slug / receiving_slug
-    specific_out_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create the output filename
-    # filename = out_dir / f"{sending_name_clean}_to_{receiving_name_clean}_{major_name_clean}.json" # Old way
-    filename = specific_out_dir / f"{major_slug}.json"
-    
-    # Save the JSON data
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
-    
     print(f"Saved JSON to {filename}")
-    return filename 
\ No newline at end of file
+    return filename
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Parallel, incremental ASSIST JSON → RAG conversion.
+
+Convert operations from a batch config are fanned out across a process pool.
+Each input is fingerprinted by the SHA-256 of its bytes, its major key and
+source URL, and the converter source (``assist_to_rag.py``). If the
+fingerprint matches the last successful conversion recorded in the manifest
+and the output still exists, the input is skipped. After a small ASSIST
+update only the changed majors are regenerated, and editing the converter
+regenerates everything.
+
+Outputs are written atomically by ``save_rag_json``. Every run writes a
+per-file report (status, seconds, error) next to the manifest.
+
+Example:
+    report = run_conversions(jobs, Path("rag_output/conversion_manifest.json"), workers=8)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+CONVERTER_SOURCE = Path(__file__).resolve().with_name("assist_to_rag.py")
+
+
+@dataclass(frozen=True)
+class ConversionJob:
+    """One ``convert`` operation from a batch config."""
+
+    input_file: str
+    output_file: str
+    major_key: Optional[str] = None
+    source_url: Optional[str] = None
+
+    @classmethod
+    def from_op(cls, op: Dict[str, Any]) -> "ConversionJob":
+        return cls(op["input_file"], op["output_file"], op.get("major_key"), op.get("source_url"))
+
+
+@dataclass
+class ConversionReport:
+    """Per-file outcome of a conversion run."""
+
+    files: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def _count(self, status: str) -> int:
+        return sum(1 for f in self.files if f["status"] == status)
+
+    @property
+    def converted(self) -> int:
+        return self._count("converted")
+
+    @property
+    def skipped(self) -> int:
+        return self._count("skipped")
+
+    @property
+    def failed(self) -> int:
+        return self._count("failed")
+
+    def summary(self) -> str:
+        return (
+            f"{self.converted} converted, {self.skipped} unchanged, {self.failed} failed "
+            f"in {self.elapsed:.1f}s"
+        )
+
+
+def _converter_version() -> str:
+    return hashlib.sha256(CONVERTER_SOURCE.read_bytes()).hexdigest()
+
+
+def job_fingerprint(job: ConversionJob, converter_version: str) -> str:
+    """Content hash deciding whether a job's output is still current."""
+    digest = hashlib.sha256()
+    digest.update(Path(job.input_file).read_bytes())
+    digest.update(json.dumps([job.major_key, job.source_url, converter_version]).encode())
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return ``{output_file: entry}`` from a manifest (empty if missing or unreadable)."""
+    try:
+        with open(path) as f:
+            return json.load(f).get("outputs", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_atomic(data: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _convert(job: ConversionJob) -> Dict[str, Any]:
+    """Worker: convert one file and time it (runs in a child process)."""
+    from assist_to_rag import process_assist_json_file, save_rag_json
+
+    start = time.perf_counter()
+    try:
+        rag_data = process_assist_json_file(
+            job.input_file, manual_source_url=job.source_url, major_key=job.major_key
+        )
+        save_rag_json(rag_data, job.output_file)
+        return {"status": "converted", "seconds": time.perf_counter() - start, "error": None}
+    except Exception as e:
+        return {"status": "failed", "seconds": time.perf_counter() - start, "error": f"{type(e).__name__}: {e}"}
+
+
+def run_conversions(
+    jobs: Iterable[ConversionJob],
+    manifest_path: Path,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> ConversionReport:
+    """
+    Convert every stale job on a process pool and update the manifest.
+
+    Args:
+        jobs: Conversion jobs
+        manifest_path: JSON manifest of the last successful conversions;
+            the run report is written alongside it as ``conversion_report.json``
+        workers: Worker processes (defaults to the CPU count)
+        force: Convert every job regardless of the manifest
+
+    Returns:
+        ConversionReport with one entry per job, in input order
+    """
+    manifest_path = Path(manifest_path)
+    manifest = load_manifest(manifest_path)
+    converter_version = _converter_version()
+    report = ConversionReport()
+    start = time.perf_counter()
+
+    pending: Dict[int, tuple] = {}
+    entries: List[Dict[str, Any]] = []
+    for job in jobs:
+        entry = {"input": job.input_file, "output": job.output_file, "status": None, "seconds": 0.0, "error": None}
+        entries.append(entry)
+        try:
+            fingerprint = job_fingerprint(job, converter_version)
+        except OSError as e:
+            entry.update(status="failed", error=f"{type(e).__name__}: {e}")
+            continue
+
+        previous = manifest.get(job.output_file)
+        if (not force and previous and previous.get("fingerprint") == fingerprint
+                and Path(job.output_file).exists()):
+            entry["status"] = "skipped"
+        else:
+            pending[len(entries) - 1] = (job, fingerprint)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_convert, job): index for index, (job, _) in pending.items()}
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                job, fingerprint = pending[index]
+                result = future.result()
+                entries[index].update(result)
+
+                mark = "✅" if result["status"] == "converted" else "❌"
+                print(f"[{done}/{len(pending)}] {mark} {job.output_file} ({result['seconds']:.2f}s)"
+                      + (f": {result['error']}" if result["error"] else ""))
+
+                if result["status"] == "converted":
+                    manifest[job.output_file] = {
+                        "input": job.input_file,
+                        "fingerprint": fingerprint,
+                        "converted_at": time.time(),
+                    }
+
+    report.files = entries
+    report.elapsed = time.perf_counter() - start
+
+    _write_json_atomic({"converter_version": converter_version, "outputs": manifest}, manifest_path)
+    _write_json_atomic(
+        {"summary": report.summary(), "elapsed": report.elapsed, "files": report.files},
+        manifest_path.with_name("conversion_report.json"),
+    )
+    return report
+
+
+__all__ = ["ConversionJob", "ConversionReport", "job_fingerprint", "load_manifest", "run_conversions"]
@@ -9,6 +9,7 @@ context-rich format suitable for AI applications.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Callable
 from enum import Enum
@@ -656,8 +657,10 @@ def process_assist_json_file(file_path: Union[str, Path], manual_source_url: Opt
     }
 
 def save_rag_json(rag_data: Dict[str, Any], output_path: Union[str, Path]) -> None:
-    """Saves the RAG data to a JSON file."""
+    """Saves the RAG data to a JSON file (atomically: temp file + rename)."""
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(rag_data, f, indent=2) 
\ No newline at end of file
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(rag_data, f, indent=2)
+    os.replace(tmp_path, output_path)
@@ -8,10 +8,11 @@ import json
 import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
-import time
 
 # Import our modules
 from assist_json_downloader import download_agreement_json
+from assist_batch_downloader import BatchDownloader
+from assist_rag_pipeline import ConversionJob, run_conversions
 from assist_to_rag import process_assist_json_file, save_rag_json
 
 
@@ -84,70 +85,50 @@ def batch_command(args: argparse.Namespace) -> None:
         with open(config_path, 'r') as f:
             config = json.load(f)
         
-        # Process each operation
-        total_ops = len(config.get("operations", []))
+        operations = config.get("operations", [])
+        total_ops = len(operations)
         print(f"🔄 Processing {total_ops} operations from config file")
         
-        for i, op in enumerate(config.get("operations", []), 1):
+        # Downloads run first, concurrently, under a shared rate limit; the
+        # manifest lets an interrupted batch resume without re-fetching
+        download_ops = [op for op in operations if op.get("type") == "download"]
+        if download_ops:
+            print(f"\n📥 Downloading {len(download_ops)} agreements "
+                  f"({args.workers} workers, {args.rate} req/s)")
+            downloader = BatchDownloader(
+                Path(args.manifest),
+                rate=args.rate,
+                max_workers=args.workers
+            )
+            report = downloader.download_all(download_ops, refresh=args.refresh)
+            print(f"📥 {report.summary()}")
+        
+        # Conversions fan out across a process pool; unchanged inputs are skipped
+        jobs = []
+        for i, op in enumerate(operations, 1):
             op_type = op.get("type")
             
-            print(f"\n[{i}/{total_ops}] {op_type.upper()} operation:")
-            
             if op_type == "download":
-                # Extract parameters
-                year_id = op.get("year_id")
-                sending_id = op.get("sending_id")
-                receiving_id = op.get("receiving_id")
-                major_key = op.get("major_key")
-                output_dir = Path(op.get("output_dir", "./json"))
-                
-                # Validate parameters
-                if not all([year_id, sending_id, receiving_id, major_key]):
-                    print("❌ Missing required parameters for download operation")
-                    continue
-                
-                # Download the agreement
-                try:
-                    print(f"📥 Downloading agreement: {sending_id} → {receiving_id}, major {major_key}")
-                    json_file = download_agreement_json(
-                        year_id,
-                        sending_id,
-                        receiving_id,
-                        major_key,
-                        output_dir
-                    )
-                    print(f"✅ Downloaded to {json_file}")
-                    
-                    # Add a small delay to avoid hammering the API
-                    time.sleep(1)
-                except Exception as e:
-                    print(f"❌ Error downloading agreement: {e}")
+                continue
             
-            elif op_type == "convert":
-                # Extract parameters
-                input_file = op.get("input_file")
-                output_file = op.get("output_file")
-                major_key = op.get("major_key")  # Extract major_key from the operation
-                source_url = op.get("source_url")
-                
+            if op_type == "convert":
                 # Validate parameters
-                if not all([input_file, output_file]):
-                    print("❌ Missing required parameters for convert operation")
+                if not all([op.get("input_file"), op.get("output_file")]):
+                    print(f"[{i}/{total_ops}] ❌ Missing required parameters for convert operation")
                     continue
-                
-                # Convert the file
-                try:
-                    print(f"🔄 Converting {input_file} to RAG format")
-                    rag_data = process_assist_json_file(
-                        input_file, manual_source_url=source_url, major_key=major_key
-                    )
-                    save_rag_json(rag_data, output_file)
-                    print(f"✅ Converted to {output_file}")
-                except Exception as e:
-                    print(f"❌ Error converting file: {e}")
-            
+                jobs.append(ConversionJob.from_op(op))
             else:
-                print(f"❓ Unknown operation type: {op_type}")
+                print(f"[{i}/{total_ops}] ❓ Unknown operation type: {op_type}")
+        
+        if jobs:
+            print(f"\n🔄 Converting {len(jobs)} files to RAG format")
+            report = run_conversions(
+                jobs,
+                Path(args.conversion_manifest),
+                workers=args.jobs,
+                force=args.force
+            )
+            print(f"🔄 {report.summary()}")
         
         print(f"\n✅ Batch processing complete")
     
@@ -182,6 +163,18 @@ def main() -> None:
     # Batch command
     batch_parser = subparsers.add_parser("batch", help="Process a batch of operations from a config file")
     batch_parser.add_argument("--config", required=True, help="Path to JSON config file")
+    batch_parser.add_argument("--workers", type=int, default=4, help="Concurrent downloads")
+    batch_parser.add_argument("--rate", type=float, default=1.0, help="Maximum ASSIST requests per second")
+    batch_parser.add_argument("--manifest", default="./json/download_manifest.jsonl",
+                              help="JSONL manifest of completed downloads (for resuming)")
+    batch_parser.add_argument("--refresh", action="store_true",
+                              help="Re-check completed downloads with conditional requests")
+    batch_parser.add_argument("--jobs", type=int, default=None,
+                              help="Conversion worker processes (default: CPU count)")
+    batch_parser.add_argument("--conversion-manifest", default="./rag_output/conversion_manifest.json",
+                              help="Manifest of converted inputs; unchanged inputs are skipped")
+    batch_parser.add_argument("--force", action="store_true",
+                              help="Convert every file even if its input is unchanged")
     
     # Parse arguments
     args = parser.parse_args()
@@ -0,0 +1,127 @@
+"""Tests for the concurrent ASSIST downloader against a local stub server."""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+MODULE_DIR = Path(__file__).resolve().parents[1]
+if str(MODULE_DIR) not in sys.path:
+    sys.path.insert(0, str(MODULE_DIR))
+
+from assist_batch_downloader import BatchDownloader, DownloadManifest, TokenBucket  # noqa: E402
+
+# Recorded agreement served for every key (renamed per major so paths differ)
+RECORDED = next((MODULE_DIR / "json").rglob("*.json"))
+
+
+class _StubAssist(BaseHTTPRequestHandler):
+    agreement = json.loads(RECORDED.read_text())
+    requests_seen = []
+    failures = {}  # major_key -> remaining 503 responses
+    lock = threading.Lock()
+
+    def do_GET(self):  # noqa: N802
+        key = parse_qs(urlparse(self.path).query)["Key"][0]
+        major = key.rsplit("/", 1)[-1]
+        etag = f'"{major}-v1"'
+        with self.lock:
+            self.requests_seen.append((key, self.headers.get("If-None-Match")))
+            if self.failures.get(major, 0) > 0:
+                self.failures[major] -= 1
+                self.send_response(503)
+                self.end_headers()
+                return
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        data = json.loads(json.dumps(self.agreement))
+        data["result"]["name"] = f"Major {major}"
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubAssist)
+    _StubAssist.requests_seen = []
+    _StubAssist.failures = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _ops(out_dir, majors):
+    return [
+        {"type": "download", "year_id": "75", "sending_id": "137", "receiving_id": "7",
+         "major_key": major, "output_dir": str(out_dir)}
+        for major in majors
+    ]
+
+
+def _downloader(tmp_path, base_url, **kwargs):
+    kwargs.setdefault("rate", 200)
+    kwargs.setdefault("backoff", 0.01)
+    return BatchDownloader(tmp_path / "manifest.jsonl", base_url=base_url, max_workers=4, **kwargs)
+
+
+def test_downloads_and_resumes(tmp_path, stub_server):
+    ops = _ops(tmp_path / "json", ["m1", "m2", "m3", "m4", "m5"])
+    report = _downloader(tmp_path, stub_server).download_all(ops)
+
+    assert sorted(report.downloaded) == sorted(f"75/137/to/7/Major/m{i}" for i in range(1, 6))
+    assert not report.failed
+    saved = sorted(p.name for p in (tmp_path / "json").rglob("*.json"))
+    assert saved == [f"major_m{i}.json" for i in range(1, 6)]
+
+    # A fresh downloader resumes from the manifest without touching the network
+    seen = len(_StubAssist.requests_seen)
+    report = _downloader(tmp_path, stub_server).download_all(ops)
+    assert len(report.skipped) == 5
+    assert len(_StubAssist.requests_seen) == seen
+
+
+def test_refresh_uses_conditional_requests(tmp_path, stub_server):
+    ops = _ops(tmp_path / "json", ["m1", "m2"])
+    _downloader(tmp_path, stub_server).download_all(ops)
+
+    report = _downloader(tmp_path, stub_server).download_all(ops, refresh=True)
+    assert sorted(report.not_modified) == ["75/137/to/7/Major/m1", "75/137/to/7/Major/m2"]
+    assert all(etag is not None for _, etag in _StubAssist.requests_seen[-2:])
+
+
+def test_retries_transient_errors(tmp_path, stub_server):
+    _StubAssist.failures = {"flaky": 2, "broken": 10}
+    ops = _ops(tmp_path / "json", ["flaky", "broken"])
+    report = _downloader(tmp_path, stub_server, max_retries=3).download_all(ops)
+
+    assert report.downloaded == ["75/137/to/7/Major/flaky"]
+    assert list(report.failed) == ["75/137/to/7/Major/broken"]
+    manifest = DownloadManifest(tmp_path / "manifest.jsonl")
+    assert manifest.is_complete("75/137/to/7/Major/flaky")
+    assert not manifest.is_complete("75/137/to/7/Major/broken")
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 5 / 50 * 0.9
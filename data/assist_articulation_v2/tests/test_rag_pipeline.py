@@ -0,0 +1,70 @@
+"""Tests for the parallel, incremental ASSIST → RAG conversion pipeline."""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+MODULE_DIR = Path(__file__).resolve().parents[1]
+if str(MODULE_DIR) not in sys.path:
+    sys.path.insert(0, str(MODULE_DIR))
+
+from assist_rag_pipeline import ConversionJob, load_manifest, run_conversions  # noqa: E402
+from assist_to_rag import process_assist_json_file  # noqa: E402
+
+RECORDED = sorted((MODULE_DIR / "json").rglob("*.json"))[:3]
+
+
+def _jobs(tmp_path):
+    jobs = []
+    for i, source in enumerate(RECORDED):
+        input_file = tmp_path / "json" / source.name
+        input_file.parent.mkdir(parents=True, exist_ok=True)
+        if not input_file.exists():
+            shutil.copy(source, input_file)
+        jobs.append(ConversionJob(str(input_file), str(tmp_path / "rag_output" / source.name), f"key-{i}"))
+    return jobs
+
+
+def test_converts_then_skips_unchanged(tmp_path):
+    jobs = _jobs(tmp_path)
+    manifest_path = tmp_path / "rag_output" / "conversion_manifest.json"
+
+    report = run_conversions(jobs, manifest_path, workers=2)
+    assert report.converted == 3 and report.failed == 0
+    for job in jobs:
+        expected = process_assist_json_file(job.input_file, major_key=job.major_key)
+        assert json.loads(Path(job.output_file).read_text()) == expected
+    assert set(load_manifest(manifest_path)) == {job.output_file for job in jobs}
+
+    report = run_conversions(jobs, manifest_path, workers=2)
+    assert report.skipped == 3 and report.converted == 0
+
+    # Only the changed input is regenerated
+    changed = Path(jobs[1].input_file)
+    data = json.loads(changed.read_text())
+    data["result"]["name"] += " (updated)"
+    changed.write_text(json.dumps(data))
+    report = run_conversions(jobs, manifest_path, workers=2)
+    assert [f["status"] for f in report.files] == ["skipped", "converted", "skipped"]
+
+    # A deleted output is regenerated even though its input is unchanged
+    Path(jobs[0].output_file).unlink()
+    report = run_conversions(jobs, manifest_path, workers=2)
+    assert [f["status"] for f in report.files] == ["converted", "skipped", "skipped"]
+
+
+def test_failures_are_reported(tmp_path):
+    jobs = _jobs(tmp_path)
+    Path(jobs[0].input_file).write_text("{not json")
+    jobs.append(ConversionJob(str(tmp_path / "missing.json"), str(tmp_path / "rag_output" / "missing.json")))
+    manifest_path = tmp_path / "rag_output" / "conversion_manifest.json"
+
+    report = run_conversions(jobs, manifest_path, workers=2)
+    statuses = [f["status"] for f in report.files]
+    assert statuses == ["failed", "converted", "converted", "failed"]
+    assert all(f["error"] for f in report.files if f["status"] == "failed")
+    assert jobs[0].output_file not in load_manifest(manifest_path)
+
+    saved = json.loads((tmp_path / "rag_output" / "conversion_report.json").read_text())
+    assert [f["status"] for f in saved["files"]] == statuses
@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+Incremental build of TransferAI's derived data, from raw sources to FAISS stores.
+
+Every derived artifact (parsed catalogue, chunk JSONL files, vector stores and
+the BM25 pickle) is declared below with its inputs and the command that
+produces it. ``python -m data.build`` then works like ``make``, with content
+hashes instead of timestamps:
+
+- An artifact's fingerprint is the SHA-256 of its input files (the producer
+  script is one of them) and its command. It is rebuilt only when the
+  fingerprint differs from the manifest or an output is missing.
+- Dependencies are inferred: an artifact depends on whichever artifact
+  produces one of its inputs. Stale decisions are made after upstream stages
+  finish, so a regenerated chunk file with identical bytes does not trigger
+  re-embedding.
+- Independent stages run in parallel on a thread pool (each stage is a
+  subprocess).
+
+Results go to ``data/build_manifest.json``. Tools read it through
+``artifact_status`` to check at startup that a cache was built from the
+current inputs. File hashes are cached in the manifest by size and mtime,
+so these checks only re-hash files that changed.
+
+Usage:
+    python -m data.build                   # build everything that is stale
+    python -m data.build course_faiss -j 2 # one target and its upstream stages
+    python -m data.build --dry-run         # show what would run
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MANIFEST = REPO_ROOT / "data" / "build_manifest.json"
+MANIFEST_VERSION = 1
+
+_GEN = "data/vector_db/generation_scripts"
+_CHUNKS = "data/vector_db/chunk_output"
+_STORES = "data/vector_db/vectorstores"
+_CHUNK_IO = f"{_GEN}/chunk_io.py"
+_ARTIC_RAG = "data/assist_articulation_v2/rag_output/santa_monica_college/university_of_california_san_diego"
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """
+    One build target.
+
+    Attributes:
+        name: Target name used on the command line and in the manifest
+        inputs: Repo-relative files, directories or glob patterns
+        outputs: Repo-relative files or directories the command writes
+        command: Producer command run from the repo root; ``{python}`` is
+            replaced by the current interpreter
+    """
+
+    name: str
+    inputs: Sequence[str]
+    outputs: Sequence[str]
+    command: Sequence[str]
+
+
+def _vectorstore(name: str, chunk_file: str) -> Artifact:
+    return Artifact(
+        name=name,
+        inputs=(f"{_CHUNKS}/{chunk_file}", f"{_GEN}/build_vectorstore.py",
+                f"{_GEN}/incremental_index.py", f"{_GEN}/embedding_engine.py", _CHUNK_IO),
+        outputs=(f"{_STORES}/{name}",),
+        command=("{python}", f"{_GEN}/build_vectorstore.py",
+                 "--input-path", f"{_CHUNKS}/{chunk_file}", "--output-dir", f"{_STORES}/{name}"),
+    )
+
+
+ARTIFACTS: List[Artifact] = [
+    Artifact(
+        "parsed_programs",
+        inputs=("data/SMC_catalog/catalog_cleaned.txt", "data/SMC_catalog/parse_catalog.py"),
+        outputs=("data/SMC_catalog/parsed_programs",),
+        command=("{python}", "data/SMC_catalog/parse_catalog.py"),
+    ),
+    Artifact(
+        "course_chunks",
+        inputs=("data/SMC_catalog/parsed_programs/*.json", f"{_GEN}/generate_course_chunks.py", _CHUNK_IO),
+        outputs=(f"{_CHUNKS}/course_chunks.jsonl",),
+        command=("{python}", f"{_GEN}/generate_course_chunks.py"),
+    ),
+    Artifact(
+        "section_chunks",
+        inputs=("data/SMC_catalog/parsed_programs/*.json", f"{_GEN}/generate_section_chunks.py", _CHUNK_IO),
+        outputs=(f"{_CHUNKS}/section_chunks.jsonl",),
+        command=("{python}", f"{_GEN}/generate_section_chunks.py"),
+    ),
+    Artifact(
+        "smc_faq_chunks",
+        inputs=("data/SMC_FAQs/*_faq_rag.json", f"{_GEN}/generate_smc_faq_chunks.py", _CHUNK_IO),
+        outputs=(f"{_CHUNKS}/smc_faq_chunks.jsonl",),
+        command=("{python}", f"{_GEN}/generate_smc_faq_chunks.py"),
+    ),
+    Artifact(
+        "transfer_terms_chunks",
+        inputs=("data/transfer_term_glossary/transfer_terms.json", f"{_GEN}/generate_transfer_term_chunks.py", _CHUNK_IO),
+        outputs=(f"{_CHUNKS}/transfer_terms_chunks.jsonl",),
+        command=("{python}", f"{_GEN}/generate_transfer_term_chunks.py"),
+    ),
+    Artifact(
+        "ucsd_transfer_timeline_chunks",
+        inputs=("data/UCSD_transfer_timeline/ucsd_transfer_application_timeline.json",
+                f"{_GEN}/generate_ucsd_timeline_chunks.py", _CHUNK_IO),
+        outputs=(f"{_CHUNKS}/ucsd_transfer_timeline_chunks.jsonl",),
+        command=("{python}", f"{_GEN}/generate_ucsd_timeline_chunks.py"),
+    ),
+    Artifact(
+        "articulation_chunks",
+        inputs=(f"{_ARTIC_RAG}/*.json", f"{_GEN}/generate_articulation_chunks.py", _CHUNK_IO),
+        outputs=(f"{_CHUNKS}/course_mappings_chunks.jsonl",
+                 f"{_CHUNKS}/requirements_chunks.jsonl",
+                 f"{_CHUNKS}/program_info_chunks.jsonl"),
+        command=("{python}", f"{_GEN}/generate_articulation_chunks.py", "--mode", "split"),
+    ),
+    _vectorstore("course_faiss", "course_chunks.jsonl"),
+    _vectorstore("section_faiss", "section_chunks.jsonl"),
+    _vectorstore("smc_faq_faiss", "smc_faq_chunks.jsonl"),
+    _vectorstore("transfer_terms_faiss", "transfer_terms_chunks.jsonl"),
+    _vectorstore("ucsd_transfer_timeline_faiss", "ucsd_transfer_timeline_chunks.jsonl"),
+    _vectorstore("assist_artic_course_mappings_faiss", "course_mappings_chunks.jsonl"),
+    _vectorstore("assist_artic_requirements_faiss", "requirements_chunks.jsonl"),
+    _vectorstore("assist_artic_program_info_faiss", "program_info_chunks.jsonl"),
+    Artifact(
+        "bm25_cache",
+        inputs=("data/SMC_catalog/parsed_programs/*.json",
+                "tools/catalog_store.py", "tools/course_search_tool.py"),
+        outputs=("data/vector_db/bm25_cache.pkl",),
+        command=("{python}", "-c",
+                 "from tools.course_search_tool import rebuild_bm25_cache; rebuild_bm25_cache()"),
+    ),
+]
+
+
+# ---------------------------------------------------------------------------
+# Content hashing
+# ---------------------------------------------------------------------------
+
+
+class FileHasher:
+    """
+    SHA-256 of files, memoised by (size, mtime_ns).
+
+    The memo is persisted in the manifest, so repeated builds and startup
+    checks only read files whose size or mtime changed.
+    """
+
+    def __init__(self, root: Path, cache: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.root = Path(root)
+        self.cache: Dict[str, Dict[str, Any]] = dict(cache or {})
+        self._lock = threading.Lock()
+
+    def file_digest(self, rel_path: str) -> str:
+        stat = (self.root / rel_path).stat()
+        with self._lock:
+            cached = self.cache.get(rel_path)
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            return cached["sha256"]
+
+        digest = hashlib.sha256()
+        with open(self.root / rel_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+        with self._lock:
+            self.cache[rel_path] = entry
+        return entry["sha256"]
+
+    def expand(self, pattern: str) -> List[str]:
+        """Repo-relative files matched by a file, directory or glob pattern."""
+        path = self.root / pattern
+        if any(c in pattern for c in "*?["):
+            matches = sorted(p for p in self.root.glob(pattern) if p.is_file())
+        elif path.is_dir():
+            matches = sorted(
+                p for p in path.rglob("*")
+                if p.is_file() and "__pycache__" not in p.parts and not p.name.startswith(".")
+            )
+        else:
+            matches = [path] if path.is_file() else []
+        return [p.relative_to(self.root).as_posix() for p in matches]
+
+    def digests(self, patterns: Iterable[str]) -> Dict[str, str]:
+        """``{relative path: sha256}`` for every file matched by the patterns."""
+        return {rel: self.file_digest(rel) for pattern in patterns for rel in self.expand(pattern)}
+
+
+def fingerprint(artifact: Artifact, input_digests: Dict[str, str]) -> str:
+    """Hash deciding whether an artifact's outputs are current."""
+    payload = json.dumps({"inputs": sorted(input_digests.items()), "command": list(artifact.command)})
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+
+def load_manifest(path: Path = DEFAULT_MANIFEST) -> Dict[str, Any]:
+    """Return the build manifest (an empty one if missing or unreadable)."""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "artifacts": {}, "files": {}}
+
+
+def _write_manifest(manifest: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _find(name: str, artifacts: Sequence[Artifact]) -> Artifact:
+    for artifact in artifacts:
+        if artifact.name == name:
+            return artifact
+    raise KeyError(f"unknown build target: {name}")
+
+
+def artifact_status(
+    name: str,
+    manifest_path: Path = DEFAULT_MANIFEST,
+    root: Path = REPO_ROOT,
+    artifacts: Sequence[Artifact] = ARTIFACTS,
+) -> str:
+    """
+    Check whether an artifact was built from the current inputs.
+
+    Meant for tools validating their caches at startup.
+
+    Returns:
+        "current", "stale" (inputs changed or an output is missing) or
+        "unknown" (never recorded in the manifest)
+    """
+    manifest = load_manifest(manifest_path)
+    entry = manifest["artifacts"].get(name)
+    if not entry:
+        return "unknown"
+    artifact = _find(name, artifacts)
+    if not all((Path(root) / out).exists() for out in artifact.outputs):
+        return "stale"
+    hasher = FileHasher(root, manifest.get("files"))
+    current = fingerprint(artifact, hasher.digests(artifact.inputs))
+    return "current" if current == entry.get("fingerprint") else "stale"
+
+
+def record_artifact(
+    name: str,
+    manifest_path: Path = DEFAULT_MANIFEST,
+    root: Path = REPO_ROOT,
+    artifacts: Sequence[Artifact] = ARTIFACTS,
+) -> None:
+    """
+    Mark an artifact as built from the current inputs.
+
+    For tools that rebuild a cache themselves, so the next startup check
+    passes without running the build.
+    """
+    artifact = _find(name, artifacts)
+    manifest = load_manifest(manifest_path)
+    hasher = FileHasher(root, manifest.get("files"))
+    input_digests = hasher.digests(artifact.inputs)
+    manifest["artifacts"][name] = {
+        "fingerprint": fingerprint(artifact, input_digests),
+        "inputs": input_digests,
+        "outputs": hasher.digests(artifact.outputs),
+        "built_at": time.time(),
+        "seconds": None,
+    }
+    manifest["files"] = hasher.cache
+    _write_manifest(manifest, Path(manifest_path))
+
+
+# ---------------------------------------------------------------------------
+# Graph and scheduling
+# ---------------------------------------------------------------------------
+
+
+def _produces(output: str, pattern: str) -> bool:
+    """True if an input pattern reads from (or inside) an output path."""
+    return (pattern == output or pattern.startswith(output.rstrip("/") + "/")
+            or fnmatch.fnmatch(output, pattern))
+
+
+def dependency_graph(artifacts: Sequence[Artifact]) -> Dict[str, Set[str]]:
+    """``{artifact: upstream artifacts}`` inferred from inputs and outputs."""
+    graph: Dict[str, Set[str]] = {a.name: set() for a in artifacts}
+    for consumer in artifacts:
+        for producer in artifacts:
+            if producer is consumer:
+                continue
+            if any(_produces(out, pattern) for out in producer.outputs for pattern in consumer.inputs):
+                graph[consumer.name].add(producer.name)
+    return graph
+
+
+def _select(targets: Optional[Iterable[str]], graph: Dict[str, Set[str]]) -> Set[str]:
+    """The targets plus everything upstream of them."""
+    selected: Set[str] = set()
+    stack = list(targets) if targets else list(graph)
+    while stack:
+        name = stack.pop()
+        if name not in graph:
+            raise KeyError(f"unknown build target: {name}")
+        if name not in selected:
+            selected.add(name)
+            stack.extend(graph[name])
+    return selected
+
+
+@dataclass
+class BuildReport:
+    """Outcome of a build."""
+
+    built: List[str] = field(default_factory=list)
+    up_to_date: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    blocked: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.blocked
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.built)} built, {len(self.up_to_date)} up to date, "
+            f"{len(self.failed)} failed, {len(self.blocked)} blocked in {self.elapsed:.1f}s"
+        )
+
+
+def build(
+    targets: Optional[Iterable[str]] = None,
+    *,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    dry_run: bool = False,
+    root: Path = REPO_ROOT,
+    manifest_path: Path = DEFAULT_MANIFEST,
+    artifacts: Sequence[Artifact] = ARTIFACTS,
+) -> BuildReport:
+    """
+    Bring the selected artifacts up to date.
+
+    Args:
+        targets: Artifact names (defaults to all); upstream stages are included
+        jobs: Stages run concurrently (defaults to min(4, CPU count))
+        force: Rebuild every selected artifact
+        dry_run: Only report what is stale; stages downstream of a stale one
+            are listed as stale too, though an identical rebuild would skip them
+        root: Repository root the paths are relative to
+        manifest_path: Build manifest to read and update
+        artifacts: Artifact declarations
+
+    Returns:
+        BuildReport grouping artifact names by outcome
+    """
+    root = Path(root)
+    manifest_path = Path(manifest_path)
+    graph = dependency_graph(artifacts)
+    selected = _select(targets, graph)
+    by_name = {a.name: a for a in artifacts}
+    manifest = load_manifest(manifest_path)
+    hasher = FileHasher(root, manifest.get("files"))
+    manifest_lock = threading.Lock()
+    report = BuildReport()
+    start = time.perf_counter()
+
+    def stale(artifact: Artifact, input_digests: Dict[str, str]) -> bool:
+        entry = manifest["artifacts"].get(artifact.name)
+        return (force or not entry
+                or entry.get("fingerprint") != fingerprint(artifact, input_digests)
+                or not all((root / out).exists() for out in artifact.outputs))
+
+    if dry_run:
+        rebuilt: Set[str] = set()
+        for name in _topological(selected, graph):
+            artifact = by_name[name]
+            if graph[name] & rebuilt or stale(artifact, hasher.digests(artifact.inputs)):
+                rebuilt.add(name)
+                report.built.append(name)
+                print(f"🔨 {name}: stale")
+            else:
+                report.up_to_date.append(name)
+                print(f"✅ {name}: up to date")
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def run(artifact: Artifact) -> str:
+        """Worker: rebuild one artifact if stale and record it."""
+        input_digests = hasher.digests(artifact.inputs)
+        if not stale(artifact, input_digests):
+            return "up_to_date"
+
+        command = [sys.executable if arg == "{python}" else arg for arg in artifact.command]
+        stage_start = time.perf_counter()
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        if result.returncode != 0:
+            tail = "\n".join((result.stderr or result.stdout).strip().splitlines()[-20:])
+            raise RuntimeError(f"exit status {result.returncode}\n{tail}")
+        missing = [out for out in artifact.outputs if not (root / out).exists()]
+        if missing:
+            raise RuntimeError(f"command did not produce {', '.join(missing)}")
+
+        with manifest_lock:
+            manifest["artifacts"][artifact.name] = {
+                "fingerprint": fingerprint(artifact, input_digests),
+                "inputs": input_digests,
+                "outputs": hasher.digests(artifact.outputs),
+                "built_at": time.time(),
+                "seconds": round(time.perf_counter() - stage_start, 3),
+            }
+            manifest["files"] = dict(hasher.cache)
+            _write_manifest(manifest, manifest_path)
+        return "built"
+
+    remaining = set(selected)
+    done: Set[str] = set()
+    running: Dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=jobs or min(4, os.cpu_count() or 1)) as pool:
+        while remaining or running:
+            for name in sorted(remaining):
+                upstream = graph[name] & selected
+                if upstream & (set(report.failed) | set(report.blocked)):
+                    remaining.discard(name)
+                    report.blocked.append(name)
+                    print(f"⏭️  {name}: blocked by a failed upstream stage")
+                elif upstream <= done:
+                    remaining.discard(name)
+                    running[pool.submit(run, by_name[name])] = name
+            if not running:
+                if remaining:
+                    raise RuntimeError(f"dependency cycle among: {', '.join(sorted(remaining))}")
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    report.failed[name] = str(e)
+                    print(f"❌ {name}: {e}")
+                    continue
+                done.add(name)
+                getattr(report, outcome).append(name)
+                print(f"{'🔨' if outcome == 'built' else '✅'} {name}: {outcome.replace('_', ' ')}")
+
+    with manifest_lock:
+        manifest["files"] = dict(hasher.cache)
+        _write_manifest(manifest, manifest_path)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _topological(selected: Set[str], graph: Dict[str, Set[str]]) -> List[str]:
+    order: List[str] = []
+    visited: Set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in visited:
+            return
+        visited.add(name)
+        for upstream in sorted(graph[name] & selected):
+            visit(upstream)
+        order.append(name)
+
+    for name in sorted(selected):
+        visit(name)
+    return order
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Incrementally build TransferAI's derived data artifacts.")
+    parser.add_argument("targets", nargs="*", help="Artifacts to build (default: all).")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Stages to run in parallel.")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date.")
+    parser.add_argument("--dry-run", action="store_true", help="Show stale artifacts without building.")
+    parser.add_argument("--list", action="store_true", help="List artifacts and their dependencies.")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST), help="Build manifest path.")
+    args = parser.parse_args()
+
+    if args.list:
+        graph = dependency_graph(ARTIFACTS)
+        for name in _topological(set(graph), graph):
+            upstream = ", ".join(sorted(graph[name])) or "-"
+            print(f"{name:<36} <- {upstream}")
+        return
+
+    report = build(args.targets or None, jobs=args.jobs, force=args.force,
+                   dry_run=args.dry_run, manifest_path=Path(args.manifest))
+    print(f"\n{report.summary()}")
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Async HTTP helpers shared by the RateMyProfessors and SMC FAQ scrapers.
+
+* ``ResponseCache`` stores raw responses on disk, one JSON file per request
+  under ``<root>/<namespace>/<hash[:2]>/<hash>.json``. Parsing can be re-run
+  from it without touching the network.
+* ``AsyncFetcher`` wraps a pooled ``httpx.AsyncClient``. A semaphore bounds
+  concurrency, an optional shared rate limit applies, transient failures
+  (connection errors, 429, 5xx) are retried with exponential backoff, and
+  ``Retry-After`` is honoured. The cache sits in front.
+* ``paginate`` walks cursor-paginated results in order. The next page is
+  requested while the current one is processed. When cursors are predictable
+  (Relay's ``arrayconnection:<offset>``), several pages are kept in flight.
+
+Example:
+    async with AsyncFetcher(ResponseCache(Path("raw_cache")), namespace="rmp", concurrency=4) as fetcher:
+        response = await fetcher.post_json(url, {"query": query, "variables": variables})
+        data = response.json()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+# Status codes worth retrying
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """A request failed for good (after retries, or a cache miss when offline)."""
+
+
+@dataclass
+class Response:
+    """A raw HTTP response, live or replayed from the cache."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    text: str
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise FetchError(f"HTTP {self.status} for {self.url}")
+
+
+def request_key(method: str, url: str, body: Any = None) -> str:
+    """SHA-256 identifying a request by method, URL and (canonical JSON) body."""
+    canonical = json.dumps([method.upper(), url, body], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Raw responses on disk, grouped by namespace and keyed by :func:`request_key`."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, namespace: str, key: str) -> Path:
+        return self.root / namespace / key[:2] / f"{key}.json"
+
+    def get(self, namespace: str, method: str, url: str, body: Any = None) -> Optional[Response]:
+        path = self._path(namespace, request_key(method, url, body))
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None  # missing, or torn by an interrupted write
+        return Response(url, entry["status"], entry["headers"], entry["text"], from_cache=True)
+
+    def put(self, namespace: str, method: str, url: str, body: Any, response: Response) -> None:
+        """Store a response atomically (temporary file, then rename)."""
+        path = self._path(namespace, request_key(method, url, body))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "request": {"method": method.upper(), "url": url, "body": body},
+            "status": response.status,
+            "headers": response.headers,
+            "text": response.text,
+            "fetched_at": time.time(),
+        }
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def entries(self, namespace: str) -> Iterator[Dict[str, Any]]:
+        """Every cached entry of a namespace (request, status, headers, text, fetched_at)."""
+        for path in sorted((self.root / namespace).glob("*/*.json")):
+            try:
+                yield json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+
+class AsyncRateLimiter:
+    """Space requests at least ``1 / rate`` seconds apart across all tasks."""
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass
+class FetchStats:
+    """Network requests made, responses served from the cache, and retries."""
+
+    requests: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+
+    def summary(self) -> str:
+        return f"{self.requests} requests, {self.cache_hits} cache hits, {self.retries} retries"
+
+
+class AsyncFetcher:
+    """Pooled async HTTP client with bounded concurrency, retries and a response cache."""
+
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        *,
+        namespace: str = "default",
+        concurrency: int = 4,
+        rate: Optional[float] = None,
+        max_retries: int = 4,
+        backoff: float = 1.0,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+        refresh: bool = False,
+        offline: bool = False,
+    ):
+        """
+        Args:
+            cache: Raw response cache (``None`` disables caching)
+            namespace: Cache namespace for this fetcher's responses
+            concurrency: Requests in flight at once (also the connection pool size)
+            rate: Requests per second across all tasks (``None`` = unlimited)
+            max_retries: Retries per request after the first attempt
+            backoff: Base delay in seconds, doubled on each retry
+            timeout: Per-request timeout in seconds
+            headers: Headers sent with every request
+            refresh: Ignore cached responses (fresh ones are still stored)
+            offline: Serve from the cache only; a miss raises ``FetchError``
+        """
+        self.cache = cache
+        self.namespace = namespace
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.refresh = refresh
+        self.offline = offline
+        self.stats = FetchStats()
+        self._limiter = AsyncRateLimiter(rate) if rate else None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._client.aclose()
+        self._client = None
+
+    async def get(self, url: str) -> Response:
+        return await self.request("GET", url)
+
+    async def post_json(self, url: str, payload: Any) -> Response:
+        return await self.request("POST", url, payload)
+
+    async def request(self, method: str, url: str, body: Any = None) -> Response:
+        """Return the cached response if there is one, else fetch (and cache a 200)."""
+        if self.cache is not None and not self.refresh:
+            cached = self.cache.get(self.namespace, method, url, body)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+        if self.offline:
+            raise FetchError(f"not cached (offline): {method} {url}")
+
+        async with self._semaphore:
+            response = await self._send(method, url, body)
+        if self.cache is not None and response.status == 200:
+            self.cache.put(self.namespace, method, url, body, response)
+        return response
+
+    async def _send(self, method: str, url: str, body: Any) -> Response:
+        """Rate-limited request with retry and exponential backoff."""
+        if self._client is None:
+            raise RuntimeError("AsyncFetcher must be used as an async context manager")
+        for attempt in range(self.max_retries + 1):
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            self.stats.requests += 1
+            try:
+                raw = await self._client.request(method, url, json=body)
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                if attempt == self.max_retries:
+                    raise FetchError(f"{method} {url}: {e}") from e
+                self.stats.retries += 1
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            if raw.status_code in RETRYABLE_STATUS and attempt < self.max_retries:
+                retry_after = raw.headers.get("Retry-After", "")
+                self.stats.retries += 1
+                await asyncio.sleep(float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt)
+                continue
+            return Response(url, raw.status_code, dict(raw.headers), raw.text)
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+
+@dataclass
+class Page:
+    """One page of cursor-paginated results."""
+
+    items: List[Any]
+    has_next: bool
+    end_cursor: Optional[str]
+    cursor: Optional[str] = None  # cursor the page was requested with (``None`` = first page)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+def relay_cursor_predictor(page_size: int) -> Callable[[Optional[str]], Optional[str]]:
+    """
+    Predict Relay ``arrayconnection:<offset>`` cursors.
+
+    The returned function maps the cursor a page is requested with to that page's
+    end cursor, assuming a full page. It returns ``None`` for opaque cursors.
+    """
+    def predict(cursor: Optional[str]) -> Optional[str]:
+        if cursor is None:
+            offset = -1
+        else:
+            try:
+                prefix, _, number = base64.b64decode(cursor).decode("ascii").rpartition(":")
+                offset = int(number)
+            except (ValueError, UnicodeDecodeError):
+                return None
+            if prefix != "arrayconnection":
+                return None
+        return base64.b64encode(f"arrayconnection:{offset + page_size}".encode("ascii")).decode("ascii")
+    return predict
+
+
+async def paginate(
+    fetch_page: Callable[[Optional[str]], Awaitable[Page]],
+    *,
+    prefetch: int = 1,
+    predict: Optional[Callable[[Optional[str]], Optional[str]]] = None,
+) -> AsyncIterator[Page]:
+    """
+    Yield pages in order, requesting ahead of the consumer.
+
+    The page after the one being yielded is always already in flight. With
+    *predict* (see :func:`relay_cursor_predictor`), up to *prefetch* pages are
+    requested speculatively. A page whose request cursor turns out to differ
+    from the previous page's real end cursor is discarded and refetched.
+
+    Args:
+        fetch_page: Coroutine function taking a cursor (``None`` = first page)
+        prefetch: Pages kept in flight ahead of the consumer
+        predict: Maps a request cursor to the end cursor that page should have
+    """
+    pending: Deque[Tuple[Optional[str], asyncio.Future]] = deque()
+
+    def schedule(cursor: Optional[str]) -> None:
+        pending.append((cursor, asyncio.ensure_future(fetch_page(cursor))))
+
+    async def discard_pending() -> None:
+        tasks = [task for _, task in pending]
+        pending.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    schedule(None)
+    try:
+        while pending:
+            cursor, task = pending.popleft()
+            page = await task
+            page.cursor = cursor
+
+            if not page.has_next or not page.end_cursor:
+                await discard_pending()
+                yield page
+                return
+
+            if pending and pending[0][0] != page.end_cursor:
+                await discard_pending()  # speculation went wrong; resume from the real cursor
+            if not pending:
+                schedule(page.end_cursor)
+            if predict is not None:
+                while len(pending) < max(prefetch, 1):
+                    guess = predict(pending[-1][0])
+                    if guess is None:
+                        break
+                    schedule(guess)
+            yield page
+    finally:
+        await discard_pending()
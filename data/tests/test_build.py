@@ -0,0 +1,122 @@
+"""Tests for the incremental data build (``data.build``)."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from data.build import (  # noqa: E402
+    ARTIFACTS,
+    Artifact,
+    artifact_status,
+    build,
+    dependency_graph,
+    load_manifest,
+    record_artifact,
+)
+
+# Copies its input upper-cased and appends a line to a run log
+UPPER = (
+    "import sys, pathlib; src, dst = map(pathlib.Path, sys.argv[1:3]); "
+    "dst.write_text(src.read_text().upper()); "
+    "open('runs.log', 'a').write(dst.name + '\\n')"
+)
+
+
+def _stage(name, src, dst):
+    return Artifact(name, inputs=(src,), outputs=(dst,), command=("{python}", "-c", UPPER, src, dst))
+
+
+def _project(tmp_path):
+    (tmp_path / "raw.txt").write_text("hello\n")
+    (tmp_path / "other.txt").write_text("other\n")
+    return [
+        _stage("a", "raw.txt", "a.txt"),
+        _stage("b", "a.txt", "b.txt"),
+        _stage("c", "other.txt", "c.txt"),
+    ]
+
+
+def _runs(tmp_path):
+    log = tmp_path / "runs.log"
+    return log.read_text().split() if log.exists() else []
+
+
+def _build(tmp_path, artifacts, **kwargs):
+    return build(root=tmp_path, manifest_path=tmp_path / "manifest.json", artifacts=artifacts, jobs=2, **kwargs)
+
+
+def test_dependencies_are_inferred_from_inputs_and_outputs(tmp_path):
+    graph = dependency_graph(_project(tmp_path))
+    assert graph == {"a": set(), "b": {"a"}, "c": set()}
+
+
+def test_builds_once_then_skips_unchanged(tmp_path):
+    artifacts = _project(tmp_path)
+
+    report = _build(tmp_path, artifacts)
+    assert report.ok and sorted(report.built) == ["a", "b", "c"]
+    assert (tmp_path / "b.txt").read_text() == "HELLO\n"
+
+    report = _build(tmp_path, artifacts)
+    assert report.built == [] and sorted(report.up_to_date) == ["a", "b", "c"]
+    assert len(_runs(tmp_path)) == 3
+
+
+def test_only_stale_stages_rebuild(tmp_path):
+    artifacts = _project(tmp_path)
+    _build(tmp_path, artifacts)
+
+    (tmp_path / "other.txt").write_text("changed\n")
+    report = _build(tmp_path, artifacts)
+    assert report.built == ["c"]
+
+    # Rewriting an input with identical content leaves everything current
+    (tmp_path / "raw.txt").write_text("hello\n")
+    assert _build(tmp_path, artifacts).built == []
+
+    # A changed input whose output is byte-identical stops the rebuild there
+    (tmp_path / "raw.txt").write_text("HELLO\n")
+    assert _build(tmp_path, artifacts).built == ["a"]
+
+
+def test_targets_include_upstream_stages(tmp_path):
+    report = _build(tmp_path, _project(tmp_path), targets=["b"])
+    assert report.built == ["a", "b"]
+    assert not (tmp_path / "c.txt").exists()
+
+
+def test_failure_blocks_downstream(tmp_path):
+    artifacts = _project(tmp_path)
+    artifacts[0] = Artifact("a", ("raw.txt",), ("a.txt",), ("{python}", "-c", "raise SystemExit(3)"))
+
+    report = _build(tmp_path, artifacts)
+    assert "a" in report.failed and report.blocked == ["b"] and report.built == ["c"]
+    assert not report.ok
+
+
+def test_artifact_status_tracks_inputs(tmp_path):
+    artifacts = _project(tmp_path)
+    manifest = tmp_path / "manifest.json"
+    status = lambda name: artifact_status(name, manifest, tmp_path, artifacts)  # noqa: E731
+
+    assert status("a") == "unknown"
+    _build(tmp_path, artifacts)
+    assert status("a") == "current"
+
+    (tmp_path / "raw.txt").write_text("new\n")
+    assert status("a") == "stale"
+
+    record_artifact("a", manifest, tmp_path, artifacts)
+    assert status("a") == "current"
+    assert "raw.txt" in load_manifest(manifest)["files"]
+
+
+def test_declared_graph_is_acyclic():
+    report = build(dry_run=True, manifest_path=Path("/nonexistent/manifest.json"), artifacts=ARTIFACTS)
+    assert len(report.built) == len(ARTIFACTS)
+    graph = dependency_graph(ARTIFACTS)
+    assert graph["course_faiss"] == {"course_chunks"}
+    assert graph["course_chunks"] == {"parsed_programs"}
@@ -0,0 +1,60 @@
+"""Tests for the SMC catalog parser's precompiled fast paths and parallel program parsing."""
+
+import re
+import sys
+from pathlib import Path
+
+CATALOG_DIR = Path(__file__).resolve().parents[1] / "SMC_catalog"
+if str(CATALOG_DIR) not in sys.path:
+    sys.path.insert(0, str(CATALOG_DIR))
+
+from parse_catalog import SMCCatalogParser  # noqa: E402
+
+CATALOG = (CATALOG_DIR / "catalog_cleaned.txt").read_text(encoding="utf-8")
+
+
+def _reference_fix_hyphenation(parser, text):
+    """The per-call regex version the class constants replaced."""
+    text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+    text = re.sub(r'(\w+)-\s+([a-z]\w+)', parser._fix_hyphen_with_space, text)
+    for pattern, replacement in SMCCatalogParser.HYPHENATION_FIXES.items():
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    for prefix in SMCCatalogParser.HYPHEN_PREFIXES:
+        text = re.sub(rf'\b{prefix}-\s+([a-z]\w+)', rf'{prefix}\1', text, flags=re.IGNORECASE)
+    return text
+
+
+def test_fix_hyphenation_matches_plain_substitution(tmp_path):
+    parser = SMCCatalogParser(str(tmp_path / "catalog.txt"), str(tmp_path), quiet=True)
+    samples = [
+        CATALOG[:200_000],
+        "Enter- tainment and ENVIRON- MENT; pre- requisite, Co- operative, xpre- fix, stu- dents stu- dents",
+        "no hyphens at all",
+    ]
+    for text in samples:
+        assert parser.fix_hyphenation(text) == _reference_fix_hyphenation(parser, text)
+
+
+def test_parallel_parse_matches_serial(tmp_path, capsys):
+    # The first four program sections and the small header between them
+    starts = [m.start() for m in re.finditer(r"\n=", CATALOG)]
+    catalog = tmp_path / "catalog.txt"
+    catalog.write_text(CATALOG[:starts[4]] + "\n", encoding="utf-8")
+
+    results = {}
+    for workers in (1, 2):
+        out_dir = tmp_path / f"out_{workers}"
+        parser = SMCCatalogParser(str(catalog), str(out_dir))
+        parser.parse(workers=workers)
+        results[workers] = (
+            parser.programs,
+            parser.small_headers,
+            parser.parsing_warnings,
+            capsys.readouterr().out.replace(str(out_dir), "OUT"),
+            {p.name: p.read_bytes() for p in sorted(out_dir.rglob("*.json"))},
+        )
+        assert {"read", "hyphenation", "programs", "write"} <= set(parser.timings)
+        assert len(parser.program_timings) == len(parser.programs)
+
+    assert len(results[1][0]) == 4 and len(results[1][1]) == 1
+    assert results[1] == results[2]
@@ -0,0 +1,245 @@
+"""Tests for the async scraping helpers and the scrapers built on them, against a local stub server."""
+
+import asyncio
+import base64
+import html
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+for path in (ROOT, ROOT / "data" / "Professor_Ratings", ROOT / "data" / "SMC_FAQs"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from data.scraping import AsyncFetcher, FetchError, Page, ResponseCache, paginate  # noqa: E402
+from ratemyprofapi import AsyncRateMyProfessorClient  # noqa: E402
+
+# Recorded scrapes the stub server answers from
+RMP_RECORDED = json.loads((ROOT / "data/Professor_Ratings/santa_monica_college_professors_rag.json").read_text())
+FAQ_RECORDED = {
+    "/student-support/international-education/counseling/faq.php":
+        json.loads((ROOT / "data/SMC_FAQs/smc_international_faq_rag.json").read_text()),
+    "/academics/online-learning/students/student-faq.php":
+        json.loads((ROOT / "data/SMC_FAQs/smc_online_learning_faq_rag.json").read_text()),
+}
+NEW_WINDOW = "(opens in new window)"
+
+
+def _cursor(offset):
+    return base64.b64encode(f"arrayconnection:{offset}".encode()).decode()
+
+
+def _teacher_node(prof):
+    metrics = prof["metrics"]
+    return {
+        "id": prof["id"], "firstName": prof["first_name"], "lastName": prof["last_name"],
+        "department": prof["department"], "avgRating": metrics["rating"], "numRatings": metrics["num_ratings"],
+        "wouldTakeAgainPercent": metrics["would_take_again_percent"], "avgDifficulty": metrics["difficulty"],
+        "school": prof["school"],
+    }
+
+
+def _answer_html(faq):
+    """Rebuild an answer's markup: links inline, with their screen-reader-only suffix."""
+    answer, parts, pos = faq["answer"], [], 0
+    for link in faq.get("links", []):
+        visible = link["text"][:-len(NEW_WINDOW)] if link["text"].endswith(NEW_WINDOW) else link["text"]
+        at = answer.find(visible, pos)
+        assert at >= 0, visible
+        hidden = f'<span class="sr-only">{NEW_WINDOW}</span>' if visible != link["text"] else ""
+        parts.append(html.escape(answer[pos:at]))
+        parts.append(f'<a href="{html.escape(link["url"])}">{html.escape(visible)}{hidden}</a>')
+        pos = at + len(visible)
+    parts.append(html.escape(answer[pos:]))
+    return "".join(parts)
+
+
+def _faq_page(recorded):
+    items = "".join(
+        f'<div class="accordion__item"><h3 class="accordion__toggle" aria-expanded="false">'
+        f'{html.escape(faq["question"])}</h3><div class="accordion__content"><p>{_answer_html(faq)}</p></div></div>'
+        for faq in recorded["faqs"]
+    )
+    return f"<html><body><main><h1>{recorded['metadata']['title']}</h1>{items}</main></body></html>"
+
+
+class _StubSites(BaseHTTPRequestHandler):
+    nodes = [_teacher_node(prof) for prof in RMP_RECORDED["professors"]]
+    requests_seen = []
+    failures = 0  # next requests answered with 503
+    delay = 0.0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def _begin(self):
+        with self.lock:
+            self.requests_seen.append((self.command, self.path))
+            type(self).in_flight += 1
+            type(self).max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self.failures > 0:
+                type(self).failures -= 1
+                return False
+        time.sleep(self.delay)
+        return True
+
+    def _end(self, status, body=b"", content_type="application/json"):
+        with self.lock:
+            type(self).in_flight -= 1
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        if not self._begin():
+            return self._end(503)
+        recorded = FAQ_RECORDED.get(self.path)
+        if recorded is None:
+            return self._end(404)
+        self._end(200, _faq_page(recorded).encode(), "text/html; charset=utf-8")
+
+    def do_POST(self):  # noqa: N802
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not self._begin():
+            return self._end(503)
+        variables = payload["variables"]
+        if "NewSearchSchoolsQuery" in payload["query"]:
+            school = RMP_RECORDED["school_info"]
+            data = {"search": {"schools": {"edges": [{"node": school}]}}}
+        else:
+            cursor = variables.get("cursor")
+            start = 0 if cursor is None else int(base64.b64decode(cursor).decode().rsplit(":", 1)[1]) + 1
+            edges = [{"node": node} for node in self.nodes[start:start + variables["count"]]]
+            data = {"search": {"teachers": {
+                "pageInfo": {
+                    "hasNextPage": start + len(edges) < len(self.nodes),
+                    "endCursor": _cursor(start + len(edges) - 1) if edges else None,
+                },
+                "edges": edges,
+            }}}
+        self._end(200, json.dumps({"data": data}).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubSites)
+    _StubSites.requests_seen = []
+    _StubSites.failures = 0
+    _StubSites.delay = 0.0
+    _StubSites.max_in_flight = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+async def _all_professors(base_url, **fetcher_kwargs):
+    async with AsyncFetcher(namespace="rmp", **fetcher_kwargs) as fetcher:
+        client = AsyncRateMyProfessorClient(fetcher, base_url=f"{base_url}/graphql")
+        schools = await client.search_schools("Santa Monica College")
+        professors = await client.get_all_professors(schools[0]["id"], page_size=500, prefetch=3)
+    return professors, fetcher.stats
+
+
+def test_professor_pages_are_prefetched(stub_server):
+    _StubSites.delay = 0.05
+    professors, stats = asyncio.run(_all_professors(stub_server, concurrency=4))
+
+    assert [p["id"] for p in professors] == [p["id"] for p in RMP_RECORDED["professors"]]
+    assert professors[0]["first_name"] == RMP_RECORDED["professors"][0]["first_name"]
+    assert _StubSites.max_in_flight > 1
+    # 1 school search + 5 pages, plus at most `prefetch` speculative requests past the end
+    assert 6 <= stats.requests <= 9
+
+
+def test_cached_responses_replay_offline(tmp_path, stub_server):
+    cache = ResponseCache(tmp_path / "raw_cache")
+    professors, _ = asyncio.run(_all_professors(stub_server, cache=cache))
+    seen = len(_StubSites.requests_seen)
+
+    replayed, stats = asyncio.run(_all_professors(stub_server, cache=cache, offline=True))
+    assert replayed == professors
+    assert stats.requests == 0 and stats.cache_hits >= 6
+    assert len(_StubSites.requests_seen) == seen
+    assert all(entry["status"] == 200 for entry in cache.entries("rmp"))
+
+
+def test_retries_transient_errors(stub_server):
+    _StubSites.failures = 2
+
+    async def search(**kwargs):
+        async with AsyncFetcher(backoff=0.01, **kwargs) as fetcher:
+            response = await fetcher.post_json(
+                f"{stub_server}/graphql", {"query": "NewSearchSchoolsQuery", "variables": {}})
+        return response, fetcher.stats
+
+    response, stats = asyncio.run(search(max_retries=3))
+    assert response.status == 200 and stats.retries == 2
+
+    _StubSites.failures = 5
+    response, _ = asyncio.run(search(max_retries=1))
+    assert response.status == 503
+    with pytest.raises(FetchError):
+        response.raise_for_status()
+
+
+def test_paginate_recovers_from_wrong_predictions():
+    items = list(range(23))
+    requested = []
+
+    async def fetch_page(cursor):
+        requested.append(cursor)
+        start = 0 if cursor is None else int(cursor[1:]) + 1
+        chunk = items[start:start + 5]
+        return Page(chunk, start + 5 < len(items), f"c{chunk[-1]}" if chunk else None)
+
+    async def collect(predict):
+        return [page async for page in paginate(fetch_page, prefetch=3, predict=predict)]
+
+    # A predictor that is always off by one: every speculative page is discarded
+    pages = asyncio.run(collect(lambda cursor: f"c{(int(cursor[1:]) if cursor else -1) + 6}"))
+    assert [i for page in pages for i in page.items] == items
+    assert [page.cursor for page in pages] == [None, "c4", "c9", "c14", "c19"]
+
+    # Without a predictor only the next page is in flight
+    requested.clear()
+    pages = asyncio.run(collect(None))
+    assert [i for page in pages for i in page.items] == items
+    assert requested == [None, "c4", "c9", "c14", "c19"]
+
+
+def test_faq_scraper_parses_fetched_and_cached_pages(tmp_path, stub_server):
+    pytest.importorskip("bs4")
+    from studentfaqscraper import SMCSeparateFAQScraper
+
+    def scrape(out_dir, **kwargs):
+        out_dir.mkdir()
+        scraper = SMCSeparateFAQScraper(cache_dir=tmp_path / "raw_cache", output_dir=out_dir,
+                                        base_url=stub_server, **kwargs)
+        scraper.run_scraping()
+        return {
+            key: json.loads((out_dir / config["output_rag"]).read_text())
+            for key, config in scraper.pages_config.items()
+        }
+
+    scraped = scrape(tmp_path / "live")
+    for path, recorded in FAQ_RECORDED.items():
+        faqs = scraped[recorded["metadata"]["page_type"]]["faqs"]
+        assert faqs == recorded["faqs"]
+    assert len(_StubSites.requests_seen) == 2
+
+    # Re-parsing comes entirely from the raw page cache
+    replayed = scrape(tmp_path / "replay", offline=True)
+    assert len(_StubSites.requests_seen) == 2
+    assert {k: v["faqs"] for k, v in replayed.items()} == {k: v["faqs"] for k, v in scraped.items()}
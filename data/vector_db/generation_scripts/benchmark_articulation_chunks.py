@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Articulation Chunk Generation Benchmark
+
+Times ``generate_articulation_chunks`` against corpus size. The ASSIST
+articulation JSONs are replicated ``--scales`` times into a scratch directory,
+each replica under its own major ids (as if more campuses and majors were
+added), and for each size the benchmark reports
+
+- ``parse``: building the raw chunks (``iter_raw_chunks``)
+- ``enrich``: the single-pass ``RelationshipIndex`` plus enrichment
+- ``total``: the full streamed ``generate_chunks`` run
+
+Per-chunk time should stay flat as the corpus grows.
+
+Usage:
+    python data/vector_db/generation_scripts/benchmark_articulation_chunks.py --scales 1 4 16
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import generate_articulation_chunks as artic
+
+DEFAULT_INPUT_DIR = (
+    Path(__file__).resolve().parents[2]
+    / "assist_articulation_v2/rag_output/santa_monica_college/university_of_california_san_diego"
+)
+
+
+def _replicate(input_dir: Path, output_dir: Path, copies: int) -> int:
+    """Write *copies* replicas of every input JSON, each with distinct major ids."""
+    written = 0
+    for source in sorted(input_dir.rglob("*.json")):
+        text = source.read_text(encoding="utf-8")
+        major_id = artic.parse_assist_url(json.loads(text).get("source_url", "")).get("major_id")
+        for copy_no in range(copies):
+            replica = text.replace(major_id, f"{major_id}-{copy_no}") if major_id and copy_no else text
+            (output_dir / f"{copy_no}_{source.name}").write_text(replica, encoding="utf-8")
+            written += 1
+    return written
+
+
+def _measure(input_dir: Path, copies: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="articulation_bench_") as tmp:
+        corpus = Path(tmp)
+        files = _replicate(input_dir, corpus, copies)
+
+        # Validation warnings and progress bars are not what is being measured
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            start = time.perf_counter()
+            chunks = list(artic.iter_raw_chunks(corpus))
+            parse = time.perf_counter() - start
+
+            start = time.perf_counter()
+            artic.enrich_relationships(chunks)
+            enrich = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in artic.generate_chunks(corpus):
+                pass
+            total = time.perf_counter() - start
+
+    return {"copies": copies, "files": files, "chunks": len(chunks), "parse": parse, "enrich": enrich, "total": total}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark articulation chunk generation against corpus size")
+    parser.add_argument("--input-dir", type=Path, default=DEFAULT_INPUT_DIR, help="Directory of ASSIST articulation JSONs")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8], help="Corpus replica counts to time")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Time every scale and print a comparison table."""
+    args = parse_args()
+
+    print(f"{'copies':>6}{'files':>8}{'chunks':>9}{'parse':>9}{'enrich':>9}{'total':>9}{'µs/chunk':>10}")
+    for copies in args.scales:
+        r = _measure(args.input_dir, copies)
+        print(
+            f"{r['copies']:>6}{r['files']:>8}{r['chunks']:>9}{r['parse']:>8.2f}s{r['enrich']:>8.3f}s"
+            f"{r['total']:>8.2f}s{r['total'] / max(r['chunks'], 1) * 1e6:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,194 @@
 import argparse
 from pathlib import Path
-from typing import List, Union, Dict
-import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import fnmatch
 
-from tqdm import tqdm
 from langchain.docstore.document import Document
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
 
+from chunk_io import iter_jsonl
+from embedding_engine import EmbeddingEngine
+from incremental_index import (
+    ChunkIdAssigner,
+    EmbeddingCache,
+    content_hash,
+    embed_missing,
+    plan_update,
+)
+
+# Chunks embedded and added to the index per step while streaming a chunk file
+ADD_BATCH_SIZE = 4096
+
 ###############################################################################
 # Helpers
 ###############################################################################
 
+class ChunkFile:
+    """Re-iterable stream of Documents read lazily from a chunk JSONL file.
+
+    Optional header lines (``{'_metadata': …}``) and malformed lines are skipped.
+    """
+
+    def __init__(self, jsonl_path: Union[str, Path]):
+        self.path = Path(jsonl_path)
+
+    def __iter__(self) -> Iterator[Document]:
+        for obj in iter_jsonl(self.path):
+            if "page_content" not in obj:
+                print(f"[WARN] {self.path.name}: skipping chunk without page_content")
+                continue
+            yield Document(page_content=obj["page_content"], metadata=obj.get("metadata", {}))
+
+
 def load_chunks(jsonl_path: Union[str, Path]) -> List[Document]:
     """Load JSONL chunks, skipping optional header lines starting with {'_metadata': …}."""
-    p = Path(jsonl_path)
-    docs: List[Document] = []
-    total = sum(1 for _ in p.open("r", encoding="utf-8"))
-    with p.open("r", encoding="utf-8") as f:
-        for line in tqdm(f, total=total, desc=f"Reading {p.name}"):
-            if not line.strip():
-                continue
-            try:
-                obj = json.loads(line)
-                if "_metadata" in obj:
-                    continue  # header
-                docs.append(Document(page_content=obj["page_content"], metadata=obj.get("metadata", {})))
-            except Exception as exc:
-                print(f"[WARN] {p.name}: skipping malformed line – {exc}")
-    return docs
+    return list(ChunkFile(jsonl_path))
 
 
-def build_vectorstore(docs: List[Document], model_name: str) -> FAISS:
+def build_vectorstore(docs: List[Document], model_name: str, batch_size: Optional[int] = None, workers: Optional[int] = None) -> FAISS:
     """Embed *docs* with *model_name* and return FAISS store."""
-    embedder = HuggingFaceEmbeddings(model_name=model_name)
-    return FAISS.from_documents(docs, embedder)
+    engine = EmbeddingEngine(model_name, workers=workers, batch_size=batch_size)
+    store = FAISS.from_documents(docs, engine)
+    print(f"  {engine.stats.summary()}")
+    engine.close()
+    return store
+
+
+def _seed_cache_from_index(store: FAISS, cache: EmbeddingCache) -> int:
+    """Copy the vectors of an index built without a cache into the cache.
+
+    Lets the first incremental build after an upgrade reuse every existing
+    embedding instead of re-encoding the corpus.
+    """
+    hashes, vectors = [], []
+    for position, docstore_id in store.index_to_docstore_id.items():
+        doc = store.docstore.search(docstore_id)
+        if isinstance(doc, Document):
+            hashes.append(content_hash(doc.page_content))
+            vectors.append(store.index.reconstruct(int(position)))
+    if hashes:
+        cache.add(hashes, vectors)
+    return len(hashes)
+
+
+def update_vectorstore(
+    docs: Iterable[Document],
+    model_name: str,
+    out_dir: Path,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    rebuild: bool = False,
+) -> Dict[str, Any]:
+    """Bring the FAISS store in *out_dir* in line with *docs*, embedding only new text.
+
+    *docs* is iterated twice – once to plan the update from chunk ids and content
+    hashes, once to embed and add the new chunks in batches of ``ADD_BATCH_SIZE`` –
+    so a :class:`ChunkFile` streams the corpus without holding it in memory.
+
+    Args:
+        docs: Re-iterable chunks the store should contain
+        model_name: Sentence-transformers model used for embeddings
+        out_dir: Store directory (index plus embedding cache sidecar)
+        batch_size: Texts per embedding batch (autotuned if None)
+        workers: Embedding worker processes (defaults to the CPU count)
+        rebuild: Write a fresh index (cached embeddings are still reused)
+
+    Returns:
+        Counts of ``chunks``, ``embedded``/``cached`` texts and ``added``/``deleted``/
+        ``unchanged`` chunks, plus the engine's ``throughput`` summary when anything
+        was embedded
+    """
+    out_dir = Path(out_dir)
+    engine: Optional[EmbeddingEngine] = None
+
+    def get_embedder() -> EmbeddingEngine:
+        nonlocal engine
+        if engine is None:
+            engine = EmbeddingEngine(model_name, workers=workers, batch_size=batch_size)
+        return engine
+
+    # Pass 1: chunk id -> content hash (no text or metadata kept)
+    assign_id = ChunkIdAssigner()
+    wanted = {assign_id(d.metadata): content_hash(d.page_content) for d in docs}
+    stats: Dict[str, Any] = {
+        "chunks": len(wanted), "embedded": 0, "cached": 0, "added": 0, "deleted": 0, "unchanged": len(wanted),
+    }
+    if not wanted:
+        return stats
+
+    cache = EmbeddingCache(out_dir, model_name)
+    store: Optional[FAISS] = None
+    indexed = cache.indexed()
+    if (out_dir / "index.faiss").exists() and not rebuild:
+        if indexed and plan_update(indexed, wanted).is_noop:
+            cache.close()
+            return stats
+        store = FAISS.load_local(str(out_dir), get_embedder(), allow_dangerous_deserialization=True)
+        if not indexed:
+            seeded = _seed_cache_from_index(store, cache)
+            print(f"  Seeded embedding cache with {seeded:,} vectors from the existing index")
+            store = None  # legacy ids – rebuild the index from cached vectors
+    if store is None:
+        indexed = {}
+
+    plan = plan_update(indexed, wanted)
+    if store is not None and plan.delete:
+        store.delete(plan.delete)
+
+    # Pass 2: embed and add the new chunks batch by batch
+    to_add = set(plan.add)
+    assign_id = ChunkIdAssigner()
+    batch: List[Tuple[str, Document]] = []
+
+    def flush() -> None:
+        nonlocal store
+        hashes = [wanted[chunk_id] for chunk_id, _ in batch]
+        embedded, cached = embed_missing(
+            cache,
+            [doc.page_content for _, doc in batch],
+            hashes,
+            stream_fn=lambda texts: get_embedder().embed_stream(texts),
+        )
+        stats["embedded"] += embedded
+        stats["cached"] += cached
+
+        text_embeddings = list(zip((doc.page_content for _, doc in batch), cache.get(hashes).tolist()))
+        metadatas = [doc.metadata for _, doc in batch]
+        ids = [chunk_id for chunk_id, _ in batch]
+        if store is None:
+            store = FAISS.from_embeddings(text_embeddings, get_embedder(), metadatas=metadatas, ids=ids)
+        else:
+            store.add_embeddings(text_embeddings, metadatas=metadatas, ids=ids)
+        batch.clear()
+
+    for doc in docs:
+        chunk_id = assign_id(doc.metadata)
+        if chunk_id in to_add:
+            batch.append((chunk_id, doc))
+            if len(batch) >= ADD_BATCH_SIZE:
+                flush()
+    if batch:
+        flush()
+
+    if store is not None:
+        store.save_local(str(out_dir))
+    cache.set_indexed(wanted)
+    cache.close()
+    stats.update(added=len(plan.add), deleted=len(plan.delete), unchanged=len(plan.unchanged))
+    if engine is not None:
+        engine.close()
+        if engine.stats.texts:
+            stats["throughput"] = engine.stats.summary()
+    return stats
+
+
+def _report(stats: Dict[str, Any], out_dir: Path) -> None:
+    if "throughput" in stats:
+        print(f"  {stats['throughput']}")
+    print(
+        f"✔ Vector store updated → {out_dir} ({stats['added']:,} added, {stats['deleted']:,} deleted, "
+        f"{stats['unchanged']:,} unchanged; {stats['embedded']:,} embedded, {stats['cached']:,} from cache)"
+    )
 
 
 def matches_patterns(name: str, patterns: List[str]) -> bool:
@@ -52,6 +205,9 @@ def main() -> None:
     parser.add_argument("--output-dir", default="data/vector_db/vectorstores", help="Directory where FAISS index folders will be written.")
     parser.add_argument("--include", nargs="*", default=["*.jsonl"], help="Glob pattern(s) of files to include when --input-path is a directory.")
     parser.add_argument("--exclude", nargs="*", default=[], help="Glob pattern(s) to exclude.")
+    parser.add_argument("--batch-size", type=int, default=None, help="Texts per embedding batch (default: autotuned).")
+    parser.add_argument("--workers", type=int, default=None, help="Embedding worker processes (default: CPU count).")
+    parser.add_argument("--rebuild", action="store_true", help="Write fresh indexes (cached embeddings are still reused).")
 
     args = parser.parse_args()
 
@@ -70,11 +226,9 @@ def main() -> None:
         return f"{s}_faiss"
 
     if in_path.is_file():
-        docs = load_chunks(in_path)
-        print(f"✔ Loaded {len(docs):,} chunks from {in_path.name}. Embedding …")
-        store = build_vectorstore(docs, args.model_name)
-        store.save_local(out_root)
-        print(f"✔ Vector store saved → {out_root}")
+        print(f"✔ Streaming chunks from {in_path.name}. Updating index …")
+        stats = update_vectorstore(ChunkFile(in_path), args.model_name, out_root, args.batch_size, args.workers, args.rebuild)
+        _report(stats, out_root)
         return
 
     # Directory mode
@@ -86,16 +240,13 @@ def main() -> None:
         raise FileNotFoundError("No JSONL chunk files matched include/exclude patterns.")
 
     for path in jsonl_files:
-        docs = load_chunks(path)
-        if not docs:
+        print(f"\n✔ Streaming chunks from {path.name}. Updating index …")
+        subdir = out_root / stem_to_dir(path.stem)
+        stats = update_vectorstore(ChunkFile(path), args.model_name, subdir, args.batch_size, args.workers, args.rebuild)
+        if not stats["chunks"]:
             print(f"[WARN] {path.name}: no valid chunks – skipping.")
             continue
-        print(f"\n✔ Loaded {len(docs):,} chunks from {path.name}. Embedding …")
-        store = build_vectorstore(docs, args.model_name)
-        subdir = out_root / stem_to_dir(path.stem)
-        subdir.mkdir(parents=True, exist_ok=True)
-        store.save_local(subdir)
-        print(f"✔ Vector store saved → {subdir}")
+        _report(stats, subdir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,135 @@
+"""Streaming JSONL I/O shared by the chunk generation scripts.
+
+Chunks flow through the pipeline one record at a time: generators produce
+them, ``iter_jsonl`` reads them back, and ``JsonlWriter`` writes them through
+a buffered file. Memory therefore stays flat as the corpus grows.
+
+``JsonlWriter`` writes to a temporary file and renames it on success, so a
+failed run never leaves a truncated chunk file behind. A ``_metadata`` header
+can be given up front or, when it summarises the records (counts, warnings),
+at ``close`` – the body is then spooled and the header prepended.
+
+Example:
+    with JsonlWriter(Path("chunk_output/course_chunks.jsonl")) as writer:
+        writer.write_all(iter_course_chunks(input_dir))
+    print(writer.stats.summary())
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import statistics
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+# Bytes buffered before a write hits the file
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def iter_jsonl(path: Union[str, Path], skip_header: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yield one JSON object per non-empty line, skipping ``_metadata`` headers."""
+    path = Path(path)
+    with path.open("r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError as exc:
+                print(f"[WARN] {path.name}:{line_no}: skipping malformed line – {exc}")
+                continue
+            if skip_header and isinstance(obj, dict) and "_metadata" in obj:
+                continue
+            yield obj
+
+
+@dataclass
+class ChunkStats:
+    """Running chunk count and ``page_content`` length statistics."""
+
+    # Lengths only (4 bytes per chunk) so the median can be reported
+    lengths: array = field(default_factory=lambda: array("I"))
+
+    def add(self, chunk: Dict[str, Any]) -> None:
+        self.lengths.append(len(chunk.get("page_content", "")))
+
+    @property
+    def count(self) -> int:
+        return len(self.lengths)
+
+    def summary(self) -> str:
+        if not self.lengths:
+            return "no chunks"
+        return (
+            f"min {min(self.lengths)}, max {max(self.lengths)}, "
+            f"mean {statistics.mean(self.lengths):.1f}, median {statistics.median(self.lengths)}"
+        )
+
+
+class JsonlWriter:
+    """Buffered, atomic JSONL writer with an optional (possibly deferred) header."""
+
+    def __init__(self, path: Union[str, Path], header: Optional[Dict[str, Any]] = None, defer_header: bool = False):
+        """
+        Args:
+            path: Destination file
+            header: ``_metadata`` header written as the first line
+            defer_header: Header is supplied to ``close`` instead
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats = ChunkStats()
+        self._defer_header = defer_header
+        self._tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self._file = open(self._tmp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+        if header is not None and not defer_header:
+            self._file.write(json.dumps({"_metadata": header}, ensure_ascii=False) + "\n")
+
+    def write(self, chunk: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+        self.stats.add(chunk)
+
+    def write_all(self, chunks: Iterable[Dict[str, Any]]) -> int:
+        """Write every chunk from an iterable; returns how many were written."""
+        before = self.stats.count
+        for chunk in chunks:
+            self.write(chunk)
+        return self.stats.count - before
+
+    def close(self, header: Optional[Dict[str, Any]] = None) -> None:
+        """Finish the file and move it into place (prepending a deferred header)."""
+        self._file.close()
+        if self._defer_header:
+            body_path = self._tmp_path
+            self._tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.hdr.tmp")
+            with open(self._tmp_path, "w", encoding="utf-8") as out, open(body_path, "r", encoding="utf-8") as body:
+                out.write(json.dumps({"_metadata": header or {}}, ensure_ascii=False) + "\n")
+                shutil.copyfileobj(body, out, WRITE_BUFFER_SIZE)
+            os.unlink(body_path)
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        self._file.close()
+        if self._tmp_path.exists():
+            os.unlink(self._tmp_path)
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+        elif not self._file.closed:
+            self.close()
+
+
+def write_jsonl(chunks: Iterable[Dict[str, Any]], path: Union[str, Path], header: Optional[Dict[str, Any]] = None) -> ChunkStats:
+    """Stream *chunks* to *path*; returns the writer's statistics."""
+    with JsonlWriter(path, header=header) as writer:
+        writer.write_all(chunks)
+    return writer.stats
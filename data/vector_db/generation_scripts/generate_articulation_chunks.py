@@ -1,15 +1,20 @@
 import argparse
+import heapq
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Any, Optional, Set, Tuple
 
+import os
 import re
 import statistics
+import tempfile
 import urllib.parse
 from datetime import datetime
 
 from tqdm import tqdm
 
+from chunk_io import JsonlWriter, iter_jsonl
+
 # Optional dependency – during local development LangChain may not be installed.
 try:
     from langchain.text_splitter import RecursiveCharacterTextSplitter  # type: ignore
@@ -131,12 +136,8 @@ def extract_major_type(title: str) -> Optional[str]:
 
 def extract_keywords(texts: List[str]) -> List[str]:
     """Return a list of domain-specific keywords found in *texts*."""
-    tokens: Set[str] = set()
     joined = " ".join(texts).lower()
-    for kw in ASSIST_KEYWORDS:
-        if kw.lower() in joined:
-            tokens.add(kw)
-    return sorted(tokens)
+    return [kw for kw, needle in _KEYWORD_NEEDLES if needle in joined]
 
 
 def calculate_completeness(meta: Dict[str, Any]) -> float:
@@ -146,44 +147,108 @@ def calculate_completeness(meta: Dict[str, Any]) -> float:
     return round(non_empty / total, 2) if total else 0.0
 
 
+def validate_chunk(idx: int, ch: Dict[str, Any]) -> None:
+    """Run simple quality checks on one chunk, print warnings if failures detected."""
+    txt = ch.get("page_content", "")
+    meta = ch.get("metadata", {})
+    if txt.startswith('.'):
+        print(f"[WARN] Chunk {idx} starts with period.")
+    if len(txt) < GENERAL_INFO_MIN:
+        print(f"[WARN] Chunk {idx} shorter than minimum length ({len(txt)} chars).")
+    if meta.get("type") == "requirement":
+        # Quick presence check for course info
+        if "course_mappings" not in meta and "receiving_course_text" not in meta:
+            print(f"[WARN] Requirement chunk {idx} missing course info.")
+
+
 def validate_chunks(chunks: List[Dict[str, Any]]) -> None:
     """Run simple quality checks, print warnings if failures detected."""
     for idx, ch in enumerate(chunks):
-        txt = ch.get("page_content", "")
-        meta = ch.get("metadata", {})
-        if txt.startswith('.'):
-            print(f"[WARN] Chunk {idx} starts with period.")
-        if len(txt) < GENERAL_INFO_MIN:
-            print(f"[WARN] Chunk {idx} shorter than minimum length ({len(txt)} chars).")
-        if meta.get("type") == "requirement":
-            # Quick presence check for course info
-            if "course_mappings" not in meta and "receiving_course_text" not in meta:
-                print(f"[WARN] Requirement chunk {idx} missing course info.")
+        validate_chunk(idx, ch)
 
 
-def enrich_relationships(chunks: List[Dict[str, Any]]) -> None:
-    """Populate shared_courses and alternative_paths in chunk metadata."""
-    # Map course_code -> set of parent_major_id
-    course_map: Dict[str, Set[str]] = {}
-    for ch in chunks:
+class RelationshipIndex:
+    """Corpus-wide hash indexes for relationship enrichment.
+
+    Filled in a single pass over the chunks (``add``): every chunk gets an id
+    (its position in the corpus), and requirement chunks are indexed by
+    course code → chunk ids and major → chunk ids. ``finalize`` derives each
+    course's majors once, and each distinct list of shared courses is resolved
+    to its alternative majors once – a bounded selection capped at
+    ``MAX_ALTERNATIVE_PATHS`` rather than a full sort per chunk.
+    """
+
+    def __init__(self) -> None:
+        self.course_chunks: Dict[str, List[int]] = {}
+        self.major_chunks: Dict[Optional[str], List[int]] = {}
+        self._next_id = 0
+        # course code -> (number of distinct majors, major ids other than None)
+        self._course_majors: Optional[Dict[str, Tuple[int, FrozenSet[str]]]] = None
+        # Chunks of the same section across majors share their course lists
+        self._paths_cache: Dict[Tuple[str, ...], List[str]] = {}
+
+    def add(self, ch: Dict[str, Any]) -> int:
+        """Index one chunk; returns its chunk id."""
+        chunk_id = self._next_id
+        self._next_id += 1
         meta = ch["metadata"]
         if meta.get("type") != "requirement":
-            continue
-        parent_id = meta.get("parent_major_id")
+            return chunk_id
+        self.major_chunks.setdefault(meta.get("parent_major_id"), []).append(chunk_id)
         for code in meta.get("transferable_courses", []):
-            if not code:
-                continue
-            course_map.setdefault(code, set()).add(parent_id)
-
-    for ch in chunks:
+            if code:
+                self.course_chunks.setdefault(code, []).append(chunk_id)
+        self._course_majors = None
+        self._paths_cache.clear()
+        return chunk_id
+
+    def finalize(self) -> None:
+        """Derive each course's distinct majors from the chunk id indexes."""
+        chunk_major = {cid: major for major, ids in self.major_chunks.items() for cid in ids}
+        course_majors: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        for code, ids in self.course_chunks.items():
+            majors = {chunk_major[cid] for cid in ids}
+            course_majors[code] = (len(majors), frozenset(majors - {None}))
+        self._course_majors = course_majors
+
+    def _majors(self, code: str) -> Tuple[int, FrozenSet[str]]:
+        if self._course_majors is None:
+            self.finalize()
+        return self._course_majors.get(code, (0, frozenset()))
+
+    def shared_courses(self, codes: Iterable[str]) -> List[str]:
+        """Codes that appear in the requirements of more than one major, in input order."""
+        return [code for code in codes if self._majors(code)[0] > 1]
+
+    def alternative_paths(self, codes: Iterable[str], parent_id: Optional[str]) -> List[str]:
+        """Other majors requiring any of *codes*: sorted, unique, at most ``MAX_ALTERNATIVE_PATHS``."""
+        key = tuple(codes)
+        candidates = self._paths_cache.get(key)
+        if candidates is None:
+            # One spare entry so dropping parent_id still leaves a full list
+            majors = set().union(*(self._majors(code)[1] for code in key))
+            candidates = heapq.nsmallest(MAX_ALTERNATIVE_PATHS + 1, majors)
+            self._paths_cache[key] = candidates
+        return [major for major in candidates if major != parent_id][:MAX_ALTERNATIVE_PATHS]
+
+    def enrich(self, ch: Dict[str, Any]) -> None:
+        """Populate shared_courses and alternative_paths of one requirement chunk."""
         meta = ch["metadata"]
         if meta.get("type") != "requirement":
-            continue
-        parent_id = meta.get("parent_major_id")
-        shared = [code for code in meta.get("transferable_courses", []) if len(course_map.get(code, set())) > 1]
+            return
+        shared = self.shared_courses(meta.get("transferable_courses", []))
         meta["shared_courses"] = shared
-        alt_paths = sorted({mid for code in shared for mid in course_map.get(code, set()) if mid != parent_id})
-        meta["alternative_paths"] = alt_paths
+        meta["alternative_paths"] = self.alternative_paths(shared, meta.get("parent_major_id"))
+
+
+def enrich_relationships(chunks: List[Dict[str, Any]]) -> None:
+    """Populate shared_courses and alternative_paths in chunk metadata."""
+    index = RelationshipIndex()
+    for ch in chunks:
+        index.add(ch)
+    index.finalize()
+    for ch in chunks:
+        index.enrich(ch)
 
 
 def build_general_info_chunks(data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -357,6 +422,9 @@ def build_requirement_chunks(data: Dict[str, Any]) -> List[Dict[str, Any]]:
             if group_instruction:
                 header += f" | Group Instruction: {group_instruction}"
 
+            # Keywords depend only on the section, so every chunk of it shares them
+            section_keywords = extract_keywords([header, " ".join(mapping_strings)])
+
             # Assemble content and split into size-bound chunks
             current_lines: List[str] = [header]
             current_len = len(header)
@@ -390,8 +458,7 @@ def build_requirement_chunks(data: Dict[str, Any]) -> List[Dict[str, Any]]:
                 # Compute content quality score now that meta exists
                 meta["content_quality_score"] = calculate_completeness(meta)
 
-                # Keywords
-                meta["keywords"] = extract_keywords([header, " ".join(mapping_strings)])
+                meta["keywords"] = list(section_keywords)
 
                 chunks.append({
                     "page_content": content,
@@ -422,10 +489,8 @@ def build_requirement_chunks(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return chunks
 
 
-def generate_chunks(input_dir: Path) -> List[Dict[str, Any]]:
-    """Walk *input_dir* recursively and build a combined list of articulation chunks."""
-    chunks: List[Dict[str, Any]] = []
-
+def iter_raw_chunks(input_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Walk *input_dir* recursively yielding unenriched articulation chunks, file by file."""
     json_files = [p for p in input_dir.rglob("*.json")]
     for file_path in tqdm(json_files, desc="Processing articulation JSONs"):
         try:
@@ -434,22 +499,34 @@ def generate_chunks(input_dir: Path) -> List[Dict[str, Any]]:
             print(f"[WARN] Could not parse {file_path}: {exc}")
             continue
 
-        chunks.extend(build_general_info_chunks(data))
-        chunks.extend(build_requirement_chunks(data))
+        yield from build_general_info_chunks(data)
+        yield from build_requirement_chunks(data)
 
-    # After initial construction, enrich relationships and validate
-    enrich_relationships(chunks)
-    validate_chunks(chunks)
 
-    return chunks
+def generate_chunks(input_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Stream the combined articulation chunks of *input_dir*, enriched and validated.
 
+    Relationships need the whole corpus, so chunks are spooled to a temporary
+    JSONL file while the :class:`RelationshipIndex` is built, then read back
+    one at a time for enrichment. Only the index is held in memory.
+    """
+    index = RelationshipIndex()
+    fd, spool_path = tempfile.mkstemp(prefix="articulation_chunks_", suffix=".jsonl")
+    os.close(fd)
+    try:
+        with JsonlWriter(spool_path) as spool:
+            for ch in iter_raw_chunks(input_dir):
+                index.add(ch)
+                spool.write(ch)
 
-def write_jsonl(chunks: List[Dict[str, Any]], output_file: Path) -> None:
-    """Write *chunks* as one JSON object per line to *output_file*."""
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with output_file.open("w", encoding="utf-8") as f:
-        for ch in chunks:
-            f.write(json.dumps(ch, ensure_ascii=False) + "\n")
+        index.finalize()
+        for idx, ch in enumerate(iter_jsonl(spool_path)):
+            index.enrich(ch)
+            validate_chunk(idx, ch)
+            yield ch
+    finally:
+        if os.path.exists(spool_path):
+            os.unlink(spool_path)
 
 
 ###############################################################################
@@ -488,10 +565,10 @@ def main() -> None:
 
     if args.mode == "combined":
         output_file = Path(args.output_file)
-        chunks = generate_chunks(input_dir)
-        write_jsonl(chunks, output_file)
+        with JsonlWriter(output_file) as writer:
+            writer.write_all(generate_chunks(input_dir))
 
-        lengths = [len(c["page_content"]) for c in chunks]
+        lengths = writer.stats.lengths
         if lengths:
             print("\nChunk length statistics (characters):")
             print(f"  min   : {min(lengths)}")
@@ -499,19 +576,15 @@ def main() -> None:
             print(f"  mean  : {statistics.mean(lengths):.1f}")
             print(f"  median: {statistics.median(lengths)}")
 
-        print(f"\n✔ Generated {len(chunks):,} articulation chunks → {output_file}")
+        print(f"\n✔ Generated {writer.stats.count:,} articulation chunks → {output_file}")
     else:
         output_dir = Path(args.output_dir)
-        result = generate_split_chunks(input_dir)
-
-        write_jsonl_with_header(result["course_mappings"], output_dir / "course_mappings_chunks.jsonl", result["header"])
-        write_jsonl_with_header(result["requirements"], output_dir / "requirements_chunks.jsonl", result["header"])
-        write_jsonl_with_header(result["program_info"], output_dir / "program_info_chunks.jsonl", result["header"])
+        counts = generate_split_chunks(input_dir, output_dir)["chunk_counts"]
 
         print("\n✔ Multi-vector chunk generation completed:")
-        print(f"  Course mapping chunks : {len(result['course_mappings']):,}")
-        print(f"  Requirement chunks    : {len(result['requirements']):,}")
-        print(f"  Program info chunks   : {len(result['program_info']):,}")
+        print(f"  Course mapping chunks : {counts['course_mappings']:,}")
+        print(f"  Requirement chunks    : {counts['requirements']:,}")
+        print(f"  Program info chunks   : {counts['program_info']:,}")
         print(f"  Output directory      : {output_dir}")
 
 
@@ -568,6 +641,11 @@ ASSIST_KEYWORDS = {
     "transfer", "articulation", "prerequisite", "major prep",
     "IGETC", "GE", "lower division", "upper division",
 }
+# (keyword, lowercase needle) in output order for extract_keywords
+_KEYWORD_NEEDLES = tuple((kw, kw.lower()) for kw in sorted(ASSIST_KEYWORDS))
+
+# Upper bound on a requirement chunk's alternative_paths (the first majors by id)
+MAX_ALTERNATIVE_PATHS = 128
 
 # Regex patterns that should not be split across chunks
 PRESERVE_PATTERNS = [
@@ -604,25 +682,34 @@ def _subject_area(code: Optional[str]) -> Optional[str]:
     return match.group(1).upper() if match else None
 
 
-def write_jsonl_with_header(chunks: List[Dict[str, Any]], output_file: Path, header_meta: Dict[str, Any]) -> None:
-    """Write *chunks* to *output_file* preceded by a metadata header line."""
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with output_file.open("w", encoding="utf-8") as f:
-        f.write(json.dumps({"_metadata": header_meta}, ensure_ascii=False) + "\n")
-        for ch in chunks:
-            f.write(json.dumps(ch, ensure_ascii=False) + "\n")
+SPLIT_COLLECTIONS = ("course_mappings", "requirements", "program_info")
 
 
-def generate_split_chunks(input_dir: Path) -> Dict[str, Any]:
-    """Generate three distinct chunk collections – course mappings, requirements, program info –
-    along with a summary header suitable for multi-vector database ingestion."""
+def generate_split_chunks(input_dir: Path, output_dir: Path) -> Dict[str, Any]:
+    """Write three distinct chunk collections – course mappings, requirements, program info –
+    to ``<collection>_chunks.jsonl`` files in *output_dir*, each preceded by a summary header
+    suitable for multi-vector database ingestion. Returns the header.
 
-    combined_chunks = generate_chunks(input_dir)
+    Requirement and program chunks are streamed straight to their files; only the
+    deduplicated course mappings are held in memory."""
 
-    # Containers for results
+    writers = {
+        name: JsonlWriter(output_dir / f"{name}_chunks.jsonl", defer_header=True) for name in SPLIT_COLLECTIONS
+    }
+    try:
+        header = _write_split_chunks(generate_chunks(input_dir), writers)
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+    for writer in writers.values():
+        writer.close(header)
+    return header
+
+
+def _write_split_chunks(combined_chunks: Iterable[Dict[str, Any]], writers: Dict[str, JsonlWriter]) -> Dict[str, Any]:
+    # Course mappings are deduplicated across majors, so they are written last
     course_map: Dict[Tuple[str, Tuple[str, ...], str], Dict[str, Any]] = {}
-    requirement_chunks: List[Dict[str, Any]] = []
-    program_chunks: List[Dict[str, Any]] = []
 
     majors_seen: Set[str] = set()
     warnings: List[str] = []
@@ -639,7 +726,7 @@ def generate_split_chunks(input_dir: Path) -> Dict[str, Any]:
                 "degree_type": extract_major_type(meta.get("agreement_title", "")),
             }
             new_meta.pop("type", None)
-            program_chunks.append({"page_content": ch["page_content"], "metadata": clean_metadata(new_meta)})
+            writers["program_info"].write({"page_content": ch["page_content"], "metadata": clean_metadata(new_meta)})
             majors_seen.add(meta.get("agreement_title", ""))
             continue
 
@@ -677,7 +764,7 @@ def generate_split_chunks(input_dir: Path) -> Dict[str, Any]:
                 "all_smc_options": [m.get("sending_course_code") for m in course_maps],
             })
 
-            requirement_chunks.append({"page_content": ch["page_content"], "metadata": clean_metadata(new_meta)})
+            writers["requirements"].write({"page_content": ch["page_content"], "metadata": clean_metadata(new_meta)})
 
             # 3️⃣  Derive individual course-mapping chunks --------------------
             for m in course_maps:
@@ -742,29 +829,17 @@ def generate_split_chunks(input_dir: Path) -> Dict[str, Any]:
         warnings.append(f"Unhandled chunk type: {chunk_type_original}")
 
     # Finalise course-mapping chunks and convert *applicable_majors* sets → sorted lists
-    course_chunks: List[Dict[str, Any]] = []
     for data in course_map.values():
         majors_list = sorted(data["metadata"].pop("applicable_majors"))
         data["metadata"]["applicable_majors"] = majors_list
-        course_chunks.append(data)
+        writers["course_mappings"].write(data)
 
-    summary_header = {
+    return {
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "majors_processed": len(majors_seen),
-        "chunk_counts": {
-            "course_mappings": len(course_chunks),
-            "requirements": len(requirement_chunks),
-            "program_info": len(program_chunks),
-        },
+        "chunk_counts": {name: writers[name].stats.count for name in SPLIT_COLLECTIONS},
         "warnings": warnings,
     }
 
-    return {
-        "course_mappings": course_chunks,
-        "requirements": requirement_chunks,
-        "program_info": program_chunks,
-        "header": summary_header,
-    }
-
 if __name__ == "__main__":
     main() 
\ No newline at end of file
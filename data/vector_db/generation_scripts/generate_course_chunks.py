@@ -3,10 +3,12 @@ import json
 import os
 import re
 import statistics
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from tqdm import tqdm
 
+from chunk_io import write_jsonl
+
 # Optional dependency – during local development LangChain may not be installed.
 try:
     from langchain.text_splitter import RecursiveCharacterTextSplitter  # type: ignore
@@ -132,10 +134,8 @@ def course_to_chunk(course: Dict[str, Any], program_name: str, source_file: str)
     }
 
 
-def process_catalog_dir(input_dir: str) -> List[Dict[str, Any]]:
-    """Walk *input_dir* collecting course chunks from every programme JSON file."""
-    chunks: List[Dict[str, Any]] = []
-
+def process_catalog_dir(input_dir: str) -> Iterator[Dict[str, Any]]:
+    """Walk *input_dir* yielding course chunks from every programme JSON file, one at a time."""
     for root, dirs, files in os.walk(input_dir):
         # skip extra_refs folders
         if 'extra_refs' in root.split(os.sep):
@@ -182,19 +182,10 @@ def process_catalog_dir(input_dir: str) -> List[Dict[str, Any]]:
                         "total_chunks": total_chunks,
                     }
 
-                    chunks.append({
+                    yield {
                         "page_content": part,
                         "metadata": clean_metadata(metadata),
-                    })
-
-    return chunks
-
-
-def write_jsonl(chunks: List[Dict[str, Any]], output_path: str) -> None:
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        for chunk in chunks:
-            f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+                    }
 
 
 ###############################################################################
@@ -217,11 +208,10 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    chunks = process_catalog_dir(args.input_dir)
-    write_jsonl(chunks, args.output_file)
+    stats = write_jsonl(process_catalog_dir(args.input_dir), args.output_file)
 
     # Print summary statistics for chunk lengths
-    lengths = [len(c["page_content"]) for c in chunks]
+    lengths = stats.lengths
     if lengths:
         mean_len = statistics.mean(lengths)
         median_len = statistics.median(lengths)
@@ -238,7 +228,7 @@ def main() -> None:
         for ctx in SKIPPED_OVERLAP:
             print(f"  • {ctx}")
 
-    print(f"\n✔ Generated {len(chunks):,} course chunks → {args.output_file}")
+    print(f"\n✔ Generated {stats.count:,} course chunks → {args.output_file}")
 
 
 if __name__ == "__main__":
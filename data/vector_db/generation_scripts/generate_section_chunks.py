@@ -3,10 +3,12 @@ import json
 import argparse
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator
 
 from tqdm import tqdm
 
+from chunk_io import write_jsonl
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -37,9 +39,8 @@ def clean_metadata(raw: Dict[str, Any]) -> Dict[str, Any]:
 # Core processing
 # ---------------------------------------------------------------------------
 
-def generate_section_chunks(input_dir: Path) -> List[Dict[str, Any]]:
-    chunks: List[Dict[str, Any]] = []
-
+def generate_section_chunks(input_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yield one chunk per scheduled section, file by file."""
     json_files: List[Path] = [p for p in input_dir.rglob("*.json") if "extra_refs" not in p.parts]
 
     for file_path in tqdm(json_files, desc="Scanning programme files"):
@@ -97,12 +98,10 @@ def generate_section_chunks(input_dir: Path) -> List[Dict[str, Any]]:
                 if co_enroll:
                     meta["co_enrollment_with"] = co_enroll
 
-                chunks.append({
+                yield {
                     "page_content": page_content,
                     "metadata": clean_metadata(meta),
-                })
-
-    return chunks
+                }
 
 
 # ---------------------------------------------------------------------------
@@ -125,15 +124,9 @@ def main() -> None:
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir)
-    chunks = generate_section_chunks(input_dir)
-
-    out_path = Path(args.output_file)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
-        for ch in chunks:
-            f.write(json.dumps(ch, ensure_ascii=False) + "\n")
+    stats = write_jsonl(generate_section_chunks(input_dir), Path(args.output_file))
 
-    print(f"\n✔ Generated {len(chunks):,} section chunks → {args.output_file}")
+    print(f"\n✔ Generated {stats.count:,} section chunks → {args.output_file}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
 import argparse
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Union
+from typing import Iterator, List, Dict, Any, Union
 import re
 from tqdm import tqdm
 
+from chunk_io import write_jsonl
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -91,16 +93,6 @@ def build_chunks(json_path: Path) -> List[Dict[str, Any]]:
 
     return chunks
 
-# ---------------------------------------------------------------------------
-# I/O helpers
-# ---------------------------------------------------------------------------
-
-def write_jsonl(chunks: List[Dict[str, Any]], outfile: Path) -> None:
-    outfile.parent.mkdir(parents=True, exist_ok=True)
-    with outfile.open("w", encoding="utf-8") as f:
-        for ch in chunks:
-            f.write(json.dumps(ch, ensure_ascii=False) + "\n")
-
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -116,13 +108,13 @@ def main():
     if not files:
         raise FileNotFoundError(f"No *_faq_rag.json files found in {input_dir}")
 
-    all_chunks: List[Dict[str, Any]] = []
-    for fp in files:
-        print(f"Processing {fp.name} …")
-        all_chunks.extend(build_chunks(fp))
+    def iter_chunks() -> Iterator[Dict[str, Any]]:
+        for fp in files:
+            print(f"Processing {fp.name} …")
+            yield from build_chunks(fp)
 
-    write_jsonl(all_chunks, Path(args.output_file))
-    print(f"✔ Generated {len(all_chunks):,} FAQ chunks → {args.output_file}")
+    stats = write_jsonl(iter_chunks(), Path(args.output_file))
+    print(f"✔ Generated {stats.count:,} FAQ chunks → {args.output_file}")
 
 
 if __name__ == "__main__":
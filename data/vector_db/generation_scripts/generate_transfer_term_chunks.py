@@ -5,6 +5,8 @@ from typing import Dict, List, Any
 import re
 from tqdm import tqdm
 
+from chunk_io import write_jsonl
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -87,11 +89,6 @@ def build_chunks(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return chunks
 
 
-def write_jsonl(chunks: List[Dict[str, Any]], outfile: Path):
-    outfile.parent.mkdir(parents=True, exist_ok=True)
-    with outfile.open("w", encoding="utf-8") as f:
-        for ch in chunks:
-            f.write(json.dumps(ch, ensure_ascii=False) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import List, Dict, Any
 import re
 
+from chunk_io import write_jsonl
+
 CHAR_LIMIT = 650
 OVERLAP_SENT = 1
 
@@ -121,13 +123,6 @@ def build_chunks(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return all_chunks
 
 
-def write_jsonl(chunks: List[Dict[str, Any]], outfile: Path):
-    outfile.parent.mkdir(parents=True, exist_ok=True)
-    with outfile.open("w", encoding="utf-8") as f:
-        for ch in chunks:
-            f.write(json.dumps(ch, ensure_ascii=False) + "\n")
-
-
 def main():
     parser = argparse.ArgumentParser(description="Generate vector-ready chunks from UCSD transfer timeline JSON.")
     parser.add_argument("--input-file", default=TIMELINE_FILE_DEFAULT, help="Path to UCSD timeline JSON.")
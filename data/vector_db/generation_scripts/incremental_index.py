@@ -0,0 +1,218 @@
+"""Incremental indexing helpers for ``build_vectorstore.py``.
+
+Each chunk gets a stable id derived from its metadata (plus an occurrence
+counter for chunks whose metadata is identical) and a content hash of its
+``page_content``. Embeddings are cached per content hash in a sidecar next to
+the FAISS index:
+
+* ``embeddings.npy`` – float32 matrix, one row per cached vector
+* ``embedding_cache.sqlite`` – ``(model, content_hash) → row`` plus the
+  ``chunk id → content hash`` map of the chunks currently in the index
+
+A rebuild embeds only chunks whose text has never been seen by that model,
+deletes removed ids from the index and adds new or changed ones.
+
+The module has no FAISS/LangChain dependency so the bookkeeping can be tested
+on its own.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+CACHE_DB = "embedding_cache.sqlite"
+CACHE_VECTORS = "embeddings.npy"
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of a chunk's page_content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ChunkIdAssigner:
+    """Assign stable chunk ids one chunk at a time (see :func:`chunk_ids`)."""
+
+    def __init__(self):
+        self._seen: Dict[str, int] = {}
+
+    def __call__(self, metadata: dict) -> str:
+        key = hashlib.sha256(
+            json.dumps(metadata, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        ).hexdigest()[:32]
+        occurrence = self._seen.get(key, 0)
+        self._seen[key] = occurrence + 1
+        return key if occurrence == 0 else f"{key}-{occurrence}"
+
+
+def chunk_ids(metadatas: Iterable[dict]) -> List[str]:
+    """Stable ids for chunks, derived from their metadata.
+
+    Chunks with identical metadata are told apart by their order of
+    occurrence, so ids survive edits to the text and to unrelated chunks.
+    """
+    assign = ChunkIdAssigner()
+    return [assign(metadata) for metadata in metadatas]
+
+
+@dataclass
+class UpdatePlan:
+    """Index changes needed to go from the indexed chunks to the wanted ones."""
+
+    add: List[str] = field(default_factory=list)
+    delete: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def is_noop(self) -> bool:
+        return not self.add and not self.delete
+
+
+def plan_update(indexed: Dict[str, str], wanted: Dict[str, str]) -> UpdatePlan:
+    """Diff ``{chunk id: content hash}`` maps.
+
+    A chunk whose text changed is deleted and re-added under the same id.
+    ``add`` keeps the order of *wanted*.
+    """
+    plan = UpdatePlan()
+    for chunk_id, digest in wanted.items():
+        previous = indexed.get(chunk_id)
+        if previous == digest:
+            plan.unchanged.append(chunk_id)
+        else:
+            plan.add.append(chunk_id)
+            if previous is not None:
+                plan.delete.append(chunk_id)
+    plan.delete.extend(chunk_id for chunk_id in indexed if chunk_id not in wanted)
+    return plan
+
+
+class EmbeddingCache:
+    """Content-hash → embedding cache stored as an ``.npy`` matrix plus sqlite index."""
+
+    def __init__(self, directory: Path, model_name: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self._db = sqlite3.connect(self.directory / CACHE_DB)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS vectors (
+                model TEXT NOT NULL, content_hash TEXT NOT NULL, row INTEGER NOT NULL,
+                PRIMARY KEY (model, content_hash));
+            CREATE TABLE IF NOT EXISTS indexed (
+                chunk_id TEXT PRIMARY KEY, content_hash TEXT NOT NULL);
+            """
+        )
+        path = self.directory / CACHE_VECTORS
+        self._vectors: Optional[np.ndarray] = np.load(path, mmap_mode="r") if path.exists() else None
+        self._pending: List[np.ndarray] = []
+        self._pending_rows = 0
+
+    @property
+    def _stored_rows(self) -> int:
+        return 0 if self._vectors is None else len(self._vectors)
+
+    def lookup(self, hashes: Sequence[str]) -> Dict[str, int]:
+        """Return ``{content hash: row}`` for the cached subset of *hashes*."""
+        rows: Dict[str, int] = {}
+        unique = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            for digest, row in self._db.execute(
+                f"SELECT content_hash, row FROM vectors WHERE model = ? AND content_hash IN ({placeholders})",
+                [self.model_name, *batch],
+            ):
+                rows[digest] = row
+        return rows
+
+    def add(self, hashes: Sequence[str], vectors: np.ndarray) -> None:
+        """Cache freshly computed vectors (persisted by :meth:`flush`)."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        first = self._stored_rows + self._pending_rows
+        self._db.executemany(
+            "INSERT OR REPLACE INTO vectors (model, content_hash, row) VALUES (?, ?, ?)",
+            [(self.model_name, digest, first + i) for i, digest in enumerate(hashes)],
+        )
+        self._pending.append(vectors)
+        self._pending_rows += len(vectors)
+
+    def get(self, hashes: Sequence[str]) -> np.ndarray:
+        """Vectors for *hashes*, all of which must be cached."""
+        rows = self.lookup(hashes)
+        stored = self._stored_rows
+        pending = np.concatenate(self._pending) if self._pending else None
+        out = []
+        for digest in hashes:
+            row = rows[digest]
+            out.append(self._vectors[row] if row < stored else pending[row - stored])
+        return np.asarray(out, dtype=np.float32)
+
+    def indexed(self) -> Dict[str, str]:
+        """``{chunk id: content hash}`` of the chunks currently in the index."""
+        return dict(self._db.execute("SELECT chunk_id, content_hash FROM indexed"))
+
+    def set_indexed(self, mapping: Dict[str, str]) -> None:
+        self._db.execute("DELETE FROM indexed")
+        self._db.executemany("INSERT INTO indexed (chunk_id, content_hash) VALUES (?, ?)", mapping.items())
+
+    def flush(self) -> None:
+        """Append pending vectors to the ``.npy`` file, then commit the sqlite index."""
+        if self._pending:
+            parts = ([np.asarray(self._vectors)] if self._vectors is not None else []) + self._pending
+            matrix = np.concatenate(parts)
+            path = self.directory / CACHE_VECTORS
+            tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npy")
+            np.save(tmp_path, matrix)
+            os.replace(tmp_path, path)
+            self._vectors = np.load(path, mmap_mode="r")
+            self._pending, self._pending_rows = [], 0
+        self._db.commit()
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+
+def embed_missing(
+    cache: EmbeddingCache,
+    texts: Sequence[str],
+    hashes: Sequence[str],
+    embed_fn=None,
+    batch_size: int = 256,
+    stream_fn=None,
+) -> Tuple[int, int]:
+    """Embed the texts whose hash is not cached yet.
+
+    Either *embed_fn* (a list of texts → vectors) is called in batches of
+    *batch_size*, or *stream_fn* (texts → iterator of vector arrays in input
+    order) is consumed and each array is cached as it arrives.
+
+    Returns:
+        (number embedded, number served from the cache)
+    """
+    cached = cache.lookup(hashes)
+    todo: Dict[str, str] = {}
+    for text, digest in zip(texts, hashes):
+        if digest not in cached and digest not in todo:
+            todo[digest] = text
+    digests, pending_texts = list(todo), list(todo.values())
+
+    if stream_fn is not None:
+        offset = 0
+        for vectors in stream_fn(pending_texts):
+            cache.add(digests[offset:offset + len(vectors)], np.asarray(vectors, dtype=np.float32))
+            offset += len(vectors)
+    else:
+        for start in range(0, len(digests), batch_size):
+            vectors = embed_fn(pending_texts[start:start + batch_size])
+            cache.add(digests[start:start + batch_size], np.asarray(vectors, dtype=np.float32))
+    return len(digests), len(set(hashes)) - len(digests)
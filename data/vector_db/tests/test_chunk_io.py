@@ -0,0 +1,69 @@
+"""Tests for the streaming chunk I/O shared by the generation scripts."""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "generation_scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from chunk_io import JsonlWriter, iter_jsonl, write_jsonl  # noqa: E402
+import generate_articulation_chunks as artic  # noqa: E402
+
+ARTIC_DIR = Path(__file__).resolve().parents[2] / (
+    "assist_articulation_v2/rag_output/santa_monica_college/university_of_california_san_diego"
+)
+
+
+def _chunks(n):
+    return ({"page_content": "x" * (i + 1), "metadata": {"i": i}} for i in range(n))
+
+
+def test_write_then_stream_back(tmp_path):
+    path = tmp_path / "out" / "chunks.jsonl"
+    stats = write_jsonl(_chunks(5), path, header={"source": "test"})
+    assert stats.count == 5 and list(stats.lengths) == [1, 2, 3, 4, 5]
+
+    lines = path.read_text().splitlines()
+    assert json.loads(lines[0]) == {"_metadata": {"source": "test"}}
+    assert list(iter_jsonl(path)) == list(_chunks(5))
+    assert len(list(iter_jsonl(path, skip_header=False))) == 6
+
+
+def test_deferred_header_is_prepended(tmp_path):
+    path = tmp_path / "chunks.jsonl"
+    writer = JsonlWriter(path, defer_header=True)
+    writer.write_all(_chunks(3))
+    writer.close({"count": writer.stats.count})
+
+    first = json.loads(path.read_text().splitlines()[0])
+    assert first == {"_metadata": {"count": 3}}
+    assert [p.name for p in tmp_path.iterdir()] == ["chunks.jsonl"]
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = tmp_path / "chunks.jsonl"
+    write_jsonl(_chunks(2), path)
+
+    def broken():
+        yield from _chunks(1)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        write_jsonl(broken(), path)
+    assert len(list(iter_jsonl(path))) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["chunks.jsonl"]
+
+
+def test_streamed_articulation_chunks_match_in_memory_enrichment(tmp_path):
+    for source in sorted(ARTIC_DIR.glob("*.json"))[:6]:
+        shutil.copy(source, tmp_path / source.name)
+
+    expected = list(artic.iter_raw_chunks(tmp_path))
+    artic.enrich_relationships(expected)
+
+    assert list(artic.generate_chunks(tmp_path)) == expected
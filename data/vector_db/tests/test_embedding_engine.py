@@ -0,0 +1,49 @@
+"""Tests for the multiprocess embedding engine (with a stand-in model)."""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "generation_scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from embedding_engine import EmbeddingEngine  # noqa: E402
+
+
+class FakeModel:
+    """Deterministic 3-d "embeddings" that also record the worker's thread limit."""
+
+    def encode(self, texts, batch_size, convert_to_numpy=True, show_progress_bar=False):
+        threads = float(os.environ["OMP_NUM_THREADS"])
+        return np.array([[len(t), sum(map(ord, t)) % 101, threads] for t in texts], dtype=np.float32)
+
+
+def fake_factory(model_name):
+    return FakeModel()
+
+
+def _expected(texts, threads):
+    return np.array([[len(t), sum(map(ord, t)) % 101, threads] for t in texts], dtype=np.float32)
+
+
+def test_stream_preserves_order_across_workers():
+    texts = [f"chunk {i} " * (i % 7 + 1) for i in range(103)]
+    with EmbeddingEngine("fake", workers=2, batch_size=5, threads_per_worker=3, model_factory=fake_factory) as engine:
+        shards = list(engine.embed_stream(texts))
+        assert len(shards) == 6  # shards of batch_size * 4 texts
+        np.testing.assert_array_equal(np.concatenate(shards), _expected(texts, 3))
+        assert engine.stats.texts == 103
+        assert engine.stats.chunks_per_second > 0
+        assert "103 chunks" in engine.stats.summary()
+
+
+def test_autotune_picks_a_candidate_and_serves_langchain_interface():
+    texts = [f"text {i}" for i in range(40)]
+    with EmbeddingEngine("fake", workers=1, model_factory=fake_factory) as engine:
+        vectors = engine.embed_documents(texts)
+        assert engine.batch_size in engine.autotune_rates
+        assert np.allclose(vectors, _expected(texts, engine.threads_per_worker))
+        assert engine.embed_query("hello") == _expected(["hello"], engine.threads_per_worker)[0].tolist()
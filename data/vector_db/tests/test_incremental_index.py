@@ -0,0 +1,70 @@
+"""Tests for the incremental indexing bookkeeping used by build_vectorstore.py."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "generation_scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from incremental_index import (  # noqa: E402
+    EmbeddingCache,
+    chunk_ids,
+    content_hash,
+    embed_missing,
+    plan_update,
+)
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), float(sum(map(ord, t)) % 97)] for t in texts]
+
+
+def test_chunk_ids_are_stable_and_disambiguate_duplicates():
+    metadatas = [{"course_code": "MATH 7"}, {"course_code": "CS 55"}, {"course_code": "MATH 7"}]
+    ids = chunk_ids(metadatas)
+    assert len(set(ids)) == 3
+    assert ids == chunk_ids([dict(m) for m in metadatas])
+    assert chunk_ids(metadatas[1:2]) == [ids[1]]
+
+
+def test_plan_update_adds_changed_and_deletes_removed():
+    indexed = {"a": "h1", "b": "h2", "c": "h3"}
+    wanted = {"a": "h1", "b": "h2-new", "d": "h4"}
+    plan = plan_update(indexed, wanted)
+    assert plan.unchanged == ["a"]
+    assert plan.add == ["b", "d"]
+    assert sorted(plan.delete) == ["b", "c"]
+    assert plan_update(wanted, wanted).is_noop
+
+
+def test_cache_embeds_only_unseen_text_and_persists(tmp_path):
+    texts = ["alpha", "beta", "alpha"]
+    hashes = [content_hash(t) for t in texts]
+    embed = CountingEmbedder()
+
+    cache = EmbeddingCache(tmp_path, "model-a")
+    assert embed_missing(cache, texts, hashes, embed, batch_size=1) == (2, 0)
+    assert embed.calls == [["alpha"], ["beta"]]
+    expected = cache.get(hashes)
+    cache.set_indexed({"x": hashes[0]})
+    cache.close()
+
+    cache = EmbeddingCache(tmp_path, "model-a")
+    assert embed_missing(cache, texts + ["gamma"], hashes + [content_hash("gamma")], embed) == (1, 2)
+    assert embed.calls[-1] == ["gamma"]
+    np.testing.assert_array_equal(cache.get(hashes), expected)
+    assert cache.indexed() == {"x": hashes[0]}
+    cache.close()
+
+    # Vectors are per model
+    other = EmbeddingCache(tmp_path, "model-b")
+    assert other.lookup(hashes) == {}
+    other.close()
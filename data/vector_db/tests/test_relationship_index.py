@@ -0,0 +1,48 @@
+"""Tests for the single-pass relationship enrichment of articulation chunks."""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "generation_scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_articulation_chunks as artic  # noqa: E402
+
+
+def _requirement(major, *codes):
+    return {"page_content": "", "metadata": {
+        "type": "requirement", "parent_major_id": major, "transferable_courses": list(codes)}}
+
+
+def test_shared_courses_and_alternative_paths():
+    chunks = [
+        _requirement("m2", "MATH 7", "CS 55"),
+        {"page_content": "", "metadata": {"type": "general_info"}},
+        _requirement("m1", "MATH 7", "CHEM 11"),
+        _requirement("m1", "CS 55"),
+        _requirement("m3", "CHEM 11", "PHYS 21"),
+    ]
+    artic.enrich_relationships(chunks)
+
+    index = artic.RelationshipIndex()
+    for ch in chunks:
+        index.add(ch)
+    assert index.course_chunks["MATH 7"] == [0, 2]
+    assert index.major_chunks["m1"] == [2, 3]
+
+    assert chunks[0]["metadata"]["shared_courses"] == ["MATH 7", "CS 55"]
+    assert chunks[0]["metadata"]["alternative_paths"] == ["m1"]
+    assert chunks[2]["metadata"]["alternative_paths"] == ["m2", "m3"]
+    assert chunks[4]["metadata"]["shared_courses"] == ["CHEM 11"]
+    assert "shared_courses" not in chunks[1]["metadata"]
+
+
+def test_alternative_paths_are_capped_and_sorted(monkeypatch):
+    monkeypatch.setattr(artic, "MAX_ALTERNATIVE_PATHS", 3)
+    majors = [f"m{i}" for i in (5, 3, 9, 1, 7)]
+    chunks = [_requirement(major, "MATH 7") for major in majors]
+    artic.enrich_relationships(chunks)
+
+    assert chunks[0]["metadata"]["alternative_paths"] == ["m1", "m3", "m7"]
+    assert chunks[3]["metadata"]["alternative_paths"] == ["m3", "m5", "m7"]
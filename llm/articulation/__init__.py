@@ -32,6 +32,9 @@ from .validators import (
     explain_if_satisfied,
     validate_combo_against_group,
     validate_uc_courses_against_group_sections,
+    compile_logic_block,
+    evaluate_logic_block,
+    validate_against_documents,
 )
 
 # Rendering API - functions for converting logic to human-readable text
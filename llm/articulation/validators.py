@@ -6,6 +6,9 @@ satisfy articulation requirements. It handles complex nested logic structures (A
 and provides detailed explanations for why requirements are or are not satisfied.
 
 Key Functions:
+- compile_logic_block: Compiles a logic block into an evaluable form
+- evaluate_logic_block: Structured (render-free) validation of one block
+- validate_against_documents: Validates one student against many documents
 - is_articulation_satisfied: Determines if selected courses satisfy requirements
 - explain_if_satisfied: Provides a detailed explanation of validation results
 - validate_combo_against_group: Validates courses against group-level requirements
@@ -14,11 +17,411 @@ The validators prioritize accuracy and detailed explanation generation to help
 users understand exactly how their course selections match articulation requirements.
 """
 
-import re
-from typing import List, Dict, Tuple, Union, Any, Optional, Set
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Dict, Tuple, Union, Any, Optional, Set, FrozenSet, Iterable
 from .models import LogicBlock, ValidationResult, CourseOption
 
 
+# ---------------------------------------------------------------------------
+# Compiled logic blocks
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CompiledOption:
+    """
+    One AND option of an OR block, reduced to a set of normalized course ids.
+    
+    Attributes:
+        label: Display label ("Option A", "Option B", ...)
+        required: Normalized (uppercase) course codes that must all be taken
+        status: "ok", "invalid" (not an AND block) or "empty" (no courses)
+    """
+    label: str
+    required: FrozenSet[str] = frozenset()
+    status: str = "ok"
+
+
+@dataclass(frozen=True)
+class CompiledLogic:
+    """
+    Evaluable form of a logic block, built once by compile_logic_block.
+    
+    Attributes:
+        source: The logic block dict it was compiled from
+        options: Compiled options in declaration order
+        is_empty: True if the block was missing or not a dict
+        no_articulation: True if the block carries no_articulation=True
+        is_valid: True for a non-empty OR block with a list of options
+        honors_required: Precomputed is_honors_required(source)
+    """
+    source: Optional[Dict[str, Any]]
+    options: Tuple[CompiledOption, ...] = ()
+    is_empty: bool = False
+    no_articulation: bool = False
+    is_valid: bool = False
+    honors_required: bool = False
+
+
+def compile_logic_block(logic_block: Union[LogicBlock, Dict[str, Any], None]) -> CompiledLogic:
+    """
+    Compile a logic block into a CompiledLogic.
+    
+    The OR-of-AND structure is flattened into per-option frozensets of
+    normalized course codes and the honors requirement is evaluated once, so
+    each later check is a handful of set operations.
+    
+    Args:
+        logic_block: A LogicBlock or dict representing articulation requirements
+        
+    Returns:
+        The compiled, immutable representation
+    """
+    from .detectors import is_honors_required
+    
+    block = logic_block.dict() if isinstance(logic_block, LogicBlock) else logic_block
+    if not block or not isinstance(block, dict):
+        return CompiledLogic(source=None, is_empty=True)
+    
+    no_articulation = bool(block.get("no_articulation", False))
+    block_type = block.get("type", "OR")
+    raw_options = block.get("courses", [])
+    if block_type != "OR" or not isinstance(raw_options, list) or not raw_options:
+        return CompiledLogic(source=block, no_articulation=no_articulation)
+    
+    options = []
+    for i, option in enumerate(raw_options):
+        label = f"Option {chr(65 + i)}"
+        if not isinstance(option, dict) or option.get("type") != "AND":
+            options.append(CompiledOption(label, status="invalid"))
+            continue
+        required = frozenset(
+            c.get("course_letters", "").upper().strip()
+            for c in option.get("courses", [])
+            if isinstance(c, dict) and "course_letters" in c
+        )
+        options.append(CompiledOption(label, required, "ok" if required else "empty"))
+    
+    return CompiledLogic(
+        source=block,
+        options=tuple(options),
+        no_articulation=no_articulation,
+        is_valid=True,
+        honors_required=is_honors_required(block),
+    )
+
+
+# Identity-keyed cache so documents that share a logic block dict compile it
+# once. Logic blocks are treated as immutable once loaded; the cache holds a
+# reference to each block so an id() is never reused while cached.
+_COMPILED_CACHE: "OrderedDict[int, Tuple[Any, CompiledLogic]]" = OrderedDict()
+_COMPILED_CACHE_SIZE = 4096
+_COMPILED_CACHE_LOCK = threading.Lock()
+
+
+def _compiled(logic_block: Union[LogicBlock, Dict[str, Any], None]) -> CompiledLogic:
+    """Return the cached compilation of logic_block (dicts only; others compile fresh)."""
+    if not isinstance(logic_block, dict):
+        return compile_logic_block(logic_block)
+    
+    key = id(logic_block)
+    with _COMPILED_CACHE_LOCK:
+        entry = _COMPILED_CACHE.get(key)
+        if entry is not None and entry[0] is logic_block:
+            _COMPILED_CACHE.move_to_end(key)
+            return entry[1]
+    
+    compiled = compile_logic_block(logic_block)
+    with _COMPILED_CACHE_LOCK:
+        _COMPILED_CACHE[key] = (logic_block, compiled)
+        _COMPILED_CACHE.move_to_end(key)
+        while len(_COMPILED_CACHE) > _COMPILED_CACHE_SIZE:
+            _COMPILED_CACHE.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_cache() -> None:
+    """Drop every cached compilation (call after mutating loaded logic blocks)."""
+    with _COMPILED_CACHE_LOCK:
+        _COMPILED_CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Structured evaluation
+# ---------------------------------------------------------------------------
+
+@dataclass
+class LogicEvaluation:
+    """
+    Structured result of checking selected courses against a compiled block.
+    
+    Validation results are plain data; the human-readable explanation and the
+    redundant-course analysis are only computed when first accessed.
+    
+    Attributes:
+        compiled: The compiled logic block that was evaluated
+        selected_courses: Selected courses as given
+        satisfied_options: (label, matched courses) for each fully satisfied option
+        partial_matches: Partially matched options, best first, each with
+            label, matched, missing, percentage and required
+        unmatched_options: (label, required courses) for options with no match
+    """
+    compiled: CompiledLogic
+    selected_courses: Tuple[str, ...]
+    satisfied_options: List[Tuple[str, List[str]]] = field(default_factory=list)
+    partial_matches: List[Dict[str, Any]] = field(default_factory=list)
+    unmatched_options: List[Tuple[str, List[str]]] = field(default_factory=list)
+    detect_all_redundant: bool = False
+    
+    @property
+    def is_satisfied(self) -> bool:
+        """True if at least one option is fully satisfied (ignores honors)."""
+        return bool(self.satisfied_options)
+    
+    @property
+    def honors_missing(self) -> bool:
+        """True if the block requires honors and no honors course was selected."""
+        return self.compiled.honors_required and not any(
+            course.upper().strip().endswith('H') for course in self.selected_courses
+        )
+    
+    @property
+    def match_percentage(self) -> int:
+        """100 when satisfied, otherwise the best partial match percentage."""
+        if self.is_satisfied:
+            return 100
+        return int(self.partial_matches[0]["percentage"]) if self.partial_matches else 0
+    
+    @property
+    def missing_courses(self) -> List[str]:
+        """Courses still missing from the best partial match."""
+        return list(self.partial_matches[0]["missing"]) if self.partial_matches else []
+    
+    @cached_property
+    def redundant_groups(self) -> List[List[str]]:
+        """Groups of equivalent selected courses (computed on first access)."""
+        if self.compiled.source is None:
+            return []
+        
+        # Import here to avoid circular imports
+        from .detectors import detect_redundant_courses
+        
+        redundant_groups = detect_redundant_courses(list(self.selected_courses), self.compiled.source)
+        if self.detect_all_redundant:
+            # Pattern matching against a minimal logic block
+            pattern_redundant = detect_redundant_courses(
+                list(self.selected_courses), {"type": "OR", "courses": []}
+            )
+            existing_groups = {frozenset(group) for group in redundant_groups}
+            for group in pattern_redundant:
+                if frozenset(group) not in existing_groups:
+                    redundant_groups.append(group)
+                    existing_groups.add(frozenset(group))
+        return redundant_groups
+    
+    @cached_property
+    def explanation(self) -> str:
+        """Human-readable explanation (rendered on first access)."""
+        return _render_explanation(self)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the is_articulation_satisfied result dictionary.
+        
+        Applies the honors check on top of the structural result; the
+        explanation is rendered here because the dictionary includes it.
+        """
+        compiled = self.compiled
+        if compiled.is_empty or compiled.no_articulation:
+            return {
+                "is_satisfied": False,
+                "explanation": "❌ This course must be completed at UCSD.",
+                "satisfied_options": [],
+                "missing_courses": {},
+                "redundant_courses": [],
+                "match_percentage": 0
+            }
+        
+        is_satisfied = self.is_satisfied
+        explanation = self.explanation
+        satisfied_options = list(self.satisfied_options[0][1]) if is_satisfied else []
+        missing_courses = {} if is_satisfied else {course: [] for course in self.missing_courses}
+        match_percentage = self.match_percentage
+        
+        if self.honors_missing:
+            if not missing_courses:
+                missing_courses = {"Honors version required": []}
+            else:
+                missing_courses = {"Honors version of " + course: [] for course in missing_courses}
+            
+            if is_satisfied:
+                # Update to not satisfied if honors requirement was missed
+                is_satisfied = False
+                explanation += " However, an honors course is required."
+                match_percentage = 0
+        
+        return {
+            'is_satisfied': is_satisfied,
+            'explanation': explanation,
+            'satisfied_options': satisfied_options,
+            'missing_courses': missing_courses,
+            'redundant_courses': self.redundant_groups if compiled.is_valid else [],
+            'match_percentage': match_percentage
+        }
+
+
+def evaluate_logic_block(
+    logic_block: Union[CompiledLogic, LogicBlock, Dict[str, Any], None],
+    selected_courses: Iterable[str],
+    detect_all_redundant: bool = False
+) -> LogicEvaluation:
+    """
+    Evaluate selected courses against a logic block without rendering text.
+    
+    Args:
+        logic_block: A CompiledLogic, LogicBlock or logic block dict
+        selected_courses: Selected course codes
+        detect_all_redundant: Whether redundant detection should also use
+            honors/non-honors pattern matching
+        
+    Returns:
+        A LogicEvaluation with satisfied options, partial matches and
+        unmatched options populated
+    """
+    compiled = logic_block if isinstance(logic_block, CompiledLogic) else _compiled(logic_block)
+    selected = tuple(selected_courses)
+    selected_set = {c.upper().strip() for c in selected}
+    return _evaluate(compiled, selected, selected_set, detect_all_redundant)
+
+
+def _evaluate(
+    compiled: CompiledLogic,
+    selected: Tuple[str, ...],
+    selected_set: Set[str],
+    detect_all_redundant: bool = False
+) -> LogicEvaluation:
+    """Evaluate a compiled block against an already normalized selection."""
+    evaluation = LogicEvaluation(compiled, selected, detect_all_redundant=detect_all_redundant)
+    
+    for option in compiled.options:
+        if option.status != "ok":
+            continue
+        required = option.required
+        matched = required & selected_set
+        
+        if len(matched) == len(required):
+            # Complete match - all required courses are selected
+            evaluation.satisfied_options.append((option.label, sorted(matched)))
+        elif matched:
+            # Partial match - calculate percentage complete
+            evaluation.partial_matches.append({
+                "label": option.label,
+                "matched": sorted(matched),
+                "missing": sorted(required - selected_set),
+                "percentage": len(matched) / len(required) * 100,
+                "required": sorted(required)
+            })
+        else:
+            evaluation.unmatched_options.append((option.label, sorted(required)))
+    
+    # Highest percentage first; stable, so ties keep option order
+    evaluation.partial_matches.sort(key=lambda x: x["percentage"], reverse=True)
+    return evaluation
+
+
+def validate_against_documents(
+    documents: Iterable[Any],
+    selected_courses: Iterable[str]
+) -> List[LogicEvaluation]:
+    """
+    Validate one student's courses against many documents in a single pass.
+    
+    The selection is normalized once and each document's logic block is
+    compiled at most once per process. No explanations are rendered unless a
+    caller reads LogicEvaluation.explanation or calls to_dict().
+    
+    Args:
+        documents: Documents (anything with .metadata) or raw logic block dicts
+        selected_courses: Selected course codes
+        
+    Returns:
+        One LogicEvaluation per document, in input order
+    """
+    selected = tuple(selected_courses)
+    selected_set = {c.upper().strip() for c in selected}
+    
+    results = []
+    for doc in documents:
+        metadata = getattr(doc, "metadata", None)
+        logic_block = metadata.get("logic_block", {}) if isinstance(metadata, dict) else doc
+        results.append(_evaluate(_compiled(logic_block), selected, selected_set))
+    return results
+
+
+def _render_explanation(evaluation: LogicEvaluation) -> str:
+    """Render the explain_if_satisfied text for a structured evaluation."""
+    compiled = evaluation.compiled
+    if compiled.is_empty:
+        return "⚠️ No articulation logic available."
+    if not compiled.is_valid:
+        return "⚠️ Invalid or empty articulation structure."
+    
+    # Format explanation for redundant courses if any found
+    redundant_note = ""
+    if evaluation.redundant_groups:
+        redundant_note = "\n\n⚠️ **Redundant courses detected**:\n"
+        for group in evaluation.redundant_groups:
+            redundant_note += f"- Courses **{', '.join(group)}** are equivalent. Only one is needed.\n"
+    
+    if evaluation.satisfied_options:
+        # Format the success message
+        if len(evaluation.satisfied_options) == 1:
+            label, matched = evaluation.satisfied_options[0]
+            success_msg = f"✅ **Complete match!** Satisfies {label} with: {', '.join(matched)}"
+        else:
+            success_msg = "✅ **Complete match!** Satisfies multiple options:\n"
+            for label, matched in evaluation.satisfied_options:
+                success_msg += f"- {label}: {', '.join(matched)}\n"
+        return success_msg + redundant_note
+    
+    partial_matches = evaluation.partial_matches
+    if partial_matches:
+        best_match = partial_matches[0]
+        
+        # Create a progress bar for visualization (10 characters wide)
+        progress_chars = int(best_match["percentage"] / 10)
+        progress_bar = "█" * progress_chars + "░" * (10 - progress_chars)
+        
+        # Format the partial match message
+        partial_msg = f"⚠️ **Partial match ({int(best_match['percentage'])}%)** [{progress_bar}]\n\n"
+        partial_msg += f"**Best option: {best_match['label']}**\n"
+        partial_msg += f"✓ Matched: {', '.join(best_match['matched'])}\n"
+        partial_msg += f"✗ Missing: **{', '.join(best_match['missing'])}**\n\n"
+        
+        # Add details about other potential options
+        if len(partial_matches) > 1:
+            partial_msg += "Other partial matches:\n"
+            for match in partial_matches[1:3]:  # Show up to 3 alternatives
+                partial_msg += f"- {match['label']} ({int(match['percentage'])}%): Missing {', '.join(match['missing'])}\n"
+        
+        return partial_msg + redundant_note
+    
+    # If no options were satisfied at all
+    summary = "❌ **No complete or partial matches found.**"
+    if evaluation.unmatched_options:
+        summary += f"\n\nYou need at least one of these course combinations:"
+        for _, required in evaluation.unmatched_options:
+            summary += f"\n- {', '.join(required)}"
+    
+    return summary + redundant_note
+
+
+# ---------------------------------------------------------------------------
+# Public validation API
+# ---------------------------------------------------------------------------
+
 def is_articulation_satisfied(
     logic_block: Union[LogicBlock, Dict[str, Any]], 
     selected_courses: List[str],
@@ -27,9 +430,9 @@ def is_articulation_satisfied(
     """
     Determine if selected courses satisfy a logic block.
     
-    This is the core validation function that traverses a logic block structure
-    and checks if the selected courses satisfy the requirements according to
-    the AND/OR logic. It handles nested logic structures recursively.
+    This is the core validation function. The logic block is compiled once
+    (see compile_logic_block) and evaluated structurally; the explanation is
+    rendered from the structured result rather than parsed back out of it.
     
     Args:
         logic_block: A LogicBlock or dict representing articulation requirements
@@ -54,92 +457,7 @@ def is_articulation_satisfied(
         >>> result["is_satisfied"]
         True
     """
-    # Ensure logic_block is in a consistent format
-    if isinstance(logic_block, LogicBlock):
-        logic_block_dict = logic_block.dict()
-    else:
-        logic_block_dict = logic_block
-    
-    # For empty logic or dictionary with no_articulation=True, nothing satisfies
-    if not logic_block_dict or not isinstance(logic_block_dict, dict) or logic_block_dict.get("no_articulation", False):
-        return {
-            "is_satisfied": False,
-            "explanation": "❌ This course must be completed at UCSD.",
-            "satisfied_options": [],
-            "missing_courses": {},
-            "redundant_courses": [],
-            "match_percentage": 0
-        }
-
-    # Initialize result structure
-    result = {
-        'is_satisfied': False,
-        'explanation': '',
-        'satisfied_options': [],
-        'missing_courses': {},
-        'redundant_courses': [],
-        'match_percentage': 0
-    }
-    
-    # Use explain_if_satisfied to check satisfaction and get detailed explanation
-    from .detectors import is_honors_required
-    is_satisfied, explanation, redundant_courses = explain_if_satisfied(
-        logic_block_dict, selected_courses, honors_pairs=honors_pairs
-    )
-    
-    # Parse the explanation to determine if articulation is satisfied
-    if is_satisfied:
-        result['is_satisfied'] = True
-        result['explanation'] = explanation
-        
-        # Extract satisfied options from the explanation
-        # Example format: "Complete match! Satisfies Option A with: CIS 22A, CIS 22B"
-        match = re.search(r"with:\s*([A-Z0-9, ]+)", explanation, re.IGNORECASE)
-        if match:
-            satisfied_with = match.group(1).strip()
-            result['satisfied_options'] = [course.strip() for course in satisfied_with.split(',')]
-    else:
-        result['is_satisfied'] = False
-        result['explanation'] = explanation
-        
-        # Extract missing requirements from the explanation
-        # Example format: "Missing: CIS 22A or CIS 29"
-        missing_match = re.search(r"Missing:\s*\*\*([A-Z0-9, ]+)\*\*", explanation, re.IGNORECASE)
-        if missing_match:
-            missing_courses = missing_match.group(1).strip()
-            result['missing_courses'] = {course.strip(): [] for course in missing_courses.split(',')}
-    
-    # Check if honors are required but not provided
-    if is_honors_required(logic_block_dict):
-        honors_provided = any(course.upper().strip().endswith('H') for course in selected_courses)
-        if not honors_provided:
-            if not result['missing_courses']:
-                result['missing_courses'] = {"Honors version required": []}
-            else:
-                result['missing_courses'] = {"Honors version of " + course: [] 
-                                           for course in result['missing_courses']}
-            
-            if result['is_satisfied']:
-                # Update to not satisfied if honors requirement was missed
-                result['is_satisfied'] = False
-                result['explanation'] += " However, an honors course is required."
-    
-    # Calculate match percentage
-    if result['is_satisfied']:
-        result['match_percentage'] = 100
-    else:
-        # If we have partial matches, extract the percentage from the explanation
-        partial_match = re.search(r"Partial match \((\d+)%\)", explanation)
-        if partial_match:
-            result['match_percentage'] = int(partial_match.group(1))
-        else:
-            result['match_percentage'] = 0
-    
-    # Store any redundant courses detected
-    if redundant_courses:
-        result['redundant_courses'] = redundant_courses
-    
-    return result
+    return evaluate_logic_block(logic_block, selected_courses).to_dict()
 
 
 def explain_if_satisfied(
@@ -180,180 +498,10 @@ def explain_if_satisfied(
         >>> "MATH 1A" in explanation
         True
     """
-    # Ensure logic_block is a dict for consistent handling
-    if isinstance(logic_block, LogicBlock):
-        logic_block_dict = logic_block.dict()
-    else:
-        logic_block_dict = logic_block
-    
-    # Normalize selected courses to uppercase for consistent comparison
-    selected_set = {c.upper().strip() for c in selected_courses}
-    redundant_courses = []
-
-    # Validate the logic block structure
-    if not logic_block_dict or not isinstance(logic_block_dict, dict):
-        return False, "⚠️ No articulation logic available.", []
-
-    block_type = logic_block_dict.get("type", "OR")
-    options = logic_block_dict.get("courses", [])
-
-    # Ensure we have a valid OR block with options
-    if block_type != "OR" or not isinstance(options, list) or not options:
-        return False, "⚠️ Invalid or empty articulation structure.", []
-
-    # Initialize tracking variables
-    all_missing_courses = set()
-    feedback_lines = []
-    
-    # Import detect_redundant_courses here to avoid circular imports
-    from .detectors import detect_redundant_courses
-    
-    # Check for redundant courses using the detector
-    redundant_groups = detect_redundant_courses(selected_courses, logic_block_dict)
-    
-    # Check for additional redundant courses using pattern matching if requested
-    if detect_all_redundant:
-        # Create a minimal logic block for pattern matching
-        pattern_logic_block = {"type": "OR", "courses": []}
-        pattern_redundant = detect_redundant_courses(selected_courses, pattern_logic_block)
-        
-        # Merge the results, avoiding duplicates
-        existing_groups = {frozenset(group) for group in redundant_groups}
-        for group in pattern_redundant:
-            if frozenset(group) not in existing_groups:
-                redundant_groups.append(group)
-                existing_groups.add(frozenset(group))
-    
-    # Format explanation for redundant courses if any found
-    redundant_note = ""
-    if redundant_groups:
-        redundant_note = "\n\n⚠️ **Redundant courses detected**:\n"
-        for group in redundant_groups:
-            redundant_note += f"- Courses **{', '.join(group)}** are equivalent. Only one is needed.\n"
-
-    # Track if any option is satisfied and collect details about partial matches
-    any_option_satisfied = False
-    satisfied_options = []
-    best_partial_match = None
-    best_partial_percentage = 0
-    partial_matches = []
-
-    # Analyze each option (AND block) in the OR block
-    for i, option in enumerate(options):
-        label = f"Option {chr(65 + i)}"
-
-        # Ensure valid AND path
-        if not isinstance(option, dict) or option.get("type") != "AND":
-            feedback_lines.append(f"{label}: ⚠️ Skipped (invalid format).")
-            continue
-
-        # Extract required courses for this option
-        required = {c.get("course_letters", "").upper() for c in option.get("courses", []) if "course_letters" in c}
-        
-        # Compare with selected courses
-        missing = required - selected_set
-        matched = required & selected_set
-
-        # Skip empty options
-        if not required:
-            feedback_lines.append(f"{label}: ⚠️ Empty option — no courses required?")
-            continue
-
-        # Complete match - all required courses are selected
-        if required.issubset(selected_set):
-            any_option_satisfied = True
-            satisfied_options.append((label, sorted(matched)))
-        # Partial match - calculate percentage complete
-        elif matched:
-            match_percentage = len(matched) / len(required) * 100
-            partial_matches.append({
-                "label": label,
-                "matched": sorted(matched),
-                "missing": sorted(missing),
-                "percentage": match_percentage,
-                "required": sorted(required)
-            })
-            
-            # Track the best partial match
-            if match_percentage > best_partial_percentage:
-                best_partial_percentage = match_percentage
-                best_partial_match = {
-                    "label": label,
-                    "matched": sorted(matched),
-                    "missing": sorted(missing),
-                    "percentage": match_percentage
-                }
-                
-            # Add to overall missing courses
-            all_missing_courses.update(missing)
-
-            # Add formatted feedback for this partial match
-            feedback_lines.append(f"{label}: ⚠️ **Partial match ({int(match_percentage)}%)** — " + 
-                                   f"Matched: {', '.join(sorted(matched))} ➡️ " +
-                                   f"Still missing: **{', '.join(sorted(missing))}**")
-        # No match - all courses are missing
-        else:
-            all_missing_courses.update(missing)
-            feedback_lines.append(f"{label}: 🚫 No matching courses taken — requires: {', '.join(sorted(required))}")
-
-    # After checking all options, return the appropriate result
-    if any_option_satisfied:
-        # Format the success message
-        if len(satisfied_options) == 1:
-            label, matched = satisfied_options[0]
-            success_msg = f"✅ **Complete match!** Satisfies {label} with: {', '.join(matched)}"
-        else:
-            success_msg = "✅ **Complete match!** Satisfies multiple options:\n"
-            for label, matched in satisfied_options:
-                success_msg += f"- {label}: {', '.join(matched)}\n"
-            
-        # Add redundant course info if applicable
-        if redundant_note:
-            success_msg += redundant_note
-        return True, success_msg, redundant_groups
-
-    # If no options were fully satisfied but we have partial matches
-    if partial_matches:
-        # Sort by highest percentage complete
-        partial_matches.sort(key=lambda x: x["percentage"], reverse=True)
-        best_match = partial_matches[0]
-        
-        # Create a progress bar for visualization (10 characters wide)
-        progress_chars = int(best_match["percentage"] / 10)
-        progress_bar = "█" * progress_chars + "░" * (10 - progress_chars)
-        
-        # Format the partial match message
-        partial_msg = f"⚠️ **Partial match ({int(best_match['percentage'])}%)** [{progress_bar}]\n\n"
-        partial_msg += f"**Best option: {best_match['label']}**\n"
-        partial_msg += f"✓ Matched: {', '.join(best_match['matched'])}\n"
-        partial_msg += f"✗ Missing: **{', '.join(best_match['missing'])}**\n\n"
-        
-        # Add details about other potential options
-        if len(partial_matches) > 1:
-            partial_msg += "Other partial matches:\n"
-            for i, match in enumerate(partial_matches[1:3]):  # Show up to 3 alternatives
-                partial_msg += f"- {match['label']} ({int(match['percentage'])}%): Missing {', '.join(match['missing'])}\n"
-        
-        # Add redundant course info if applicable
-        if redundant_note:
-            partial_msg += redundant_note
-            
-        return False, partial_msg, redundant_groups
-
-    # If no options were satisfied at all
-    summary = "❌ **No complete or partial matches found.**"
-    if all_missing_courses:
-        summary += f"\n\nYou need at least one of these course combinations:"
-        for i, line in enumerate(feedback_lines):
-            if "requires" in line:
-                option, requirements = line.split("requires:")
-                summary += f"\n- {requirements.strip()}"
-    
-    # Add redundant course info to the failure summary
-    if redundant_note:
-        summary += redundant_note
-
-    return False, summary, redundant_groups
+    evaluation = evaluate_logic_block(logic_block, selected_courses, detect_all_redundant)
+    if not evaluation.compiled.is_valid:
+        return False, evaluation.explanation, []
+    return evaluation.is_satisfied, evaluation.explanation, evaluation.redundant_groups
 
 
 def validate_combo_against_group(
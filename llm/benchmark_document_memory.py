@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+TransferAI Document Memory Benchmark
+
+Measures resident memory (RSS) of the loaded articulation documents built from
+``llm/data/rag_data.json`` in three representations:
+
+- ``llama``: one llama_index Document per record (the previous representation)
+- ``compact``: compact ``llm.models.document.Document`` records
+- ``spill``: compact records with text in an offset-indexed ``TextStore`` file
+
+Each mode runs in a fresh interpreter so the measurements do not interfere.
+``--copies`` replicates the dataset to approximate multi-campus loading; the
+copies share identical logic blocks, so the arena saving is an upper bound.
+
+Usage:
+    python -m llm.benchmark_document_memory --copies 100
+"""
+
+import argparse
+import copy
+import gc
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+DEFAULT_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "rag_data.json")
+MODES = ("llama", "compact", "spill")
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    # ru_maxrss is the peak RSS: kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _flattened_records(data_path: str) -> List[Dict[str, Any]]:
+    """Load and flatten the articulation data into text/metadata records."""
+    from llm.services.document_service import DocumentService
+    from llm.repositories.document_repository import DocumentRepository
+
+    with open(data_path) as f:
+        json_data = json.load(f)
+    return DocumentService(DocumentRepository()).flatten_courses_from_json(json_data)
+
+
+def _measure(mode: str, data_path: str, copies: int) -> Dict[str, Any]:
+    """Build the documents for one mode and report the RSS delta."""
+    from llama_index.core import Document as LlamaDocument
+    from llm.models.document import Document, LogicBlockArena, TextStore
+
+    base_records = _flattened_records(data_path)
+    gc.collect()
+    before = _rss_bytes()
+
+    # Each replica is converted from fresh copies, so only what the documents
+    # keep alive stays resident
+    store = TextStore() if mode == "spill" else None
+    arena = LogicBlockArena()
+    documents = []
+    for _ in range(copies):
+        for record in copy.deepcopy(base_records):
+            record["text"] = record["text"].encode().decode()  # a distinct string per replica
+            if mode == "llama":
+                documents.append(LlamaDocument(text=record["text"], metadata=record["metadata"]))
+            else:
+                documents.append(Document.from_dict(record, text_store=store, arena=arena))
+
+    gc.collect()
+    after = _rss_bytes()
+
+    result = {
+        "mode": mode,
+        "documents": len(documents),
+        "rss_before": before,
+        "rss_after": after,
+        "rss_delta": after - before,
+    }
+    if mode != "llama":
+        footprints = [doc.memory_footprint(arena) for doc in documents]
+        result["avg_document_bytes"] = sum(f["total"] for f in footprints) / len(footprints)
+        result["text_on_disk"] = store.size_bytes if store else 0
+    return result
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark articulation document memory")
+    parser.add_argument("--data", default=DEFAULT_DATA_PATH, help="Path to rag_data.json")
+    parser.add_argument("--copies", type=int, default=100, help="Dataset replicas to load")
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run every mode in a subprocess and print a comparison table."""
+    args = parse_args()
+
+    if args.worker:
+        print(json.dumps(_measure(args.worker, args.data, args.copies)))
+        return
+
+    results = []
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, "-m", "llm.benchmark_document_memory",
+             "--worker", mode, "--data", args.data, "--copies", str(args.copies)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'mode':<10}{'documents':>11}{'RSS before':>14}{'RSS after':>14}{'delta':>12}{'per doc':>10}")
+    for r in results:
+        per_doc = r["rss_delta"] / max(r["documents"], 1)
+        print(
+            f"{r['mode']:<10}{r['documents']:>11}{r['rss_before'] / 2**20:>12.1f}MB"
+            f"{r['rss_after'] / 2**20:>12.1f}MB{r['rss_delta'] / 2**20:>10.1f}MB{per_doc:>9.0f}B"
+        )
+    for r in results:
+        if "avg_document_bytes" in r:
+            print(f"{r['mode']}: memory_footprint() average {r['avg_document_bytes']:.0f} B/document, "
+                  f"{r['text_on_disk'] / 2**20:.1f} MB text on disk")
+
+
+if __name__ == "__main__":
+    main()
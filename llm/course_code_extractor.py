@@ -0,0 +1,171 @@
+"""
+TransferAI Course Code Extractor
+
+Dependency-free tokenizer and course-code extractor used by ``extract_filters``
+in both ``llm.query_parser`` and ``llm.services.query_service``.
+
+Course extraction previously ran every query through the full spaCy
+``en_core_web_sm`` pipeline (loaded at import time) only to walk its tokens.
+This module reproduces the parts of that tokenization the extraction depends
+on with a few precompiled regexes:
+
+1. Split on whitespace
+2. Peel leading and trailing punctuation off each chunk (kept as separators)
+3. Split possessive ``'S`` suffixes and letter-joining infixes such as
+   ``CSE/MATH`` or ``CHEM-PHYS``
+
+The token walk is the same one ``extract_filters`` always used: a department
+prefix (2-5 letters) directly followed by a course number (``8A``, ``21JA``)
+yields a course and becomes the carried-over prefix, so "CSE 8A and 8B"
+yields both "CSE 8A" and "CSE 8B". Connector words (AND, OR, WITH, TO, FOR)
+are skipped without resetting the carried-over prefix.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+# Words skipped between a course and a bare number ("CSE 8A and 8B")
+CONNECTOR_WORDS = frozenset({"AND", "OR", "WITH", "TO", "FOR"})
+
+_DIGIT_RE = re.compile(r"\d")
+_LEADING_PUNCT_RE = re.compile(r"^[\W_]+")
+_TRAILING_PUNCT_RE = re.compile(r"[\W_]+$")
+_POSSESSIVE_RE = re.compile(r"^(.+?)(['’]S)$")
+_INFIX_RE = re.compile(
+    r"(?<=[^\W_])[-–—~:<>=/](?=[^\W\d_])"  # hyphens and slashes before a letter
+    r"|(?<=[^\W\d_]),(?=[^\W\d_])"  # commas between letters
+)
+_PREFIX_RE = re.compile(r"[A-Z]{2,5}")
+_NUMBER_RE = re.compile(r"\d+[A-Z]{0,2}")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into word tokens and punctuation separators.
+
+    Punctuation runs are returned as empty strings so that they still break
+    the adjacency between a department prefix and a course number
+    ("CSE, 8A" is not a course) without ever matching anything themselves.
+
+    Args:
+        text: Text to tokenize (callers pass the upper-cased query).
+
+    Returns:
+        List of tokens in query order.
+
+    Example:
+        >>> tokenize("(CSE/MATH 20A)?")
+        ['', 'CSE', '', 'MATH', '20A', '']
+    """
+    tokens: List[str] = []
+    for chunk in text.split():
+        leading = _LEADING_PUNCT_RE.match(chunk)
+        if leading:
+            tokens.append("")
+            chunk = chunk[leading.end():]
+            if not chunk:
+                continue
+
+        trailing = _TRAILING_PUNCT_RE.search(chunk)
+        core = chunk[:trailing.start()] if trailing else chunk
+
+        possessive = _POSSESSIVE_RE.match(core)
+        if possessive:
+            core = possessive.group(1)
+
+        for i, part in enumerate(_INFIX_RE.split(core)):
+            if i:
+                tokens.append("")
+            tokens.append(part)
+
+        if possessive:
+            tokens.append(possessive.group(2))
+        if trailing:
+            tokens.append("")
+    return tokens
+
+
+def iter_course_codes(query: str) -> Iterator[str]:
+    """
+    Yield every course code mentioned in query, in order.
+
+    Bare course numbers inherit the most recent department prefix
+    ("CSE 8A and 8B" → "CSE 8A", "CSE 8B"). Codes may repeat.
+
+    Args:
+        query: The user's natural language query.
+
+    Yields:
+        Course codes in "DEPT NUM" format (e.g., "CSE 8A").
+    """
+    # Every course needs a number, so most chit-chat never gets tokenized
+    if not _DIGIT_RE.search(query):
+        return
+
+    tokens = tokenize(query.upper())
+    last_prefix: Optional[str] = None
+
+    for i, text in enumerate(tokens):
+        # Skip coordination words — preserve last prefix
+        if text in CONNECTOR_WORDS:
+            continue
+
+        # Full course (e.g., CSE 8A)
+        if _PREFIX_RE.fullmatch(text):
+            next_token = tokens[i + 1] if i + 1 < len(tokens) else None
+            if next_token and _NUMBER_RE.fullmatch(next_token):
+                last_prefix = text
+                yield f"{text} {next_token}"
+
+        # Suffix only (e.g., '8B' after 'CSE')
+        elif last_prefix and _NUMBER_RE.fullmatch(text):
+            yield f"{last_prefix} {text}"
+
+
+def extract_course_codes(query: str) -> List[str]:
+    """
+    Return the distinct course codes mentioned in query, in first-seen order.
+
+    Args:
+        query: The user's natural language query.
+
+    Returns:
+        List of course codes (e.g., ["CSE 8A", "CSE 8B"]).
+    """
+    return list(dict.fromkeys(iter_course_codes(query)))
+
+
+def classify_course_codes(
+    codes: Iterable[str],
+    uc_course_catalog: Optional[Set[str]] = None,
+    ccc_course_catalog: Optional[Set[str]] = None
+) -> Dict[str, List[str]]:
+    """
+    Split course codes into UC and CCC courses using the known catalogs.
+
+    Codes found in neither catalog are dropped; codes found in both are
+    treated as CCC courses.
+
+    Args:
+        codes: Course codes extracted from a query.
+        uc_course_catalog: Set of known UC course codes (e.g., "CSE 8A").
+        ccc_course_catalog: Set of known CCC course codes (e.g., "CIS 22A").
+
+    Returns:
+        A dictionary with keys "uc_course" and "ccc_courses", each containing
+        a sorted list of course codes.
+    """
+    uc_course_catalog = uc_course_catalog or set()
+    ccc_course_catalog = ccc_course_catalog or set()
+    filters = {"uc_course": set(), "ccc_courses": set()}
+
+    for course in codes:
+        if course in ccc_course_catalog:
+            filters["ccc_courses"].add(course)
+        elif course in uc_course_catalog:
+            filters["uc_course"].add(course)
+
+    return {
+        "uc_course": sorted(filters["uc_course"]),
+        "ccc_courses": sorted(filters["ccc_courses"])
+    }
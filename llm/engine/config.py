@@ -100,9 +100,15 @@ class Config:
             "cache_documents": True,
             "cache_directory": ".transferai_cache",
             "cache_ttl": 86400,  # 24 hours in seconds
+            "spill_document_text": False,  # Keep document text on disk, read on access
             
             # Query settings
             "default_query_type": "UNKNOWN",
+            # QIC intent routing, shared by the engine and agent.intent_router
+            "intent_router": False,  # Route with the QIC intent model before the rules
+            "intent_confidence_threshold": 0.8,
+            "parallel_subqueries": False,  # Fan multi-UC-course queries out to a worker pool
+            "subquery_workers": 4,
             
             # Logging
             "log_level": "INFO",
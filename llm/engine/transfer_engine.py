@@ -6,7 +6,9 @@ the various components of the system.
 """
 
 from typing import Optional, Dict, Any, List, Type
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
 import time
 from pathlib import Path
 
@@ -15,6 +17,7 @@ from llm.repositories.document_repository import DocumentRepository
 from llm.services.query_service import QueryService
 from llm.services.prompt_service import PromptService, VerbosityLevel
 from llm.services.matching_service import MatchingService
+from llm.services.intent_service import IntentService, get_intent_service, query_type_for_intent
 from llm.handlers.base import QueryHandler, HandlerRegistry
 from llm.engine.config import Config, get_config
 from llm.engine.utils import setup_logging, get_version, load_handler_classes, format_error
@@ -38,7 +41,8 @@ class TransferAIEngine:
         document_repository: Optional[DocumentRepository] = None,
         query_service: Optional[QueryService] = None,
         matching_service: Optional[MatchingService] = None,
-        prompt_service: Optional[PromptService] = None
+        prompt_service: Optional[PromptService] = None,
+        intent_service: Optional[IntentService] = None
     ):
         """
         Initialize the engine with dependencies.
@@ -49,6 +53,8 @@ class TransferAIEngine:
             query_service: Query service, or None to create a new one
             matching_service: Matching service, or None to create a new one
             prompt_service: Prompt service, or None to create a new one
+            intent_service: Intent classifier used when the ``intent_router`` config
+                flag is set, or None to use the shared QIC service
         """
         # Initialize configuration
         self.config = config or get_config()
@@ -85,9 +91,16 @@ class TransferAIEngine:
             
         self.prompt_service = prompt_service or PromptService(verbosity=verbosity)
         
+        # Optional QIC intent router (loaded lazily on first routed query)
+        self.intent_service = intent_service
+        
         # Initialize handler registry
         self.handler_registry = HandlerRegistry()
         
+        # Worker pool for multi-UC-course sub-queries (created on first use)
+        self._subquery_executor: Optional[ThreadPoolExecutor] = None
+        self._subquery_executor_lock = threading.Lock()
+        
         # Track initialization state
         self.initialized = False
         
@@ -161,7 +174,9 @@ class TransferAIEngine:
         
         # Load documents
         self.logger.info("Loading documents...")
-        self.document_repository.load_documents()
+        self.document_repository.load_documents(
+            spill_text=bool(self.config.get("spill_document_text", False))
+        )
         
         # Set document repository in matching service
         if hasattr(self.matching_service, 'set_documents'):
@@ -216,9 +231,20 @@ class TransferAIEngine:
             )
             
             # Determine query type
-            query.query_type = self.query_service.determine_query_type(query)
+            query.query_type = self._route_query_type(query)
             self.logger.debug(f"Determined query type: {query.query_type}")
             
+            # Multi-UC-course queries: one focused sub-query per UC course
+            if self._should_fan_out(query):
+                result = self.handle_subqueries(query)
+                if not result:
+                    self.logger.warning("Sub-queries returned no result")
+                    return "No relevant information found."
+                
+                elapsed = time.time() - start_time
+                self.logger.info(f"Query processed in {elapsed:.2f} seconds")
+                return result.formatted_response
+            
             # Find handler
             handler = self.handler_registry.find_handler(query)
             if not handler:
@@ -252,6 +278,159 @@ class TransferAIEngine:
             else:
                 return "An error occurred while processing your query."
     
+    def _route_query_type(self, query: Query) -> QueryType:
+        """
+        Determine the query type, consulting the intent router when enabled.
+        
+        A confident QIC prediction that maps onto an engine query type wins;
+        anything else (router disabled, low confidence, unmapped intent, model
+        unavailable) falls back to the rule-based QueryService classification.
+        
+        Args:
+            query: The query to classify
+            
+        Returns:
+            The query type to dispatch on
+        """
+        if self.config.get("intent_router", False):
+            try:
+                service = self.intent_service or get_intent_service()
+                prediction = service.classify([query.text])[0]
+                threshold = float(self.config.get("intent_confidence_threshold", 0.8))
+                query_type = query_type_for_intent(prediction.intent, query.filters)
+                
+                self.logger.debug(
+                    f"Intent router: {prediction.intent} ({prediction.confidence:.2f}) -> {query_type}"
+                )
+                if query_type is not None and prediction.confidence >= threshold:
+                    return query_type
+            except Exception as e:
+                self.logger.warning(f"Intent router unavailable, using rules: {e}")
+                
+        return self.query_service.determine_query_type(query)
+        
+    # Query types whose handlers need every UC course at once
+    _JOINT_QUERY_TYPES = frozenset({
+        QueryType.COURSE_COMPARISON,
+        QueryType.PATH_COMPLETION,
+        QueryType.GROUP_REQUIREMENT,
+    })
+    
+    def _should_fan_out(self, query: Query) -> bool:
+        """
+        Check whether a query should be split into per-UC-course sub-queries.
+        
+        Args:
+            query: The classified query
+            
+        Returns:
+            True if parallel sub-queries are enabled and the query names several
+            UC courses that can be answered independently
+        """
+        return (
+            self.config.get("parallel_subqueries", False)
+            and len(query.uc_courses) > 1
+            and query.query_type not in self._JOINT_QUERY_TYPES
+        )
+    
+    def _get_subquery_executor(self) -> ThreadPoolExecutor:
+        """Return the shared sub-query worker pool, creating it on first use."""
+        if self._subquery_executor is None:
+            with self._subquery_executor_lock:
+                if self._subquery_executor is None:
+                    self._subquery_executor = ThreadPoolExecutor(
+                        max_workers=max(1, int(self.config.get("subquery_workers", 4))),
+                        thread_name_prefix="transferai-subquery"
+                    )
+        return self._subquery_executor
+    
+    def _run_subquery(self, query: Query) -> Dict[str, Any]:
+        """
+        Classify and handle one sub-query on a worker thread.
+        
+        Args:
+            query: Sub-query focused on a single UC course
+            
+        Returns:
+            Dictionary with the handler result (or None), handler name and timing
+        """
+        start = time.perf_counter()
+        result = None
+        handler_name = None
+        try:
+            query.query_type = self._route_query_type(query)
+            handler = self.handler_registry.find_handler(query)
+            if handler:
+                handler_name = handler.__class__.__name__
+                result = handler.handle(query)
+        except Exception as e:
+            self.logger.error(f"Error processing sub-query '{query.text}': {e}", exc_info=True)
+        
+        return {
+            "result": result,
+            "uc_course": query.uc_courses[0],
+            "query_type": query.query_type.name,
+            "handler": handler_name,
+            "elapsed_ms": (time.perf_counter() - start) * 1000
+        }
+    
+    def handle_subqueries(self, query: Query) -> Optional[QueryResult]:
+        """
+        Answer a multi-UC-course query as concurrent single-course sub-queries.
+        
+        Each UC course gets its own sub-query (text from
+        ``QueryService.focus_multi_uc_query``, naming only that course, and
+        filters narrowed to it) which is classified and handled on the worker
+        pool against the shared, read-only document repository. Responses are merged in the order the UC
+        courses were extracted.
+        
+        Args:
+            query: The classified multi-course query
+            
+        Returns:
+            Merged QueryResult whose metadata lists each sub-query's handler and
+            timing under ``"subqueries"``, or None if no sub-query produced a result
+        """
+        texts = self.query_service.focus_multi_uc_query(query.text, query.uc_courses)
+        subqueries = [
+            Query(
+                text=text,
+                filters={**query.filters, "uc_course": [uc_course]},
+                config=query.config
+            )
+            for text, uc_course in zip(texts, query.uc_courses)
+        ]
+        
+        outcomes = list(self._get_subquery_executor().map(self._run_subquery, subqueries))
+        
+        timings = []
+        results = []
+        for outcome in outcomes:
+            result = outcome.pop("result")
+            timings.append(outcome)
+            self.logger.info(
+                f"Sub-query {outcome['uc_course']}: {outcome['handler']} "
+                f"({outcome['query_type']}) in {outcome['elapsed_ms']:.1f} ms"
+            )
+            if result and result.formatted_response:
+                results.append(result)
+        
+        if not results:
+            return None
+        
+        satisfied_values = [r.satisfied for r in results]
+        return QueryResult(
+            raw_response="\n".join(r.raw_response for r in results),
+            formatted_response="\n\n---\n\n".join(r.formatted_response for r in results),
+            satisfied=None if None in satisfied_values else all(satisfied_values),
+            matched_docs=[doc for r in results for doc in r.matched_docs],
+            metadata={
+                "uc_courses": list(query.uc_courses),
+                "multi_course_query": True,
+                "subqueries": timings
+            }
+        )
+        
     def _register_handlers(self):
         """
         Register query handlers with the registry.
@@ -14,6 +14,7 @@ from llm.handlers.base import QueryHandler
 from llm.repositories.document_repository import DocumentRepository
 from llm.services.matching_service import MatchingService
 from llm.services.articulation_facade import ArticulationFacade
+from llm.services.query_classifier import extract_features
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -67,14 +68,7 @@ class CourseComparisonHandler(QueryHandler):
         if len(query.uc_courses) < 2:
             return False
             
-        query_lower = query.text.lower()
-        comparison_keywords = [
-            'same', 'similar', 'different', 'alike', 'equivalent',
-            'compare', 'versus', 'vs', 'like', 'match',
-            'both require', 'both need', 'both accept'
-        ]
-        
-        return any(keyword in query_lower for keyword in comparison_keywords)
+        return extract_features(query.text).has('comparison_handler')
     
     def handle(self, query: Query) -> Optional[QueryResult]:
         """
@@ -12,6 +12,7 @@ from llm.handlers.base import QueryHandler
 from llm.repositories.document_repository import DocumentRepository
 from llm.services.matching_service import MatchingService
 from llm.services.articulation_facade import ArticulationFacade
+from llm.services.query_classifier import extract_features
 from llm.services.query_service import QueryService
 
 
@@ -59,11 +60,7 @@ class CourseEquivalencyHandler(QueryHandler):
             return False
             
         # Check for equivalency keywords
-        equivalency_keywords = [
-            "satisfy", "transfer to", "fulfill", "equivalent", "what can",
-            "what would", "what does", "what uc", "what requirements"
-        ]
-        if any(keyword in query.text.lower() for keyword in equivalency_keywords):
+        if extract_features(query.text).has("equivalency_handler"):
             return True
             
         return False
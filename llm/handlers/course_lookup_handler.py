@@ -13,6 +13,7 @@ from llm.handlers.base import QueryHandler
 from llm.repositories.document_repository import DocumentRepository
 from llm.services.matching_service import MatchingService
 from llm.services.articulation_facade import ArticulationFacade
+from llm.services.query_classifier import extract_features
 from llm.services.query_service import QueryService
 
 # Set up logger
@@ -63,12 +64,7 @@ class CourseLookupHandler(QueryHandler):
             return False
             
         # Check for lookup keywords 
-        lookup_keywords = [
-            "which", "what", "courses satisfy", "courses that satisfy", 
-            "what satisfies", "can satisfy", "courses for"
-        ]
-        
-        if any(keyword in query.text.lower() for keyword in lookup_keywords):
+        if extract_features(query.text).has("lookup_handler"):
             return True
             
         return False
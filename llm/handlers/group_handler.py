@@ -15,6 +15,7 @@ from llm.handlers.base import QueryHandler
 from llm.repositories.document_repository import DocumentRepository
 from llm.services.matching_service import MatchingService
 from llm.services.articulation_facade import ArticulationFacade
+from llm.services.query_classifier import extract_features
 from llm.services.query_service import QueryService
 
 
@@ -64,12 +65,7 @@ class GroupQueryHandler(QueryHandler):
             return True
             
         # Check for group-related keywords
-        group_keywords = [
-            "group requirements", "group", "requirement group", 
-            "course requirements", "prerequisites"
-        ]
-        
-        if any(keyword in query.text.lower() for keyword in group_keywords):
+        if extract_features(query.text).has("group_handler"):
             # Only handle if not explicitly another type and no UC course mentioned
             # (those would likely be course-specific queries, not group-level)
             return not (query.query_type != QueryType.UNKNOWN or query.uc_courses)
@@ -7,13 +7,13 @@ UC course requirements.
 """
 
 from typing import Optional, Dict, Any, List
-import re
 
 from llm.models.query import Query, QueryResult, QueryType
 from llm.handlers.base import QueryHandler
 from llm.repositories.document_repository import DocumentRepository
 from llm.services.matching_service import MatchingService
 from llm.services.articulation_facade import ArticulationFacade
+from llm.services.query_classifier import extract_features
 from llm.services.query_service import QueryService
 
 
@@ -61,25 +61,15 @@ class HonorsQueryHandler(QueryHandler):
         if query.query_type == QueryType.HONORS_REQUIREMENT:
             return True
             
-        # Check for honors keywords
-        honors_keywords = [
-            "honors", "honor", "h course", "h version", "h credit",
-            "1h", "2h", "3h", "4h", "5h", "8h", "10h", "11h", "20h", "21h",
-            "require honors", "honors required", "need honors", "with honors"
-        ]
+        features = extract_features(query.text)
         
-        # Also check for course code with H suffix like "MATH 20AH"
-        text_lower = query.text.lower()
-        
-        # Either match one of the explicit keywords, or a course code ending with H
-        has_honors_keyword = any(keyword in text_lower for keyword in honors_keywords)
-        
-        # Use regex to find course codes ending with H
-        has_honors_course_code = bool(re.search(r'\d+[a-z]*h\b', text_lower))
+        # Either match one of the explicit honors keywords, or a course code
+        # ending with H like "MATH 20AH"
+        has_honors_keyword = features.has("honors_handler")
+        has_honors_course_code = features.has("honors_course_code")
         
         # Check for transfer path or major references
-        transfer_keywords = ["transfer", "pathway", "path", "major", "cs major", "computer science"]
-        has_transfer_keyword = any(keyword in text_lower for keyword in transfer_keywords)
+        has_transfer_keyword = features.has("transfer_path")
         
         # Handle general honors requirements for transfer paths
         if has_honors_keyword and has_transfer_keyword:
@@ -109,8 +99,7 @@ class HonorsQueryHandler(QueryHandler):
         
         # Check if this is a general query about honors courses in a transfer path
         text_lower = query.text.lower()
-        transfer_keywords = ["transfer", "pathway", "path", "major", "cs major", "computer science"]
-        is_transfer_path_query = any(keyword in text_lower for keyword in transfer_keywords)
+        is_transfer_path_query = extract_features(query.text).has("transfer_path")
         
         # Handle transfer path honors requirement queries
         if is_transfer_path_query or not query.uc_courses:
@@ -6,7 +6,6 @@ ask whether specific combinations of courses complete a requirement path or sect
 """
 
 from typing import Optional, Dict, Any, List, Set, Tuple
-import re
 import logging
 
 from llm.models.query import Query, QueryResult, QueryType
@@ -14,6 +13,7 @@ from llm.handlers.base import QueryHandler
 from llm.repositories.document_repository import DocumentRepository
 from llm.services.matching_service import MatchingService
 from llm.services.articulation_facade import ArticulationFacade
+from llm.services.query_classifier import extract_features
 from llm.services.query_service import QueryService
 
 # Set up logger
@@ -64,34 +64,12 @@ class PathCompletionHandler(QueryHandler):
         Returns:
             True if this handler can process the query, False otherwise
         """
-        query_lower = query.text.lower()
-        
-        # Check for path completion keywords
-        path_keywords = [
-            'full path', 'complete path', 'complete requirement', 'finish requirement',
-            'satisfy requirement', 'satisfy section', 'complete section',
-            'entire path', 'one path', 'enough for', 'sufficient for'
-        ]
-        
         # Must have UC courses
         if not query.uc_courses:
             return False
         
-        # Check for path completion phrases
-        if any(keyword in query_lower for keyword in path_keywords):
-            return True
-            
-        # Check for question patterns about path completion
-        path_patterns = [
-            r'(?:is|are|do|does)\s+.+\s+(?:one|a|the)\s+(?:full|complete|entire)\s+path',
-            r'(?:is|are|do|does)\s+.+\s+(?:complete|satisfy|finish)\s+(?:the|a|one)\s+(?:requirement|section|path)',
-            r'(?:is|are|do|does)\s+.+\s+(?:enough|sufficient)\s+(?:to|for|in)\s+(?:complete|satisfy)'
-        ]
-        
-        if any(re.search(pattern, query_lower) for pattern in path_patterns):
-            return True
-        
-        return False
+        # Check for path completion phrases and question patterns
+        return extract_features(query.text).has('path', 'path_pattern')
     
     def handle(self, query: Query) -> Optional[QueryResult]:
         """
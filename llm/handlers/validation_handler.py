@@ -12,6 +12,7 @@ from llm.handlers.base import QueryHandler
 from llm.repositories.document_repository import DocumentRepository
 from llm.services.matching_service import MatchingService
 from llm.services.articulation_facade import ArticulationFacade
+from llm.services.query_classifier import extract_features
 from llm.services.query_service import QueryService
 
 
@@ -59,11 +60,7 @@ class ValidationQueryHandler(QueryHandler):
             return False
             
         # Check for validation keywords
-        validation_keywords = [
-            "satisfy", "fulfill", "equivalent", "transfer", "articulate", 
-            "count for", "substitute", "meet requirement"
-        ]
-        if any(keyword in query.text.lower() for keyword in validation_keywords):
+        if extract_features(query.text).has("validation_handler"):
             return True
             
         return False
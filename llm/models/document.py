@@ -1,34 +1,225 @@
 """
 TransferAI Document Model
 
-This module defines the Document model used throughout the TransferAI system. It wraps 
-the llama_index Document class to provide a consistent interface while adding additional
-functionality specific to articulation document processing.
+This module defines the Document model used throughout the TransferAI system. Documents
+are compact ``__slots__`` records that keep only the fields TransferAI reads; llama_index
+Documents are converted on the way in and rebuilt on demand on the way out.
+
+Memory is kept low for multi-campus loads by:
+- interning the short strings in metadata (course codes, group and section ids)
+- sharing identical logic blocks through a ``LogicBlockArena`` owned by the loader,
+  so the blocks are freed together with the documents that use them
+- optionally spilling document text to an offset-indexed ``TextStore`` file,
+  read back only when ``Document.text`` is accessed
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Set, Tuple
+import json
+import sys
+import tempfile
+import threading
+import uuid
+
 from llama_index.core import Document as LlamaDocument
 
+# Strings up to this length are interned (codes, ids, titles); longer ones are left alone
+INTERN_MAX_LENGTH = 64
+
+
+def _intern_strings(value: Any) -> Any:
+    """
+    Recursively intern short strings in a JSON-like value.
+
+    Args:
+        value: A dict, list, string or scalar
+
+    Returns:
+        The same structure with short strings (and dict keys) interned
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+    if isinstance(value, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    return value
+
+
+class LogicBlockArena:
+    """
+    Shared storage for articulation logic blocks.
+
+    Structurally identical logic blocks (common across campuses and sections)
+    are stored once and every document references the same dict. Shared
+    blocks must be treated as read-only. An arena belongs to one document load
+    (see ``DocumentService.load_documents``) and is dropped with it.
+    """
+
+    def __init__(self):
+        """Initialize an empty arena."""
+        self._blocks: Dict[str, Dict[str, Any]] = {}
+        self._ids: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def intern(self, block: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the shared instance of a logic block.
+
+        Args:
+            block: Logic block to store
+
+        Returns:
+            The arena's copy of an identical block (the interned input if new)
+        """
+        key = json.dumps(block, sort_keys=True, separators=(",", ":"))
+        with self._lock:
+            shared = self._blocks.get(key)
+            if shared is None:
+                shared = _intern_strings(block)
+                self._blocks[key] = shared
+                self._ids.add(id(shared))
+        return shared
+
+    def owns(self, block: Any) -> bool:
+        """Return True if block is a shared arena instance."""
+        return id(block) in self._ids
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+
+def compact_metadata(metadata: Dict[str, Any], arena: Optional[LogicBlockArena] = None) -> Dict[str, Any]:
+    """
+    Intern metadata strings and share the logic block through an arena.
+
+    Args:
+        metadata: Document metadata
+        arena: Logic block arena; if None the logic block is not shared
+
+    Returns:
+        Compacted metadata dictionary
+    """
+    if not isinstance(metadata, dict):
+        return metadata
+
+    compacted = {}
+    for key, value in metadata.items():
+        key = sys.intern(key) if isinstance(key, str) else key
+        if key == "logic_block" and isinstance(value, dict) and arena is not None:
+            compacted[key] = arena.intern(value)
+        else:
+            compacted[key] = _intern_strings(value)
+    return compacted
+
+
+class TextStore:
+    """
+    Append-only, offset-indexed file holding document text.
+
+    Documents backed by a store keep only an (offset, length) pair; the text is
+    read from disk when ``Document.text`` is accessed.
+
+    Attributes:
+        path: Backing file path, or None for an anonymous temporary file
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: File to write (truncated); an anonymous temporary file if None
+        """
+        self.path = path
+        self._file = open(path, "w+b") if path else tempfile.TemporaryFile()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, text: str) -> Tuple[int, int]:
+        """
+        Write text to the end of the store.
+
+        Args:
+            text: Text to store
+
+        Returns:
+            (offset, length) in bytes
+        """
+        data = text.encode("utf-8")
+        with self._lock:
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+        return offset, len(data)
+
+    def read(self, offset: int, length: int) -> str:
+        """
+        Read text previously returned by ``append``.
+
+        Args:
+            offset: Byte offset
+            length: Byte length
+
+        Returns:
+            The stored text
+        """
+        with self._lock:
+            self._file.flush()
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return data.decode("utf-8")
+
+    @property
+    def size_bytes(self) -> int:
+        """Total bytes written to the store."""
+        return self._size
+
+    def close(self) -> None:
+        """Close the backing file."""
+        self._file.close()
+
+
+def _deep_sizeof(value: Any, seen: Set[int], skip: Optional[LogicBlockArena] = None) -> int:
+    """Approximate deep size of a JSON-like value, counting shared objects once."""
+    if id(value) in seen or (skip is not None and isinstance(value, dict) and skip.owns(value)):
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _deep_sizeof(k, seen, skip) + _deep_sizeof(v, seen, skip)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            size += _deep_sizeof(v, seen, skip)
+    return size
+
 
 class Document:
     """
     A document representing articulation information between courses.
     
-    This class wraps the llama_index Document class to provide a standardized interface
-    for working with articulation documents. It adds methods specific to the TransferAI
-    system while maintaining compatibility with the underlying document storage.
+    A compact record exposing the same interface as the llama_index Document it
+    replaces (``text``, ``metadata``, ``doc_id``, ``embedding``) plus methods
+    specific to the TransferAI system.
     
     Attributes:
-        _document: The underlying llama_index Document
+        metadata: Dictionary of metadata associated with the document
+        doc_id: Unique identifier for the document
+        embedding: Vector embedding of the document content
     """
 
+    __slots__ = ("_text", "_text_ref", "_text_store", "metadata", "doc_id", "embedding")
+
     def __init__(
         self, 
         text: str = "", 
         metadata: Optional[Dict[str, Any]] = None,
         doc_id: Optional[str] = None,
         embedding: Optional[List[float]] = None,
-        llama_document: Optional[LlamaDocument] = None
+        llama_document: Optional[LlamaDocument] = None,
+        text_store: Optional[TextStore] = None,
+        arena: Optional[LogicBlockArena] = None
     ):
         """
         Initialize a Document instance.
@@ -36,59 +227,42 @@ class Document:
         Args:
             text: The document text content
             metadata: Dictionary of metadata associated with the document
-            doc_id: Unique identifier for the document
+            doc_id: Unique identifier for the document (generated if None)
             embedding: Vector embedding of the document content
-            llama_document: An existing llama_index Document to wrap
+            llama_document: An existing llama_index Document to copy (not retained)
+            text_store: Store to spill the text to instead of keeping it in memory
+            arena: Arena to share the logic block through
         """
-        if llama_document:
-            self._document = llama_document
-        else:
-            self._document = LlamaDocument(
-                text=text,
-                metadata=metadata or {},
-                doc_id=doc_id,
-                embedding=embedding
-            )
+        if llama_document is not None:
+            text = llama_document.text
+            metadata = llama_document.metadata
+            doc_id = llama_document.doc_id
+            embedding = llama_document.embedding
+
+        self.metadata = compact_metadata(metadata or {}, arena)
+        self.doc_id = doc_id or str(uuid.uuid4())
+        self.embedding = embedding
+        self._text_store = text_store
+        self._text_ref: Optional[Tuple[int, int]] = None
+        self._text: Optional[str] = None
+        self.text = text
 
     @property
     def text(self) -> str:
         """Get the document text content."""
-        return self._document.text
+        if self._text_ref is not None:
+            return self._text_store.read(*self._text_ref)
+        return self._text
 
     @text.setter
     def text(self, value: str) -> None:
         """Set the document text content."""
-        self._document.text = value
-
-    @property
-    def metadata(self) -> Dict[str, Any]:
-        """Get the document metadata."""
-        return self._document.metadata
-
-    @metadata.setter
-    def metadata(self, value: Dict[str, Any]) -> None:
-        """Set the document metadata."""
-        self._document.metadata = value
-
-    @property
-    def doc_id(self) -> Optional[str]:
-        """Get the document ID."""
-        return self._document.doc_id
-
-    @doc_id.setter
-    def doc_id(self, value: str) -> None:
-        """Set the document ID."""
-        self._document.doc_id = value
-
-    @property
-    def embedding(self) -> Optional[List[float]]:
-        """Get the document embedding."""
-        return self._document.embedding
-
-    @embedding.setter
-    def embedding(self, value: List[float]) -> None:
-        """Set the document embedding."""
-        self._document.embedding = value
+        if self._text_store is not None and isinstance(value, str):
+            self._text_ref = self._text_store.append(value)
+            self._text = None
+        else:
+            self._text_ref = None
+            self._text = value
 
     def get_uc_course(self) -> str:
         """
@@ -154,26 +328,76 @@ class Document:
         logic_block = self.get_logic_block()
         return logic_block.get("no_articulation", False)
 
+    def memory_footprint(self, arena: Optional[LogicBlockArena] = None) -> Dict[str, int]:
+        """
+        Approximate memory used by this document, in bytes.
+
+        Logic blocks held by arena are reported separately since they are paid
+        for once across all documents that use them.
+
+        Args:
+            arena: Arena the document was loaded with, if any
+
+        Returns:
+            Dictionary with ``record``, ``metadata``, ``text``, ``embedding``,
+            ``total`` (sum of the previous four), ``shared_logic_block`` and
+            ``text_on_disk`` sizes
+        """
+        seen: Set[int] = set()
+        record = sys.getsizeof(self)
+        metadata = _deep_sizeof(self.metadata, seen, skip=arena)
+        text = sys.getsizeof(self._text) if self._text is not None else 0
+        embedding = _deep_sizeof(self.embedding, seen) if self.embedding is not None else 0
+
+        logic_block = self.metadata.get("logic_block") if isinstance(self.metadata, dict) else None
+        shared = _deep_sizeof(logic_block, set()) if arena is not None and arena.owns(logic_block) else 0
+
+        return {
+            "record": record,
+            "metadata": metadata,
+            "text": text,
+            "embedding": embedding,
+            "total": record + metadata + text + embedding,
+            "shared_logic_block": shared,
+            "text_on_disk": self._text_ref[1] if self._text_ref else 0,
+        }
+
     @classmethod
-    def from_llama_document(cls, document: LlamaDocument) -> "Document":
+    def from_llama_document(
+        cls,
+        document: LlamaDocument,
+        text_store: Optional[TextStore] = None,
+        arena: Optional[LogicBlockArena] = None
+    ) -> "Document":
         """
         Create a Document instance from a llama_index Document.
         
+        The fields are copied; the llama_index Document is not retained.
+
         Args:
-            document: The llama_index Document to wrap
+            document: The llama_index Document to convert
+            text_store: Optional store to spill the text to
+            arena: Optional arena to share the logic block through
             
         Returns:
-            A new Document instance wrapping the provided document
+            A new Document instance with the provided document's data
         """
-        return cls(llama_document=document)
+        return cls(llama_document=document, text_store=text_store, arena=arena)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Document":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        text_store: Optional[TextStore] = None,
+        arena: Optional[LogicBlockArena] = None
+    ) -> "Document":
         """
         Create a Document instance from a dictionary.
         
         Args:
             data: Dictionary containing document data
+            text_store: Optional store to spill the text to
+            arena: Optional arena to share the logic block through
             
         Returns:
             A new Document instance with the provided data
@@ -182,7 +406,9 @@ class Document:
             text=data.get("text", ""),
             metadata=data.get("metadata", {}),
             doc_id=data.get("doc_id"),
-            embedding=data.get("embedding")
+            embedding=data.get("embedding"),
+            text_store=text_store,
+            arena=arena
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -201,12 +427,17 @@ class Document:
 
     def to_llama_document(self) -> LlamaDocument:
         """
-        Get the underlying llama_index Document.
+        Build a llama_index Document with this document's data.
         
         Returns:
-            The wrapped llama_index Document
+            A new llama_index Document
         """
-        return self._document
+        return LlamaDocument(
+            text=self.text,
+            metadata=self.metadata,
+            doc_id=self.doc_id,
+            embedding=self.embedding
+        )
 
     def __str__(self) -> str:
         """String representation of the document."""
@@ -9,16 +9,15 @@ language queries about course articulation. It provides functions to:
 3. Identify group and section references
 4. Match queries to specific articulation documents
 
-The module uses spaCy for NLP processing and regex patterns to identify course codes, 
-groups, and sections in user questions. It handles various formats and edge cases in 
-course code notation.
+The module uses a lightweight regex tokenizer (``llm.course_code_extractor``) and regex
+patterns to identify course codes, groups, and sections in user questions. It handles
+various formats and edge cases in course code notation.
 """
 
 import re
 from typing import Dict, List, Set, Tuple, Optional, Any, Union
-import spacy
 
-nlp = spacy.load("en_core_web_sm")
+from llm.course_code_extractor import classify_course_codes, iter_course_codes
 
 def normalize_course_code(code: str) -> str:
     """
@@ -87,8 +86,8 @@ def extract_filters(query: str, uc_course_catalog: Set[str], ccc_course_catalog:
     """
     Extract UC and CCC course codes from a natural language query.
     
-    Uses NLP and pattern matching to identify course codes in user queries, distinguishing
-    between UC and CCC courses based on the provided course catalogs.
+    Uses a lightweight regex tokenizer and pattern matching to identify course codes in user
+    queries, distinguishing between UC and CCC courses based on the provided course catalogs.
     
     Args:
         query: The user's natural language query.
@@ -107,56 +106,7 @@ def extract_filters(query: str, uc_course_catalog: Set[str], ccc_course_catalog:
         This function handles sequences like "CSE 8A and 8B" by tracking the last department
         prefix seen to correctly identify "8B" as "CSE 8B".
     """
-    filters = {"uc_course": set(), "ccc_courses": set()}
-    doc = nlp(query.upper())
-    last_prefix = None
-
-    # print("🔍 [spaCy] Tokenized words:", [token.text for token in doc])
-
-    for i, token in enumerate(doc):
-        text = token.text.strip(",.?!")
-        next_token = doc[i + 1].text.strip(",.?!") if i + 1 < len(doc) else None
-
-        # print(f"🔎 [Token {i}] '{text}' (next: '{next_token}')")
-
-        # Skip coordination words — preserve last prefix
-        if text in {"AND", "OR", "WITH", "TO", "FOR"}:
-            # print(f"⏭️ Skipping connector: {text}")
-            continue
-
-        course = None
-
-        # Full course (e.g., CSE 8A)
-        if re.fullmatch(r"[A-Z]{2,5}", text) and next_token and re.fullmatch(r"\d+[A-Z]{0,2}", next_token):
-            course = f"{text} {next_token}"
-            last_prefix = text
-            # print(f"🧩 Full course match → {course}")
-
-        # Suffix only (e.g., '8B' after 'CSE')
-        elif re.fullmatch(r"\d+[A-Z]{0,2}", text) and last_prefix:
-            course = f"{last_prefix} {text}"
-            # print(f"🧩 Suffix course match → {course}")
-
-        else:
-            # print(f"⛔ Skipping token: {text}")
-            continue
-
-        in_uc = course in uc_course_catalog
-        in_ccc = course in ccc_course_catalog
-        # print(f"📘 {course} → in_uc: {in_uc}, in_ccc: {in_ccc}")
-
-        if in_uc and not in_ccc:
-            filters["uc_course"].add(course)
-        elif in_ccc and not in_uc:
-            filters["ccc_courses"].add(course)
-        elif in_uc and in_ccc:
-            filters["ccc_courses"].add(course)
-
-    # print("🎯 [DEBUG] Extracted filters:", filters)
-    return {
-        "uc_course": sorted(filters["uc_course"]),
-        "ccc_courses": sorted(filters["ccc_courses"])
-    }
+    return classify_course_codes(iter_course_codes(query), uc_course_catalog, ccc_course_catalog)
 
 def extract_reverse_matches(query: str, docs: List[Any]) -> List[Any]:
     """
@@ -3,58 +3,62 @@ TransferAI Document Repository
 
 This module provides access to the document storage layer for articulation documents.
 It follows the Repository pattern to abstract the data access logic and provide
-efficient caching for improved performance.
+efficient caching for improved performance (see llm.repositories.result_cache).
 """
 
-from typing import List, Dict, Any, Optional, Set, Union, Tuple, Callable
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Set, Union, Tuple, Callable
+from bisect import bisect_left
 import os
 from pathlib import Path
 import json
 import re
-import functools
 import time
 from datetime import datetime, timedelta
 
 # Import our wrapped Document class instead of llama_index
-from llm.models.document import Document
+from llm.models.document import Document, TextStore
 
-# Define cache decorator for method results
-def cached_result(ttl_seconds: int = 3600):
+from llm.repositories.result_cache import cached_result, cache_stats, instance_caches
+
+
+def _contains(posting: Sequence[int], ordinal: int) -> bool:
+    """Binary-search membership test on an ascending posting list."""
+    at = bisect_left(posting, ordinal)
+    return at < len(posting) and posting[at] == ordinal
+
+
+def intersect_postings(postings: Iterable[Sequence[int]]) -> List[int]:
     """
-    Method decorator that caches results with a time-to-live (TTL).
+    Intersect ascending posting lists, smallest first.
+    
+    The smallest list is the candidate set; each larger list only filters
+    the surviving candidates by binary search, so the cost is bounded by
+    the smallest posting rather than the largest. Stops as soon as the
+    result is empty.
     
     Args:
-        ttl_seconds: Cache expiration time in seconds (default: 1 hour)
-    """
-    def decorator(func):
-        cache = {}
+        postings: Ascending ordinal lists (at least one)
         
-        @functools.wraps(func)
-        def wrapper(self, *args, **kwargs):
-            # Create a cache key from the function arguments
-            key = str(args) + str(sorted(kwargs.items()))
-            
-            # Check if result is in cache and not expired
-            if key in cache:
-                result, timestamp = cache[key]
-                if timestamp + ttl_seconds > time.time():
-                    return result
-            
-            # Call the original function and cache the result
-            result = func(self, *args, **kwargs)
-            cache[key] = (result, time.time())
-            return result
-            
-        # Add a method to clear the cache that can be called both as an instance method
-        # and as a direct function
-        def clear_cache(self=None):
-            cache.clear()
-            
-        wrapper.clear_cache = clear_cache
-        wrapper._is_cached_method = True
-            
-        return wrapper
-    return decorator
+    Returns:
+        Ascending ordinals present in every posting
+    """
+    ordered = sorted(postings, key=len)
+    if not ordered:
+        return []
+    result = list(ordered[0])
+    for posting in ordered[1:]:
+        if not result:
+            break
+        result = [i for i in result if _contains(posting, i)]
+    return result
+
+
+def union_postings(postings: Iterable[Sequence[int]]) -> List[int]:
+    """Return the ascending union of posting lists."""
+    merged: Set[int] = set()
+    for posting in postings:
+        merged.update(posting)
+    return sorted(merged)
 
 
 class DocumentRepository:
@@ -65,6 +69,11 @@ class DocumentRepository:
     with methods for searching by various criteria and efficient caching
     for improved performance.
     
+    Lookups are served from inverted indexes built once per document load
+    (see _build_indexes). Each index maps a key to the ascending ordinals of
+    the matching documents in self.documents, so a lookup costs one dict
+    access plus the size of the result.
+    
     Attributes:
         documents: List of articulation documents
         uc_course_catalog: Set of all UC courses in the repository
@@ -86,6 +95,16 @@ class DocumentRepository:
         self._cache: Dict[str, Any] = {}
         self._last_loaded: Optional[float] = None
         
+        # Inverted indexes: key -> ascending document ordinals
+        self._uc_index: Dict[str, List[int]] = {}
+        self._ccc_index: Dict[str, List[int]] = {}
+        self._group_index: Dict[Any, List[int]] = {}
+        self._section_index: Dict[Any, List[int]] = {}
+        self._group_section_index: Dict[Tuple[Any, Any], List[int]] = {}
+        self._reverse_index: Dict[str, List[int]] = {}
+        self._indexed_documents: Optional[List[Document]] = None
+        self._indexed_count: int = 0
+        
         # Initialize query service for course code normalization
         from llm.services.query_service import QueryService
         self._query_service = QueryService()
@@ -93,7 +112,7 @@ class DocumentRepository:
         if documents:
             self._build_course_catalogs()
         
-    def load_documents(self, path: Optional[str] = None) -> int:
+    def load_documents(self, path: Optional[str] = None, spill_text: bool = False) -> int:
         """
         Load documents from the data source.
         
@@ -103,6 +122,8 @@ class DocumentRepository:
         
         Args:
             path: Optional path to the document data file
+            spill_text: Keep document text in a temporary offset-indexed file
+                instead of in memory
             
         Returns:
             Number of documents loaded
@@ -110,7 +131,7 @@ class DocumentRepository:
         from llm.services.document_service import DocumentService
         
         start_time = time.time()
-        document_service = DocumentService(self)
+        document_service = DocumentService(self, text_store=TextStore() if spill_text else None)
         count = document_service.load_documents(path)
         
         # Document_service already updates these values but we track the load time here
@@ -122,25 +143,24 @@ class DocumentRepository:
         """Clear all cached results in the repository."""
         self._cache = {}
         
-        # Clear method-specific caches
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if hasattr(attr, '_is_cached_method') and attr._is_cached_method:
-                # Call the clear_cache method with self as the argument
-                attr.clear_cache(self)
+        # Clear this instance's method-specific caches
+        for cache in instance_caches(self).values():
+            cache.clear()
                 
     def get_reload_status(self) -> Dict[str, Any]:
         """
         Get information about the document loading status.
         
         Returns:
-            Dictionary with document count and last load time
+            Dictionary with document count, last load time and result cache
+            counters (hits, misses, evictions, expirations per method)
         """
         return {
             "document_count": len(self.documents),
             "last_loaded": datetime.fromtimestamp(self._last_loaded).isoformat() if self._last_loaded else None,
             "uc_course_count": len(self.uc_course_catalog),
-            "ccc_course_count": len(self.ccc_course_catalog)
+            "ccc_course_count": len(self.ccc_course_catalog),
+            "cache": cache_stats(self)
         }
     
     @cached_result(ttl_seconds=3600)
@@ -157,12 +177,10 @@ class DocumentRepository:
         # Normalize the course code for case-insensitive search
         normalized_course = self._normalize_course_code(uc_course)
         
-        return [
-            doc for doc in self.documents
-            if self._normalize_course_code(doc.metadata.get("uc_course", "")) == normalized_course
-        ]
+        self._ensure_indexes()
+        return self._materialize(self._uc_index.get(normalized_course, ()))
     
-    @cached_result(ttl_seconds=3600)
+    @cached_result(ttl_seconds=3600, unordered=True)
     def find_by_ccc_courses(self, ccc_courses: List[str], require_all: bool = True) -> List[Document]:
         """
         Find documents containing specific CCC courses.
@@ -175,26 +193,7 @@ class DocumentRepository:
         Returns:
             List of documents matching the criteria
         """
-        if not ccc_courses:
-            return []
-            
-        # Normalize the course codes for comparison
-        normalized_courses = [self._normalize_course_code(course) for course in ccc_courses]
-        
-        result = []
-        for doc in self.documents:
-            doc_courses = [self._normalize_course_code(c) for c in doc.metadata.get("ccc_courses", [])]
-            
-            if require_all:
-                # All specified courses must be present
-                if all(nc in doc_courses for nc in normalized_courses):
-                    result.append(doc)
-            else:
-                # Match if any of the courses are present
-                if any(nc in doc_courses for nc in normalized_courses):
-                    result.append(doc)
-                    
-        return result
+        return self._materialize(self.postings_for_ccc_courses(ccc_courses, require_all))
         
     @cached_result(ttl_seconds=3600)
     def find_by_group(self, group_id: str) -> List[Document]:
@@ -207,10 +206,23 @@ class DocumentRepository:
         Returns:
             List of documents matching the group
         """
-        return [
-            doc for doc in self.documents
-            if doc.metadata.get("group") == group_id
-        ]
+        self._ensure_indexes()
+        return self._materialize(self._lookup(self._group_index, group_id))
+        
+    @cached_result(ttl_seconds=3600)
+    def find_by_group_section(self, group_id: str, section_id: str) -> List[Document]:
+        """
+        Find documents for a specific section within a group.
+        
+        Args:
+            group_id: The group identifier to search for
+            section_id: The section identifier to search for
+            
+        Returns:
+            List of documents matching both the group and the section
+        """
+        self._ensure_indexes()
+        return self._materialize(self._lookup(self._group_section_index, (group_id, section_id)))
         
     @cached_result(ttl_seconds=3600)
     def find_by_section(self, section_id: str) -> List[Document]:
@@ -223,10 +235,8 @@ class DocumentRepository:
         Returns:
             List of documents matching the section
         """
-        return [
-            doc for doc in self.documents
-            if doc.metadata.get("section") == section_id
-        ]
+        self._ensure_indexes()
+        return self._materialize(self._lookup(self._section_index, section_id))
         
     @cached_result(ttl_seconds=3600)
     def find_reverse_matches(self, ccc_course: str) -> List[Document]:
@@ -246,13 +256,76 @@ class DocumentRepository:
             return []
             
         normalized_course = self._normalize_course_code(ccc_course)
-        matches = []
         
-        for doc in self.documents:
-            if self._logic_contains_course(doc.metadata.get("logic_block", {}), normalized_course):
-                matches.append(doc)
-                
-        return matches
+        self._ensure_indexes()
+        return self._materialize(self._reverse_index.get(normalized_course, ()))
+        
+    def postings_for_uc_course(self, uc_course: str) -> Sequence[int]:
+        """
+        Posting list (ascending document ordinals) for a UC course.
+        
+        Like the other postings_for_* methods this returns the index entry
+        itself; callers must not mutate it. Ordinals index get_all_documents().
+        
+        Args:
+            uc_course: The UC course code to look up
+            
+        Returns:
+            Ascending ordinals of the matching documents
+        """
+        self._ensure_indexes()
+        return self._uc_index.get(self._normalize_course_code(uc_course), [])
+    
+    def postings_for_ccc_course(self, ccc_course: str) -> Sequence[int]:
+        """
+        Posting list (ascending document ordinals) for documents listing a
+        CCC course in ccc_courses.
+        
+        Returns the index entry itself; callers must not mutate it.
+        """
+        self._ensure_indexes()
+        return self._ccc_index.get(self._normalize_course_code(ccc_course), [])
+    
+    def postings_for_ccc_courses(self, ccc_courses: List[str], require_all: bool = True) -> List[int]:
+        """
+        Posting list for documents containing all (or any) of the CCC courses.
+        
+        Each requested code is normalized once; the per-course postings are
+        intersected (require_all) or unioned.
+        
+        Args:
+            ccc_courses: List of CCC course codes
+            require_all: Intersect when True, union when False
+            
+        Returns:
+            Ascending ordinals of the matching documents
+        """
+        if not ccc_courses:
+            return []
+        postings = [self.postings_for_ccc_course(course) for course in set(ccc_courses)]
+        return intersect_postings(postings) if require_all else union_postings(postings)
+    
+    def postings_for_group(self, group_id: str) -> Sequence[int]:
+        """Posting list for a group identifier."""
+        self._ensure_indexes()
+        return self._lookup(self._group_index, group_id)
+    
+    def postings_for_section(self, section_id: str) -> Sequence[int]:
+        """Posting list for a section identifier."""
+        self._ensure_indexes()
+        return self._lookup(self._section_index, section_id)
+    
+    def get_documents_at(self, ordinals: Iterable[int]) -> List[Document]:
+        """
+        Materialize document ordinals returned by the postings_for_* methods.
+        
+        Args:
+            ordinals: Document ordinals, in the order wanted
+            
+        Returns:
+            The corresponding documents
+        """
+        return self._materialize(ordinals)
         
     def get_all_documents(self) -> List[Document]:
         """
@@ -325,19 +398,122 @@ class DocumentRepository:
         """
         Build the UC and CCC course catalogs from the loaded documents.
         
-        This creates sets of all unique UC and CCC course codes for later reference.
+        This creates sets of all unique UC and CCC course codes for later reference,
+        and rebuilds the inverted lookup indexes in the same pass.
         """
-        self.uc_course_catalog = set()
-        self.ccc_course_catalog = set()
+        self._build_indexes()
         
-        for doc in self.documents:
-            uc = doc.metadata.get("uc_course")
-            if uc:
-                self.uc_course_catalog.add(self._normalize_course_code(uc))
-                
-            for ccc in doc.metadata.get("ccc_courses", []):
-                if ccc:
-                    self.ccc_course_catalog.add(self._normalize_course_code(ccc))
+        self.uc_course_catalog = {code for code in self._uc_index if code}
+        self.ccc_course_catalog = {code for code in self._ccc_index if code}
+    
+    def _build_indexes(self) -> None:
+        """
+        Build the inverted indexes used by the find_* methods.
+        
+        Every course code is normalized once here rather than on every lookup:
+        
+        - _uc_index: normalized UC course -> documents
+        - _ccc_index: normalized CCC course -> documents listing it in ccc_courses
+        - _group_index / _section_index / _group_section_index: raw metadata values
+        - _reverse_index: normalized CCC course -> documents whose logic block
+          mentions it (same traversal as _logic_contains_course)
+        """
+        normalized: Dict[str, str] = {}
+        
+        def norm(code: str) -> str:
+            if code not in normalized:
+                normalized[code] = self._normalize_course_code(code)
+            return normalized[code]
+        
+        uc_index: Dict[str, List[int]] = {}
+        ccc_index: Dict[str, List[int]] = {}
+        group_index: Dict[Any, List[int]] = {}
+        section_index: Dict[Any, List[int]] = {}
+        group_section_index: Dict[Tuple[Any, Any], List[int]] = {}
+        reverse_index: Dict[str, List[int]] = {}
+        
+        for ordinal, doc in enumerate(self.documents):
+            metadata = doc.metadata
+            
+            uc_index.setdefault(norm(metadata.get("uc_course") or ""), []).append(ordinal)
+            
+            for ccc in {norm(c or "") for c in metadata.get("ccc_courses", [])}:
+                ccc_index.setdefault(ccc, []).append(ordinal)
+            
+            group = metadata.get("group")
+            section = metadata.get("section")
+            self._add_posting(group_index, group, ordinal)
+            self._add_posting(section_index, section, ordinal)
+            self._add_posting(group_section_index, (group, section), ordinal)
+            
+            for course in self._logic_courses(metadata.get("logic_block", {}), norm):
+                reverse_index.setdefault(course, []).append(ordinal)
+        
+        self._uc_index = uc_index
+        self._ccc_index = ccc_index
+        self._group_index = group_index
+        self._section_index = section_index
+        self._group_section_index = group_section_index
+        self._reverse_index = reverse_index
+        self._indexed_documents = self.documents
+        self._indexed_count = len(self.documents)
+    
+    def _ensure_indexes(self) -> None:
+        """Rebuild the indexes if self.documents was replaced or resized since the last build."""
+        if self._indexed_documents is not self.documents or self._indexed_count != len(self.documents):
+            self._build_course_catalogs()
+    
+    @staticmethod
+    def _add_posting(index: Dict[Any, List[int]], key: Any, ordinal: int) -> None:
+        """Append ordinal under key, skipping unhashable metadata values."""
+        try:
+            index.setdefault(key, []).append(ordinal)
+        except TypeError:
+            pass
+    
+    @staticmethod
+    def _lookup(index: Dict[Any, List[int]], key: Any) -> List[int]:
+        """Return the posting list for key (empty for unknown or unhashable keys)."""
+        try:
+            return index.get(key, [])
+        except TypeError:
+            return []
+    
+    def _materialize(self, ordinals) -> List[Document]:
+        """Map document ordinals back to Document objects."""
+        documents = self.documents
+        return [documents[i] for i in ordinals]
+    
+    def _logic_courses(self, logic_block: Dict[str, Any], norm: Callable[[str], str]) -> Set[str]:
+        """
+        Collect every normalized course mentioned in a logic block.
+        
+        Mirrors _logic_contains_course: entries typed AND/OR are recursed into,
+        any other dict entry contributes its course_letters.
+        
+        Args:
+            logic_block: The logic block to walk
+            norm: Course code normalizer
+            
+        Returns:
+            Set of normalized course codes found in the block
+        """
+        found: Set[str] = set()
+        stack = [logic_block]
+        while stack:
+            block = stack.pop()
+            if not block or not isinstance(block, dict):
+                continue
+            courses = block.get("courses", [])
+            if not isinstance(courses, list):
+                continue
+            for entry in courses:
+                if isinstance(entry, dict):
+                    if entry.get("type") in {"AND", "OR"}:
+                        stack.append(entry)
+                    else:
+                        found.add(norm(entry.get("course_letters", "")))
+        return found
     
     def _normalize_course_code(self, course_code: str) -> str:
         """
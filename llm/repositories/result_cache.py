@@ -0,0 +1,222 @@
+"""
+TransferAI Result Cache
+
+Bounded LRU + TTL cache used by the repository ``cached_result`` decorator.
+
+Each decorated method gets one ResultCache per repository instance, so
+repositories no longer share (or leak into) a closure-level dict. Entries are
+evicted least-recently-used once ``max_entries`` is reached, expire after
+``ttl_seconds``, and every operation runs under a lock so concurrent handler
+threads can share a repository safely.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import functools
+import threading
+import time
+import weakref
+
+_MISSING = object()
+
+
+def canonical_key(value: Any, unordered: bool = False) -> Hashable:
+    """
+    Convert an argument into a hashable, canonical cache key component.
+
+    Dicts become sorted item tuples and sets become frozensets. Lists and
+    tuples keep their order unless ``unordered`` is True, in which case they
+    are treated as sets (so ``["A", "B"]`` and ``["B", "A"]`` share a key).
+
+    Args:
+        value: Argument value to canonicalize
+        unordered: Treat sequences as unordered collections
+
+    Returns:
+        A hashable representation of value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted(
+            ((repr(k), canonical_key(v, unordered)) for k, v in value.items()),
+            key=lambda item: item[0],
+        ))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(canonical_key(v, unordered) for v in value)
+    if isinstance(value, (list, tuple)):
+        items = tuple(canonical_key(v, unordered) for v in value)
+        return frozenset(items) if unordered else items
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with per-entry time-to-live.
+
+    Attributes:
+        max_entries: Maximum number of live entries
+        ttl_seconds: Seconds before an entry expires
+        hits / misses / evictions / expirations: Lifetime counters
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+_INSTANCE_CACHES_ATTR = "_result_caches"
+_instance_caches_lock = threading.Lock()
+
+
+def instance_caches(owner: Any) -> Dict[str, ResultCache]:
+    """
+    Return the per-instance {method name: ResultCache} registry of owner.
+
+    Args:
+        owner: The object whose method results are cached
+
+    Returns:
+        The (possibly newly created) registry dict
+    """
+    caches = owner.__dict__.get(_INSTANCE_CACHES_ATTR)
+    if caches is None:
+        with _instance_caches_lock:
+            caches = owner.__dict__.setdefault(_INSTANCE_CACHES_ATTR, {})
+    return caches
+
+
+def cached_result(ttl_seconds: float = 3600, max_entries: int = 256, unordered: bool = False):
+    """
+    Method decorator that caches results per instance with LRU + TTL eviction.
+
+    Args:
+        ttl_seconds: Cache expiration time in seconds (default: 1 hour)
+        max_entries: Maximum cached results per instance (default: 256)
+        unordered: Treat list/tuple arguments as unordered when building keys
+    """
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        # Every cache created for this method, so clear_cache() without an
+        # instance can still reach them; weak so instances can be collected.
+        all_caches: "weakref.WeakSet[ResultCache]" = weakref.WeakSet()
+
+        def _cache_for(owner: Any) -> ResultCache:
+            caches = instance_caches(owner)
+            cache = caches.get(name)
+            if cache is None:
+                with _instance_caches_lock:
+                    cache = caches.get(name)
+                    if cache is None:
+                        cache = ResultCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+                        caches[name] = cache
+                        all_caches.add(cache)
+            return cache
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = _cache_for(self)
+            # Positions are kept; ``unordered`` applies within each argument
+            key = (
+                tuple(canonical_key(arg, unordered) for arg in args),
+                canonical_key(kwargs, unordered),
+            )
+
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+
+            # Computed outside the lock; concurrent misses may both compute
+            result = func(self, *args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        # Clear one instance's cache, or every instance's when called bare
+        def clear_cache(self: Optional[Any] = None) -> None:
+            if self is None:
+                for cache in list(all_caches):
+                    cache.clear()
+                return
+            cache = instance_caches(self).get(name)
+            if cache is not None:
+                cache.clear()
+
+        wrapper.clear_cache = clear_cache
+        wrapper._is_cached_method = True
+
+        return wrapper
+    return decorator
+
+
+def cache_stats(owner: Any) -> Dict[str, Any]:
+    """
+    Summarize the result caches attached to owner.
+
+    Returns:
+        Dictionary with per-method stats under "methods" plus summed
+        hits, misses, evictions, expirations and size
+    """
+    methods = {
+        name: cache.stats()
+        for name, cache in sorted(instance_caches(owner).items())
+    }
+    totals = {
+        field: sum(stats[field] for stats in methods.values())
+        for field in ("size", "hits", "misses", "evictions", "expirations")
+    }
+    return {**totals, "methods": methods}
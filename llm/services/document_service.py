@@ -6,18 +6,21 @@ between the TransferAIEngine and the DocumentRepository. It handles document loa
 transformation, and maintenance of course information caches.
 """
 
-from typing import List, Dict, Any, Optional, Set, Union, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Set, Union, Tuple
 import json
 import os
 import re
+import threading
 import time
+import logging
 from pathlib import Path
 
 # Import our Document model wrapper
-from llm.models.document import Document 
-from llama_index.core import Document as LlamaDocument
-from llm.repositories.document_repository import DocumentRepository
+from llm.models.document import Document, LogicBlockArena, TextStore
+from llm.repositories.document_repository import DocumentRepository, intersect_postings, union_postings
 
+# Set up logger
+logger = logging.getLogger(__name__)
 
 # Cache for course data to avoid repeated file reads
 _course_cache: Dict[str, Dict[str, Any]] = {}
@@ -34,16 +37,35 @@ class DocumentService:
     
     Attributes:
         repository: The underlying DocumentRepository
+        last_filter_plan: Query plan of the calling thread's last
+            find_documents_by_filter call
+        text_store: Store document text is spilled to, or None to keep it in memory
+        logic_block_arena: Arena sharing identical logic blocks across the
+            loaded documents; replaced on every load so old blocks are freed
     """
     
-    def __init__(self, repository: Optional[DocumentRepository] = None):
+    def __init__(
+        self,
+        repository: Optional[DocumentRepository] = None,
+        text_store: Optional[TextStore] = None
+    ):
         """
         Initialize the document service.
         
         Args:
             repository: Optional DocumentRepository instance. If None, a new one is created.
+            text_store: Optional TextStore to spill loaded document text to.
         """
         self.repository = repository or DocumentRepository()
+        self.text_store = text_store
+        self.logic_block_arena = LogicBlockArena()
+        # Per thread, so concurrent sub-queries don't overwrite each other's plan
+        self._filter_plans = threading.local()
+    
+    @property
+    def last_filter_plan(self) -> Optional[Dict[str, Any]]:
+        """Query plan of the calling thread's last find_documents_by_filter call."""
+        return getattr(self._filter_plans, "plan", None)
         
     def load_documents(self, path: Optional[str] = None) -> int:
         """
@@ -55,13 +77,16 @@ class DocumentService:
         Returns:
             Number of documents loaded
         """
+        self.logic_block_arena = LogicBlockArena()
         documents = self._load_documents(path)
         
         # Convert to our Document wrapper if needed
         wrapped_documents = []
         for doc in documents:
             if not isinstance(doc, Document):
-                wrapped_documents.append(Document.from_llama_document(doc))
+                wrapped_documents.append(Document.from_llama_document(
+                    doc, text_store=self.text_store, arena=self.logic_block_arena
+                ))
             else:
                 wrapped_documents.append(doc)
                 
@@ -350,10 +375,15 @@ class DocumentService:
 
         return flattened_docs
 
-    def _load_documents(self, path: Optional[str] = None) -> List[LlamaDocument]:
+    def _load_documents(self, path: Optional[str] = None) -> List[Document]:
         """
         Load articulation data and convert to Document objects.
         
+        Documents are built directly from the flattened dictionaries (no
+        intermediate llama_index Documents), with text spilled to
+        ``self.text_store`` when one is set and logic blocks shared through
+        ``self.logic_block_arena``.
+        
         Args:
             path: Optional path to the JSON data file
         
@@ -378,8 +408,10 @@ class DocumentService:
         flat_docs = self.flatten_courses_from_json(json_data)
         all_docs = [overview] + flat_docs
 
-        # Create LlamaDocuments first
-        return [LlamaDocument(text=d["text"], metadata=d["metadata"]) for d in all_docs]
+        return [
+            Document.from_dict(d, text_store=self.text_store, arena=self.logic_block_arena)
+            for d in all_docs
+        ]
         
     def get_uc_course_prefixes(self) -> List[str]:
         """
@@ -494,6 +526,19 @@ class DocumentService:
         """
         Find documents matching a combination of filters.
         
+        Each indexed filter (uc_course, ccc_courses, group, section) is resolved
+        to a posting list of document ordinals straight from the repository's
+        indexes. Single-key lookups are resolved before multi-key ones (a list
+        of UC courses, several CCC courses), stopping at the first empty
+        posting. The postings are then intersected smallest-first, the
+        no_articulation predicate is applied only to the survivors, and only
+        those are materialized, in repository order. The whole corpus is
+        enumerated only when no indexed filter is given.
+        
+        The plan of the calling thread's last call (posting sizes, intersection
+        order and the most selective filter) is kept in self.last_filter_plan
+        for debugging slow queries.
+        
         Args:
             filters: Dictionary of filter criteria
             limit: Optional maximum number of documents to return
@@ -501,59 +546,67 @@ class DocumentService:
         Returns:
             List of documents matching all specified filters
         """
-        results = self.repository.get_all_documents()
-        
-        # Apply UC course filter
-        if "uc_course" in filters and filters["uc_course"]:
-            if isinstance(filters["uc_course"], list):
-                uc_docs = []
-                for uc in filters["uc_course"]:
-                    uc_docs.extend(self.repository.find_by_uc_course(uc))
-                results = uc_docs
-            else:
-                results = self.repository.find_by_uc_course(filters["uc_course"])
-                
-        # Apply CCC course filter
-        if "ccc_courses" in filters and filters["ccc_courses"]:
-            ccc_docs = self.repository.find_by_ccc_courses(
-                filters["ccc_courses"],
-                True
-            )
-            # Intersect with current results
-            if "uc_course" in filters and filters["uc_course"]:
-                # Find docs that match both UC and CCC filters
-                results = [doc for doc in results if doc in ccc_docs]
-            else:
-                results = ccc_docs
-                
-        # Apply group filter
-        if "group" in filters and filters["group"]:
-            group_docs = self.repository.find_by_group(filters["group"])
-            # Intersect with current results
-            if "uc_course" in filters or "ccc_courses" in filters:
-                results = [doc for doc in results if doc in group_docs]
+        start_time = time.time()
+        repository = self.repository
+        
+        # (name, number of index keys involved, resolver)
+        resolvers = []
+        if filters.get("uc_course"):
+            uc_courses = filters["uc_course"]
+            if isinstance(uc_courses, list):
+                resolvers.append(("uc_course", len(uc_courses), lambda: union_postings(
+                    repository.postings_for_uc_course(uc) for uc in set(uc_courses)
+                )))
             else:
-                results = group_docs
-                
-        # Apply section filter
-        if "section" in filters and filters["section"]:
-            section_docs = self.repository.find_by_section(filters["section"])
-            # Intersect with current results
-            results = [doc for doc in results if doc in section_docs]
-            
-        # Apply no_articulation filter
+                resolvers.append(("uc_course", 1, lambda: repository.postings_for_uc_course(uc_courses)))
+        if filters.get("ccc_courses"):
+            resolvers.append(("ccc_courses", len(filters["ccc_courses"]), lambda: (
+                repository.postings_for_ccc_courses(filters["ccc_courses"], True)
+            )))
+        if filters.get("section"):
+            resolvers.append(("section", 1, lambda: repository.postings_for_section(filters["section"])))
+        if filters.get("group"):
+            resolvers.append(("group", 1, lambda: repository.postings_for_group(filters["group"])))
+        
+        # Cheapest lookups first, so an empty posting skips the costlier ones
+        resolvers.sort(key=lambda resolver: resolver[1])
+        postings: Dict[str, Sequence[int]] = {}
+        for name, _, resolve in resolvers:
+            postings[name] = resolve()
+            if not postings[name]:
+                break
+        
+        order = sorted(postings, key=lambda name: len(postings[name]))
+        if order:
+            result: Sequence[int] = intersect_postings(postings[name] for name in order)
+        else:
+            result = range(repository.get_documents_count())
+        
+        # Residual predicate - evaluated only on the surviving candidates
         if "no_articulation" in filters:
             no_articulation_value = filters["no_articulation"]
-            results = [
-                doc for doc in results
+            result = [
+                i for i, doc in zip(result, repository.get_documents_at(result))
                 if (isinstance(doc.metadata.get("logic_block", {}), dict) and
                     doc.metadata.get("logic_block", {}).get("no_articulation", False)) == no_articulation_value
             ]
-            
-        # Apply limit
+        
         if limit is not None and limit > 0:
-            results = results[:limit]
-            
+            result = result[:limit]
+        results = repository.get_documents_at(result)
+        
+        plan = {
+            "filters": [name for name, _, _ in resolvers],
+            "posting_sizes": {name: len(posting) for name, posting in postings.items()},
+            "intersection_order": order,
+            "most_selective": order[0] if order else None,
+            "skipped": [name for name, _, _ in resolvers if name not in postings],
+            "result_count": len(results),
+            "elapsed_ms": round((time.time() - start_time) * 1000, 3),
+        }
+        self._filter_plans.plan = plan
+        logger.debug("find_documents_by_filter plan: %s", plan)
+        
         return results
         
     def validate_documents_same_section(self, docs: List[Document]) -> List[Document]:
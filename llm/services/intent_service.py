@@ -0,0 +1,279 @@
+"""
+TransferAI Intent Service
+
+In-process server for the Query Intent Classifier (QIC) trained in
+``QIC model/``. The model artefacts (ONNX session preferred, PyTorch fallback)
+are loaded once, on first use, and every caller shares them.
+
+Concurrent ``classify`` calls are coalesced: a worker thread collects the
+requests that arrive within ``max_wait_ms`` of each other (up to
+``max_batch_size`` texts) and runs them through the model in one backend call.
+
+The service is an optional router. ``TransferAIEngine`` consults it when the
+``intent_router`` config flag is set, and the agent uses it to skip the planner
+call for simple, high-confidence intents (see ``agent.intent_router``).
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+
+from llm.models.query import QueryType
+
+logger = logging.getLogger(__name__)
+
+QIC_ROOT = Path(__file__).resolve().parents[2] / "QIC model"
+DEFAULT_CONFIG_PATH = QIC_ROOT / "src" / "config.yaml"
+
+# A backend maps a batch of texts to one (intent, confidence) pair per text
+Backend = Callable[[List[str]], List[Tuple[str, float]]]
+
+
+@dataclass(frozen=True)
+class IntentPrediction:
+    """
+    Predicted intent for one text.
+
+    Attributes:
+        text: The classified text
+        intent: Predicted intent label (the QIC fallback label when unsure)
+        confidence: Calibrated probability of the top intent
+    """
+    text: str
+    intent: str
+    confidence: float
+
+
+def load_qic_backend(
+    config_path: Path = DEFAULT_CONFIG_PATH,
+    output_dir: Optional[Path] = None
+) -> Backend:
+    """
+    Load the QIC artefacts and return a batch prediction function.
+
+    Args:
+        config_path: The QIC training config (``QIC model/src/config.yaml``)
+        output_dir: Trained artefacts directory; defaults to ``$QIC_OUTPUT_DIR``
+            or ``QIC model/outputs``
+
+    Returns:
+        Backend returning (intent, confidence) for every input text
+
+    Raises:
+        FileNotFoundError: If the model has not been trained/exported
+    """
+    config_path = Path(config_path)
+    qic_root = str(config_path.resolve().parents[1])
+    if qic_root not in sys.path:
+        sys.path.insert(0, qic_root)
+    from src.infer import load_artefacts, predict_intents
+
+    output_dir = Path(output_dir or os.getenv("QIC_OUTPUT_DIR") or QIC_ROOT / "outputs")
+    cfg, tokenizer, model, label_encoder, device = load_artefacts(config_path, output_dir=output_dir)
+
+    def predict(texts: List[str]) -> List[Tuple[str, float]]:
+        # One dynamically padded model run for the whole coalesced batch
+        outputs = predict_intents(
+            texts, tokenizer, model, label_encoder, device, cfg,
+            batch_size=max(len(texts), 1), return_probs=True
+        )
+        return [(intent, confidence) for intent, confidence, _ in outputs]
+
+    return predict
+
+
+class _Request:
+    """One pending classify() call."""
+
+    __slots__ = ("texts", "done", "result", "error")
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.done = threading.Event()
+        self.result: List[IntentPrediction] = []
+        self.error: Optional[BaseException] = None
+
+
+class IntentService:
+    """
+    Shared, batching intent classifier.
+
+    Attributes:
+        max_batch_size: Texts collected before a batch is run early
+        max_wait_ms: How long the first request of a batch waits for company
+        batches_run: Number of backend calls made so far
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Backend] = None,
+        config_path: Path = DEFAULT_CONFIG_PATH,
+        output_dir: Optional[Path] = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0
+    ):
+        """
+        Initialize the service (the model itself is loaded on first use).
+
+        Args:
+            backend: Prediction function to use instead of the QIC model
+            config_path: QIC config used when loading the model
+            output_dir: QIC artefacts directory used when loading the model
+            max_batch_size: Maximum texts coalesced into one backend call
+            max_wait_ms: Coalescing window in milliseconds
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.batches_run = 0
+
+        self._backend = backend
+        self._config_path = config_path
+        self._output_dir = output_dir
+        self._load_error: Optional[BaseException] = None
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _get_backend(self) -> Backend:
+        """Return the backend, loading the QIC model exactly once."""
+        if self._backend is None:
+            if self._load_error is not None:
+                raise RuntimeError(f"QIC model unavailable: {self._load_error}")
+            try:
+                start = time.perf_counter()
+                self._backend = load_qic_backend(self._config_path, self._output_dir)
+                logger.info(f"Loaded QIC intent model in {time.perf_counter() - start:.2f}s")
+            except Exception as e:
+                self._load_error = e
+                raise RuntimeError(f"QIC model unavailable: {e}") from e
+        return self._backend
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name="intent-service", daemon=True
+                    )
+                    self._worker.start()
+
+    def classify(self, texts: Sequence[str]) -> List[IntentPrediction]:
+        """
+        Classify texts, sharing a model run with concurrent callers.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            One IntentPrediction per text, in input order
+
+        Raises:
+            RuntimeError: If the model cannot be loaded
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+
+        request = _Request(texts)
+        self._ensure_worker()
+        self._queue.put(request)
+        request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _run(self) -> None:
+        """Worker loop: gather a batch, run it, repeat."""
+        while True:
+            batch = [self._queue.get()]
+            size = len(batch[0].texts)
+            deadline = time.monotonic() + self.max_wait_ms / 1000.0
+
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            self._process(batch)
+
+    def _process(self, batch: List[_Request]) -> None:
+        """Run one backend call for every request in batch and hand out results."""
+        texts = [text for request in batch for text in request.texts]
+        try:
+            outputs = self._get_backend()(texts)
+            if len(outputs) != len(texts):
+                raise RuntimeError(f"Intent backend returned {len(outputs)} results for {len(texts)} texts")
+        except BaseException as e:
+            for request in batch:
+                request.error = e
+                request.done.set()
+            return
+
+        self.batches_run += 1
+        offset = 0
+        for request in batch:
+            chunk = outputs[offset:offset + len(request.texts)]
+            offset += len(request.texts)
+            request.result = [
+                IntentPrediction(text=text, intent=intent, confidence=float(confidence))
+                for text, (intent, confidence) in zip(request.texts, chunk)
+            ]
+            request.done.set()
+
+
+def query_type_for_intent(intent: str, filters: Dict[str, Any]) -> Optional[QueryType]:
+    """
+    Map a QIC intent onto the engine's query types.
+
+    Only intents the articulation handlers actually serve are mapped; the
+    course filters decide which course-level type applies.
+
+    Args:
+        intent: Predicted QIC intent
+        filters: Filters extracted from the query
+
+    Returns:
+        The matching QueryType, or None when the intent has no engine handler
+    """
+    uc_courses = filters.get("uc_course") or []
+    ccc_courses = filters.get("ccc_courses") or []
+
+    if intent == "course_equivalency":
+        if uc_courses and ccc_courses:
+            return QueryType.COURSE_VALIDATION
+        if ccc_courses:
+            return QueryType.COURSE_EQUIVALENCY
+        if uc_courses:
+            return QueryType.COURSE_LOOKUP
+    elif intent == "major_requirements" and filters.get("group"):
+        return QueryType.GROUP_REQUIREMENT
+    return None
+
+
+_SERVICE: Optional[IntentService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_intent_service() -> IntentService:
+    """Return the process-wide IntentService (created on first use)."""
+    global _SERVICE
+    if _SERVICE is None:
+        with _SERVICE_LOCK:
+            if _SERVICE is None:
+                _SERVICE = IntentService()
+    return _SERVICE
@@ -0,0 +1,261 @@
+"""
+TransferAI Query Classifier
+
+Single-pass keyword and pattern scanner shared by query typing
+(``QueryService.determine_query_type``) and handler dispatch
+(``QueryHandler.can_handle``).
+
+Every keyword list those checks use is registered below as a named group and
+compiled into one Aho-Corasick automaton; every regex list is compiled into a
+single alternation per group. ``extract_features`` scans the lower-cased query
+once and returns a ``QueryFeatures`` vector answering which groups fired
+(pattern groups are searched on first use).
+Results are cached per query text, so typing a query and asking each
+registered handler about it costs one scan instead of one per check.
+
+Keyword groups keep the substring semantics of the ``any(keyword in text)``
+checks they replace: "do" still fires inside "does", "vs" inside "versus".
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+import re
+
+# Keyword groups: group name -> substrings of the lower-cased query
+KEYWORD_GROUPS: Dict[str, Tuple[str, ...]] = {
+    # QueryService.determine_query_type
+    "comparison": (
+        'same', 'similar', 'different', 'alike', 'equivalent',
+        'compare', 'comparison', 'versus', 'vs', 'like', 'match',
+        'require the same', 'both require', 'both need',
+        'both accept', 'both satisfy'
+    ),
+    "path": (
+        'full path', 'complete path', 'complete requirement', 'finish requirement',
+        'satisfy requirement', 'satisfy section', 'complete section',
+        'entire path', 'one path', 'enough for', 'sufficient for'
+    ),
+    "validation": ('does', 'do', 'can', 'will', 'satisfy', 'meet', 'fulfill', 'equivalent'),
+    "honors": ('honors', 'honour', 'honor', 'h course', 'h version', 'h class', 'h-designated'),
+    "articulation": ('articulation', 'has articulation', 'articulated', 'have articulation', 'any articulation'),
+    "satisfy": ('satisfy', 'fulfil', 'fulfill', 'meet', 'complete', 'articulate', 'transfer', 'equivalent'),
+    "question_starter": ('what', 'which', 'how', 'tell me', 'show me', 'list', 'find'),
+    "school": ('de anza', 'deanza', 'foothill', 'community college', 'ccc', 'college'),
+
+    # Handler can_handle checks (PathCompletionHandler reuses "path")
+    "comparison_handler": (
+        'same', 'similar', 'different', 'alike', 'equivalent',
+        'compare', 'versus', 'vs', 'like', 'match',
+        'both require', 'both need', 'both accept'
+    ),
+    "equivalency_handler": (
+        "satisfy", "transfer to", "fulfill", "equivalent", "what can",
+        "what would", "what does", "what uc", "what requirements"
+    ),
+    "lookup_handler": (
+        "which", "what", "courses satisfy", "courses that satisfy",
+        "what satisfies", "can satisfy", "courses for"
+    ),
+    "group_handler": (
+        "group requirements", "group", "requirement group",
+        "course requirements", "prerequisites"
+    ),
+    "honors_handler": (
+        "honors", "honor", "h course", "h version", "h credit",
+        "1h", "2h", "3h", "4h", "5h", "8h", "10h", "11h", "20h", "21h",
+        "require honors", "honors required", "need honors", "with honors"
+    ),
+    "transfer_path": ("transfer", "pathway", "path", "major", "cs major", "computer science"),
+    "validation_handler": (
+        "satisfy", "fulfill", "equivalent", "transfer", "articulate",
+        "count for", "substitute", "meet requirement"
+    ),
+}
+
+# Pattern groups: group name -> regexes searched in the lower-cased query
+PATTERN_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "comparison_pattern": (
+        r'(?:same|similar|different)(?:\s+\w+)*\s+(?:as|to|from|than)',
+        r'(?:compare|compared|comparing)(?:\s+\w+)*\s+(?:to|with)',
+        r'(?:both|either|neither)(?:\s+\w+)*\s+(?:require|need|accept)',
+        r'(?:match|matches|matching)(?:\s+\w+)*\s+(?:with|to)',
+        r'(?:do|does)(?:\s+\w+)*\s+(?:require|need|accept)(?:\s+\w+)*\s+(?:same|similar|different)'
+    ),
+    "path_pattern": (
+        r'(?:is|are|do|does)\s+.+\s+(?:one|a|the)\s+(?:full|complete|entire)\s+path',
+        r'(?:is|are|do|does)\s+.+\s+(?:complete|satisfy|finish)\s+(?:the|a|one)\s+(?:requirement|section|path)',
+        r'(?:is|are|do|does)\s+.+\s+(?:enough|sufficient)\s+(?:to|for|in)\s+(?:complete|satisfy)'
+    ),
+    "honors_pattern": (
+        r"(?:does|do|is|are).*(?:require|requires|need|needs).*honors",
+        r"honors.*(?:require|required|necessity|needed)",
+        r"(?:need|needs).*honors"
+    ),
+    "articulation_pattern": (
+        r"(?:does|do|is|are|has|have)\s+\w+\s+(?:any|have|has)\s+articulation",
+        r"(?:is|are)\s+\w+\s+articulated",
+        r"(?:can|could)\s+\w+\s+(?:be|get)\s+articulated",
+        r"(?:does|is)\s+there\s+(?:a|any)\s+(?:course|articulation)\s+for\s+\w+"
+    ),
+    "lookup_pattern": (
+        r"which\s+(?:\w+\s+)*courses?\s+(?:satisfy|fulfill|meet|complete|articulate\s+to|articulate\s+with|transfer\s+to|transfer\s+as)\s+(.+?)(?:\?|$|at)",
+        r"what\s+(?:\w+\s+)*courses?\s+(?:satisfy|fulfill|meet|complete|articulate\s+to|articulate\s+with|transfer\s+to|transfer\s+as)\s+(.+?)(?:\?|$|at)",
+        r"courses?\s+(?:that|which|to)\s+(?:satisfy|fulfill|meet|complete|articulate\s+to|articulate\s+with|transfer\s+to|transfer\s+as)\s+(.+?)(?:\?|$|at)",
+        r"(?:satisfy|fulfill|meet|complete)\s+(.+?)(?:\s+with|$|\?)"
+    ),
+    # Course codes ending in H, e.g. "MATH 1AH"
+    "honors_course_code": (r'\d+[a-z]*h\b',),
+}
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton reporting every keyword that occurs in a text.
+
+    Transitions are precomputed for every state and every character that
+    appears in a keyword, so scanning is one dict lookup per character;
+    characters outside that alphabet send the scan back to the root.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to search for (matched case-sensitively)
+        """
+        self._delta: List[Dict[str, int]] = [{}]
+        outputs: List[Set[str]] = [set()]
+
+        # Trie of all keywords
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                nxt = self._delta[state].get(char)
+                if nxt is None:
+                    nxt = len(self._delta)
+                    self._delta[state][char] = nxt
+                    self._delta.append({})
+                    outputs.append(set())
+                state = nxt
+            outputs[state].add(keyword)
+
+        # Breadth-first failure links, folded into a complete transition table
+        alphabet = {char for edges in self._delta for char in edges}
+        fail = [0] * len(self._delta)
+        queue = deque()
+        for char in alphabet:
+            child = self._delta[0].get(char)
+            if child is None:
+                self._delta[0][char] = 0
+            else:
+                queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            for char in alphabet:
+                child = self._delta[state].get(char)
+                if child is None:
+                    self._delta[state][char] = self._delta[fail[state]][char]
+                else:
+                    fail[child] = self._delta[fail[state]][char]
+                    queue.append(child)
+
+        self._outputs: List[FrozenSet[str]] = [frozenset(out) for out in outputs]
+
+    def find_all(self, text: str) -> Set[str]:
+        """
+        Return every keyword occurring in text (overlaps included).
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched keywords
+        """
+        delta = self._delta
+        outputs = self._outputs
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
+
+
+class QueryFeatures:
+    """
+    Feature vector for one query text.
+
+    Keyword groups are resolved by the single automaton scan. Pattern groups
+    are searched the first time they are asked about and memoized, so checks
+    that short-circuit before reaching a pattern never pay for it.
+
+    Attributes:
+        text: The lower-cased query text
+        keywords: Every registered keyword found in the query
+    """
+
+    __slots__ = ("text", "keywords", "_groups")
+
+    def __init__(self, text: str, keywords: FrozenSet[str]):
+        self.text = text
+        self.keywords = keywords
+        self._groups: Dict[str, bool] = {
+            group: True for keyword in keywords for group in _KEYWORD_INDEX[keyword]
+        }
+
+    def _fired(self, group: str) -> bool:
+        fired = self._groups.get(group)
+        if fired is None:
+            pattern = _PATTERNS.get(group)
+            fired = bool(pattern and pattern.search(self.text))
+            self._groups[group] = fired
+        return fired
+
+    def has(self, *groups: str) -> bool:
+        """Return True if any of the named groups fired."""
+        return any(self._fired(group) for group in groups)
+
+    @property
+    def signals(self) -> FrozenSet[str]:
+        """Names of every keyword and pattern group that fired."""
+        return frozenset(
+            group for group in (*KEYWORD_GROUPS, *PATTERN_GROUPS) if self._fired(group)
+        )
+
+    def __repr__(self) -> str:
+        return f"QueryFeatures(signals={sorted(self.signals)})"
+
+
+_AUTOMATON = KeywordAutomaton(
+    {keyword for keywords in KEYWORD_GROUPS.values() for keyword in keywords}
+)
+_KEYWORD_INDEX: Dict[str, Tuple[str, ...]] = {}
+for _group, _keywords in KEYWORD_GROUPS.items():
+    for _keyword in _keywords:
+        _KEYWORD_INDEX[_keyword] = _KEYWORD_INDEX.get(_keyword, ()) + (_group,)
+
+# One alternation per group: a search of the union fires iff any member would
+_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    group: re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    for group, patterns in PATTERN_GROUPS.items()
+}
+
+
+@lru_cache(maxsize=1024)
+def extract_features(text: str) -> QueryFeatures:
+    """
+    Scan a query once and return its feature vector.
+
+    Args:
+        text: The raw query text (lower-cased internally)
+
+    Returns:
+        QueryFeatures for the text
+    """
+    text_lower = text.lower()
+    return QueryFeatures(text_lower, frozenset(_AUTOMATON.find_all(text_lower)))
@@ -7,12 +7,10 @@ It extracts information from raw queries and categorizes them by type.
 
 from typing import Dict, List, Any, Set, Optional, Tuple, Union
 import re
-import spacy
 
+from llm.course_code_extractor import classify_course_codes, iter_course_codes
 from llm.models.query import Query, QueryType
-
-# Load spaCy model for NLP processing
-nlp = spacy.load("en_core_web_sm")
+from llm.services.query_classifier import extract_features
 
 class QueryService:
     """
@@ -94,8 +92,10 @@ class QueryService:
         """
         Extract UC and CCC course codes from a natural language query.
         
-        Uses NLP and pattern matching to identify course codes in user queries, distinguishing
-        between UC and CCC courses based on the provided course catalogs.
+        Uses a lightweight regex tokenizer (see ``llm.course_code_extractor``) to identify
+        course codes in user queries, distinguishing between UC and CCC courses based on the
+        provided course catalogs. Bare numbers inherit the last department prefix, so
+        "CSE 8A and 8B" yields both "CSE 8A" and "CSE 8B".
         
         Args:
             query_text: The user's natural language query.
@@ -110,48 +110,9 @@ class QueryService:
             >>> extract_filters("Does CIS 22A satisfy CSE 8A?", {"CSE 8A"}, {"CIS 22A"})
             {'uc_course': ['CSE 8A'], 'ccc_courses': ['CIS 22A']}
         """
-        filters = {"uc_course": set(), "ccc_courses": set()}
-        doc = nlp(query_text.upper())
-        last_prefix = None
-
-        # Process each token in the query
-        for i, token in enumerate(doc):
-            text = token.text.strip(",.?!")
-            next_token = doc[i + 1].text.strip(",.?!") if i + 1 < len(doc) else None
-
-            # Skip coordination words — preserve last prefix
-            if text in {"AND", "OR", "WITH", "TO", "FOR"}:
-                continue
-
-            course = None
-
-            # Full course (e.g., CSE 8A)
-            if re.fullmatch(r"[A-Z]{2,5}", text) and next_token and re.fullmatch(r"\d+[A-Z]{0,2}", next_token):
-                course = f"{text} {next_token}"
-                last_prefix = text
-
-            # Suffix only (e.g., '8B' after 'CSE')
-            elif re.fullmatch(r"\d+[A-Z]{0,2}", text) and last_prefix:
-                course = f"{last_prefix} {text}"
-
-            else:
-                continue
-
-            # Determine if course is UC or CCC
-            in_uc = course in (uc_course_catalog or set())
-            in_ccc = course in (ccc_course_catalog or set())
-
-            if in_uc and not in_ccc:
-                filters["uc_course"].add(course)
-            elif in_ccc and not in_uc:
-                filters["ccc_courses"].add(course)
-            elif in_uc and in_ccc:
-                filters["ccc_courses"].add(course)
-
-        return {
-            "uc_course": sorted(filters["uc_course"]),
-            "ccc_courses": sorted(filters["ccc_courses"])
-        }
+        return classify_course_codes(
+            iter_course_codes(query_text), uc_course_catalog, ccc_course_catalog
+        )
     
     def extract_reverse_matches(self, query: str, docs: List[Any]) -> List[Any]:
         """
@@ -256,6 +217,46 @@ class QueryService:
         """
         return [f"{query.strip()} (focus on {uc})" for uc in uc_courses]
 
+    def focus_multi_uc_query(self, query: str, uc_courses: List[str]) -> List[str]:
+        """
+        Rewrite a multi-course query into one sub-query per UC course.
+        
+        Unlike split_multi_uc_query, each sub-query names only its own UC course:
+        every run of UC course mentions ("CSE 8A, 8B and 11") is replaced by that
+        course, so handlers and LLM prompts reading Query.text see the same single
+        course as Query.uc_courses. A query with no recognizable run falls back to
+        a "(focus on ...)" suffix.
+        
+        Args:
+            query: The original user query.
+            uc_courses: List of UC courses detected in the query.
+            
+        Returns:
+            List of sub-query texts, one per UC course, in the same order.
+            
+        Examples:
+            >>> focus_multi_uc_query("Does CIS 22A satisfy CSE 8A, 8B and 11?", ["CSE 8A", "CSE 8B", "CSE 11"])
+            ['Does CIS 22A satisfy CSE 8A?', 'Does CIS 22A satisfy CSE 8B?', 'Does CIS 22A satisfy CSE 11?']
+        """
+        query = query.strip()
+        codes = [code.split(None, 1) for code in uc_courses if len(code.split()) == 2]
+        if not codes:
+            return [f"{query} (focus on {uc})" for uc in uc_courses]
+        
+        prefixes = "|".join(sorted({re.escape(prefix) for prefix, _ in codes}, key=len, reverse=True))
+        numbers = "|".join(sorted({re.escape(number) for _, number in codes}, key=len, reverse=True))
+        full = rf"\b(?:{prefixes})\s*-?\s*(?:{numbers})\b"
+        bare = rf"(?:(?:{prefixes})\s*-?\s*)?\b(?:{numbers})\b"
+        separator = r"(?:\s*,\s*(?:(?:and|or|&)\s+)?|\s+(?:and|or|&)\s+|\s*/\s*)"
+        # A full course code, then any further codes (bare numbers inherit its prefix)
+        run = re.compile(rf"{full}(?:{separator}{bare})*", re.IGNORECASE)
+        
+        subqueries = []
+        for uc in uc_courses:
+            text, replaced = run.subn(lambda _: uc, query)
+            subqueries.append(text if replaced else f"{query} (focus on {uc})")
+        return subqueries
+
     def enrich_uc_courses_with_prefixes(self, matches: List[str], uc_prefixes: List[str]) -> List[str]:
         """
         Enrich course code matches with department prefixes where needed.
@@ -358,7 +359,9 @@ class QueryService:
         
         This method analyzes the query text and extracted filters to categorize
         the query into specific types for proper handling. It uses both exact
-        pattern matching and keyword analysis to identify query intent.
+        pattern matching and keyword analysis to identify query intent; the
+        query text is scanned once by ``extract_features`` and the resulting
+        feature vector is shared with handler dispatch.
         
         Args:
             query: The query to categorize
@@ -366,120 +369,57 @@ class QueryService:
         Returns:
             The determined query type
         """
-        query_lower = query.text.lower()
+        features = extract_features(query.text)
         
         # First check if we can determine the type from the filters
         if 'group' in query.filters and query.filters['group']:
             return QueryType.GROUP_REQUIREMENT
             
-        # Check for course comparison queries - look for comparative patterns
+        # Check for course comparison queries - look for comparative keywords and patterns
         if 'uc_course' in query.filters and len(query.filters['uc_course']) >= 2:
-            # Keywords indicating comparison
-            comparison_keywords = [
-                'same', 'similar', 'different', 'alike', 'equivalent',
-                'compare', 'comparison', 'versus', 'vs', 'like', 'match',
-                'require the same', 'both require', 'both need',
-                'both accept', 'both satisfy'
-            ]
-            
-            # Patterns for comparison queries
-            comparison_patterns = [
-                r'(?:same|similar|different)(?:\s+\w+)*\s+(?:as|to|from|than)',
-                r'(?:compare|compared|comparing)(?:\s+\w+)*\s+(?:to|with)',
-                r'(?:both|either|neither)(?:\s+\w+)*\s+(?:require|need|accept)',
-                r'(?:match|matches|matching)(?:\s+\w+)*\s+(?:with|to)',
-                r'(?:do|does)(?:\s+\w+)*\s+(?:require|need|accept)(?:\s+\w+)*\s+(?:same|similar|different)'
-            ]
-            
-            # Check for comparison keywords
-            if any(keyword in query_lower for keyword in comparison_keywords) or \
-               any(re.search(pattern, query_lower) for pattern in comparison_patterns):
+            if features.has('comparison', 'comparison_pattern'):
                 return QueryType.COURSE_COMPARISON
                 
         # Check for path completion queries - look for full path, complete requirement patterns
         if 'uc_course' in query.filters and query.filters['uc_course']:
-            path_keywords = [
-                'full path', 'complete path', 'complete requirement', 'finish requirement',
-                'satisfy requirement', 'satisfy section', 'complete section',
-                'entire path', 'one path', 'enough for', 'sufficient for'
-            ]
-            
-            path_patterns = [
-                r'(?:is|are|do|does)\s+.+\s+(?:one|a|the)\s+(?:full|complete|entire)\s+path',
-                r'(?:is|are|do|does)\s+.+\s+(?:complete|satisfy|finish)\s+(?:the|a|one)\s+(?:requirement|section|path)',
-                r'(?:is|are|do|does)\s+.+\s+(?:enough|sufficient)\s+(?:to|for|in)\s+(?:complete|satisfy)'
-            ]
-            
-            if any(keyword in query_lower for keyword in path_keywords) or any(re.search(pattern, query_lower) for pattern in path_patterns):
+            if features.has('path', 'path_pattern'):
                 return QueryType.PATH_COMPLETION
 
         # COURSE VALIDATION CHECK (does X satisfy Y?)
         # Do this check before honors to ensure proper precedence
         if 'uc_course' in query.filters and 'ccc_courses' in query.filters:
             if len(query.filters['uc_course']) == 1 and len(query.filters['ccc_courses']) >= 1:
-                validation_keywords = ['does', 'do', 'can', 'will', 'satisfy', 'meet', 'fulfill', 'equivalent']
                 # If query contains both course types and any validation keyword, prioritize this as validation
-                if any(keyword in query_lower for keyword in validation_keywords):
+                if features.has('validation'):
                     return QueryType.COURSE_VALIDATION
             
         # Check for honors query - specific honors requirement questions only
-        honors_keywords = ['honors', 'honour', 'honor', 'h course', 'h version', 'h class', 'h-designated']
-        if any(keyword in query_lower for keyword in honors_keywords):
-            # Look for specific honors requirement question patterns
-            honors_patterns = [
-                r"(?:does|do|is|are).*(?:require|requires|need|needs).*honors",
-                r"honors.*(?:require|required|necessity|needed)",
-                r"(?:need|needs).*honors"
-            ]
-            
-            # Only classify as HONORS_REQUIREMENT if it's specifically asking if honors is required
-            if any(re.search(pattern, query_lower) for pattern in honors_patterns):
-                return QueryType.HONORS_REQUIREMENT
+        # Only classify as HONORS_REQUIREMENT if it's specifically asking if honors is required
+        if features.has('honors') and features.has('honors_pattern'):
+            return QueryType.HONORS_REQUIREMENT
         
         # Check for "has articulation" queries
         if 'uc_course' in query.filters and query.filters['uc_course'] and len(query.filters['uc_course']) == 1:
-            articulation_keywords = ['articulation', 'has articulation', 'articulated', 'have articulation', 'any articulation']
-            articulation_patterns = [
-                r"(?:does|do|is|are|has|have)\s+\w+\s+(?:any|have|has)\s+articulation",
-                r"(?:is|are)\s+\w+\s+articulated",
-                r"(?:can|could)\s+\w+\s+(?:be|get)\s+articulated",
-                r"(?:does|is)\s+there\s+(?:a|any)\s+(?:course|articulation)\s+for\s+\w+"
-            ]
-            
-            if any(keyword in query_lower for keyword in articulation_keywords) or \
-               any(re.search(pattern, query_lower) for pattern in articulation_patterns):
+            if features.has('articulation', 'articulation_pattern'):
                 return QueryType.COURSE_LOOKUP
         
         # Check for course lookup queries (which courses satisfy X?)
-        # This pattern checks for various ways users ask about what courses satisfy a requirement
-        lookup_patterns = [
-            r"which\s+(?:\w+\s+)*courses?\s+(?:satisfy|fulfill|meet|complete|articulate\s+to|articulate\s+with|transfer\s+to|transfer\s+as)\s+(.+?)(?:\?|$|at)",
-            r"what\s+(?:\w+\s+)*courses?\s+(?:satisfy|fulfill|meet|complete|articulate\s+to|articulate\s+with|transfer\s+to|transfer\s+as)\s+(.+?)(?:\?|$|at)",
-            r"courses?\s+(?:that|which|to)\s+(?:satisfy|fulfill|meet|complete|articulate\s+to|articulate\s+with|transfer\s+to|transfer\s+as)\s+(.+?)(?:\?|$|at)",
-            r"(?:satisfy|fulfill|meet|complete)\s+(.+?)(?:\s+with|$|\?)"
-        ]
-        
         # If query contains a lookup pattern and has a UC course filter, it's likely a COURSE_LOOKUP
-        for pattern in lookup_patterns:
-            if re.search(pattern, query_lower) and 'uc_course' in query.filters and query.filters['uc_course']:
-                return QueryType.COURSE_LOOKUP
+        if features.has('lookup_pattern') and 'uc_course' in query.filters and query.filters['uc_course']:
+            return QueryType.COURSE_LOOKUP
         
         # IMPROVED: Course lookup detection - prioritize "which courses satisfy X" type queries
         # This handles simple queries like "Which courses satisfy CSE 8B?" or "What satisfies CSE 11?"
         if ('uc_course' in query.filters and query.filters['uc_course'] and 
             ('ccc_courses' not in query.filters or not query.filters['ccc_courses'])):
             
-            satisfy_keywords = ['satisfy', 'fulfil', 'fulfill', 'meet', 'complete', 'articulate', 'transfer', 'equivalent']
-            question_starters = ['what', 'which', 'how', 'tell me', 'show me', 'list', 'find']
-            
             # For general queries about satisfying a UC course, classify as COURSE_LOOKUP
-            if any(keyword in query_lower for keyword in satisfy_keywords) or any(starter in query_lower for starter in question_starters):
+            if features.has('satisfy', 'question_starter'):
                 return QueryType.COURSE_LOOKUP
         
         # Check if query mentions a school and UC course, likely asking for articulation
-        school_keywords = ['de anza', 'deanza', 'foothill', 'community college', 'ccc', 'college']
         if ('uc_course' in query.filters and query.filters['uc_course'] and 
-            any(school in query_lower for school in school_keywords)):
+            features.has('school')):
             
             return QueryType.COURSE_LOOKUP
         
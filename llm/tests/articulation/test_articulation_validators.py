@@ -18,6 +18,9 @@ from llm.articulation.validators import (
     explain_if_satisfied,
     validate_combo_against_group,
     validate_uc_courses_against_group_sections,
+    compile_logic_block,
+    evaluate_logic_block,
+    validate_against_documents,
 )
 
 # For testing with LogicBlock and other model classes
@@ -1140,5 +1143,85 @@ class TestValidateUCCoursesAgainstGroupSections(unittest.TestCase):
         self.assertIn("MATH 20B", result["matched_ccc_courses"])
 
 
+class TestCompiledEvaluator(unittest.TestCase):
+    """Test the compiled, render-free evaluation path."""
+    
+    def setUp(self):
+        self.logic_block = {
+            "type": "OR",
+            "courses": [
+                {"type": "AND", "courses": [{"course_letters": "cis 22a"}, {"course_letters": "CIS 22B"}]},
+                {"type": "AND", "courses": [{"course_letters": "CIS 36A"}, {"course_letters": "CIS 36B"}, {"course_letters": "CIS 22B"}]},
+                "not-an-option",
+                {"type": "AND", "courses": []},
+                {"type": "AND", "courses": [{"course_letters": "MATH 1A"}]},
+            ]
+        }
+    
+    def test_compile_flattens_options(self):
+        compiled = compile_logic_block(self.logic_block)
+        
+        self.assertTrue(compiled.is_valid)
+        self.assertEqual(compiled.options[0].required, frozenset({"CIS 22A", "CIS 22B"}))
+        self.assertEqual([o.status for o in compiled.options], ["ok", "ok", "invalid", "empty", "ok"])
+        self.assertEqual(compiled.options[4].label, "Option E")
+        self.assertFalse(compiled.honors_required)
+    
+    def test_structured_partial_result(self):
+        evaluation = evaluate_logic_block(self.logic_block, ["CIS 22B", "CIS 36A"])
+        
+        self.assertFalse(evaluation.is_satisfied)
+        # Best partial match first: B is 2/3 complete, A is 1/2
+        self.assertEqual([m["label"] for m in evaluation.partial_matches], ["Option B", "Option A"])
+        self.assertEqual(evaluation.missing_courses, ["CIS 36B"])
+        self.assertEqual(evaluation.match_percentage, 66)
+        self.assertEqual(evaluation.unmatched_options, [("Option E", ["MATH 1A"])])
+    
+    def test_rendering_is_lazy(self):
+        evaluation = evaluate_logic_block(self.logic_block, ["MATH 1A"])
+        
+        self.assertTrue(evaluation.is_satisfied)
+        self.assertNotIn("explanation", evaluation.__dict__)
+        self.assertIn("Satisfies Option E with: MATH 1A", evaluation.explanation)
+    
+    def test_satisfied_options_read_directly(self):
+        """Satisfied options come from the evaluator, not from parsing the explanation."""
+        result = is_articulation_satisfied(self.logic_block, ["CIS 22A", "CIS 22B", "MATH 1A"])
+        
+        self.assertTrue(result["is_satisfied"])
+        self.assertIn("multiple options", result["explanation"])
+        self.assertEqual(result["satisfied_options"], ["CIS 22A", "CIS 22B"])
+    
+    def test_honors_folded_into_compiled_block(self):
+        honors_block = {
+            "type": "OR",
+            "courses": [{"type": "AND", "courses": [{"course_letters": "MATH 22H", "honors": True}]}]
+        }
+        compiled = compile_logic_block(honors_block)
+        self.assertTrue(compiled.honors_required)
+        
+        self.assertTrue(evaluate_logic_block(compiled, ["MATH 22H"]).to_dict()["is_satisfied"])
+        missing = evaluate_logic_block(compiled, ["MATH 22"]).to_dict()
+        self.assertFalse(missing["is_satisfied"])
+        self.assertEqual(missing["missing_courses"], {"Honors version required": []})
+    
+    def test_batch_validation_matches_single_calls(self):
+        class Doc:
+            def __init__(self, logic_block):
+                self.metadata = {"logic_block": logic_block}
+        
+        docs = [Doc(self.logic_block), Doc({"no_articulation": True}), Doc({})]
+        selected = ["CIS 22A", "CIS 22B"]
+        
+        evaluations = validate_against_documents(docs, selected)
+        
+        self.assertEqual(len(evaluations), 3)
+        for doc, evaluation in zip(docs, evaluations):
+            self.assertEqual(
+                evaluation.to_dict(),
+                is_articulation_satisfied(doc.metadata["logic_block"], selected)
+            )
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
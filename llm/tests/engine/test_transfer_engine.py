@@ -382,5 +382,92 @@ class TestTransferAIEngineIntegration(unittest.TestCase):
             mock_handler.handle.assert_called_once()
 
 
+class TestParallelSubqueries(unittest.TestCase):
+    """Tests for the multi-UC-course sub-query fan-out."""
+    
+    def setUp(self):
+        """Set up an engine whose handler echoes the single UC course it receives."""
+        settings = {"parallel_subqueries": True, "subquery_workers": 4}
+        self.config = MagicMock(spec=Config)
+        self.config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        self.config.as_dict.return_value = {"verbosity": "STANDARD"}
+        
+        self.doc_repo = MagicMock(spec=DocumentRepository)
+        self.doc_repo.documents = ["doc1"]
+        self.doc_repo.uc_course_catalog = set(["CSE 8A", "CSE 8B", "CSE 11"])
+        self.doc_repo.ccc_course_catalog = set(["CIS 22A"])
+        
+        self.query_service = MagicMock(spec=QueryService)
+        self.query_service.focus_multi_uc_query.side_effect = QueryService().focus_multi_uc_query
+        
+        def handle(query):
+            uc_course = query.uc_courses[0]
+            return QueryResult(raw_response=uc_course, formatted_response=f"Answer for {uc_course}", satisfied=True)
+        
+        self.handler = MagicMock(spec=QueryHandler)
+        self.handler.handle.side_effect = handle
+        self.registry = MagicMock(spec=HandlerRegistry)
+        self.registry.find_handler.return_value = self.handler
+        
+        with patch('llm.engine.transfer_engine.HandlerRegistry', return_value=self.registry):
+            self.engine = TransferAIEngine(
+                config=self.config,
+                document_repository=self.doc_repo,
+                query_service=self.query_service
+            )
+        self.engine.initialized = True
+    
+    def test_fan_out_merges_in_order(self):
+        """Each UC course is handled separately and responses keep extraction order."""
+        self.query_service.extract_filters.return_value = {
+            "uc_course": ["CSE 8A", "CSE 8B", "CSE 11"],
+            "ccc_courses": ["CIS 22A"]
+        }
+        self.query_service.determine_query_type.return_value = QueryType.COURSE_VALIDATION
+        
+        response = self.engine.handle_query("Does CIS 22A satisfy CSE 8A, 8B and 11?")
+        
+        self.assertEqual(
+            response,
+            "Answer for CSE 8A\n\n---\n\nAnswer for CSE 8B\n\n---\n\nAnswer for CSE 11"
+        )
+        self.assertEqual(self.handler.handle.call_count, 3)
+        for call in self.handler.handle.call_args_list:
+            sub_query = call.args[0]
+            self.assertEqual(len(sub_query.uc_courses), 1)
+            self.assertEqual(sub_query.ccc_courses, ["CIS 22A"])
+            self.assertEqual(sub_query.text, f"Does CIS 22A satisfy {sub_query.uc_courses[0]}?")
+    
+    def test_subquery_timings_in_metadata(self):
+        """The merged result reports handler and timing for every sub-query."""
+        self.query_service.determine_query_type.return_value = QueryType.COURSE_LOOKUP
+        query = Query(
+            text="Which courses satisfy CSE 8A and 8B?",
+            filters={"uc_course": ["CSE 8A", "CSE 8B"]},
+            config={},
+            query_type=QueryType.COURSE_LOOKUP
+        )
+        
+        result = self.engine.handle_subqueries(query)
+        
+        self.assertTrue(result.satisfied)
+        subqueries = result.metadata["subqueries"]
+        self.assertEqual([s["uc_course"] for s in subqueries], ["CSE 8A", "CSE 8B"])
+        for s in subqueries:
+            self.assertEqual(s["query_type"], "COURSE_LOOKUP")
+            self.assertGreaterEqual(s["elapsed_ms"], 0)
+            self.assertIsNotNone(s["handler"])
+    
+    def test_joint_query_types_not_split(self):
+        """Comparison queries need every UC course in one handler call."""
+        self.query_service.extract_filters.return_value = {"uc_course": ["CSE 8A", "CSE 8B"]}
+        self.query_service.determine_query_type.return_value = QueryType.COURSE_COMPARISON
+        
+        self.engine.handle_query("Do CSE 8A and CSE 8B require the same courses?")
+        
+        self.handler.handle.assert_called_once()
+        self.assertEqual(self.handler.handle.call_args.args[0].uc_courses, ["CSE 8A", "CSE 8B"])
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
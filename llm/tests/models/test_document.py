@@ -0,0 +1,102 @@
+"""
+Tests for the compact Document model.
+
+These tests verify:
+- Documents are slotted records that do not retain llama_index objects
+- Metadata strings are interned and identical logic blocks are shared
+- Text spilled to a TextStore is read back lazily and unchanged
+- Per-document memory reporting
+"""
+
+import unittest
+
+from llama_index.core import Document as LlamaDocument
+
+from llm.models.document import Document, LogicBlockArena, TextStore, compact_metadata
+
+
+LOGIC_BLOCK = {
+    "type": "OR",
+    "courses": [{"type": "AND", "courses": [{"course_letters": "CIS 22A", "honors": False}]}],
+}
+
+
+class TestDocument(unittest.TestCase):
+    """Tests for the Document record."""
+
+    def test_slots_and_interface(self):
+        doc = Document(text="CSE 8A", metadata={"uc_course": "CSE 8A", "logic_block": LOGIC_BLOCK})
+        with self.assertRaises(AttributeError):
+            doc.extra = 1
+        self.assertEqual(doc.text, "CSE 8A")
+        self.assertEqual(doc.get_uc_course(), "CSE 8A")
+        self.assertEqual(doc.get_logic_block(), LOGIC_BLOCK)
+        self.assertIsNotNone(doc.doc_id)
+
+    def test_from_llama_document_copies_fields(self):
+        llama_doc = LlamaDocument(text="text", metadata={"uc_course": "CSE 11"}, doc_id="abc")
+        doc = Document.from_llama_document(llama_doc)
+        self.assertEqual((doc.text, doc.doc_id, doc.get_uc_course()), ("text", "abc", "CSE 11"))
+        self.assertFalse(any(value is llama_doc for value in (doc.metadata, doc.text)))
+        self.assertEqual(doc.to_llama_document().text, "text")
+
+    def test_interning_and_shared_logic_blocks(self):
+        arena = LogicBlockArena()
+        a = Document(metadata={"uc_course": "".join(["CSE ", "8A"]), "logic_block": dict(LOGIC_BLOCK)}, arena=arena)
+        b = Document(metadata={"uc_course": "".join(["CSE ", "8A"]), "logic_block": dict(LOGIC_BLOCK)}, arena=arena)
+        self.assertIs(a.get_uc_course(), b.get_uc_course())
+        self.assertIs(a.get_logic_block(), b.get_logic_block())
+
+    def test_logic_blocks_not_shared_without_arena(self):
+        a = Document(metadata={"logic_block": dict(LOGIC_BLOCK)})
+        b = Document(metadata={"logic_block": dict(LOGIC_BLOCK)}, arena=LogicBlockArena())
+        c = Document(metadata={"logic_block": dict(LOGIC_BLOCK)}, arena=LogicBlockArena())
+        self.assertEqual(a.get_logic_block(), b.get_logic_block())
+        self.assertIsNot(a.get_logic_block(), b.get_logic_block())
+        self.assertIsNot(b.get_logic_block(), c.get_logic_block())
+
+    def test_private_arena(self):
+        arena = LogicBlockArena()
+        first = compact_metadata({"logic_block": {"type": "OR", "courses": []}}, arena)
+        second = compact_metadata({"logic_block": {"courses": [], "type": "OR"}}, arena)
+        self.assertIs(first["logic_block"], second["logic_block"])
+        self.assertEqual(len(arena), 1)
+        self.assertTrue(arena.owns(first["logic_block"]))
+
+
+class TestTextStore(unittest.TestCase):
+    """Tests for lazily loaded document text."""
+
+    def setUp(self):
+        self.store = TextStore()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_spilled_text_round_trip(self):
+        texts = ["CSE 8A - Intro", "Überblick ✅", ""]
+        docs = [Document(text=text, text_store=self.store) for text in texts]
+        self.assertEqual([doc.text for doc in docs], texts)
+        self.assertEqual(self.store.size_bytes, sum(len(t.encode("utf-8")) for t in texts))
+
+        docs[0].text = "replaced"
+        self.assertEqual(docs[0].text, "replaced")
+        self.assertEqual(docs[1].text, texts[1])
+
+    def test_memory_footprint(self):
+        arena = LogicBlockArena()
+        resident = Document(text="x" * 1000, metadata={"uc_course": "CSE 8A", "logic_block": LOGIC_BLOCK}, arena=arena)
+        spilled = Document(text="x" * 1000, metadata={"uc_course": "CSE 8A", "logic_block": LOGIC_BLOCK},
+                           text_store=self.store, arena=arena)
+
+        resident_report = resident.memory_footprint(arena)
+        spilled_report = spilled.memory_footprint(arena)
+        self.assertGreater(resident_report["text"], 1000)
+        self.assertEqual(spilled_report["text"], 0)
+        self.assertEqual(spilled_report["text_on_disk"], 1000)
+        self.assertGreater(spilled_report["shared_logic_block"], 0)
+        self.assertLess(spilled_report["total"], resident_report["total"])
+
+
+if __name__ == '__main__':
+    unittest.main()
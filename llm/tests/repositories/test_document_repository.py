@@ -420,6 +420,60 @@ class TestDocumentRepository(unittest.TestCase):
         repo.test_method("test")
         self.assertEqual(call_count, 2)
 
+    def test_find_by_group_section(self):
+        """Test the composite (group, section) index."""
+        docs = self.repo.find_by_group_section("1", "A")
+        self.assertEqual([d.metadata["uc_course"] for d in docs], ["CSE 8A", "CSE 8B", "CSE 11", "CSE 15L"])
+        self.assertEqual(self.repo.find_by_group_section("1", "B"), [])
+
+    def test_indexes_keep_document_order(self):
+        """Index lookups return documents in repository order, without duplicates."""
+        docs = self.repo.find_by_ccc_courses(["CIS 22B", "CIS 22A", "cis22a"], require_all=False)
+        self.assertEqual([d.metadata["uc_course"] for d in docs], ["CSE 8A", "CSE 8B", "CSE 11"])
+
+    def test_indexes_rebuilt_when_documents_replaced(self):
+        """Assigning a new document list is picked up without an explicit rebuild."""
+        repo = DocumentRepository(self.test_docs)
+        repo.documents = self.test_docs[2:4]
+        repo.clear_cache()  # as DocumentService.load_documents does
+        self.assertEqual(len(repo.find_by_group("2")), 2)
+        self.assertEqual(repo.find_by_group("1"), [])
+        self.assertEqual(len(repo.find_reverse_matches("MATH 1A")), 1)
+
+    def test_reverse_index_does_not_normalize_per_lookup(self):
+        """Reverse matches are served from the index built at load time."""
+        repo = DocumentRepository(self.test_docs)
+        with patch.object(repo, "_logic_contains_course") as scan:
+            docs = repo.find_reverse_matches("CIS 22B")
+        scan.assert_not_called()
+        self.assertEqual([d.metadata["uc_course"] for d in docs], ["CSE 8B", "CSE 11"])
+
+    def test_find_by_ccc_courses_matches_linear_scan(self):
+        """Posting intersection/union returns what the old per-document scan did."""
+        def scan(courses, require_all):
+            wanted = [self.repo._normalize_course_code(c) for c in courses]
+            result = []
+            for doc in self.repo.documents:
+                have = [self.repo._normalize_course_code(c) for c in doc.metadata.get("ccc_courses", [])]
+                check = all if require_all else any
+                if check(w in have for w in wanted):
+                    result.append(doc)
+            return result
+        
+        queries = [
+            ["CIS 22A"], ["cis22b", "CIS 22A"], ["CIS 22A", "MATH 1A"], ["MATH 1B", "math 1b"],
+            ["CIS 36A", "CIS 22B", "MATH 1A"], ["NOPE 1"], ["NOPE 1", "CIS 22A"],
+        ]
+        for courses in queries:
+            for require_all in (True, False):
+                expected = scan(courses, require_all)
+                self.repo.clear_cache()
+                with patch.object(self.repo, "_normalize_course_code", wraps=self.repo._normalize_course_code) as norm:
+                    docs = self.repo.find_by_ccc_courses(courses, require_all=require_all)
+                self.assertEqual(docs, expected, (courses, require_all))
+                # Only the requested codes are normalized, not every document's
+                self.assertLessEqual(norm.call_count, len(courses))
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+Tests for the repository result cache.
+
+These tests verify:
+- LRU eviction and TTL expiry in ResultCache
+- Canonical keys for argument ordering variants
+- Per-instance isolation of cached_result
+- Thread safety and counters exposed through DocumentRepository.get_reload_status
+"""
+
+import threading
+import time
+import unittest
+from typing import Any, Dict
+
+from llm.repositories.document_repository import DocumentRepository
+from llm.repositories.result_cache import ResultCache, cached_result, canonical_key
+
+
+class MockDocument:
+    def __init__(self, metadata: Dict[str, Any], text: str = "Test document"):
+        self.metadata = metadata
+        self.text = text
+
+
+class Counter:
+    """Minimal owner object for decorated methods."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached_result(ttl_seconds=3600, max_entries=2)
+    def double(self, value):
+        self.calls += 1
+        return value * 2
+
+    @cached_result(ttl_seconds=3600, unordered=True)
+    def joined(self, values):
+        self.calls += 1
+        return ",".join(sorted(values))
+
+    @cached_result(ttl_seconds=3600, unordered=True)
+    def pair(self, first, second):
+        self.calls += 1
+        return (first, second)
+
+
+class TestResultCache(unittest.TestCase):
+    """Tests for the ResultCache container."""
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "a" becomes most recent
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl_expiry_removes_entry(self):
+        cache = ResultCache(max_entries=4, ttl_seconds=0.05)
+        cache.set("a", 1)
+        time.sleep(0.06)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.expirations, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_size_rejected(self):
+        with self.assertRaises(ValueError):
+            ResultCache(max_entries=0)
+
+    def test_canonical_key(self):
+        self.assertEqual(canonical_key(["B", "A"], unordered=True), canonical_key(["A", "B", "A"], unordered=True))
+        self.assertNotEqual(canonical_key(["B", "A"]), canonical_key(["A", "B"]))
+        self.assertEqual(canonical_key({"x": [1], "y": 2}), canonical_key({"y": 2, "x": [1]}))
+
+
+class TestCachedResultDecorator(unittest.TestCase):
+    """Tests for the per-instance cached_result decorator."""
+
+    def test_instances_do_not_share_entries(self):
+        first, second = Counter(), Counter()
+        first.double(2)
+        second.double(2)
+
+        self.assertEqual(first.calls, 1)
+        self.assertEqual(second.calls, 1)
+
+    def test_bounded_per_instance(self):
+        owner = Counter()
+        for value in range(5):
+            owner.double(value)
+
+        stats = owner._result_caches["double"].stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 3)
+
+    def test_unordered_arguments_share_entry(self):
+        owner = Counter()
+        owner.joined(["CIS 22A", "MATH 1A"])
+        owner.joined(["MATH 1A", "CIS 22A"])
+
+        self.assertEqual(owner.calls, 1)
+
+    def test_unordered_keeps_argument_positions(self):
+        owner = Counter()
+        self.assertEqual(owner.pair(["X"], ["Y"]), (["X"], ["Y"]))
+        self.assertEqual(owner.pair(["Y"], ["X"]), (["Y"], ["X"]))
+        self.assertEqual(owner.pair("a", "b"), ("a", "b"))
+        self.assertEqual(owner.pair("b", "a"), ("b", "a"))
+        self.assertEqual(owner.calls, 4)
+
+        # Order within each list argument is still ignored
+        owner.pair(["Y", "Z"], ["X"])
+        owner.pair(["Z", "Y"], ["X"])
+        self.assertEqual(owner.calls, 5)
+
+    def test_bare_clear_cache_clears_every_instance(self):
+        first, second = Counter(), Counter()
+        first.double(1)
+        second.double(1)
+        Counter.double.clear_cache()
+        first.double(1)
+        second.double(1)
+
+        self.assertEqual((first.calls, second.calls), (2, 2))
+
+    def test_concurrent_access(self):
+        owner = Counter()
+        errors = []
+
+        def worker():
+            try:
+                for value in range(200):
+                    self.assertEqual(owner.double(value % 5), (value % 5) * 2)
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        stats = owner._result_caches["double"].stats()
+        self.assertLessEqual(stats["size"], 2)
+        self.assertEqual(stats["hits"] + stats["misses"], 8 * 200)
+
+
+class TestRepositoryCacheStats(unittest.TestCase):
+    """Cache counters surfaced through DocumentRepository.get_reload_status."""
+
+    def setUp(self):
+        self.repo = DocumentRepository([
+            MockDocument({"uc_course": "CSE 8A", "group": "1", "section": "A", "ccc_courses": ["CIS 22A"]}),
+            MockDocument({"uc_course": "MATH 20A", "group": "2", "section": "B", "ccc_courses": ["MATH 1A"]}),
+        ])
+
+    def test_reload_status_reports_hits_and_misses(self):
+        self.repo.find_by_uc_course("CSE 8A")
+        self.repo.find_by_uc_course("CSE 8A")
+        self.repo.find_by_ccc_courses(["CIS 22A", "MATH 1A"], require_all=False)
+        self.repo.find_by_ccc_courses(["MATH 1A", "CIS 22A"], require_all=False)
+
+        cache = self.repo.get_reload_status()["cache"]
+        self.assertEqual(cache["hits"], 2)
+        self.assertEqual(cache["misses"], 2)
+        self.assertEqual(cache["methods"]["find_by_uc_course"]["size"], 1)
+
+    def test_repositories_are_isolated(self):
+        other = DocumentRepository([MockDocument({"uc_course": "CSE 8A", "group": "9"})])
+        self.repo.find_by_group("1")
+
+        self.assertEqual(other.find_by_group("1"), [])
+        self.repo.clear_cache()
+        self.assertEqual(self.repo.get_reload_status()["cache"]["size"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
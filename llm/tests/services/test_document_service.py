@@ -8,6 +8,7 @@ These tests verify the functionality of the DocumentService class, including:
 - Filter operations
 """
 
+import threading
 import unittest
 from unittest.mock import patch, MagicMock, call, PropertyMock
 from typing import Dict, List, Any, Set
@@ -57,6 +58,8 @@ class TestDocumentService(unittest.TestCase):
         # Create a mock DocumentRepository
         self.mock_repo = MagicMock(spec=DocumentRepository)
         self.mock_repo.get_all_documents.return_value = self.test_docs
+        self.mock_repo.get_documents_count.return_value = len(self.test_docs)
+        self.mock_repo.get_documents_at.side_effect = lambda ordinals: [self.test_docs[i] for i in ordinals]
         
         # Mock get_course_catalogs to return sample catalogs
         self.mock_repo.get_course_catalogs.return_value = (
@@ -86,6 +89,24 @@ class TestDocumentService(unittest.TestCase):
             self.mock_repo._build_course_catalogs.assert_called_once()
             self.mock_repo.clear_cache.assert_called_once()
     
+    def test_load_documents_uses_one_arena_per_load(self):
+        """Logic blocks are shared within a load, never with an earlier load."""
+        flat = [{"text": "", "metadata": {"logic_block": {"type": "OR", "courses": []}}} for _ in range(2)]
+        
+        loads = []
+        with patch.object(self.service, '_load_json_data', return_value={}), \
+                patch.object(self.service, '_build_course_cache'), \
+                patch.object(self.service, 'flatten_courses_from_json', side_effect=lambda _: [dict(d) for d in flat]):
+            for _ in range(2):
+                self.service.load_documents()
+                loads.append((self.service.logic_block_arena, self.mock_repo.documents))
+        
+        (first_arena, first_docs), (second_arena, second_docs) = loads
+        self.assertIsNot(first_arena, second_arena)
+        self.assertIs(first_docs[1].get_logic_block(), first_docs[2].get_logic_block())
+        self.assertIsNot(first_docs[1].get_logic_block(), second_docs[1].get_logic_block())
+        self.assertFalse(second_arena.owns(first_docs[1].get_logic_block()))
+    
     def test_get_uc_course_prefixes(self):
         """Test getting UC course prefixes."""
         # Call the method
@@ -176,33 +197,34 @@ class TestDocumentService(unittest.TestCase):
     
     def test_find_documents_by_filter_uc_course(self):
         """Test finding documents by UC course filter."""
-        # Mock the repository methods
-        self.mock_repo.find_by_uc_course.return_value = [self.test_docs[0]]
+        # Mock the repository posting lookups
+        self.mock_repo.postings_for_uc_course.return_value = [0]
         
         # Call the method with UC course filter
         docs = self.service.find_documents_by_filter({"uc_course": "CSE 8A"})
         
         # Verify the result
         self.assertEqual(docs, [self.test_docs[0]])
-        self.mock_repo.find_by_uc_course.assert_called_once_with("CSE 8A")
+        self.mock_repo.postings_for_uc_course.assert_called_once_with("CSE 8A")
+        self.mock_repo.get_all_documents.assert_not_called()
     
     def test_find_documents_by_filter_ccc_courses(self):
         """Test finding documents by CCC courses filter."""
-        # Mock the repository methods
-        self.mock_repo.find_by_ccc_courses.return_value = [self.test_docs[0]]
+        # Mock the repository posting lookups
+        self.mock_repo.postings_for_ccc_courses.return_value = [0]
         
         # Call the method with CCC courses filter
         docs = self.service.find_documents_by_filter({"ccc_courses": ["CIS 22A"]})
         
         # Verify the result
         self.assertEqual(docs, [self.test_docs[0]])
-        self.mock_repo.find_by_ccc_courses.assert_called_once_with(["CIS 22A"], True)
+        self.mock_repo.postings_for_ccc_courses.assert_called_once_with(["CIS 22A"], True)
     
     def test_find_documents_by_filter_combined(self):
         """Test finding documents by combined filters."""
-        # Mock the repository methods
-        self.mock_repo.find_by_uc_course.return_value = [self.test_docs[0]]
-        self.mock_repo.find_by_ccc_courses.return_value = [self.test_docs[0]]
+        # Mock the repository posting lookups
+        self.mock_repo.postings_for_uc_course.return_value = [0]
+        self.mock_repo.postings_for_ccc_courses.return_value = [0, 1]
         
         # Call the method with combined filters
         docs = self.service.find_documents_by_filter({
@@ -212,8 +234,9 @@ class TestDocumentService(unittest.TestCase):
         
         # Verify the result
         self.assertEqual(docs, [self.test_docs[0]])
-        self.mock_repo.find_by_uc_course.assert_called_once_with("CSE 8A")
-        self.mock_repo.find_by_ccc_courses.assert_called_once_with(["CIS 22A"], True)
+        self.mock_repo.postings_for_uc_course.assert_called_once_with("CSE 8A")
+        self.mock_repo.postings_for_ccc_courses.assert_called_once_with(["CIS 22A"], True)
+        self.mock_repo.get_documents_at.assert_called_once_with([0])
     
     def test_find_documents_by_filter_with_limit(self):
         """Test finding documents with a limit."""
@@ -222,7 +245,94 @@ class TestDocumentService(unittest.TestCase):
         
         # Verify the result
         self.assertEqual(docs, [self.test_docs[0]])
-        self.mock_repo.get_all_documents.assert_called_once()
+        self.mock_repo.get_documents_count.assert_called_once()
+    
+    def test_find_documents_by_filter_reports_most_selective(self):
+        """The plan records posting sizes and the most selective filter."""
+        self.mock_repo.postings_for_uc_course.return_value = [0]
+        self.mock_repo.postings_for_group.return_value = [0, 1]
+        
+        docs = self.service.find_documents_by_filter({"group": "1", "uc_course": "CSE 8A"})
+        
+        self.assertEqual(docs, [self.test_docs[0]])
+        plan = self.service.last_filter_plan
+        self.assertEqual(plan["posting_sizes"], {"uc_course": 1, "group": 2})
+        self.assertEqual(plan["most_selective"], "uc_course")
+        self.assertEqual(plan["intersection_order"], ["uc_course", "group"])
+        self.assertEqual(plan["result_count"], 1)
+    
+    def test_find_documents_by_filter_plan_is_per_thread(self):
+        """A concurrent call on another thread does not replace this thread's plan."""
+        self.mock_repo.postings_for_uc_course.return_value = [0]
+        self.mock_repo.postings_for_group.return_value = [0, 1]
+        worker_plans = []
+        
+        def worker():
+            self.service.find_documents_by_filter({"group": "1"})
+            worker_plans.append(self.service.last_filter_plan)
+        
+        self.service.find_documents_by_filter({"uc_course": "CSE 8A"})
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        
+        self.assertEqual(self.service.last_filter_plan["filters"], ["uc_course"])
+        self.assertEqual(worker_plans[0]["filters"], ["group"])
+    
+    def test_find_documents_by_filter_short_circuits_empty_posting(self):
+        """An empty posting skips the remaining lookups."""
+        self.mock_repo.postings_for_uc_course.return_value = []
+        
+        docs = self.service.find_documents_by_filter({"uc_course": "CSE 999", "group": "1"})
+        
+        self.assertEqual(docs, [])
+        self.mock_repo.postings_for_group.assert_not_called()
+        self.assertEqual(self.service.last_filter_plan["skipped"], ["group"])
+    
+    def test_find_documents_by_filter_resolves_cheapest_first(self):
+        """Single-key lookups run before multi-key ones and can skip them."""
+        self.mock_repo.postings_for_group.return_value = []
+        
+        docs = self.service.find_documents_by_filter(
+            {"ccc_courses": ["CIS 22A", "CIS 36A"], "uc_course": ["CSE 8A", "MATH 20A"], "group": "9"}
+        )
+        
+        self.assertEqual(docs, [])
+        self.mock_repo.postings_for_ccc_courses.assert_not_called()
+        self.mock_repo.postings_for_uc_course.assert_not_called()
+        self.assertEqual(self.service.last_filter_plan["skipped"], ["uc_course", "ccc_courses"])
+    
+    def test_find_documents_by_filter_uc_course_list_is_union(self):
+        """A list of UC courses unions the postings without duplicates."""
+        self.mock_repo.postings_for_uc_course.side_effect = lambda uc: {
+            "MATH 20A": [1],
+            "CSE 8A": [0],
+        }.get(uc, [])
+        
+        docs = self.service.find_documents_by_filter(
+            {"uc_course": ["MATH 20A", "CSE 8A", "MATH 20A"], "no_articulation": False}
+        )
+        
+        self.assertEqual(docs, self.test_docs)
+    
+    def test_find_documents_by_filter_with_repository(self):
+        """End-to-end against a real repository with inverted indexes."""
+        service = DocumentService(repository=DocumentRepository(self.test_docs))
+        
+        docs = service.find_documents_by_filter(
+            {"ccc_courses": ["cis 22a"], "group": "1", "section": "A"}
+        )
+        self.assertEqual(docs, [self.test_docs[0]])
+        self.assertEqual(
+            service.find_documents_by_filter({"group": "2", "section": "A"}), []
+        )
+        self.assertEqual(
+            service.find_documents_by_filter({"ccc_courses": ["CIS 22A", "MATH 1A"]}), []
+        )
+        self.assertEqual(
+            service.find_documents_by_filter({"uc_course": ["cse 8a", "MATH 20A"], "group": "2"}),
+            [self.test_docs[1]],
+        )
     
     def test_validate_documents_same_section(self):
         """Test validating documents from the same section."""
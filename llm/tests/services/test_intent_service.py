@@ -0,0 +1,120 @@
+"""
+Tests for the in-process QIC intent service.
+
+These tests verify:
+- Concurrent classify() calls are coalesced into shared backend calls
+- Backend and model-loading errors reach every waiting caller
+- QIC intents map onto engine query types only when a handler applies
+"""
+
+import threading
+import unittest
+
+from llm.models.query import QueryType
+from llm.services.intent_service import IntentService, query_type_for_intent
+
+
+class RecordingBackend:
+    """Fake backend labelling every text and recording batch sizes."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.batches.append(list(texts))
+        return [(f"intent:{text}", 0.9) for text in texts]
+
+
+class TestIntentService(unittest.TestCase):
+    """Tests for IntentService batching."""
+
+    def test_classify_preserves_order(self):
+        service = IntentService(backend=RecordingBackend())
+        predictions = service.classify(["a", "b", "c"])
+        self.assertEqual([p.intent for p in predictions], ["intent:a", "intent:b", "intent:c"])
+        self.assertEqual([p.text for p in predictions], ["a", "b", "c"])
+        self.assertEqual(service.classify([]), [])
+
+    def test_concurrent_calls_are_coalesced(self):
+        backend = RecordingBackend()
+        service = IntentService(backend=backend, max_batch_size=64, max_wait_ms=50)
+        results = {}
+        barrier = threading.Barrier(8)
+
+        def worker(i):
+            barrier.wait()
+            results[i] = service.classify([f"q{i}"])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i in range(8):
+            self.assertEqual(results[i][0].intent, f"intent:q{i}")
+        self.assertLess(service.batches_run, 8)
+        self.assertEqual(sum(len(batch) for batch in backend.batches), 8)
+
+    def test_max_batch_size_respected(self):
+        backend = RecordingBackend()
+        service = IntentService(backend=backend, max_batch_size=2, max_wait_ms=50)
+        threads = [threading.Thread(target=service.classify, args=([f"q{i}"],)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(len(batch) <= 2 for batch in backend.batches))
+
+    def test_backend_error_propagates(self):
+        def failing(texts):
+            raise ValueError("boom")
+
+        service = IntentService(backend=failing)
+        with self.assertRaises(ValueError):
+            service.classify(["x"])
+
+    def test_missing_model_raises_runtime_error(self):
+        service = IntentService(output_dir="/nonexistent/qic-outputs")
+        with self.assertRaises(RuntimeError):
+            service.classify(["x"])
+        # The load failure is cached rather than retried
+        with self.assertRaises(RuntimeError):
+            service.classify(["y"])
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            IntentService(backend=RecordingBackend(), max_batch_size=0)
+
+
+class TestQueryTypeForIntent(unittest.TestCase):
+    """Tests for the intent → QueryType mapping."""
+
+    def test_course_equivalency(self):
+        self.assertEqual(
+            query_type_for_intent("course_equivalency", {"uc_course": ["CSE 8A"], "ccc_courses": ["CIS 22A"]}),
+            QueryType.COURSE_VALIDATION,
+        )
+        self.assertEqual(
+            query_type_for_intent("course_equivalency", {"ccc_courses": ["CIS 22A"]}),
+            QueryType.COURSE_EQUIVALENCY,
+        )
+        self.assertEqual(
+            query_type_for_intent("course_equivalency", {"uc_course": ["CSE 8A"]}),
+            QueryType.COURSE_LOOKUP,
+        )
+        self.assertIsNone(query_type_for_intent("course_equivalency", {}))
+
+    def test_group_and_unmapped(self):
+        self.assertEqual(
+            query_type_for_intent("major_requirements", {"group": "1"}),
+            QueryType.GROUP_REQUIREMENT,
+        )
+        self.assertIsNone(query_type_for_intent("major_requirements", {}))
+        self.assertIsNone(query_type_for_intent("application_deadline", {"uc_course": ["CSE 8A"]}))
+
+
+if __name__ == '__main__':
+    unittest.main()
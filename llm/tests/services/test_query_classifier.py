@@ -0,0 +1,61 @@
+"""
+Tests for the single-pass query classifier.
+
+These tests verify:
+- The Aho-Corasick automaton reports every (overlapping) keyword occurrence
+- Keyword groups keep substring semantics and pattern groups fire lazily
+- Feature vectors are cached per query text
+"""
+
+import unittest
+
+from llm.services.query_classifier import (
+    KEYWORD_GROUPS,
+    KeywordAutomaton,
+    extract_features,
+)
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    """Tests for the keyword automaton."""
+
+    def test_overlapping_and_nested_keywords(self):
+        automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+        self.assertEqual(automaton.find_all("ushers"), {"he", "she", "hers"})
+        self.assertEqual(automaton.find_all("xyz"), set())
+
+    def test_matches_substring_checks(self):
+        keywords = [k for group in KEYWORD_GROUPS.values() for k in group]
+        automaton = KeywordAutomaton(keywords)
+        text = "does cse 8a and math 1ah both require the same honors path at de anza?"
+        self.assertEqual(automaton.find_all(text), {k for k in keywords if k in text})
+
+
+class TestExtractFeatures(unittest.TestCase):
+    """Tests for query feature vectors."""
+
+    def test_keyword_groups(self):
+        features = extract_features("Does CIS 22A satisfy CSE 8A?")
+        self.assertTrue(features.has("validation"))  # "do" inside "does"
+        self.assertTrue(features.has("satisfy", "school"))
+        self.assertFalse(features.has("honors", "group_handler"))
+
+    def test_pattern_groups(self):
+        features = extract_features("If I complete CSE 8A and 8B, is that one full path?")
+        self.assertTrue(features.has("path_pattern"))
+        self.assertTrue(extract_features("Can I take MATH 2BH?").has("honors_course_code"))
+        self.assertFalse(extract_features("Which courses satisfy CSE 11?").has("honors_pattern"))
+
+    def test_signals(self):
+        signals = extract_features("Does CSE 12 require honors courses at De Anza?").signals
+        self.assertIn("honors", signals)
+        self.assertIn("honors_pattern", signals)
+        self.assertNotIn("comparison", signals)
+
+    def test_cached_per_text(self):
+        self.assertIs(extract_features("Which courses satisfy CSE 8B?"),
+                      extract_features("Which courses satisfy CSE 8B?"))
+
+
+if __name__ == '__main__':
+    unittest.main()
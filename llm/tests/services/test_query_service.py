@@ -162,6 +162,28 @@ class TestQueryService(unittest.TestCase):
             "What satisfies CSE 8A and MATH 20A? (focus on MATH 20A)"
         )
 
+    def test_focus_multi_uc_query(self):
+        """Each sub-query names only its own UC course."""
+        query = "Does CIS 22A satisfy CSE 8A, 8B and 11?"
+        uc_courses = ["CSE 8A", "CSE 8B", "CSE 11"]
+        
+        result = self.query_service.focus_multi_uc_query(query, uc_courses)
+        self.assertEqual(result, [
+            "Does CIS 22A satisfy CSE 8A?",
+            "Does CIS 22A satisfy CSE 8B?",
+            "Does CIS 22A satisfy CSE 11?",
+        ])
+        self.assertEqual(
+            self.query_service.focus_multi_uc_query("What satisfies cse-8a and MATH 20A?", ["CSE 8A", "MATH 20A"]),
+            ["What satisfies CSE 8A?", "What satisfies MATH 20A?"]
+        )
+        
+        # No recognizable mention: fall back to a focus suffix
+        self.assertEqual(
+            self.query_service.focus_multi_uc_query("Compare them", ["CSE 8A", "CSE 8B"]),
+            ["Compare them (focus on CSE 8A)", "Compare them (focus on CSE 8B)"]
+        )
+
     def test_enrich_uc_courses_with_prefixes(self):
         """Test enriching course codes with prefixes."""
         matches = ["CSE 8A", "8B", "MATH 20A", "20B"]
@@ -0,0 +1,138 @@
+"""
+Tests for the spaCy-free course code extractor.
+
+These tests verify:
+- Tokenization of punctuation, possessives and infixes
+- Prefix carry-over ("CSE 8A and 8B") and connector handling
+- UC / CCC classification against the course catalogs
+- Parity with the former spaCy-based extraction over every query in
+  ``regression tests/`` (skipped when spaCy is not installed)
+"""
+
+import re
+import unittest
+from pathlib import Path
+from typing import List
+
+from llm.course_code_extractor import (
+    classify_course_codes,
+    extract_course_codes,
+    tokenize,
+)
+
+REGRESSION_DIR = Path(__file__).resolve().parents[2] / "regression tests"
+TEST_HEADER_RE = re.compile(r"^===== Test \d+: (.+) =====$", re.MULTILINE)
+
+# Extra phrasings exercising punctuation, possessives and infixes
+EDGE_CASE_QUERIES = [
+    "Does CIS 22A, 22B, or 22C satisfy CSE 8A?",
+    "(CSE 8A) and CSE 8B's prerequisites?",
+    "CSE/MATH 20A - is it the same as MATH-20A?",
+    "Can I take CIS-22A or CIS22A for CSE 11!",
+    "What about CSE, 8A?",
+    "MATH 1A. 1B. 1C. Do they count for MATH 20A/20B?",
+    "Is \"PHYS 4A\" enough for PHYS 2A and for 2B?",
+    "CSE 8A to 8B with 11",
+    "does cse 15l have any articulation?",
+    "No course numbers here at all.",
+]
+
+
+def _regression_queries() -> List[str]:
+    queries = set()
+    for path in sorted(REGRESSION_DIR.glob("*.txt")):
+        queries.update(TEST_HEADER_RE.findall(path.read_text(encoding="utf-8")))
+    return sorted(queries)
+
+
+def _spacy_course_codes(nlp, query: str) -> List[str]:
+    """The token walk extract_filters ran over spaCy tokens before this module."""
+    doc = nlp(query.upper())
+    last_prefix = None
+    codes = []
+
+    for i, token in enumerate(doc):
+        text = token.text.strip(",.?!")
+        next_token = doc[i + 1].text.strip(",.?!") if i + 1 < len(doc) else None
+
+        if text in {"AND", "OR", "WITH", "TO", "FOR"}:
+            continue
+
+        if re.fullmatch(r"[A-Z]{2,5}", text) and next_token and re.fullmatch(r"\d+[A-Z]{0,2}", next_token):
+            codes.append(f"{text} {next_token}")
+            last_prefix = text
+        elif re.fullmatch(r"\d+[A-Z]{0,2}", text) and last_prefix:
+            codes.append(f"{last_prefix} {text}")
+
+    return list(dict.fromkeys(codes))
+
+
+class TestTokenize(unittest.TestCase):
+    """Tests for the regex tokenizer."""
+
+    def test_punctuation_becomes_separators(self):
+        self.assertEqual(tokenize("(CSE/MATH 20A)?"), ["", "CSE", "", "MATH", "20A", ""])
+
+    def test_possessive_and_digit_hyphen(self):
+        self.assertEqual(tokenize("CSE'S CIS-22A"), ["CSE", "'S", "CIS-22A"])
+
+
+class TestExtractCourseCodes(unittest.TestCase):
+    """Tests for course code extraction and classification."""
+
+    def test_prefix_carry_over(self):
+        self.assertEqual(
+            extract_course_codes("If I complete CSE 8A and 8B, is that one full path?"),
+            ["CSE 8A", "CSE 8B"],
+        )
+        self.assertEqual(
+            extract_course_codes("Can I complete just CIS 21JA and 21JB to satisfy CSE 30?"),
+            ["CIS 21JA", "CIS 21JB", "CSE 30"],
+        )
+
+    def test_punctuation_breaks_adjacency(self):
+        self.assertEqual(extract_course_codes("What about CSE, 8A?"), [])
+
+    def test_no_digits(self):
+        self.assertEqual(extract_course_codes("Which honors courses are required?"), [])
+
+    def test_classification(self):
+        filters = classify_course_codes(
+            extract_course_codes("Do MATH 1A and 1B satisfy MATH 20A and 20B? What about XYZ 9?"),
+            {"MATH 20A", "MATH 20B", "MATH 1B"},
+            {"MATH 1A", "MATH 1B"},
+        )
+        self.assertEqual(filters, {
+            "uc_course": ["MATH 20A", "MATH 20B"],
+            "ccc_courses": ["MATH 1A", "MATH 1B"],
+        })
+        self.assertEqual(classify_course_codes(["CSE 8A"]), {"uc_course": [], "ccc_courses": []})
+
+
+class TestSpacyParity(unittest.TestCase):
+    """Extraction must match the former spaCy tokenization on real queries."""
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            import spacy
+        except ImportError:
+            raise unittest.SkipTest("spaCy is not installed")
+        # The blank English pipeline shares en_core_web_sm's tokenizer rules
+        cls.nlp = spacy.blank("en")
+
+    def test_regression_queries(self):
+        queries = _regression_queries()
+        self.assertGreater(len(queries), 0)
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(extract_course_codes(query), _spacy_course_codes(self.nlp, query))
+
+    def test_edge_case_queries(self):
+        for query in EDGE_CASE_QUERIES:
+            with self.subTest(query=query):
+                self.assertEqual(extract_course_codes(query), _spacy_course_codes(self.nlp, query))
+
+
+if __name__ == '__main__':
+    unittest.main()
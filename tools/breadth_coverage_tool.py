@@ -14,16 +14,49 @@ Only the Python standard-library plus ``pydantic`` is required – no external
 network or heavyweight dependencies.
 
 NOTE: Some IGETC courses can be for multiple areas, but must only be counted once.
+
+The raw ASSIST files are compiled once into a compact area index – a sorted
+area universe (one bit per area), a ``course → area bitmask`` table for the
+currently active approvals, and every ``(course, area, approved, removed)``
+span for date-aware queries.  The index is persisted to
+``data/igetc_area_index.json`` keyed by a content digest of the source files,
+so a cold start reads one small JSON file instead of re-walking ~90 files; a
+stale or missing artefact is recompiled transparently.  Coverage for a student
+then reduces to OR-ing a handful of integers, which also makes batch
+evaluation (:func:`compute_batch_coverage`) cheap.
+
+When the compiled tool snapshot (:mod:`tools.tool_snapshot`) holds an area
+index built from the same source files (by size and mtime), it is used as is
+and the source digest is not even computed.
+
+Passing ``as_of`` (e.g. ``"Fall 2025"``) evaluates approvals as they stood in
+that term: an area counts when it was approved on or before the term and not
+yet removed.  Without ``as_of`` the ASSIST ``is_active`` flags are used, as
+before.
+
+Rebuild the artefact explicitly with::
+
+    python tools/breadth_coverage_tool.py --build
 """
 
 from pathlib import Path
+import hashlib
 import json
+from dataclasses import dataclass
 from functools import lru_cache
 from collections import defaultdict
-from typing import Dict, List, Set, DefaultDict
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, DefaultDict, Tuple
 import re
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+try:
+    from tools.tool_snapshot import file_signature, get_tool_snapshot
+except ImportError:  # pragma: no cover – direct script execution
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from tools.tool_snapshot import file_signature, get_tool_snapshot
 
 # Fallback if LangChain is unavailable in minimal CI environments -----------------
 try:
@@ -60,6 +93,26 @@ IGETC_DIRS: List[Path] = [
     / "assist_igetc_areas",
 ]
 
+_INDEX_PATH: Path = Path(__file__).resolve().parents[1] / "data" / "igetc_area_index.json"
+
+# Bump whenever the artefact layout changes so old files are recompiled.
+_INDEX_VERSION = 1
+
+# Terms are ordered Winter < Spring < Summer < Fall within a calendar year.
+_SEASONS: Dict[str, int] = {
+    "w": 0,
+    "winter": 0,
+    "s": 1,
+    "sp": 1,
+    "spring": 1,
+    "su": 2,
+    "summer": 2,
+    "f": 3,
+    "fall": 3,
+}
+_TERM_RE = re.compile(r"^([a-z]+)\s*(\d{4})$")
+_NEVER = 10**9  # term key for "not removed"
+
 # ---------------------------------------------------------------------------
 # Pydantic Schemas ----------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -79,6 +132,17 @@ class _BCIn(BaseModel):  # noqa: D401
     student_courses: List[str] = Field(
         ..., description="List of completed SMC course codes (e.g. ['ENGL 1', 'MATH 7'])"
     )
+    as_of: Optional[str] = Field(
+        None,
+        description="Evaluate approvals as of this term (e.g. 'Fall 2025', 'F2025'); defaults to currently active.",
+    )
+
+    @field_validator("as_of")
+    @classmethod
+    def _check_term(cls, value: Optional[str]) -> Optional[str]:  # noqa: D401
+        if value is not None:
+            _term_key(value)
+        return value
 
 
 # ---------------------------------------------------------------------------
@@ -122,69 +186,252 @@ def _extract_course_records(obj):  # noqa: D401, ANN001 – object type varies
             yield from _extract_course_records(obj[key])
 
 
-@lru_cache(maxsize=1)
-def _load_igetc_course_map() -> Dict[str, Set[str]]:  # noqa: D401
-    """Return mapping ``{course_code: {area_codes}}`` memoised for process lifetime."""
+def _term_key(term: str) -> int:  # noqa: D401
+    """Return a sortable key for *term* ('Fall 2025', 'F2025', 'Su2002' …).
+
+    Raises ``ValueError`` for anything that is not a season plus a 4-digit year.
+    """
+
+    match = _TERM_RE.match(" ".join(str(term).strip().lower().split()))
+    if not match or match.group(1) not in _SEASONS:
+        raise ValueError(f"Unrecognised term {term!r}; expected e.g. 'Fall 2025' or 'F2025'")
+    return int(match.group(2)) * 4 + _SEASONS[match.group(1)]
+
+
+def _raw_term_key(date: object, default: int) -> int:  # noqa: D401
+    """Term key for an ASSIST ``date_approved`` / ``date_removed`` object."""
+
+    if not isinstance(date, dict):
+        return default
+    raw = date.get("raw") or date.get("formatted") or ""
+    try:
+        return _term_key(raw)
+    except ValueError:
+        return default
 
-    mapping: Dict[str, Set[str]] = defaultdict(set)
 
+# ---------------------------------------------------------------------------
+# Compiled area index -------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _AreaIndex:
+    """Compiled IGETC mapping – one bit per area in :pyattr:`areas`."""
+
+    digest: str
+    areas: Tuple[str, ...]
+    # course → bitmask of currently active areas (ASSIST ``is_active`` flags)
+    current: Dict[str, int]
+    # course → ((area_bit, approved_key, removed_key), ...) for as-of queries
+    spans: Dict[str, Tuple[Tuple[int, int, int], ...]]
+
+    @property
+    def current_universe(self) -> int:
+        universe = 0
+        for mask in self.current.values():
+            universe |= mask
+        return universe
+
+    def area_names(self, mask: int) -> List[str]:
+        """Area codes for the set bits of *mask*, in sorted order."""
+
+        return [area for bit, area in enumerate(self.areas) if mask >> bit & 1]
+
+
+def _source_files() -> List[Path]:
+    files: List[Path] = []
     for folder in IGETC_DIRS:
-        if not folder.exists():
+        if folder.exists():
+            files.extend(sorted(folder.glob("*.json")))
+    return files
+
+
+def _source_digest(files: Iterable[Path]) -> str:  # noqa: D401
+    """Content digest of the source files (checkout-stable, unlike mtimes)."""
+
+    sha = hashlib.sha256(f"v{_INDEX_VERSION}".encode())
+    for path in files:
+        sha.update(f"{path.parent.name}/{path.name}".encode())
+        sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def _compile_index(files: Iterable[Path], digest: str = "") -> _AreaIndex:  # noqa: D401
+    """Walk the raw ASSIST files once and compile an :class:`_AreaIndex`.
+
+    Department files list per-area approvals under ``igetc_areas``; area files
+    hold one area (``area.code``) with course-level approval dates.
+    """
+
+    # (course, area) → {(approved, removed, active)}
+    raw_spans: DefaultDict[Tuple[str, str], Set[Tuple[int, int, bool]]] = defaultdict(set)
+
+    for json_file in files:
+        try:
+            with json_file.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except Exception:  # pragma: no cover – skip unreadable files
             continue
 
-        for json_file in folder.glob("*.json"):
-            try:
-                with json_file.open("r", encoding="utf-8") as fh:
-                    data = json.load(fh)
-            except Exception:  # pragma: no cover – skip unreadable files
+        file_area = None
+        if isinstance(data, dict) and isinstance(data.get("area"), dict):
+            file_area = data["area"].get("code")
+
+        for record in _extract_course_records(data):
+            raw_code = (
+                record.get("course_code")
+                or record.get("smc_course")
+                or record.get("course")
+                or record.get("smcCourse")
+            )
+            if not raw_code or not isinstance(raw_code, str):
                 continue
-
-            for record in _extract_course_records(data):
-                # Skip inactive course at *record* level if present
-                if not bool(record.get("is_active", True)):
-                    continue
-
-                # Determine course code -----------------------------------
-                raw_code = (
-                    record.get("course_code")
-                    or record.get("smc_course")
-                    or record.get("course")
-                    or record.get("smcCourse")
+            code = _normalise_code(raw_code)
+            course_active = bool(record.get("is_active", True))
+
+            entries = []
+            for ar in record.get("igetc_areas") or []:
+                if isinstance(ar, dict) and (ar.get("area") or ar.get("igetc_area")):
+                    entries.append((ar.get("area") or ar.get("igetc_area"), ar))
+                elif isinstance(ar, str):
+                    entries.append((ar, {}))
+            if record.get("igetc_area"):
+                entries.append((record["igetc_area"], record))
+            elif file_area and not entries:
+                entries.append((file_area, record))
+
+            for area, info in entries:
+                raw_spans[(code, str(area).strip().upper())].add(
+                    (
+                        _raw_term_key(info.get("date_approved"), 0),
+                        _raw_term_key(info.get("date_removed"), _NEVER),
+                        course_active and bool(info.get("is_active", True)),
+                    )
                 )
-                if not raw_code or not isinstance(raw_code, str):
-                    continue
 
-                norm_code = _normalise_code(raw_code)
+    areas = tuple(sorted({area for _, area in raw_spans}))
+    bit = {area: i for i, area in enumerate(areas)}
+
+    current: Dict[str, int] = {}
+    spans: DefaultDict[str, List[Tuple[int, int, int]]] = defaultdict(list)
+    for (code, area), entries in sorted(raw_spans.items()):
+        for approved, removed, active in sorted(entries):
+            spans[code].append((bit[area], approved, removed))
+            if active:
+                current[code] = current.get(code, 0) | 1 << bit[area]
+
+    return _AreaIndex(
+        digest=digest,
+        areas=areas,
+        current=current,
+        spans={code: tuple(items) for code, items in spans.items()},
+    )
+
+
+def _dump_index(index: _AreaIndex, path: Path) -> None:
+    payload = {
+        "version": _INDEX_VERSION,
+        "digest": index.digest,
+        "areas": list(index.areas),
+        "current": index.current,
+        "spans": {code: [list(s) for s in items] for code, items in index.spans.items()},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+
+
+def _read_index(path: Path, digest: str) -> Optional[_AreaIndex]:  # noqa: D401
+    """Return the persisted index if it exists and matches *digest*."""
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != _INDEX_VERSION or payload.get("digest") != digest:
+            return None
+        return _AreaIndex(
+            digest=digest,
+            areas=tuple(payload["areas"]),
+            current={code: int(mask) for code, mask in payload["current"].items()},
+            spans={code: tuple(tuple(s) for s in items) for code, items in payload["spans"].items()},
+        )
+    except Exception:  # noqa: BLE001 – missing / corrupted artefact → recompile
+        return None
+
+
+def build_area_index(path: Optional[Path] = None) -> _AreaIndex:  # noqa: D401
+    """Compile the IGETC index from the raw files and persist it to *path*."""
+
+    files = _source_files()
+    index = _compile_index(files, _source_digest(files))
+    _dump_index(index, path or _INDEX_PATH)
+    return index
+
+
+@lru_cache(maxsize=1)
+def _load_area_index() -> _AreaIndex:  # noqa: D401
+    """Return the compiled index, memoised for process lifetime."""
+
+    snapshot = get_tool_snapshot().load("igetc", file_signature(_source_files()))
+    if snapshot is not None:
+        return snapshot
+
+    try:
+        files = _source_files()
+        digest = _source_digest(files)
+    except Exception:  # noqa: BLE001 – unreadable sources → compile without persisting
+        return _compile_index(_source_files())
+
+    index = _read_index(_INDEX_PATH, digest)
+    if index is not None:
+        return index
+
+    index = _compile_index(files, digest)
+    try:
+        _dump_index(index, _INDEX_PATH)
+    except Exception as exc:  # noqa: BLE001
+        # Non-fatal – the artefact is only an optimisation
+        print(f"[WARN] Could not write IGETC area index: {exc}")
+    return index
+
 
-                # Determine breadth areas --------------------------------
-                areas: Set[str] = set()
+def _snapshot_section() -> Tuple[Tuple[Tuple[str, int, int], ...], _AreaIndex]:
+    """Compile the area index from the raw files for :mod:`tools.tool_snapshot`."""
 
-                if "igetc_area" in record and record["igetc_area"]:
-                    areas.add(str(record["igetc_area"]).strip().upper())
+    files = _source_files()
+    return file_signature(files), _compile_index(files, _source_digest(files))
 
-                if "area" in record and record.get("igetc_area") is None:  # area fallback
-                    # Some records may use "area" key directly
-                    areas.add(str(record["area"]).strip().upper())
 
-                if "igetc_areas" in record and isinstance(record["igetc_areas"], list):
-                    for ar in record["igetc_areas"]:
-                        if isinstance(ar, dict):
-                            # Respect is_active on area sub-record if present
-                            if not bool(ar.get("is_active", True)):
-                                continue
-                            area_code = ar.get("area") or ar.get("igetc_area")
-                            if area_code:
-                                areas.add(str(area_code).strip().upper())
-                        elif isinstance(ar, str):
-                            areas.add(str(ar).strip().upper())
+@lru_cache(maxsize=1)
+def _load_igetc_course_map() -> Dict[str, Set[str]]:  # noqa: D401
+    """Return mapping ``{course_code: {area_codes}}`` memoised for process lifetime."""
+
+    index = _load_area_index()
+    return {code: set(index.area_names(mask)) for code, mask in index.current.items()}
+
 
-                # No area codes found – skip
-                if not areas:
-                    continue
+@lru_cache(maxsize=32)
+def _masks_as_of(term: int) -> Tuple[Dict[str, int], int]:  # noqa: D401
+    """Return ``(course → area mask, area universe)`` for approvals valid in *term*."""
 
-                mapping[norm_code].update(areas)
+    masks: Dict[str, int] = {}
+    universe = 0
+    for code, items in _load_area_index().spans.items():
+        mask = 0
+        for area_bit, approved, removed in items:
+            if approved <= term < removed:
+                mask |= 1 << area_bit
+        if mask:
+            masks[code] = mask
+            universe |= mask
+    return masks, universe
 
-    return dict(mapping)  # Cast back to regular dict for immutability
+
+def clear_cache() -> None:
+    """Drop every memoised structure (tests, or after rebuilding the data)."""
+
+    _load_area_index.cache_clear()
+    _load_igetc_course_map.cache_clear()
+    _masks_as_of.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -192,48 +439,66 @@ def _load_igetc_course_map() -> Dict[str, Set[str]]:  # noqa: D401
 # ---------------------------------------------------------------------------
 
 
-def _compute_coverage(student_courses: List[str]) -> BreadthCoverageResult:  # noqa: D401
-    """Return coverage result for *student_courses*."""
+def _resolve_masks(as_of: Optional[str]) -> Tuple[_AreaIndex, Dict[str, int], int]:
+    index = _load_area_index()
+    if as_of is None:
+        return index, index.current, index.current_universe
+    masks, universe = _masks_as_of(_term_key(as_of))
+    return index, masks, universe
 
-    mapping = _load_igetc_course_map()
-
-    # Compute universe of areas once from mapping --------------------------------
-    all_areas: Set[str] = set()
-    for areas in mapping.values():
-        all_areas.update(areas)
 
+def _coverage_from_masks(
+    student_courses: Iterable[str], index: _AreaIndex, masks: Mapping[str, int], universe: int
+) -> BreadthCoverageResult:
     matched_dict: DefaultDict[str, Set[str]] = defaultdict(set)
     unmatched: Set[str] = set()
+    covered = 0
 
     for course in student_courses:
         norm = _normalise_code(course)
-        if norm in mapping:
-            for area in mapping[norm]:
-                matched_dict[area].add(norm)
-        else:
+        mask = masks.get(norm, 0)
+        if not mask:
             unmatched.add(norm)
+            continue
+        covered |= mask
+        for area in index.area_names(mask):
+            matched_dict[area].add(norm)
 
     # Sort for deterministic output and convert sets to lists
-    matched_sorted = {area: sorted(list(courses)) for area, courses in matched_dict.items()}
-    missing_sorted = sorted(all_areas - set(matched_sorted))
-    unmatched_sorted = sorted(list(unmatched))  # Convert set to sorted list
-
     return BreadthCoverageResult(
-        matched=matched_sorted,
-        missing=missing_sorted,
-        unmatched_courses=unmatched_sorted,
+        matched={area: sorted(matched_dict[area]) for area in sorted(matched_dict)},
+        missing=index.area_names(universe & ~covered),
+        unmatched_courses=sorted(unmatched),
     )
 
 
+def _compute_coverage(student_courses: List[str], as_of: Optional[str] = None) -> BreadthCoverageResult:  # noqa: D401
+    """Return coverage result for *student_courses* (optionally as of a term)."""
+
+    return _coverage_from_masks(student_courses, *_resolve_masks(as_of))
+
+
+def compute_batch_coverage(
+    students: Mapping[str, Sequence[str]], as_of: Optional[str] = None
+) -> Dict[str, BreadthCoverageResult]:  # noqa: D401
+    """Return ``{student_id: BreadthCoverageResult}`` for many students at once.
+
+    The index and per-term masks are resolved once for the whole batch.
+    """
+
+    resolved = _resolve_masks(as_of)
+    return {sid: _coverage_from_masks(courses, *resolved) for sid, courses in students.items()}
+
+
 # ---------------------------------------------------------------------------
 # LangChain StructuredTool wrapper -----------------------------------------
 # ---------------------------------------------------------------------------
 
 
-def _coverage_func(student_courses: List[str]):  # type: ignore[override]
+def _coverage_func(student_courses: List[str], as_of: Optional[str] = None):  # type: ignore[override]
     """Function exposed via LangChain StructuredTool."""
 
-    return _compute_coverage(student_courses).model_dump(mode="json")
+    return _compute_coverage(student_courses, as_of).model_dump(mode="json")
 
 
 BreadthCoverageTool: StructuredTool = StructuredTool.from_function(
@@ -242,7 +507,8 @@ BreadthCoverageTool: StructuredTool = StructuredTool.from_function(
     description=(
         "Given a list of Santa Monica College course codes, return which IGETC / "
         "CSU breadth areas are satisfied and which areas are still missing. "
-        "Returns `matched`, `missing`, and `unmatched_courses` keys."
+        "Optionally pass `as_of` (e.g. 'Fall 2025') to use the approvals in force "
+        "that term. Returns `matched`, `missing`, and `unmatched_courses` keys."
     ),
     args_schema=_BCIn,
     return_schema=BreadthCoverageResult,
@@ -253,6 +519,9 @@ BreadthCoverageTool: StructuredTool = StructuredTool.from_function(
 __all__ = [
     "BreadthCoverageTool",
     "BreadthCoverageResult",
+    "build_area_index",
+    "clear_cache",
+    "compute_batch_coverage",
 ]
 
 # ---------------------------------------------------------------------------
@@ -260,8 +529,22 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":  # pragma: no cover – simple CLI demo
-    sample = ["ENGL 1", "MATH 7", "HIST 11"]
-    import json as _json
-
-    output = BreadthCoverageTool.invoke({"student_courses": sample})
-    print(_json.dumps(output, indent=2))
+    import argparse
+
+    parser = argparse.ArgumentParser(description="IGETC breadth coverage")
+    parser.add_argument("--build", action="store_true", help=f"recompile {_INDEX_PATH.name} and exit")
+    parser.add_argument("--batch", type=Path, help="JSON file mapping student id → list of course codes")
+    parser.add_argument("--as-of", dest="as_of", help="evaluate approvals as of a term, e.g. 'Fall 2025'")
+    args = parser.parse_args()
+
+    if args.build:
+        built = build_area_index()
+        print(f"Wrote {_INDEX_PATH} ({len(built.spans)} courses, {len(built.areas)} areas)")
+    elif args.batch:
+        students = json.loads(args.batch.read_text(encoding="utf-8"))
+        results = compute_batch_coverage(students, args.as_of)
+        print(json.dumps({sid: r.model_dump(mode="json") for sid, r in results.items()}, indent=2))
+    else:
+        sample = ["ENGL 1", "MATH 7", "HIST 11"]
+        output = BreadthCoverageTool.invoke({"student_courses": sample, "as_of": args.as_of})
+        print(json.dumps(output, indent=2))
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+"""TransferAI – Shared Catalogue Store
+
+Single in-process owner of the parsed SMC catalogue
+(``data/SMC_catalog/parsed_programs/*.json``).  Historically every tool globbed
+and ``json.load``-ed the programme files on its own and kept a private copy;
+they now all read from :func:`get_catalog_store`, so the catalogue is parsed
+once per process.
+
+The store exposes read-only indexes:
+
+* :meth:`CatalogStore.by_code` – normalised course code → course record
+  (first occurrence wins, ``department`` injected from the programme name,
+  exactly as :func:`tools.course_detail_tool._load_catalog` always behaved).
+* :meth:`CatalogStore.by_course_id` – ``course_id`` → course record.
+* :meth:`CatalogStore.by_instructor` – normalised instructor → course codes.
+* :meth:`CatalogStore.by_department` / :meth:`CatalogStore.by_program` –
+  lower-cased department / programme name → course codes.
+* :meth:`CatalogStore.iter_courses` – every ``(program_name, course)`` pair in
+  stable file order (duplicates included), for corpus builders such as BM25.
+
+Initialisation is lazy and guarded by a lock so concurrent handler threads
+trigger exactly one load.  Each index set is built into a fresh immutable
+snapshot and swapped in atomically; readers never see a half-built state.
+Programme-file mtimes are re-checked at most every ``check_interval`` seconds
+and the snapshot is rebuilt when any file was added, removed or modified.
+
+The first load adopts the prebuilt indexes from the compiled tool snapshot
+(:mod:`tools.tool_snapshot`) when it was built from the same programme files,
+so a cold process skips the JSON parse entirely.
+
+Example
+-------
+>>> from tools.catalog_store import get_catalog_store
+>>> store = get_catalog_store()
+>>> store.by_code()["MATH 7"]["course_title"]
+'CALCULUS 1'
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import json
+import re
+import threading
+import time
+import warnings
+
+from tools.tool_snapshot import get_tool_snapshot
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_CATALOG_DIR = Path(__file__).resolve().parents[1] / "data" / "SMC_catalog" / "parsed_programs"
+
+# Seconds between mtime checks; a stat() of ~100 files is cheap but not free.
+_DEFAULT_CHECK_INTERVAL = 2.0
+
+_CODE_RE = re.compile(r"^([A-Z]+)\s*(\d+)([A-Z]?)$")
+_WS_RE = re.compile(r"\s+")
+
+
+# ---------------------------------------------------------------------------
+# Normalisation helpers
+# ---------------------------------------------------------------------------
+
+
+def normalise_code(code: str) -> str:  # noqa: D401
+    """Return canonical course-code format (e.g., 'ARC10' → 'ARC 10')."""
+
+    cleaned = _WS_RE.sub(" ", code.strip().upper())
+    match = _CODE_RE.match(cleaned)
+    if not match:
+        return cleaned
+    prefix, number, suffix = match.groups()
+    return f"{prefix} {number}{suffix}"
+
+
+def normalise_name(name: str) -> str:  # noqa: D401
+    """Return a case-folded, whitespace-collapsed instructor/department key."""
+
+    return " ".join(name.strip().lower().split())
+
+
+# ---------------------------------------------------------------------------
+# Immutable snapshot
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """One fully built set of indexes plus the file signature it came from."""
+
+    signature: Tuple[Tuple[str, int], ...]
+    courses: Tuple[Tuple[str, dict], ...]
+    by_code: Dict[str, dict] = field(default_factory=dict)
+    by_course_id: Dict[str, dict] = field(default_factory=dict)
+    by_instructor: Dict[str, List[str]] = field(default_factory=dict)
+    by_department: Dict[str, List[str]] = field(default_factory=dict)
+    by_program: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _append_unique(index: Dict[str, List[str]], key: str, value: str) -> None:
+    bucket = index.setdefault(key, [])
+    if value not in bucket:
+        bucket.append(value)
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class CatalogStore:
+    """Thread-safe, lazily loaded, mtime-reloading catalogue index."""
+
+    def __init__(
+        self, catalog_dir: Path = _CATALOG_DIR, check_interval: float = _DEFAULT_CHECK_INTERVAL
+    ) -> None:
+        self.catalog_dir = Path(catalog_dir)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._last_check = 0.0
+        self.load_count = 0
+
+    # -- loading ------------------------------------------------------------
+
+    def _signature(self) -> Tuple[Tuple[str, int], ...]:
+        if not self.catalog_dir.exists():
+            raise RuntimeError(f"Catalog directory not found: {self.catalog_dir}")
+        return tuple(
+            (p.name, p.stat().st_mtime_ns) for p in sorted(self.catalog_dir.glob("*.json"))
+        )
+
+    def _snapshot_key(self, signature: Tuple[Tuple[str, int], ...]) -> Tuple[str, Tuple[Tuple[str, int], ...]]:
+        return str(self.catalog_dir), signature
+
+    def _build(self, signature: Tuple[Tuple[str, int], ...]) -> _Snapshot:
+        courses: List[Tuple[str, dict]] = []
+        by_code: Dict[str, dict] = {}
+        by_course_id: Dict[str, dict] = {}
+        by_instructor: Dict[str, List[str]] = {}
+        by_department: Dict[str, List[str]] = {}
+        by_program: Dict[str, List[str]] = {}
+
+        for name, _ in signature:
+            json_file = self.catalog_dir / name
+            try:
+                with json_file.open("r", encoding="utf-8") as fh:
+                    program_data = json.load(fh)
+            except Exception as exc:  # noqa: BLE001
+                warnings.warn(f"Failed to load {json_file}: {exc}")
+                continue
+
+            program_name = program_data.get("program_name") or json_file.stem
+            for course in program_data.get("courses", []):
+                courses.append((program_name, course))
+
+                raw_code = course.get("course_code")
+                if not raw_code:
+                    continue
+                code = normalise_code(raw_code)
+
+                if code not in by_code:
+                    # Inject department if missing but inferable
+                    if "department" not in course and program_data.get("program_name"):
+                        course["department"] = program_data["program_name"]
+                    by_code[code] = course
+
+                course_id = course.get("course_id")
+                if course_id and course_id not in by_course_id:
+                    by_course_id[course_id] = course
+
+                _append_unique(by_program, normalise_name(program_name), code)
+                department = course.get("department") or program_name
+                _append_unique(by_department, normalise_name(department), code)
+
+                for section in course.get("sections") or []:
+                    for meeting in section.get("schedule") or []:
+                        instructor = meeting.get("instructor")
+                        if instructor:
+                            _append_unique(by_instructor, normalise_name(instructor), code)
+
+        return _Snapshot(
+            signature=signature,
+            courses=tuple(courses),
+            by_code=by_code,
+            by_course_id=by_course_id,
+            by_instructor=by_instructor,
+            by_department=by_department,
+            by_program=by_program,
+        )
+
+    def _current(self) -> _Snapshot:
+        """Return the live snapshot, loading or reloading it when required."""
+
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._last_check < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            # Another thread may have finished the (re)load while we waited
+            snapshot = self._snapshot
+            now = time.monotonic()
+            if snapshot is not None and now - self._last_check < self.check_interval:
+                return snapshot
+
+            signature = self._signature()
+            if snapshot is None:
+                snapshot = get_tool_snapshot().load("catalog", self._snapshot_key(signature))
+                if snapshot is not None:
+                    self._snapshot = snapshot
+                    self.load_count += 1
+            if snapshot is None or signature != snapshot.signature:
+                snapshot = self._build(signature)
+                self._snapshot = snapshot
+                self.load_count += 1
+            self._last_check = now
+            return snapshot
+
+    def reload(self) -> None:
+        """Force a rebuild on next access regardless of mtimes."""
+
+        with self._lock:
+            self._snapshot = None
+            self._last_check = 0.0
+
+    # -- read API -----------------------------------------------------------
+
+    def by_code(self) -> Dict[str, dict]:
+        return self._current().by_code
+
+    def by_course_id(self) -> Dict[str, dict]:
+        return self._current().by_course_id
+
+    def by_instructor(self) -> Dict[str, List[str]]:
+        return self._current().by_instructor
+
+    def by_department(self) -> Dict[str, List[str]]:
+        return self._current().by_department
+
+    def by_program(self) -> Dict[str, List[str]]:
+        return self._current().by_program
+
+    def iter_courses(self) -> Iterator[Tuple[str, dict]]:
+        return iter(self._current().courses)
+
+    def get(self, code: str) -> Optional[dict]:
+        """Return the record for *code* (any spelling) or *None*."""
+
+        return self.by_code().get(normalise_code(code))
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_STORE: Optional[CatalogStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_catalog_store() -> CatalogStore:  # noqa: D401
+    """Return the process-wide :class:`CatalogStore` (created on first use)."""
+
+    global _STORE  # noqa: PLW0603 – intentional module-level singleton
+
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = CatalogStore()
+    return _STORE
+
+
+def _snapshot_section() -> Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], _Snapshot]:
+    """Build the catalogue indexes from JSON for :mod:`tools.tool_snapshot`."""
+
+    store = CatalogStore()
+    signature = store._signature()
+    return store._snapshot_key(signature), store._build(signature)
+
+
+__all__ = ["CatalogStore", "get_catalog_store", "normalise_code", "normalise_name"]
@@ -26,8 +26,8 @@ successfully while signalling incomplete areas to developers.
 # are currently identical, so behaviour is correct for downstream consumers.
 #
 # If/when the data-engineering team delivers fully de-duplicated JSON—or if
-# departments start diverging in their definitions—we should revisit `_load_catalog`
-# and implement one of the following strategies:
+# departments start diverging in their definitions—we should revisit
+# `tools.catalog_store.CatalogStore._build` and implement one of the following strategies:
 #   1. Merge identical records and validate checksum equality.
 #   2. Choose "last wins" instead of "first wins".
 #   3. Emit a structured log or metrics signal for duplicates found.
@@ -46,6 +46,14 @@ from pydantic import BaseModel, Field, field_validator, ConfigDict
 # LangChain import (new dependency per refactor)
 from langchain_core.tools import StructuredTool
 
+try:
+    from tools.catalog_store import get_catalog_store, normalise_code
+except ImportError:  # pragma: no cover – direct script execution
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from tools.catalog_store import get_catalog_store, normalise_code
+
 # ---------------------------------------------------------------------------
 # Public Exceptions
 # ---------------------------------------------------------------------------
@@ -126,73 +134,20 @@ class CDOut(CourseDetail):  # noqa: D401
 # ---------------------------------------------------------------------------
 
 
-_CATALOG_DIR = Path(__file__).resolve().parents[1] / "data" / "SMC_catalog" / "parsed_programs"
-_CATALOG_CACHE: Optional[Dict[str, dict]] = None  # Lazy global cache
-
-
 def _normalise_code(code: str) -> str:  # noqa: D401
     """Return canonical course-code format (e.g., 'ARC10' → 'ARC 10')."""
-    import re  # local import – stdlib
 
-    # Collapse whitespace & upper-case first.
-    cleaned = re.sub(r"\s+", " ", code.strip().upper())
-
-    # Split alpha prefix, numeric part, and optional suffix letters.
-    # Examples:
-    #   'MATH31A'  -> groups('MATH', '31', 'A')
-    #   'ARC 10'   -> groups('ARC', '10', '')
-    #   'cs50'     -> groups('CS', '50', '')
-    match = re.match(r"^([A-Z]+)\s*(\d+)([A-Z]?)$", cleaned)
-    if not match:
-        # Fallback: just return collapsed/upper string
-        return cleaned
-
-    prefix, number, suffix = match.groups()
-    return f"{prefix} {number}{suffix}"
+    return normalise_code(code)
 
 
 def _load_catalog() -> Dict[str, dict]:  # noqa: D401
-    """Return a {course_code: data} mapping, memoised for process lifetime."""
-    import json
-    import warnings
-
-    global _CATALOG_CACHE  # noqa: PLW0603 – intentional module-level cache
-
-    if _CATALOG_CACHE is not None:
-        return _CATALOG_CACHE
+    """Return the shared {course_code: data} mapping from the catalogue store.
 
-    if not _CATALOG_DIR.exists():
-        raise RuntimeError(f"Catalog directory not found: {_CATALOG_DIR}")
-
-    mapping: Dict[str, dict] = {}
-
-    for json_file in _CATALOG_DIR.glob("*.json"):
-        try:
-            with json_file.open("r", encoding="utf-8") as fh:
-                program_data = json.load(fh)
-        except Exception as exc:  # noqa: BLE001
-            warnings.warn(f"Failed to load {json_file}: {exc}")
-            continue
-
-        for course in program_data.get("courses", []):
-            raw_code = course.get("course_code")
-            if not raw_code:
-                continue
-
-            norm_code = _normalise_code(raw_code)
-
-            if norm_code in mapping:
-                # Silently skip subsequent duplicates; first occurrence wins.
-                continue
-
-            # Inject department if missing but inferable
-            if "department" not in course and program_data.get("program_name"):
-                course["department"] = program_data["program_name"]
-
-            mapping[norm_code] = course
+    The store parses the programme files once per process (first occurrence of
+    a duplicated course code wins) and reloads them when they change on disk.
+    """
 
-    _CATALOG_CACHE = mapping
-    return mapping
+    return get_catalog_store().by_code()
 
 
 # ---------------------------------------------------------------------------
@@ -5,7 +5,7 @@ from __future__ import annotations
 StructuredTool that performs a keyword search across *all* Santa Monica College
 courses using a two-stage hybrid retrieval strategy:
 
-1. Sparse BM25 pass over the raw catalogue JSON files – returns the top-30
+1. Sparse BM25 pass over the shared catalogue store – returns the top-30
    candidate course documents.
 2. Dense re-rank with FAISS (Sentence-Transformer embeddings) restricted to
    the BM25 candidate set.
@@ -24,11 +24,10 @@ import overhead when the tool is present but unused in an agent prompt.
 """
 
 from pathlib import Path
-import json
 import pickle
 import sys
 from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import heapq
 
 import numpy as np
@@ -48,6 +47,8 @@ if __package__ is None or __package__ == "":  # pragma: no cover – CLI/pytest
     if str(ROOT) not in sys.path:
         sys.path.insert(0, str(ROOT))
 
+from tools.catalog_store import get_catalog_store  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Public Exceptions ----------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -90,7 +91,6 @@ class CSOut(BaseModel):  # noqa: D401
 # ---------------------------------------------------------------------------
 
 _DATA_DIR = Path(__file__).resolve().parents[1] / "data"
-_CATALOG_DIR = _DATA_DIR / "SMC_catalog" / "parsed_programs"
 _VECTORSTORE_DIR = _DATA_DIR / "vector_db" / "vectorstores" / "course_faiss"
 _BM25_CACHE_PATH = _DATA_DIR / "vector_db" / "bm25_cache.pkl"
 
@@ -110,7 +110,7 @@ _DOC_EMB_CACHE: Dict[str, np.ndarray] = {}
 
 
 def _build_bm25() -> tuple[BM25Okapi, List[Dict[str, str]]]:
-    """Scan the programme JSON files building the BM25 index.
+    """Build the BM25 index over every course in the shared catalogue store.
 
     Returns
     -------
@@ -124,38 +124,25 @@ def _build_bm25() -> tuple[BM25Okapi, List[Dict[str, str]]]:
     tokens_corpus: List[List[str]] = []
     meta_list: List[Dict[str, str]] = []
 
-    if not _CATALOG_DIR.exists():
-        raise RuntimeError(f"Catalogue directory not found: {_CATALOG_DIR}")
-
-    for json_file in sorted(_CATALOG_DIR.glob("*.json")):
-        try:
-            with json_file.open("r", encoding="utf-8") as fh:
-                program_data = json.load(fh)
-        except Exception as exc:  # noqa: BLE001
-            # Skip unreadable files; continue building index
-            print(f"[WARN] Failed to parse {json_file}: {exc}")
-            continue
-
-        program_name = program_data.get("program_name", json_file.stem)
-        for course in program_data.get("courses", []):
-            course_code = (course.get("course_code") or "").strip()
-            title = (course.get("course_title") or "").strip()
-            description = (course.get("description") or "").strip()
-
-            page_content = f"{course_code} {title} {description}".strip()
-            if not page_content:
-                continue  # Skip empty docs
-
-            tokens_corpus.append(page_content.lower().split())
-            meta_list.append(
-                {
-                    "course_id": course.get("course_id"),
-                    "course_code": course_code,
-                    "program_name": program_name,
-                    "units": course.get("units"),
-                    "page_content": page_content,
-                }
-            )
+    for program_name, course in get_catalog_store().iter_courses():
+        course_code = (course.get("course_code") or "").strip()
+        title = (course.get("course_title") or "").strip()
+        description = (course.get("description") or "").strip()
+
+        page_content = f"{course_code} {title} {description}".strip()
+        if not page_content:
+            continue  # Skip empty docs
+
+        tokens_corpus.append(page_content.lower().split())
+        meta_list.append(
+            {
+                "course_id": course.get("course_id"),
+                "course_code": course_code,
+                "program_name": program_name,
+                "units": course.get("units"),
+                "page_content": page_content,
+            }
+        )
 
     if not tokens_corpus:
         raise RuntimeError("No courses found whilst building BM25 corpus")
@@ -164,11 +151,79 @@ def _build_bm25() -> tuple[BM25Okapi, List[Dict[str, str]]]:
     return bm25, meta_list
 
 
-@lru_cache(maxsize=1)
+def _bm25_cache_status() -> str:
+    """Check the BM25 pickle against the data build manifest (``data.build``).
+
+    Returns ``"current"``, ``"stale"`` or ``"unknown"`` – the latter when the
+    cache was never recorded by a build or the manifest cannot be read.
+    """
+
+    try:
+        from data.build import artifact_status
+
+        return artifact_status("bm25_cache")
+    except Exception:  # noqa: BLE001 – the manifest is advisory
+        return "unknown"
+
+
+def _write_bm25_cache(bm25: BM25Okapi, meta_list: List[Dict[str, str]]) -> None:
+    """Persist the BM25 index and record it in the build manifest."""
+
+    _BM25_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with _BM25_CACHE_PATH.open("wb") as fh:
+        pickle.dump((bm25, meta_list), fh)
+    try:
+        from data.build import record_artifact
+
+        record_artifact("bm25_cache")
+    except Exception as exc:  # noqa: BLE001 – the manifest is advisory
+        print(f"[WARN] Could not record BM25 cache in build manifest: {exc}")
+
+
+def rebuild_bm25_cache() -> None:
+    """Rebuild the on-disk BM25 cache (the ``bm25_cache`` data build stage)."""
+
+    _write_bm25_cache(*_build_bm25())
+
+
+# (catalogue map it was built from, (bm25, meta_list)) – the map is held so
+# identity checks stay valid
+_BM25: Optional[Tuple[Dict[str, dict], Tuple[BM25Okapi, List[Dict[str, str]]]]] = None
+
+
 def _load_bm25() -> tuple[BM25Okapi, List[Dict[str, str]]]:
-    """Return the memoised BM25 & metadata list, building (and caching) if needed."""
+    """Return the memoised BM25 & metadata list for the live catalogue.
+
+    Rebuilt only when the catalogue store hands out a new ``by_code`` map
+    (i.e. after an mtime-triggered reload).
+    """
+
+    global _BM25  # noqa: PLW0603 – intentional module-level cache
+
+    catalog = get_catalog_store().by_code()
+    if _BM25 is not None and _BM25[0] is catalog:
+        return _BM25[1]
 
-    if _BM25_CACHE_PATH.exists():
+    if _BM25 is None:
+        index = _read_bm25_cache()
+    else:
+        print("[INFO] Catalogue reloaded – rebuilding BM25 index.")
+        index = _build_and_cache_bm25()
+    _BM25 = (catalog, index)
+    return index
+
+
+def _read_bm25_cache() -> tuple[BM25Okapi, List[Dict[str, str]]]:
+    """Load the on-disk BM25 pickle, building (and caching) it if needed.
+
+    A pickle the build manifest reports as stale (catalogue or builder changed
+    since it was written) is ignored and rebuilt.
+    """
+
+    status = _bm25_cache_status() if _BM25_CACHE_PATH.exists() else "unknown"
+    if status == "stale":
+        print("[INFO] BM25 cache is stale according to the build manifest – rebuilding.")
+    elif _BM25_CACHE_PATH.exists():
         try:
             with _BM25_CACHE_PATH.open("rb") as fh:
                 bm25, meta_list = pickle.load(fh)
@@ -177,13 +232,17 @@ def _load_bm25() -> tuple[BM25Okapi, List[Dict[str, str]]]:
             # Corrupted cache – rebuild afresh
             print(f"[WARN] Corrupted BM25 cache – rebuilding. ({exc})")
 
+    return _build_and_cache_bm25()
+
+
+def _build_and_cache_bm25() -> tuple[BM25Okapi, List[Dict[str, str]]]:
+    """Build the BM25 index and persist it (best effort)."""
+
     bm25, meta_list = _build_bm25()
 
     # Persist cache directory if required
     try:
-        _BM25_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with _BM25_CACHE_PATH.open("wb") as fh:
-            pickle.dump((bm25, meta_list), fh)
+        _write_bm25_cache(bm25, meta_list)
     except Exception as exc:  # noqa: BLE001
         # Non-fatal – cache is only an optimisation
         print(f"[WARN] Could not write BM25 cache: {exc}")
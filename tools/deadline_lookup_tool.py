@@ -37,6 +37,10 @@ project brief:
 Heavy objects (timeline data, FAISS index, embedding model, BM25 corpus) are
 memoised with :pyfunc:`functools.lru_cache` so that subsequent invocations
 incur negligible latency (important for unit-tests and chained tool calls).
+The timeline events – including their ``dateparser``-resolved datetimes, by
+far the slowest part of a cold start – are read from the compiled tool
+snapshot (:mod:`tools.tool_snapshot`) when it matches the JSON files and was
+built in the current year (bare dates such as "July 15" resolve to it).
 
 Example
 -------
@@ -64,6 +68,14 @@ from datetime import datetime, timedelta
 from functools import lru_cache
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+try:
+    from tools.tool_snapshot import file_signature, get_tool_snapshot
+except ImportError:  # pragma: no cover – direct script execution
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from tools.tool_snapshot import file_signature, get_tool_snapshot
+
 # ---------------------------------------------------------------------------
 # StructuredTool import with graceful fallback if *langchain_core* is missing
 # ---------------------------------------------------------------------------
@@ -202,6 +214,45 @@ def _parse_event_date_range(date_str: str) -> Tuple[Optional[datetime], Optional
     return None, None
 
 
+def _timeline_files() -> List[Path]:
+    files: List[Path] = []
+    for folder in _DEADLINE_DIRS:
+        if folder.exists():
+            files.extend(folder.glob("*.json"))
+    return files
+
+
+def _timeline_snapshot_key(files: List[Path]) -> Tuple[Tuple[Tuple[str, int, int], ...], int]:
+    # Parsed datetimes depend on the current year as well as the files
+    return file_signature(files), datetime.now().year
+
+
+def _read_timeline_events(files: List[Path]) -> List[Dict[str, Any]]:
+    """Parse *files* into a flat list of event dicts (see :func:`_load_timeline_events`)."""
+
+    events: List[Dict[str, Any]] = []
+
+    for json_file in files:
+        try:
+            with json_file.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed loading %s: %s", json_file, exc)
+            continue
+
+        for item in data.get("timeline", []):
+            start_dt, end_dt = _parse_event_date_range(item.get("date", ""))
+            item["start_dt"] = start_dt
+            item["end_dt"] = end_dt
+            item["source_file"] = json_file.name
+            events.append(item)
+
+    if not events:
+        raise RuntimeError("No timeline JSON files found in configured directories")
+
+    return events
+
+
 @lru_cache(maxsize=1)
 def _load_timeline_events() -> List[Dict[str, Any]]:
     """Load **all** timeline JSON files into a flat list of event dicts.
@@ -210,30 +261,18 @@ def _load_timeline_events() -> List[Dict[str, Any]]:
     ``start_dt``, ``end_dt`` and ``source_file``.
     """
 
-    events: List[Dict[str, Any]] = []
+    files = _timeline_files()
+    events = get_tool_snapshot().load("timeline", _timeline_snapshot_key(files))
+    if events is not None:
+        return events
+    return _read_timeline_events(files)
 
-    for folder in _DEADLINE_DIRS:
-        if not folder.exists():
-            continue
-        for json_file in folder.glob("*.json"):
-            try:
-                with json_file.open("r", encoding="utf-8") as fh:
-                    data = json.load(fh)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Failed loading %s: %s", json_file, exc)
-                continue
-
-            for item in data.get("timeline", []):
-                start_dt, end_dt = _parse_event_date_range(item.get("date", ""))
-                item["start_dt"] = start_dt
-                item["end_dt"] = end_dt
-                item["source_file"] = json_file.name
-                events.append(item)
 
-    if not events:
-        raise RuntimeError("No timeline JSON files found in configured directories")
+def _snapshot_section() -> Tuple[Tuple[Tuple[Tuple[str, int, int], ...], int], List[Dict[str, Any]]]:
+    """Parse the timeline events for :mod:`tools.tool_snapshot`."""
 
-    return events
+    files = _timeline_files()
+    return _timeline_snapshot_key(files), _read_timeline_events(files)
 
 
 # ---------------------------------------------------------------------------
@@ -10,6 +10,14 @@ from typing import Dict, List, Optional, Tuple
 # Third-party imports
 from pydantic import BaseModel, Field
 
+try:
+    from tools.tool_snapshot import file_signature, get_tool_snapshot
+except ImportError:  # pragma: no cover – direct script execution
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from tools.tool_snapshot import file_signature, get_tool_snapshot
+
 # ---------------------------------------------------------------------------
 # Optional LangChain dependency – provide a lightweight fallback when absent.
 # ---------------------------------------------------------------------------
@@ -126,19 +134,66 @@ def _slugify(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-@lru_cache(maxsize=1)
-def _assist_file_catalogue() -> List[Path]:
-    """Return list of all *.json files under ASSIST_ROOT (cached)."""
+# Both catalogues come from the compiled tool snapshot (:mod:`tools.tool_snapshot`)
+# when it was built from the same files, with the ASSIST articulation texts
+# already extracted; otherwise they are read from disk as before.
+
 
+def _assist_sources() -> List[Path]:
     if not ASSIST_ROOT.exists():
         return []
     return sorted(ASSIST_ROOT.glob("**/*.json"))
 
 
+def _assist_snapshot_key(files: List[Path]) -> Tuple[str, Tuple[Tuple[str, int, int], ...]]:
+    return str(ASSIST_ROOT), file_signature(files)
+
+
+@lru_cache(maxsize=1)
+def _assist_file_catalogue() -> List[Tuple[str, Path, Optional[str]]]:
+    """Return ``(slug, path, articulation text or None)`` per ASSIST file (cached).
+
+    Entries are sorted by path; the text is only present when served from the
+    compiled snapshot and is otherwise extracted on lookup.
+    """
+
+    files = _assist_sources()
+    compiled = get_tool_snapshot().load("assist_majors", _assist_snapshot_key(files))
+    if compiled is not None:
+        return [(slug, ASSIST_ROOT / rel_path, text) for slug, rel_path, text in compiled]
+    return [(_slugify(p.stem), p, None) for p in files]
+
+
+def _assist_snapshot_section() -> Tuple[Tuple[str, Tuple[Tuple[str, int, int], ...]], List[Tuple[str, str, str]]]:
+    """Index and extract every ASSIST file for :mod:`tools.tool_snapshot`."""
+
+    files = _assist_sources()
+    compiled = [
+        (_slugify(p.stem), p.relative_to(ASSIST_ROOT).as_posix(), _extract_text_from_assist_json(p))
+        for p in files
+    ]
+    return _assist_snapshot_key(files), compiled
+
+
 @lru_cache(maxsize=1)
 def _ucsd_transfer_prep_catalogue() -> Dict[str, dict]:
     """Return mapping of slug -> major JSON entry from the UCSD prep file."""
 
+    compiled = get_tool_snapshot().load("ucsd_majors", file_signature([UCSD_PREP_PATH]))
+    if compiled is not None:
+        return compiled
+    return _read_ucsd_transfer_prep()
+
+
+def _ucsd_snapshot_section() -> Tuple[Tuple[Tuple[str, int, int], ...], Dict[str, dict]]:
+    """Build the UCSD prep mapping for :mod:`tools.tool_snapshot`."""
+
+    return file_signature([UCSD_PREP_PATH]), _read_ucsd_transfer_prep()
+
+
+def _read_ucsd_transfer_prep() -> Dict[str, dict]:
+    """Read the UCSD prep file into a slug -> entry mapping."""
+
     if not UCSD_PREP_PATH.exists():
         return {}
 
@@ -226,11 +281,11 @@ def _extract_text_from_ucsd_entry(entry: dict) -> str:
 def _lookup_assist(major_slug: str) -> Tuple[Optional[str], List[str]]:
     """Return (text, notes) for ASSIST lookup."""
 
-    matches = [p for p in _assist_file_catalogue() if major_slug == _slugify(p.stem)]
+    matches = [(p, text) for slug, p, text in _assist_file_catalogue() if major_slug == slug]
 
     # Fallback fuzzy containment search if no exact hit
     if not matches:
-        matches = [p for p in _assist_file_catalogue() if major_slug in _slugify(p.stem)]
+        matches = [(p, text) for slug, p, text in _assist_file_catalogue() if major_slug in slug]
 
     notes: List[str] = []
     if not matches:
@@ -239,10 +294,12 @@ def _lookup_assist(major_slug: str) -> Tuple[Optional[str], List[str]]:
 
     if len(matches) > 1:
         notes.append(
-            f"Multiple ASSIST files matched '{major_slug}'. Using '{matches[0].name}'."
+            f"Multiple ASSIST files matched '{major_slug}'. Using '{matches[0][0].name}'."
         )
 
-    articulation_text = _extract_text_from_assist_json(matches[0])
+    path, articulation_text = matches[0]
+    if articulation_text is None:
+        articulation_text = _extract_text_from_assist_json(path)
     return articulation_text, notes
 
 
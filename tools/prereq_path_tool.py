@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+"""TransferAI – Prerequisite Path Tool
+
+:data:`tools.prereq_graph_tool.PrereqGraphTool` answers *"what does X
+require?"* by crawling one course at a time.  Planning questions need the
+inverse and the aggregate view, so this module builds a **catalogue-wide**
+prerequisite graph once per process and answers two kinds of queries:
+
+* ``mode="unlocks"`` – reverse adjacency: which courses list each given course
+  as a prerequisite, and which of those become eligible once the given courses
+  (plus any ``completed_courses``) are done.
+* ``mode="plan"`` – minimum number of terms needed to reach every target given
+  the completed courses.  OR-alternatives pick the cheapest branch, AND-sets
+  take the slowest member (longest path), and the chosen courses are returned
+  as a topological layering (one list per term) plus the critical path.
+
+Only *prerequisites* constrain the term count: corequisites may be taken in the
+same term and advisories are not enforced.  Prerequisites that are not in the
+local catalogue (placement-level courses such as ``MATH 20``) are treated as
+ordinary one-term leaves and reported under ``missing_courses``.
+
+Results are memoised per *(targets, completed)* signature so repeated planner
+calls are free.
+
+Example
+-------
+>>> from tools.prereq_path_tool import PrereqPathTool
+>>> PrereqPathTool.invoke({"course_codes": ["MATH 11"], "completed_courses": ["MATH 7"]})
+{'mode': 'plan', 'terms_required': 2, 'term_plan': [['MATH 8'], ['MATH 11']], ...}
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import DefaultDict, Dict, FrozenSet, List, Literal, Optional, Set, Tuple
+import sys
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Ensure project root is importable when running as a standalone script
+# ---------------------------------------------------------------------------
+
+if __package__ is None or __package__ == "":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field, field_validator
+
+from tools.course_detail_tool import _load_catalog
+from tools.prereq_graph_tool import _normalise_code, _parse_requirement_text
+
+# ---------------------------------------------------------------------------
+# Pydantic schemas
+# ---------------------------------------------------------------------------
+
+
+class PPIn(BaseModel):  # noqa: D401
+    """Input schema – target (or source) courses plus completed coursework."""
+
+    course_codes: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Target courses (mode='plan') or courses to expand (mode='unlocks').",
+    )
+    completed_courses: List[str] = Field(
+        default_factory=list, description="Courses the student has already completed."
+    )
+    mode: Literal["plan", "unlocks"] = Field(
+        "plan", description="'plan' for minimum terms / critical path, 'unlocks' for reverse look-ups."
+    )
+
+    @field_validator("course_codes", "completed_courses", mode="before")
+    def _strip_list(cls, v: List[str]) -> List[str]:  # noqa: D401, N805
+        return [str(item).strip() for item in v if str(item).strip()]
+
+
+class TargetPath(BaseModel):
+    """Per-target planning result."""
+
+    course_code: str
+    terms_required: Optional[int] = Field(
+        None, description="Terms until the course can be completed (0 = already done, None = unreachable)."
+    )
+    critical_path: List[str] = Field(
+        default_factory=list, description="Longest prerequisite chain, earliest course first."
+    )
+
+
+class PPOut(BaseModel):  # noqa: D401
+    """Output schema shared by both modes (fields unused by a mode stay empty)."""
+
+    mode: Literal["plan", "unlocks"]
+    # -- plan -----------------------------------------------------------------
+    terms_required: Optional[int] = None
+    term_plan: List[List[str]] = Field(default_factory=list)
+    targets: List[TargetPath] = Field(default_factory=list)
+    unreachable: List[str] = Field(default_factory=list)
+    # -- unlocks --------------------------------------------------------------
+    unlocks: Dict[str, List[str]] = Field(default_factory=dict)
+    newly_eligible: List[str] = Field(default_factory=list)
+    # -- shared ---------------------------------------------------------------
+    missing_courses: List[str] = Field(
+        default_factory=list, description="Referenced courses not found in the local catalogue."
+    )
+
+
+# ---------------------------------------------------------------------------
+# Catalogue-wide graph
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _CatalogueGraph:
+    """Immutable prerequisite graph over the whole catalogue.
+
+    ``requires[c]`` is a tuple of OR-alternatives, each a frozenset of courses
+    that must *all* be completed (AND).  ``unlocks`` is the reverse adjacency
+    index: prerequisite → courses that mention it in any alternative.
+    """
+
+    requires: Dict[str, Tuple[FrozenSet[str], ...]]
+    unlocks: Dict[str, FrozenSet[str]]
+    known: FrozenSet[str]
+
+
+# (catalogue map it was built from, graph) – the map is held so identity checks stay valid
+_GRAPH: Optional[Tuple[Dict[str, dict], _CatalogueGraph]] = None
+
+
+def _build_catalogue_graph() -> _CatalogueGraph:  # noqa: D401
+    """Return the prerequisite graph for the live catalogue.
+
+    Rebuilt only when the catalogue store hands out a new ``by_code`` map
+    (i.e. after an mtime-triggered reload); the memoised plan and unlock
+    results are dropped with the old graph.
+    """
+
+    global _GRAPH  # noqa: PLW0603 – intentional module-level cache
+
+    catalog = _load_catalog()
+    if _GRAPH is not None and _GRAPH[0] is catalog:
+        return _GRAPH[1]
+
+    graph = _compile_graph(catalog)
+    _plan.cache_clear()
+    _unlocks.cache_clear()
+    _GRAPH = (catalog, graph)
+    return graph
+
+
+def _compile_graph(catalog: Dict[str, dict]) -> _CatalogueGraph:  # noqa: D401
+    """Parse every catalogue prerequisite string once and index both directions."""
+
+    requires: Dict[str, Tuple[FrozenSet[str], ...]] = {}
+    reverse: DefaultDict[str, Set[str]] = defaultdict(set)
+
+    for code, record in catalog.items():
+        # Drop catalogue footnotes ("*Maximum UC credit for MATH 8 and MATH 29 ...")
+        text = (record.get("prerequisites") or "").split("*", 1)[0].strip()
+        if not text:
+            continue
+        alternatives = tuple(
+            frozenset(c for c in edge.courses if c != code)
+            for edge in _parse_requirement_text(text, "prereq")
+        )
+        alternatives = tuple(alt for alt in alternatives if alt)
+        if not alternatives:
+            continue
+        requires[code] = alternatives
+        for alt in alternatives:
+            for prereq in alt:
+                reverse[prereq].add(code)
+
+    return _CatalogueGraph(
+        requires=requires,
+        unlocks={k: frozenset(v) for k, v in reverse.items()},
+        known=frozenset(catalog),
+    )
+
+
+def _topological_layers(nodes: Set[str], deps: Dict[str, Set[str]]) -> List[List[str]]:  # noqa: D401
+    """Kahn-style layering of *nodes*; ``deps[n]`` must be a subset of *nodes*.
+
+    Layer *k* holds nodes whose longest dependency chain has length *k*.
+    """
+
+    remaining = {n: len(deps.get(n, ())) for n in nodes}
+    dependents: DefaultDict[str, List[str]] = defaultdict(list)
+    for node in nodes:
+        for dep in deps.get(node, ()):
+            dependents[dep].append(node)
+
+    layers: List[List[str]] = []
+    frontier = sorted(n for n, count in remaining.items() if count == 0)
+    while frontier:
+        layers.append(frontier)
+        nxt: List[str] = []
+        for node in frontier:
+            for child in dependents[node]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    nxt.append(child)
+        frontier = sorted(nxt)
+    return layers
+
+
+# ---------------------------------------------------------------------------
+# Query implementations (memoised per signature)
+# ---------------------------------------------------------------------------
+
+
+_UNREACHABLE = float("inf")
+
+
+@lru_cache(maxsize=512)
+def _plan(targets: Tuple[str, ...], completed: FrozenSet[str]) -> PPOut:  # noqa: D401
+    """Minimum-term plan for *targets*; cached on the sorted/frozen signature."""
+
+    graph = _build_catalogue_graph()
+    term: Dict[str, float] = {}
+    choice: Dict[str, FrozenSet[str]] = {}
+    visiting: Dict[str, int] = {}  # open course → recursion depth
+
+    def _visit(code: str) -> Tuple[float, float]:
+        """``(term index, lowest open ancestor depth touched)`` for *code*.
+
+        The term index is the longest path, minimised over OR alternatives.
+        A result that ran into a still-open ancestor (a cycle closing above
+        *code*) only holds in this traversal context, so it is not memoised.
+        """
+
+        if code in completed:
+            return 0, _UNREACHABLE
+        if code in term:
+            return term[code], _UNREACHABLE
+        if code in visiting:  # cycle – this branch can never be satisfied here
+            return _UNREACHABLE, visiting[code]
+        depth = visiting[code] = len(visiting)
+
+        best: float = 1  # no prerequisites → one term
+        best_alt: FrozenSet[str] = frozenset()
+        low: float = _UNREACHABLE
+        ranked = []
+        for alt in graph.requires.get(code, ()):
+            costs = []
+            for c in alt:
+                cost, touched = _visit(c)
+                costs.append(cost)
+                low = min(low, touched)
+            # Tie-break on alternative size, then lexicographically, for determinism
+            ranked.append(((1 + max(costs), len(alt), sorted(alt)), alt))
+        if ranked:
+            (best, _, _), best_alt = min(ranked, key=lambda item: item[0])
+
+        del visiting[code]
+        if low >= depth:  # independent of any open ancestor
+            term[code] = best
+            if best_alt and best != _UNREACHABLE:
+                choice[code] = best_alt
+        return best, low
+
+    def _earliest(code: str) -> float:
+        """Context-free term index; fills ``term``/``choice`` for *code*."""
+
+        return _visit(code)[0]
+
+    target_paths: List[TargetPath] = []
+    unreachable: List[str] = []
+    for target in targets:
+        cost = _earliest(target)
+        if cost == _UNREACHABLE:
+            unreachable.append(target)
+            target_paths.append(TargetPath(course_code=target))
+            continue
+
+        # Critical path – walk back through the slowest member of each chosen AND-set
+        path = [target]
+        node = target
+        while node in choice:
+            node = max(sorted(choice[node]), key=_earliest)
+            if node in completed:
+                break
+            path.append(node)
+        target_paths.append(
+            TargetPath(course_code=target, terms_required=int(cost), critical_path=path[::-1])
+        )
+
+    # Collect the chosen sub-DAG of courses still to be taken ---------------
+    to_take: Set[str] = set()
+    stack = [t for t in targets if t not in unreachable]
+    while stack:
+        node = stack.pop()
+        if node in completed or node in to_take:
+            continue
+        to_take.add(node)
+        _earliest(node)  # members skipped from memoisation inside a cycle
+        stack.extend(choice.get(node, ()))
+
+    deps = {n: {d for d in choice.get(n, ()) if d in to_take} for n in to_take}
+    layers = _topological_layers(to_take, deps)
+
+    reachable_terms = [p.terms_required for p in target_paths if p.terms_required is not None]
+    missing = sorted((to_take | set(targets)) - graph.known)
+
+    return PPOut(
+        mode="plan",
+        terms_required=max(reachable_terms) if reachable_terms else None,
+        term_plan=layers,
+        targets=target_paths,
+        unreachable=unreachable,
+        missing_courses=missing,
+    )
+
+
+@lru_cache(maxsize=512)
+def _unlocks(sources: Tuple[str, ...], completed: FrozenSet[str]) -> PPOut:  # noqa: D401
+    """Reverse look-up for *sources*; cached on the sorted/frozen signature."""
+
+    graph = _build_catalogue_graph()
+    done = completed | set(sources)
+
+    unlocks = {src: sorted(graph.unlocks.get(src, ())) for src in sources}
+    candidates = {c for dependents in unlocks.values() for c in dependents} - done
+    newly_eligible = sorted(
+        c for c in candidates if any(alt <= done for alt in graph.requires.get(c, ()))
+    )
+
+    return PPOut(
+        mode="unlocks",
+        unlocks=unlocks,
+        newly_eligible=newly_eligible,
+        missing_courses=sorted(set(sources) - graph.known),
+    )
+
+
+# ---------------------------------------------------------------------------
+# LangChain adapter
+# ---------------------------------------------------------------------------
+
+
+def _prereq_path(
+    *, course_codes: List[str], completed_courses: Optional[List[str]] = None, mode: str = "plan"
+):  # noqa: D401
+    """Normalise inputs into a cache signature and dispatch to the mode handler."""
+
+    codes = tuple(sorted({_normalise_code(c) for c in course_codes}))
+    completed = frozenset(_normalise_code(c) for c in completed_courses or [])
+
+    _build_catalogue_graph()  # drops memoised results if the catalogue changed
+    handler = _unlocks if mode == "unlocks" else _plan
+    return handler(codes, completed).model_dump(mode="json")
+
+
+def clear_cache() -> None:  # noqa: D401
+    """Drop the catalogue graph and all memoised query results."""
+
+    global _GRAPH  # noqa: PLW0603 – intentional module-level cache
+
+    _GRAPH = None
+    _plan.cache_clear()
+    _unlocks.cache_clear()
+
+
+PrereqPathTool: StructuredTool = StructuredTool.from_function(
+    func=_prereq_path,
+    name="prereq_path",
+    description=(
+        "Catalogue-wide prerequisite planning for Santa Monica College courses. "
+        "mode='plan': minimum number of terms to reach course_codes given completed_courses, "
+        "with a per-term course plan and the critical path. mode='unlocks': which courses "
+        "each of course_codes is a prerequisite for, and which become eligible."
+    ),
+    args_schema=PPIn,
+    return_schema=PPOut,
+)
+
+# Public exports ------------------------------------------------------------
+
+__all__ = ["PrereqPathTool", "PPOut", "TargetPath", "clear_cache"]
+
+# ---------------------------------------------------------------------------
+# CLI helper – python -m tools.prereq_path_tool --course "MATH 11" --completed "MATH 7"
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="CLI wrapper around PrereqPathTool")
+    parser.add_argument("--course", action="append", required=True, help="Target course (repeatable)")
+    parser.add_argument("--completed", action="append", default=[], help="Completed course (repeatable)")
+    parser.add_argument("--mode", choices=["plan", "unlocks"], default="plan")
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            PrereqPathTool.invoke(
+                {"course_codes": args.course, "completed_courses": args.completed, "mode": args.mode}
+            ),
+            indent=2,
+        )
+    )
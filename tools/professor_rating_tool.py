@@ -7,25 +7,46 @@ Santa Monica College instructors along with a handful of top comments.  The
 information is served out of an on-disk JSON snapshot under
 ``data/Professor_Ratings/santa_monica_college_professors_rag.json``.
 
-The tool also cross-references the local course catalogue JSONs to determine
-which SMC courses each instructor currently teaches.
+The tool also cross-references the shared catalogue store
+(:mod:`tools.catalog_store`) to determine which SMC courses each instructor
+currently teaches.
+
+The normalised RMP index is served from the compiled tool snapshot
+(:mod:`tools.tool_snapshot`) when it matches the JSON on disk.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 import json
-import glob
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+if __package__ is None or __package__ == "":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from tools.catalog_store import get_catalog_store, normalise_code  # noqa: E402
+from tools.tool_snapshot import file_signature, get_tool_snapshot  # noqa: E402
+
+# Optional dependency: rapidfuzz – without it the fuzzy fallback is skipped
+try:
+    from rapidfuzz import fuzz, process  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    process = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Constants – file paths -----------------------------------------------------
 # ---------------------------------------------------------------------------
 
 _ROOT = Path(__file__).resolve().parents[1]
 _RMP_JSON = _ROOT / "data" / "Professor_Ratings" / "santa_monica_college_professors_rag.json"
-_CATALOG_GLOB = _ROOT / "data" / "SMC_catalog" / "parsed_programs" / "*.json"
+
+# Minimum rapidfuzz ratio for a catalogue last name to match an RMP last name
+_FUZZY_LAST_NAME_CUTOFF = 90
 
 # ---------------------------------------------------------------------------
 # Exceptions ----------------------------------------------------------------
@@ -42,17 +63,25 @@ class ProfessorNotFoundError(RuntimeError):
 
 
 _RMP_CACHE: Optional[List[dict]] = None  # Raw list of professors
-_COURSE_MAP: Optional[Dict[str, List[str]]] = None  # instructor name → list[course_code]
 
 
 def _load_rmp() -> List[dict]:  # noqa: D401
-    """Return the raw Rate-My-Professor list, memoised."""
+    """Return the raw Rate-My-Professor list, memoised.
+
+    A matching compiled snapshot also primes :data:`_RMP_INDEX`.
+    """
 
-    global _RMP_CACHE  # noqa: PLW0603 – intentional module-level cache
+    global _RMP_CACHE, _RMP_INDEX  # noqa: PLW0603 – intentional module-level cache
 
     if _RMP_CACHE is not None:
         return _RMP_CACHE
 
+    index = get_tool_snapshot().load("rmp", file_signature([_RMP_JSON]))
+    if index is not None:
+        _RMP_INDEX = index
+        _RMP_CACHE = index.records
+        return _RMP_CACHE
+
     if not _RMP_JSON.exists():
         raise RuntimeError(f"RMP JSON not found at {_RMP_JSON}")
 
@@ -64,47 +93,152 @@ def _load_rmp() -> List[dict]:  # noqa: D401
 
 
 def _build_course_map() -> Dict[str, List[str]]:  # noqa: D401
-    """Return a mapping of *instructor name* → list of course codes."""
+    """Return a mapping of *instructor name* → list of course codes.
 
-    global _COURSE_MAP  # noqa: PLW0603
+    Served from the shared catalogue store's instructor index, so the
+    programme files are not re-read here.
+    """
 
-    if _COURSE_MAP is not None:
-        return _COURSE_MAP
+    return get_catalog_store().by_instructor()
 
-    mapping: Dict[str, List[str]] = {}
 
-    for json_path in glob.glob(str(_CATALOG_GLOB)):
-        try:
-            with open(json_path, "r", encoding="utf-8") as fh:
-                program = json.load(fh)
-        except Exception:  # noqa: BLE001
-            continue
+# ---------------------------------------------------------------------------
+# Helpers -------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _normalise_name(name: str) -> str:  # noqa: D401
+    """Return a case-folded, stripped representation suitable for matching."""
+
+    return " ".join(name.strip().lower().split())
 
-        for course in program.get("courses", []):
-            course_code = course.get("course_code")
-            for section in course.get("sections", []):
-                for meeting in section.get("schedule", []):
-                    instructor_raw = meeting.get("instructor")
-                    if not instructor_raw:
-                        continue
 
-                    # Store canonicalised instructor string
-                    name_norm = _normalise_name(instructor_raw)
-                    mapping.setdefault(name_norm, []).append(course_code)
+def _catalog_key(name_norm: str) -> Optional[Tuple[str, str]]:  # noqa: D401
+    """Catalogue names are 'last first-initial ...' → (last, first_initial)."""
 
-    _COURSE_MAP = mapping
-    return mapping
+    parts = name_norm.split()
+    if len(parts) < 2:
+        return None
+    return parts[0], parts[1][0]
 
 
 # ---------------------------------------------------------------------------
-# Helpers -------------------------------------------------------------------
+# Precomputed indexes --------------------------------------------------------
 # ---------------------------------------------------------------------------
 
 
-def _normalise_name(name: str) -> str:  # noqa: D401
-    """Return a case-folded, stripped representation suitable for matching."""
+@dataclass(frozen=True)
+class _RMPIndex:
+    """RMP records with names normalised once and inverted indexes by key.
 
-    return " ".join(name.strip().lower().split())
+    All index values are record ordinals into ``records`` so results can be
+    returned in the original file order.
+    """
+
+    records: List[dict]
+    names: List[str]  # normalised "first last"
+    by_last: Dict[str, List[int]]
+    by_key: Dict[Tuple[str, str], List[int]]
+    by_department: Dict[str, List[int]]
+
+
+_RMP_INDEX: Optional[_RMPIndex] = None
+# (course map it was built from, index) – the map is held so identity checks stay valid
+_COURSE_INDEX: Optional[Tuple[Dict[str, List[str]], Dict[str, Set[Tuple[str, str]]]]] = None
+
+
+def _build_rmp_index(records: List[dict]) -> _RMPIndex:  # noqa: D401
+    """Normalise *records* once and build the inverted indexes over them."""
+
+    names: List[str] = []
+    by_last: Dict[str, List[int]] = {}
+    by_key: Dict[Tuple[str, str], List[int]] = {}
+    by_department: Dict[str, List[int]] = {}
+
+    for idx, prof in enumerate(records):
+        name_norm = _normalise_name(prof.get("name", ""))
+        names.append(name_norm)
+        by_department.setdefault(prof.get("department", "").lower(), []).append(idx)
+
+        parts = name_norm.split()
+        if len(parts) >= 2:
+            # RMP name is "first last", so key is (last, first_initial)
+            last = parts[-1]
+            by_last.setdefault(last, []).append(idx)
+            by_key.setdefault((last, parts[0][0]), []).append(idx)
+
+    return _RMPIndex(records, names, by_last, by_key, by_department)
+
+
+def _rmp_index() -> _RMPIndex:  # noqa: D401
+    """Return the memoised :class:`_RMPIndex` built over :func:`_load_rmp`."""
+
+    global _RMP_INDEX  # noqa: PLW0603 – intentional module-level cache
+
+    if _RMP_INDEX is not None:
+        return _RMP_INDEX
+
+    records = _load_rmp()
+    if _RMP_INDEX is None:  # not primed from the compiled snapshot
+        _RMP_INDEX = _build_rmp_index(records)
+    return _RMP_INDEX
+
+
+def _snapshot_section() -> Tuple[Tuple[Tuple[str, int, int], ...], _RMPIndex]:
+    """Build the RMP index from JSON for :mod:`tools.tool_snapshot`."""
+
+    key = file_signature([_RMP_JSON])
+    with _RMP_JSON.open("r", encoding="utf-8") as fh:
+        records = json.load(fh).get("professors", [])
+    return key, _build_rmp_index(records)
+
+
+def _course_index() -> Dict[str, Set[Tuple[str, str]]]:  # noqa: D401
+    """Return course code → {(last, first_initial)} for catalogue instructors.
+
+    Rebuilt only when the catalogue store hands out a new instructor index
+    (i.e. after an mtime-triggered reload).
+    """
+
+    global _COURSE_INDEX  # noqa: PLW0603 – intentional module-level cache
+
+    course_map = _build_course_map()
+    if _COURSE_INDEX is not None and _COURSE_INDEX[0] is course_map:
+        return _COURSE_INDEX[1]
+
+    index: Dict[str, Set[Tuple[str, str]]] = {}
+    for name_norm, codes in course_map.items():
+        key = _catalog_key(name_norm)
+        if key is None:
+            continue
+        for code in codes:
+            index.setdefault(normalise_code(code), set()).add(key)
+
+    _COURSE_INDEX = (course_map, index)
+    return index
+
+
+def _match_instructor_keys(keys: Set[Tuple[str, str]], rmp: _RMPIndex) -> Set[int]:  # noqa: D401
+    """Resolve catalogue (last, initial) keys to RMP record ordinals.
+
+    A record matches on the exact key or on last name alone (catalogue
+    initials are unreliable).  Last names with no exact hit fall back to a
+    rapidfuzz match against the RMP last-name index, narrowed by initial.
+    """
+
+    matched: Set[int] = set()
+    for key in keys:
+        last = key[0]
+        hits = rmp.by_key.get(key, []) + rmp.by_last.get(last, [])
+        if not hits and process is not None:
+            best = process.extractOne(
+                last, rmp.by_last.keys(), scorer=fuzz.ratio, score_cutoff=_FUZZY_LAST_NAME_CUTOFF
+            )
+            if best is not None:
+                # Fuzzy hits are less certain – keep the initial when it disambiguates
+                hits = rmp.by_key.get((best[0], key[1])) or rmp.by_last[best[0]]
+        matched.update(hits)
+    return matched
 
 
 # ---------------------------------------------------------------------------
@@ -169,64 +303,37 @@ def _query_professors(
 ):  # type: ignore[override]
     """Return professor ratings filtered by name, department, and/or course code."""
 
-    rmp_data = _load_rmp()
-    course_map = _build_course_map()  # Currently unused but triggers cache for future features
+    rmp = _rmp_index()
 
     name_norm = _normalise_name(instructor_name) if instructor_name else None
     dept_norm = department.lower() if department else None
 
-    # If course_code provided, narrow rmp_data to instructors teaching that course.
+    candidates: Optional[Set[int]] = None  # None → every record
+
+    # If course_code provided, narrow to instructors teaching that course.
     if course_code:
-        code_norm = course_code.strip().upper()
-        # Step 1: Find all catalog instructor names for the given course.
-        instructors_from_catalog = {
-            name_norm
-            for name_norm, codes in course_map.items()
-            if code_norm in [c.upper() for c in codes]
-        }
-
-        if not instructors_from_catalog:
+        code_norm = normalise_code(course_code)
+        instructor_keys = _course_index().get(code_norm)
+
+        if not instructor_keys:
             raise ProfessorNotFoundError(f"No instructors found teaching {code_norm}")
 
-        # Step 2: Convert catalog names (e.g., "supat w") to (last, initial) keys.
-        instructor_keys = set()
-        last_names = set()
-        for name in instructors_from_catalog:
-            parts = name.split()
-            if len(parts) >= 2:
-                last, first_initial = parts[0], parts[1][0]
-                instructor_keys.add((last, first_initial))
-                last_names.add(last)
-
-        # Step 3: Filter RMP data by matching on the (last, initial) key.
-        filtered_rmp = []
-        for prof in rmp_data:
-            prof_name_norm = _normalise_name(prof.get("name", ""))
-            prof_parts = prof_name_norm.split()
-            if len(prof_parts) >= 2:
-                # RMP name is "first last", so key is (last, first_initial)
-                last = prof_parts[-1]
-                first_initial = prof_parts[0][0]
-                rmp_key = (last, first_initial)
-                if rmp_key in instructor_keys or last in last_names:
-                    filtered_rmp.append(prof)
-        rmp_data = filtered_rmp
-
-        if not rmp_data:
-            raise ProfessorNotFoundError(f"No rated instructors found teaching {code_norm}")
+        candidates = _match_instructor_keys(instructor_keys, rmp)
 
-    matches: List[dict] = []
+        if not candidates:
+            raise ProfessorNotFoundError(f"No rated instructors found teaching {code_norm}")
 
-    for prof in rmp_data:
-        # Department filter (if provided)
-        if dept_norm and prof.get("department", "").lower() != dept_norm:
-            continue
+    # Department filter (if provided)
+    if dept_norm is not None:
+        dept_hits = set(rmp.by_department.get(dept_norm, []))
+        candidates = dept_hits if candidates is None else candidates & dept_hits
 
-        # Name filter (if provided)
-        if name_norm and name_norm not in _normalise_name(prof.get("name", "")):
-            continue
+    ordinals = sorted(candidates) if candidates is not None else range(len(rmp.records))
 
-        matches.append(prof)
+    # Name filter (if provided) – substring match on pre-normalised names
+    matches: List[dict] = [
+        rmp.records[i] for i in ordinals if not name_norm or name_norm in rmp.names[i]
+    ]
 
     if not matches:
         raise ProfessorNotFoundError("No professors found for given parameters.")
@@ -26,7 +26,8 @@ Example
 """
 
 from datetime import time
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, NamedTuple, Set, Tuple
+import heapq
 import re
 import sys
 from pathlib import Path
@@ -160,6 +161,110 @@ def _times_overlap(a_start: time, a_end: time, b_start: time, b_end: time) -> bo
     return (a_start < b_end) and (b_start < a_end)
 
 
+# ---------------------------------------------------------------------------
+# Interval engine ------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+# Meetings are encoded on a single weekly timeline in minutes:
+#   week_minute = day_index * 1440 + minute_of_day
+# so a meeting on several days becomes several disjoint half-open intervals
+# [start, end).  Back-to-back blocks therefore never overlap.
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+class _Interval(NamedTuple):
+    start: int  # week minute, inclusive
+    end: int  # week minute, exclusive
+    section: int
+    entry: int  # index into the section's schedule list
+    days_raw: str
+    time_raw: str
+
+
+def _minute_of_day(t: time) -> int:
+    return t.hour * 60 + t.minute
+
+
+def _section_intervals(section_idx: int, sched_list: List[Dict[str, str]]) -> List[_Interval]:  # noqa: D401
+    """Encode one section's schedule entries as weekly-minute intervals.
+
+    Entries without fixed meeting days (online/arranged), without a parseable
+    time range, or malformed are skipped – they cannot clash.
+    """
+
+    intervals: List[_Interval] = []
+    for entry_idx, entry in enumerate(sched_list):
+        days_raw: str | None = entry.get("days")  # type: ignore[assignment]
+        time_raw: str | None = entry.get("time")  # type: ignore[assignment]
+        if not days_raw or not time_raw:
+            continue
+
+        day_set = _parse_days(days_raw)
+        if not day_set:
+            continue
+
+        time_tuple = _parse_time_range(time_raw)
+        if time_tuple is None:
+            continue
+
+        start_m, end_m = (_minute_of_day(t) for t in time_tuple)
+        if end_m <= start_m:
+            continue
+        for day in day_set:
+            offset = day * _MINUTES_PER_DAY
+            intervals.append(
+                _Interval(offset + start_m, offset + end_m, section_idx, entry_idx, days_raw, time_raw)
+            )
+    return intervals
+
+
+def _section_mask(sched_list: List[Dict[str, str]]) -> int:  # noqa: D401
+    """Return a weekly minute bitmap (bit *k* = week minute *k* occupied).
+
+    Two sections conflict iff ``mask_a & mask_b`` is non-zero, which makes
+    repeated compatibility checks during schedule search a single AND.
+    """
+
+    mask = 0
+    for iv in _section_intervals(0, sched_list):
+        mask |= ((1 << (iv.end - iv.start)) - 1) << iv.start
+    return mask
+
+
+def _sweep_conflicts(
+    intervals: List[_Interval],
+) -> Dict[Tuple[int, int], Tuple[_Interval, _Interval]]:  # noqa: D401
+    """Sweep-line overlap detection across sections.
+
+    Intervals are visited in start order while a min-heap keyed on end time
+    holds the currently open ones; every open interval overlaps the incoming
+    one.  Runs in O(n log n + k) for n intervals and k overlapping pairs.
+
+    Returns ``{(i, j): (interval_i, interval_j)}`` for each conflicting
+    section pair (i < j), keeping the overlap with the smallest entry indices
+    so descriptions are stable regardless of which weekday was seen first.
+    """
+
+    found: Dict[Tuple[int, int], Tuple[_Interval, _Interval]] = {}
+    active: List[Tuple[int, int, _Interval]] = []  # (end, tiebreak, interval)
+
+    for seq, iv in enumerate(sorted(intervals, key=lambda x: (x.start, x.end))):
+        while active and active[0][0] <= iv.start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            if other.section == iv.section:
+                continue
+            a, b = (other, iv) if other.section < iv.section else (iv, other)
+            pair = (a.section, b.section)
+            best = found.get(pair)
+            if best is None or (a.entry, b.entry) < (best[0].entry, best[1].entry):
+                found[pair] = (a, b)
+        heapq.heappush(active, (iv.end, seq, iv))
+
+    return found
+
+
 # ---------------------------------------------------------------------------
 # Core computation -----------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -168,61 +273,21 @@ def _times_overlap(a_start: time, a_end: time, b_start: time, b_end: time) -> bo
 def _detect_conflicts(*, sections: List[List[Dict[str, str]]]):  # type: ignore[override]
     """Return a :class:`ConflictReport` for the provided *sections*."""
 
-    # Build an intermediate representation: list[section_index] -> list of
-    # tuples (days_set, start_time, end_time, original_days, original_time).
-    parsed: List[List[Tuple[Set[int], time, time, str, str]]] = []
-
-    for sched_list in sections:
-        section_entries: List[Tuple[Set[int], time, time, str, str]] = []
-        for entry in sched_list:
-            days_raw: str | None = entry.get("days")  # type: ignore[assignment]
-            time_raw: str | None = entry.get("time")  # type: ignore[assignment]
-            if not days_raw or not time_raw:
-                # Skip malformed entries silently
-                continue
+    intervals: List[_Interval] = []
+    for idx, sched_list in enumerate(sections):
+        intervals.extend(_section_intervals(idx, sched_list))
 
-            day_set = _parse_days(days_raw)
-            if not day_set:
-                # No fixed meeting days (online/arranged) → skip
-                continue
-
-            time_tuple = _parse_time_range(time_raw)
-            if time_tuple is None:
-                continue
+    found = _sweep_conflicts(intervals)
 
-            start_t, end_t = time_tuple
-            section_entries.append((day_set, start_t, end_t, days_raw, time_raw))
-
-        parsed.append(section_entries)
-
-    conflicting_pairs: List[Tuple[int, int]] = []
-    conflict_descriptions: List[str] = []
-
-    num_sections = len(parsed)
-    for i in range(num_sections):
-        for j in range(i + 1, num_sections):
-            conflict_found = False
-            for day_set_i, s_i, e_i, days_i_raw, time_i_raw in parsed[i]:
-                for day_set_j, s_j, e_j, days_j_raw, time_j_raw in parsed[j]:
-                    if day_set_i & day_set_j and _times_overlap(s_i, e_i, s_j, e_j):
-                        # Record pair only once even if multiple overlapping components
-                        if (i, j) not in conflicting_pairs:
-                            conflicting_pairs.append((i, j))
-                        if not conflict_found:
-                            conflict_descriptions.append(
-                                f"Section {i} ({days_i_raw} {time_i_raw}) overlaps with "
-                                f"Section {j} ({days_j_raw} {time_j_raw})"
-                            )
-                            conflict_found = True
-                        # We can break after first conflict between the two sections
-                        break
-                if conflict_found:
-                    break
-
-    has_conflict = bool(conflicting_pairs)
+    conflicting_pairs: List[Tuple[int, int]] = sorted(found)
+    conflict_descriptions = [
+        f"Section {i} ({a.days_raw} {a.time_raw}) overlaps with "
+        f"Section {j} ({b.days_raw} {b.time_raw})"
+        for (i, j), (a, b) in ((pair, found[pair]) for pair in conflicting_pairs)
+    ]
 
     return ConflictReport(
-        has_conflict=has_conflict,
+        has_conflict=bool(conflicting_pairs),
         conflicting_pairs=conflicting_pairs,
         conflict_descriptions=conflict_descriptions,
     ).model_dump(mode="json")
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+"""TransferAI – Schedule Search Tool
+
+Given candidate sections for several courses (typically one
+:pyattr:`tools.section_lookup_tool.SectionLookupTool` result per course),
+enumerate combinations that pick exactly one section per course with no
+meeting-time conflicts.
+
+Each section is encoded once as a weekly minute bitmap via
+:func:`tools.schedule_conflict_tool._section_mask`, so a compatibility check
+is a single integer AND.  The backtracking search
+
+* visits the course with the fewest remaining compatible sections first,
+* prunes every section that clashes with what is already chosen, and
+* backtracks as soon as any unscheduled course has no compatible section left
+  (forward checking),
+
+so the planner no longer has to brute-force combinations inside ``llm_step``
+text.
+
+Example
+-------
+>>> from tools.schedule_search_tool import ScheduleSearchTool
+>>> ScheduleSearchTool.invoke({
+...     "courses": [
+...         {"course_code": "MATH 7", "sections": [
+...             {"section_number": "4001", "schedule": [{"days": "MW", "time": "8:00a.m.-10:05a.m."}]},
+...         ]},
+...         {"course_code": "CS 3", "sections": [
+...             {"section_number": "1716", "schedule": [{"days": "MW", "time": "9:30a.m.-11:55a.m."}]},
+...             {"section_number": "1715", "schedule": [{"days": "TTh", "time": "9:30a.m.-11:55a.m."}]},
+...         ]},
+...     ]
+... })
+{'schedules': [{'MATH 7': '4001', 'CS 3': '1715'}], 'total_found': 1, 'truncated': False, 'blocking_courses': []}
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+from pathlib import Path
+
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+
+# ---------------------------------------------------------------------------
+# Ensure project root on sys.path for standalone execution -------------------
+# ---------------------------------------------------------------------------
+
+if __package__ is None or __package__ == "":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from tools.schedule_conflict_tool import _section_mask  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Pydantic schemas -----------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+class CandidateSection(BaseModel):  # noqa: D401
+    """One candidate section – the shape returned by SectionLookupTool."""
+
+    section_number: str
+    schedule: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class CandidateCourse(BaseModel):  # noqa: D401
+    """All candidate sections for a single course."""
+
+    course_code: str
+    sections: List[CandidateSection] = Field(..., min_length=1)
+
+
+class ScheduleSearchInput(BaseModel):  # noqa: D401
+    """Input schema – candidate sections per course plus a result cap."""
+
+    courses: List[CandidateCourse] = Field(
+        ...,
+        min_length=1,
+        description="One entry per course: {course_code, sections}, e.g. SectionLookupTool outputs.",
+    )
+    max_results: int = Field(10, ge=1, le=100, description="Maximum number of schedules to return.")
+
+
+class ScheduleSearchResult(BaseModel):  # noqa: D401
+    """Output schema – conflict-free schedules as course → section maps."""
+
+    schedules: List[Dict[str, str]]
+    total_found: int
+    truncated: bool = Field(False, description="True if more schedules exist beyond max_results.")
+    blocking_courses: List[str] = Field(
+        default_factory=list,
+        description="When no schedule exists: courses whose sections clash with every option of another course.",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Search ---------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _enumerate(
+    options: List[List[Tuple[str, int]]], limit: int
+) -> Tuple[List[List[str]], bool]:  # noqa: D401
+    """Backtracking search over ``options[course] = [(section_number, mask), ...]``.
+
+    Returns up to *limit* assignments (section numbers in course order) and a
+    flag telling whether the search stopped early because of the limit.
+    """
+
+    n = len(options)
+    found: List[List[str]] = []
+    chosen: List[Optional[str]] = [None] * n
+
+    def _backtrack(remaining: List[int], occupied: int) -> bool:
+        """Return *True* to abort (limit reached)."""
+
+        if not remaining:
+            if len(found) == limit:
+                return True
+            found.append([c for c in chosen if c is not None])
+            return False
+
+        # Forward check + most-constrained-course-first ordering
+        viable: Dict[int, List[Tuple[str, int]]] = {}
+        for course in remaining:
+            fits = [opt for opt in options[course] if not opt[1] & occupied]
+            if not fits:
+                return False
+            viable[course] = fits
+        course = min(remaining, key=lambda c: (len(viable[c]), c))
+        rest = [c for c in remaining if c != course]
+
+        for number, mask in viable[course]:
+            chosen[course] = number
+            if _backtrack(rest, occupied | mask):
+                return True
+        chosen[course] = None
+        return False
+
+    truncated = _backtrack(list(range(n)), 0)
+    return found, truncated
+
+
+def _blocking_courses(codes: List[str], options: List[List[Tuple[str, int]]]) -> List[str]:  # noqa: D401
+    """Courses involved in a pairwise dead end (every option of one clashes with all of the other)."""
+
+    blocking = set()
+    for a in range(len(options)):
+        for b in range(a + 1, len(options)):
+            if all(ma & mb for _, ma in options[a] for _, mb in options[b]):
+                blocking.update({codes[a], codes[b]})
+    return [c for c in codes if c in blocking]
+
+
+def _search_schedules(*, courses: List[Any], max_results: int = 10):  # type: ignore[override]
+    """Return a :class:`ScheduleSearchResult` for the provided candidates."""
+
+    parsed = [CandidateCourse.model_validate(c) for c in courses]
+    codes = [c.course_code for c in parsed]
+
+    options: List[List[Tuple[str, int]]] = []
+    for course in parsed:
+        options.append(
+            [(sec.section_number, _section_mask(sec.schedule)) for sec in course.sections]  # type: ignore[arg-type]
+        )
+
+    assignments, truncated = _enumerate(options, max_results)
+    schedules = [dict(zip(codes, numbers)) for numbers in assignments]
+
+    return ScheduleSearchResult(
+        schedules=schedules,
+        total_found=len(schedules),
+        truncated=truncated,
+        blocking_courses=[] if schedules else _blocking_courses(codes, options),
+    ).model_dump(mode="json")
+
+
+# ---------------------------------------------------------------------------
+# StructuredTool wrapper -----------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+ScheduleSearchTool: StructuredTool = StructuredTool.from_function(
+    func=_search_schedules,
+    name="schedule_search",
+    description=(
+        "Given candidate SMC sections for several courses (each {course_code, sections} as "
+        "returned by section_lookup), enumerate conflict-free schedules that pick one section "
+        "per course. Returns up to max_results course→section_number maps, and the clashing "
+        "courses when no schedule exists."
+    ),
+    args_schema=ScheduleSearchInput,
+    return_schema=ScheduleSearchResult,
+)
+
+# Public export --------------------------------------------------------------
+
+__all__ = ["ScheduleSearchTool"]
+
+# ---------------------------------------------------------------------------
+# Manual demo ----------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":  # pragma: no cover
+    import json
+
+    from tools.section_lookup_tool import SectionLookupTool
+
+    demo = [SectionLookupTool.invoke({"course_code": code}) for code in ("MATH 7", "CS 3", "CHEM 11")]
+    print(json.dumps(ScheduleSearchTool.invoke({"courses": demo, "max_results": 5}), indent=2))
@@ -27,6 +27,7 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from tools import breadth_coverage_tool as bc_mod
 from tools.breadth_coverage_tool import (
     BreadthCoverageTool,
     BreadthCoverageResult,
@@ -35,6 +36,7 @@ from tools.breadth_coverage_tool import (
     _load_igetc_course_map,
     _compute_coverage,
     _extract_course_records,
+    compute_batch_coverage,
     IGETC_DIRS,
 )
 
@@ -648,6 +650,121 @@ class TestIntegrationAndRegression:
             assert hist_count == 1, f"HIST 11 appears {hist_count} times in area {area}"
 
 
+# =============================================================================
+# Compiled Area Index, As-Of Terms and Batch Coverage
+# =============================================================================
+
+def _dept_file(tmp_path: Path, courses: list) -> Path:
+    path = tmp_path / "SMC_igetc_TEST.json"
+    path.write_text(json.dumps({"courses": courses}), encoding="utf-8")
+    return path
+
+
+def _area(code: str, approved: str, removed: str = "", active: bool = True) -> dict:
+    return {
+        "area": code,
+        "date_approved": {"raw": approved},
+        "date_removed": {"raw": removed},
+        "is_active": active,
+    }
+
+
+class TestCompiledAreaIndex:
+    """The compiled index, its persisted artefact and date-aware evaluation."""
+
+    def test_term_key_ordering(self):
+        assert bc_mod._term_key("Winter 2020") < bc_mod._term_key("S2020")
+        assert bc_mod._term_key("spring 2020") < bc_mod._term_key("Su2020")
+        assert bc_mod._term_key("Summer 2020") < bc_mod._term_key("F2020")
+        assert bc_mod._term_key("Fall 2020") < bc_mod._term_key("W2021")
+        with pytest.raises(ValueError):
+            bc_mod._term_key("Autumn")
+
+    def test_compile_spans_and_current_mask(self, tmp_path):
+        path = _dept_file(
+            tmp_path,
+            [
+                {
+                    "course_code": "KOREAN3",
+                    "is_active": True,
+                    "igetc_areas": [_area("3B", "F2010", "F2026"), _area("6A", "F2010")],
+                },
+                {"course_code": "OLD 1", "is_active": False, "igetc_areas": [_area("4A", "F1991", "S2000", False)]},
+            ],
+        )
+        index = bc_mod._compile_index([path])
+
+        assert index.areas == ("3B", "4A", "6A")
+        assert index.area_names(index.current["KOREAN 3"]) == ["3B", "6A"]
+        assert "OLD 1" not in index.current
+        assert index.area_names(index.current_universe) == ["3B", "6A"]
+        assert len(index.spans["OLD 1"]) == 1
+
+    def test_area_files_use_file_level_area(self, tmp_path):
+        path = tmp_path / "SMC_igetc_area_5A.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "area": {"code": "5A"},
+                    "courses": [
+                        {"course_code": "ASTRON 1", "date_approved": {"raw": "F1991"}, "is_active": True}
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+        index = bc_mod._compile_index([path])
+        assert index.area_names(index.current["ASTRON 1"]) == ["5A"]
+
+    def test_artefact_round_trip_and_staleness(self, tmp_path):
+        path = _dept_file(tmp_path, [{"course_code": "ENGL 1", "igetc_areas": [_area("1A", "F1991")]}])
+        artefact = tmp_path / "index.json"
+        index = bc_mod._compile_index([path], bc_mod._source_digest([path]))
+        bc_mod._dump_index(index, artefact)
+
+        assert bc_mod._read_index(artefact, index.digest) == index
+        assert bc_mod._read_index(artefact, "other-digest") is None
+        assert bc_mod._read_index(tmp_path / "missing.json", index.digest) is None
+
+    def test_current_matches_real_data_without_as_of(self, tool):
+        mapping = _load_igetc_course_map()
+        index = bc_mod._load_area_index()
+        assert {code: set(index.area_names(mask)) for code, mask in index.current.items()} == mapping
+
+    def test_as_of_respects_removal_term(self, tool):
+        """KOREAN 3 leaves area 3B in Fall 2026 but still counts in Spring 2026."""
+
+        before = tool.invoke({"student_courses": ["KOREAN 3"], "as_of": "Spring 2026"})
+        after = tool.invoke({"student_courses": ["KOREAN 3"], "as_of": "F2026"})
+
+        assert "3B" in before["matched"]
+        assert "3B" not in after["matched"]
+        assert "6A" in after["matched"]
+
+    def test_as_of_before_approval_is_unmatched(self, tool):
+        result = tool.invoke({"student_courses": ["ENGL 1"], "as_of": "Fall 1980"})
+        assert result["matched"] == {}
+        assert result["unmatched_courses"] == ["ENGL 1"]
+
+    def test_invalid_as_of_rejected(self, tool):
+        with pytest.raises(Exception):
+            tool.invoke({"student_courses": ["ENGL 1"], "as_of": "someday"})
+
+    def test_batch_matches_single_calls(self):
+        students = {
+            "a": ["ENGL 1", "MATH 7"],
+            "b": ["HIST 11", "FAKE 999"],
+            "c": [],
+        }
+        batch = compute_batch_coverage(students)
+        assert set(batch) == set(students)
+        for sid, courses in students.items():
+            assert batch[sid] == _compute_coverage(courses)
+
+        dated = compute_batch_coverage(students, as_of="Fall 2025")
+        assert dated["a"] == _compute_coverage(students["a"], "Fall 2025")
+
+
 # =============================================================================
 # Test Runner and Utilities
 # =============================================================================
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+"""Tests for the shared CatalogStore (indexes, lazy init, mtime reload)."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.catalog_store import CatalogStore, get_catalog_store  # noqa: E402
+from tools.course_detail_tool import _load_catalog  # noqa: E402
+
+
+def _write_program(path: Path, program_name: str, courses: list) -> None:
+    path.write_text(json.dumps({"program_name": program_name, "courses": courses}), encoding="utf-8")
+
+
+@pytest.fixture
+def catalog_dir(tmp_path: Path) -> Path:
+    _write_program(
+        tmp_path / "mathematics.json",
+        "Mathematics",
+        [
+            {
+                "course_id": "MATH-7-5UNIT",
+                "course_code": "MATH 7",
+                "units": "5 UNITS",
+                "sections": [
+                    {"section_number": "1", "schedule": [{"instructor": "Supat  W", "days": "MW"}]},
+                    {"section_number": "2", "schedule": [{"instructor": "supat w", "days": "TTh"}]},
+                ],
+            },
+            {"course_id": "MATH-8-5UNIT", "course_code": "MATH8", "units": "5 UNITS"},
+        ],
+    )
+    _write_program(
+        tmp_path / "statistics.json",
+        "Statistics",
+        [
+            # Cross-listed duplicate – first occurrence (mathematics.json) wins
+            {"course_id": "MATH-7-DUP", "course_code": "MATH 7", "units": "4 UNITS"},
+            {
+                "course_id": "STAT-1-3UNIT",
+                "course_code": "STAT 1",
+                "sections": [{"section_number": "9", "schedule": [{"instructor": "Supat W"}]}],
+            },
+        ],
+    )
+    return tmp_path
+
+
+def test_indexes(catalog_dir: Path) -> None:
+    store = CatalogStore(catalog_dir)
+
+    by_code = store.by_code()
+    assert set(by_code) == {"MATH 7", "MATH 8", "STAT 1"}
+    assert by_code["MATH 7"]["units"] == "5 UNITS"
+    assert by_code["MATH 7"]["department"] == "Mathematics"
+    assert store.get("math8")["course_id"] == "MATH-8-5UNIT"
+
+    assert set(store.by_course_id()) == {"MATH-7-5UNIT", "MATH-8-5UNIT", "MATH-7-DUP", "STAT-1-3UNIT"}
+    assert store.by_instructor() == {"supat w": ["MATH 7", "STAT 1"]}
+    assert store.by_program()["statistics"] == ["MATH 7", "STAT 1"]
+    assert store.by_department()["mathematics"] == ["MATH 7", "MATH 8"]
+
+    # iter_courses keeps duplicates and file order for corpus builders
+    assert [c["course_id"] for _, c in store.iter_courses()] == [
+        "MATH-7-5UNIT",
+        "MATH-8-5UNIT",
+        "MATH-7-DUP",
+        "STAT-1-3UNIT",
+    ]
+
+
+def test_concurrent_first_access_loads_once(catalog_dir: Path) -> None:
+    store = CatalogStore(catalog_dir)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: store.by_code(), range(32)))
+
+    assert store.load_count == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_reload_on_mtime_change(catalog_dir: Path) -> None:
+    store = CatalogStore(catalog_dir, check_interval=0.0)
+    assert "PHYSCS 21" not in store.by_code()
+
+    target = catalog_dir / "statistics.json"
+    _write_program(target, "Statistics", [{"course_id": "PHYSCS-21", "course_code": "PHYSCS 21"}])
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert "PHYSCS 21" in store.by_code()
+    assert "STAT 1" not in store.by_code()
+    assert store.load_count == 2
+
+    # Unchanged files → no rebuild
+    store.by_code()
+    assert store.load_count == 2
+
+
+def test_missing_directory_raises(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError):
+        CatalogStore(tmp_path / "nope").by_code()
+
+
+def test_tools_share_one_copy() -> None:
+    """course_detail's catalogue is the store's index, not a private copy."""
+
+    assert _load_catalog() is get_catalog_store().by_code()
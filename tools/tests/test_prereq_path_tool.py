@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+"""Tests for PrereqPathTool (reverse look-ups, term layering, critical path).
+
+A small synthetic catalogue modelled on real SMC chains is patched in so the
+expected plans are stable regardless of catalogue updates:
+
+    MATH 7  ← MATH 2 or (MATH 3 and MATH 4)
+    MATH 8  ← MATH 7
+    PHYSCS 21 ← MATH 7
+    PHYSCS 22 ← MATH 8, PHYSCS 21
+    MATH 2  ← MATH 20 and MATH 32   (MATH 20 / MATH 32 not in catalogue)
+"""
+
+from pathlib import Path
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools import prereq_path_tool as _pp_mod  # noqa: E402
+from tools.catalog_store import CatalogStore  # noqa: E402
+from tools.prereq_path_tool import PrereqPathTool, PPOut  # noqa: E402
+
+_FAKE_CATALOG = {
+    "MATH 2": {"course_code": "MATH 2", "prerequisites": "MATH 20 and MATH 32"},
+    "MATH 3": {"course_code": "MATH 3", "prerequisites": "MATH 20"},
+    "MATH 4": {"course_code": "MATH 4", "prerequisites": "MATH 20"},
+    "MATH 7": {"course_code": "MATH 7", "prerequisites": "MATH 2 or (MATH 3 and MATH 4)."},
+    "MATH 8": {
+        "course_code": "MATH 8",
+        "prerequisites": "MATH 7. *Maximum UC credit for MATH 8 and MATH 29 is one course.",
+    },
+    "MATH 11": {"course_code": "MATH 11", "prerequisites": "MATH 8."},
+    "PHYSCS 21": {"course_code": "PHYSCS 21", "prerequisites": "MATH 7."},
+    "PHYSCS 22": {"course_code": "PHYSCS 22", "prerequisites": "MATH 8, PHYSCS 21."},
+    "CYC 1": {"course_code": "CYC 1", "prerequisites": "CYC 2"},
+    "CYC 2": {"course_code": "CYC 2", "prerequisites": "CYC 1"},
+    "CS 1": {"course_code": "CS 1", "prerequisites": "CS 2 or CS 3"},
+    "CS 2": {"course_code": "CS 2", "prerequisites": "CS 1"},
+    "CS 3": {"course_code": "CS 3", "prerequisites": ""},
+}
+
+
+@pytest.fixture(autouse=True)
+def fake_catalog(monkeypatch):
+    """Patch the catalogue loader and reset every memoised structure."""
+
+    monkeypatch.setattr("tools.prereq_path_tool._load_catalog", lambda: _FAKE_CATALOG)
+    _pp_mod.clear_cache()
+    yield
+    _pp_mod.clear_cache()
+
+
+def _plan(codes, completed=()):
+    return PPOut(**PrereqPathTool.invoke({"course_codes": list(codes), "completed_courses": list(completed)}))
+
+
+# ---------------------------------------------------------------------------
+# Reverse adjacency
+# ---------------------------------------------------------------------------
+
+
+def test_unlocks_lists_direct_dependents():
+    out = PrereqPathTool.invoke({"course_codes": ["math 7"], "mode": "unlocks"})
+
+    assert out["unlocks"] == {"MATH 7": ["MATH 8", "PHYSCS 21"]}
+    assert out["newly_eligible"] == ["MATH 8", "PHYSCS 21"]
+
+
+def test_unlocks_requires_full_and_set():
+    """PHYSCS 22 needs MATH 8 *and* PHYSCS 21 – completing one is not enough."""
+
+    out = PrereqPathTool.invoke(
+        {"course_codes": ["MATH 8"], "completed_courses": ["MATH 7"], "mode": "unlocks"}
+    )
+    assert "PHYSCS 22" in out["unlocks"]["MATH 8"]
+    assert "PHYSCS 22" not in out["newly_eligible"]
+
+    out = PrereqPathTool.invoke(
+        {"course_codes": ["MATH 8"], "completed_courses": ["PHYSCS 21"], "mode": "unlocks"}
+    )
+    assert "PHYSCS 22" in out["newly_eligible"]
+
+
+def test_footnote_courses_are_not_edges():
+    """'*Maximum UC credit for MATH 8 and MATH 29' must not become a prerequisite."""
+
+    graph = _pp_mod._build_catalogue_graph()
+    assert graph.requires["MATH 8"] == (frozenset({"MATH 7"}),)
+    assert "MATH 29" not in graph.unlocks
+
+
+# ---------------------------------------------------------------------------
+# Planning – layering and critical path
+# ---------------------------------------------------------------------------
+
+
+def test_plan_from_scratch_uses_cheapest_or_branch():
+    result = _plan(["MATH 7"])
+
+    # MATH 2 and (MATH 3 and MATH 4) both take two terms; the smaller set wins
+    assert result.terms_required == 3
+    assert result.term_plan == [["MATH 20", "MATH 32"], ["MATH 2"], ["MATH 7"]]
+    assert result.missing_courses == ["MATH 20", "MATH 32"]
+
+
+def test_plan_respects_completed_courses():
+    result = _plan(["PHYSCS 22", "MATH 11"], completed=["MATH 7"])
+
+    assert result.terms_required == 2
+    assert result.term_plan == [["MATH 8", "PHYSCS 21"], ["MATH 11", "PHYSCS 22"]]
+    by_code = {t.course_code: t for t in result.targets}
+    assert by_code["PHYSCS 22"].critical_path == ["MATH 8", "PHYSCS 22"]
+    assert by_code["MATH 11"].terms_required == 2
+
+
+def test_completed_target_needs_zero_terms():
+    result = _plan(["MATH 8"], completed=["MATH 8"])
+
+    assert result.terms_required == 0
+    assert result.term_plan == []
+
+
+def test_cycles_are_reported_unreachable():
+    result = _plan(["CYC 1", "MATH 8"], completed=["MATH 7"])
+
+    assert result.unreachable == ["CYC 1"]
+    assert result.terms_required == 1
+    assert result.term_plan == [["MATH 8"]]
+
+
+def test_cycle_results_do_not_depend_on_target_order():
+    """A course reached through an open cycle is re-planned for its own target."""
+
+    alone = _plan(["CS 2"])
+    together = _plan(["CS 1", "CS 2"])
+
+    assert alone.unreachable == together.unreachable == []
+    assert alone.terms_required == together.terms_required == 3
+    assert together.term_plan == [["CS 3"], ["CS 1"], ["CS 2"]]
+    paths = {p.course_code: p.critical_path for p in together.targets}
+    assert paths == {"CS 1": ["CS 3", "CS 1"], "CS 2": ["CS 3", "CS 1", "CS 2"]}
+
+
+def test_plan_follows_catalogue_reload(tmp_path, monkeypatch):
+    """Editing a programme file rebuilds the graph and drops memoised plans."""
+
+    program = tmp_path / "math.json"
+
+    def _write(prereq):
+        courses = [{"course_code": "MATH 1"}, {"course_code": "MATH 2", "prerequisites": prereq}]
+        program.write_text(json.dumps({"program_name": "Math", "courses": courses}))
+
+    _write("")
+    store = CatalogStore(tmp_path, check_interval=0.0)
+    monkeypatch.setattr("tools.prereq_path_tool._load_catalog", store.by_code)
+
+    assert _plan(["MATH 2"]).terms_required == 1
+
+    _write("MATH 1")
+    stat = program.stat()
+    os.utime(program, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    result = _plan(["MATH 2"])
+    assert result.terms_required == 2
+    assert result.term_plan == [["MATH 1"], ["MATH 2"]]
+
+
+def test_results_cached_per_signature():
+    """Order and spelling variants of the same request share one cache entry."""
+
+    _plan(["MATH 11", "PHYSCS 22"], completed=["MATH 7", "MATH 2"])
+    _plan(["physcs 22", "MATH11"], completed=["MATH 2", "MATH 7"])
+
+    info = _pp_mod._plan.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
@@ -65,3 +65,62 @@ def test_lookup_by_course_code():
 def test_invalid_course_code():
     with pytest.raises(ProfessorNotFoundError):
         ProfessorRatingTool.invoke({"course_code": "ZZZ 999"})
+
+
+def test_course_code_is_normalised():
+    """Spacing/case variants resolve through the course → instructor index."""
+
+    assert ProfessorRatingTool.invoke({"course_code": "cs3"}) == ProfessorRatingTool.invoke(
+        {"course_code": "CS 3"}
+    )
+
+
+# ---------------------------------------------------------------------------
+# Precomputed index tests ----------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def test_course_index_inverts_instructor_map(monkeypatch):
+    import tools.professor_rating_tool as pr_mod
+
+    fake_map = {"supat w": ["CS 3", "CS 50"], "lopez en": ["CS 3"], "mononym": ["CS 3"]}
+    monkeypatch.setattr(pr_mod, "_build_course_map", lambda: fake_map)
+    monkeypatch.setattr(pr_mod, "_COURSE_INDEX", None)
+
+    index = pr_mod._course_index()
+    assert index["CS 3"] == {("supat", "w"), ("lopez", "e")}
+    assert index["CS 50"] == {("supat", "w")}
+
+
+def test_course_index_rebuilt_for_new_course_map(monkeypatch):
+    """A reloaded course map is re-indexed even if it reuses a freed object's id."""
+
+    import tools.professor_rating_tool as pr_mod
+
+    current = {"map": {"supat w": ["CS 3"]}}
+    monkeypatch.setattr(pr_mod, "_build_course_map", lambda: current["map"])
+    monkeypatch.setattr(pr_mod, "_COURSE_INDEX", None)
+
+    assert pr_mod._course_index()["CS 3"] == {("supat", "w")}
+    assert pr_mod._COURSE_INDEX[0] is current["map"]
+
+    current["map"] = {"lopez en": ["CS 3"]}
+    assert pr_mod._course_index()["CS 3"] == {("lopez", "e")}
+
+
+def test_fuzzy_last_name_fallback(monkeypatch):
+    """A catalogue spelling with no exact RMP last name falls back to rapidfuzz."""
+
+    import tools.professor_rating_tool as pr_mod
+
+    records = [
+        {"name": "Anahit Hovanisyan", "department": "ESL", "metrics": {}},
+        {"name": "Rex Perez", "department": "Math", "metrics": {}},
+    ]
+    monkeypatch.setattr(pr_mod, "_load_rmp", lambda: records)
+    monkeypatch.setattr(pr_mod, "_RMP_INDEX", None)
+
+    rmp = pr_mod._rmp_index()
+    assert rmp.by_key[("perez", "r")] == [1]
+    assert pr_mod._match_instructor_keys({("hovanesyan", "a")}, rmp) == {0}
+    assert pr_mod._match_instructor_keys({("smith", "j")}, rmp) == set()
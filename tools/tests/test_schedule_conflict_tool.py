@@ -107,3 +107,46 @@ def test_no_conflict_case_2():
 
     assert result["has_conflict"] is False
     assert result["conflicting_pairs"] == []
+
+
+# ---------------------------------------------------------------------------
+# Interval engine ------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def test_multi_entry_sections_report_first_overlap_once():
+    """Several overlapping components yield one pair and one description."""
+
+    sections = [
+        [
+            {"days": "F", "time": "1:00p.m.-2:00p.m."},
+            {"days": "MW", "time": "9:00a.m.-10:00a.m."},
+        ],
+        [
+            {"days": "MWF", "time": "9:30a.m.-1:30p.m."},
+            {"days": "N", "time": "Arrange-3 Hours"},
+        ],
+        [{"days": "TTh", "time": "9:00a.m.-10:00a.m."}],
+        [{"days": "W", "time": "9:45a.m.-9:50a.m."}],
+    ]
+
+    result = ScheduleConflictTool.invoke({"sections": sections})
+
+    assert result["conflicting_pairs"] == [[0, 1], [0, 3], [1, 3]]
+    assert result["conflict_descriptions"][0] == (
+        "Section 0 (F 1:00p.m.-2:00p.m.) overlaps with Section 1 (MWF 9:30a.m.-1:30p.m.)"
+    )
+    assert len(result["conflict_descriptions"]) == 3
+
+
+def test_section_mask_is_half_open():
+    from tools.schedule_conflict_tool import _section_mask
+
+    a = _section_mask([{"days": "M", "time": "9:00a.m.-10:00a.m."}])
+    b = _section_mask([{"days": "M", "time": "10:00a.m.-11:00a.m."}])
+    c = _section_mask([{"days": "W", "time": "9:00a.m.-10:00a.m."}])
+
+    assert bin(a).count("1") == 60
+    assert not a & b
+    assert not a & c
+    assert _section_mask([{"days": "N", "time": "Arrange"}]) == 0
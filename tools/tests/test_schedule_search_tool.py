@@ -0,0 +1,90 @@
+"""Tests for ScheduleSearchTool (conflict-free schedule enumeration)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.schedule_search_tool import ScheduleSearchTool  # noqa: E402
+from tools.section_lookup_tool import SectionLookupTool  # noqa: E402
+from tools.schedule_conflict_tool import ScheduleConflictTool  # noqa: E402
+
+
+def _section(number: str, days: str, time: str) -> dict:
+    return {"section_number": number, "schedule": [{"days": days, "time": time}]}
+
+
+MW_9 = ("MW", "9:00a.m.-10:25a.m.")
+MW_10 = ("MW", "10:30a.m.-11:55a.m.")
+TTH_9 = ("TTh", "9:00a.m.-10:25a.m.")
+
+
+def test_enumerates_all_conflict_free_combinations():
+    courses = [
+        {"course_code": "MATH 7", "sections": [_section("1", *MW_9), _section("2", *TTH_9)]},
+        {"course_code": "CS 3", "sections": [_section("3", *MW_9), _section("4", *MW_10)]},
+    ]
+
+    out = ScheduleSearchTool.invoke({"courses": courses})
+
+    assert out["truncated"] is False
+    assert sorted(map(lambda s: tuple(s.items()), out["schedules"])) == sorted(
+        [
+            (("MATH 7", "1"), ("CS 3", "4")),
+            (("MATH 7", "2"), ("CS 3", "3")),
+            (("MATH 7", "2"), ("CS 3", "4")),
+        ]
+    )
+    # Key order follows the input course order
+    assert all(list(s) == ["MATH 7", "CS 3"] for s in out["schedules"])
+
+
+def test_max_results_truncates():
+    courses = [
+        {"course_code": "A 1", "sections": [_section("1", *MW_9), _section("2", *TTH_9)]},
+        {"course_code": "B 1", "sections": [_section("3", "F", "9:00a.m.-10:00a.m."), _section("4", *MW_10)]},
+    ]
+
+    out = ScheduleSearchTool.invoke({"courses": courses, "max_results": 2})
+
+    assert out["total_found"] == 2
+    assert out["truncated"] is True
+
+
+def test_no_schedule_reports_blocking_courses():
+    courses = [
+        {"course_code": "A 1", "sections": [_section("1", *MW_9)]},
+        {"course_code": "B 1", "sections": [_section("2", "M", "10:00a.m.-11:00a.m.")]},
+        {"course_code": "C 1", "sections": [_section("3", *TTH_9)]},
+    ]
+
+    out = ScheduleSearchTool.invoke({"courses": courses})
+
+    assert out["schedules"] == []
+    assert out["blocking_courses"] == ["A 1", "B 1"]
+
+
+def test_results_are_conflict_free_on_real_sections():
+    """Every returned schedule passes ScheduleConflictTool on real catalogue sections."""
+
+    candidates = [SectionLookupTool.invoke({"course_code": c}) for c in ("MATH 7", "CS 3", "CHEM 11")]
+
+    out = ScheduleSearchTool.invoke({"courses": candidates, "max_results": 25})
+    assert out["schedules"], out
+
+    by_number = {
+        (c["course_code"], s["section_number"]): s["schedule"] for c in candidates for s in c["sections"]
+    }
+    for schedule in out["schedules"]:
+        blocks = [by_number[(code, number)] for code, number in schedule.items()]
+        assert ScheduleConflictTool.invoke({"sections": blocks})["has_conflict"] is False
+
+
+def test_empty_sections_rejected():
+    with pytest.raises(ValidationError):
+        ScheduleSearchTool.invoke({"courses": [{"course_code": "A 1", "sections": []}]})
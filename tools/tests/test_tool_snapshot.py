@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+"""Tests for the compiled tool data snapshot (format, staleness, tool hooks)."""
+
+from pathlib import Path
+import json
+import os
+import subprocess
+import sys
+import warnings
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import tools.breadth_coverage_tool as bc_mod  # noqa: E402
+import tools.deadline_lookup_tool as dl_mod  # noqa: E402
+import tools.major_requirement_tool as mr_mod  # noqa: E402
+import tools.professor_rating_tool as pr_mod  # noqa: E402
+import tools.tool_snapshot as ts_mod  # noqa: E402
+from tools.catalog_store import CatalogStore  # noqa: E402
+from tools.tool_snapshot import ToolSnapshot, build_snapshot, write_snapshot  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def snapshot_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("snapshot") / "tool_snapshot.bin"
+    build_snapshot(path)
+    return path
+
+
+@pytest.fixture
+def use_snapshot(snapshot_path: Path, monkeypatch: pytest.MonkeyPatch) -> ToolSnapshot:
+    """Point every tool at the test snapshot with cold caches."""
+
+    snapshot = ToolSnapshot(snapshot_path)
+    monkeypatch.setattr(ts_mod, "_SNAPSHOT", snapshot)
+    monkeypatch.setattr(pr_mod, "_RMP_CACHE", None)
+    monkeypatch.setattr(pr_mod, "_RMP_INDEX", None)
+    for cached in (
+        bc_mod._load_area_index,
+        bc_mod._load_igetc_course_map,
+        mr_mod._assist_file_catalogue,
+        mr_mod._ucsd_transfer_prep_catalogue,
+        dl_mod._load_timeline_events,
+    ):
+        cached.cache_clear()
+    yield snapshot
+    bc_mod.clear_cache()
+    mr_mod._assist_file_catalogue.cache_clear()
+    mr_mod._ucsd_transfer_prep_catalogue.cache_clear()
+    dl_mod._load_timeline_events.cache_clear()
+
+
+def _fail(*_args, **_kwargs):
+    raise AssertionError("rebuilt from JSON although the snapshot is current")
+
+
+def test_all_sections_built(use_snapshot: ToolSnapshot) -> None:
+    assert set(use_snapshot.sections()) == set(ts_mod._SECTION_BUILDERS)
+
+
+def test_tools_load_from_snapshot(use_snapshot: ToolSnapshot, monkeypatch: pytest.MonkeyPatch) -> None:
+    expected_catalog = CatalogStore()._build(CatalogStore()._signature())
+    expected_rmp = pr_mod._snapshot_section()[1]
+    expected_igetc = bc_mod._snapshot_section()[1]
+    expected_ucsd = mr_mod._read_ucsd_transfer_prep()
+    expected_timeline = dl_mod._read_timeline_events(dl_mod._timeline_files())
+
+    monkeypatch.setattr(CatalogStore, "_build", _fail)
+    monkeypatch.setattr(pr_mod, "_build_rmp_index", _fail)
+    monkeypatch.setattr(bc_mod, "_compile_index", _fail)
+    monkeypatch.setattr(mr_mod, "_read_ucsd_transfer_prep", _fail)
+    monkeypatch.setattr(mr_mod, "_extract_text_from_assist_json", _fail)
+    monkeypatch.setattr(dl_mod, "_read_timeline_events", _fail)
+
+    store = CatalogStore()
+    assert store.by_code() == expected_catalog.by_code
+    assert store.by_instructor() == expected_catalog.by_instructor
+    assert list(store.iter_courses()) == list(expected_catalog.courses)
+    assert store.load_count == 1
+    # Shared records stay shared after the round trip
+    code, course = next((c["course_code"], c) for _, c in store.iter_courses() if c.get("course_code"))
+    assert store.get(code) is course
+
+    assert pr_mod._rmp_index() == expected_rmp
+    assert bc_mod._load_area_index() == expected_igetc
+    assert mr_mod._ucsd_transfer_prep_catalogue() == expected_ucsd
+    assert dl_mod._load_timeline_events() == expected_timeline
+    assert any(ev["start_dt"] is not None for ev in dl_mod._load_timeline_events())
+
+    result = mr_mod.major_requirement_tool("Computer Science")
+    assert result.assist_articulation
+
+
+def test_stale_sections_fall_back(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    catalog_dir = tmp_path / "catalog"
+    catalog_dir.mkdir()
+    program = catalog_dir / "math.json"
+    program.write_text(json.dumps({"program_name": "Math", "courses": [{"course_code": "MATH 7"}]}))
+
+    source = CatalogStore(catalog_dir)
+    signature = source._signature()
+    compiled = source._build(signature)
+    compiled.by_code["MATH 7"]["course_title"] = "FROM SNAPSHOT"
+    path = tmp_path / "snapshot.bin"
+    write_snapshot(path, {"catalog": (source._snapshot_key(signature), compiled)})
+    monkeypatch.setattr(ts_mod, "_SNAPSHOT", ToolSnapshot(path))
+
+    assert CatalogStore(catalog_dir).get("MATH 7")["course_title"] == "FROM SNAPSHOT"
+
+    stat = program.stat()
+    os.utime(program, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert "course_title" not in CatalogStore(catalog_dir).get("MATH 7")
+
+
+def test_load_checks_key(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.bin"
+    write_snapshot(path, {"a": (("x", 1), {"value": [1, 2]}), "b": (None, "second")})
+    snapshot = ToolSnapshot(path)
+
+    assert snapshot.load("a", ("x", 1)) == {"value": [1, 2]}
+    assert snapshot.load("a", ("x", 2)) is None
+    assert snapshot.load("b", None) == "second"
+    assert snapshot.load("missing", None) is None
+
+
+def test_unusable_files_are_ignored(tmp_path: Path) -> None:
+    assert ToolSnapshot(tmp_path / "missing.bin").load("a", None) is None
+
+    path = tmp_path / "snapshot.bin"
+    write_snapshot(path, {"a": (None, "value")})
+    data = path.read_bytes()
+
+    old_version = ts_mod._PREAMBLE.pack(ts_mod._MAGIC, ts_mod.SNAPSHOT_VERSION + 1, 0)
+    for corrupt in (b"not a snapshot", old_version + data[ts_mod._PREAMBLE.size:], data[:-3]):
+        path.write_bytes(corrupt)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert ToolSnapshot(path).load("a", None) is None
+        assert caught
+
+
+def test_reload_sees_rebuilt_file(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.bin"
+    write_snapshot(path, {"a": (None, 1)})
+    snapshot = ToolSnapshot(path)
+    assert snapshot.load("a", None) == 1
+
+    write_snapshot(path, {"a": (None, 2)})
+    snapshot.reload()
+    assert snapshot.load("a", None) == 2
+
+
+def test_partial_rebuild_keeps_other_sections(snapshot_path: Path, tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(snapshot_path.read_bytes())
+    before = ToolSnapshot(snapshot_path)
+
+    assert set(build_snapshot(path, ["rmp"])) == {"rmp"}
+
+    after = ToolSnapshot(path)
+    assert set(after.sections()) == set(ts_mod._SECTION_BUILDERS)
+    for name in ts_mod._SECTION_BUILDERS:
+        if name != "rmp":
+            assert after.raw(name) == before.raw(name)
+    assert after.load("rmp", after.sections()["rmp"]["key"]) == pr_mod._snapshot_section()[1]
+
+
+def test_cold_start_is_fast(snapshot_path: Path) -> None:
+    """A fresh process maps every section well within the 200 ms budget."""
+
+    script = """
+import time
+from tools import breadth_coverage_tool, catalog_store, deadline_lookup_tool, major_requirement_tool, professor_rating_tool
+started = time.perf_counter()
+catalog_store.get_catalog_store().by_code()
+professor_rating_tool._rmp_index()
+breadth_coverage_tool._load_igetc_course_map()
+major_requirement_tool._assist_file_catalogue()
+major_requirement_tool._ucsd_transfer_prep_catalogue()
+deadline_lookup_tool._load_timeline_events()
+print(time.perf_counter() - started)
+"""
+    env = dict(os.environ, TRANSFERAI_TOOL_SNAPSHOT=str(snapshot_path), TRANSFERAI_SKIP_VECTORSTORE="1")
+    out = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    assert float(out.stdout.strip().splitlines()[-1]) < 0.2
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+"""TransferAI – Compiled Tool Data Snapshot
+
+A cold worker used to rebuild every tool's in-memory structures from the raw
+JSON on first use: the parsed catalogue (~100 programme files), the RMP
+professor index, the IGETC area index, the ASSIST/UCSD major indexes and the
+transfer timeline (whose ``dateparser`` pass alone takes seconds).  This
+module serialises all of those derived structures into one versioned file,
+``data/tool_snapshot.bin``, which tools memory-map and decode lazily – only
+the sections a tool actually touches are ever unpickled.
+
+File layout::
+
+    b"TAISNAP\\0" | u32 version | u32 header length | JSON header | sections…
+
+The header maps each section name to its ``offset`` (from the end of the
+header), its ``length`` and the *key* it was built for – typically a
+:func:`file_signature` of its source files.  :meth:`ToolSnapshot.load` only
+returns a section whose stored key equals the caller's current key, so an
+edited, added or removed source file (or a monkey-patched path in the
+unit-tests) silently falls back to the JSON loaders.  A missing, truncated or
+old-version snapshot behaves the same.
+
+Each section is produced by a ``_snapshot_section()``-style function in the
+owning tool module (see ``_SECTION_BUILDERS``), which builds the structure
+from the raw files and returns ``(key, value)``.  Rebuild the snapshot after
+changing any data with::
+
+    python tools/tool_snapshot.py [--section NAME ...]
+
+``--section`` rebuilds only the named sections and keeps the others.
+
+Set ``TRANSFERAI_TOOL_SNAPSHOT`` to read the snapshot from another path.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+import gc
+import importlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import threading
+import time
+import warnings
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_ROOT = Path(__file__).resolve().parents[1]
+_SNAPSHOT_PATH = _ROOT / "data" / "tool_snapshot.bin"
+
+_MAGIC = b"TAISNAP\0"
+_PREAMBLE = struct.Struct("<8sII")  # magic, format version, header length
+
+# Bump whenever the file layout or any section's structure changes.
+SNAPSHOT_VERSION = 1
+
+# Section name → ``module:function`` building ``(key, value)`` from the raw data
+_SECTION_BUILDERS: Dict[str, str] = {
+    "catalog": "tools.catalog_store:_snapshot_section",
+    "rmp": "tools.professor_rating_tool:_snapshot_section",
+    "igetc": "tools.breadth_coverage_tool:_snapshot_section",
+    "assist_majors": "tools.major_requirement_tool:_assist_snapshot_section",
+    "ucsd_majors": "tools.major_requirement_tool:_ucsd_snapshot_section",
+    "timeline": "tools.deadline_lookup_tool:_snapshot_section",
+}
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+
+def file_signature(paths: Iterable[Path]) -> Tuple[Tuple[str, int, int], ...]:  # noqa: D401
+    """Return ``(path, size, mtime_ns)`` per file; missing files get ``-1``s."""
+
+    signature = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+            signature.append((str(path), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append((str(path), -1, -1))
+    return tuple(signature)
+
+
+def _canonical(key: Any) -> Any:
+    """Round-trip *key* through JSON so tuples compare equal to stored lists."""
+
+    return json.loads(json.dumps(key))
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+class ToolSnapshot:
+    """Lazily memory-mapped snapshot file; sections are decoded on demand."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._opened = False
+        self._mmap: Optional[mmap.mmap] = None
+        self._sections: Dict[str, dict] = {}
+
+    def _open(self) -> None:
+        with self._lock:
+            if self._opened:
+                return
+            self._opened = True
+            try:
+                with self.path.open("rb") as fh:
+                    mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return  # missing or empty file – every load falls back
+
+            try:
+                magic, version, header_len = _PREAMBLE.unpack_from(mapped, 0)
+                if magic != _MAGIC or version != SNAPSHOT_VERSION:
+                    raise ValueError(f"unsupported snapshot format (version {version})")
+                start = _PREAMBLE.size
+                header = json.loads(bytes(mapped[start:start + header_len]).decode("utf-8"))
+                sections = header["sections"]
+                base = start + header_len
+                for entry in sections.values():
+                    entry["offset"] += base
+                    if entry["offset"] + entry["length"] > len(mapped):
+                        raise ValueError("truncated snapshot")
+            except Exception as exc:  # noqa: BLE001 – unusable file → JSON fallback
+                warnings.warn(f"Ignoring tool snapshot {self.path}: {exc}")
+                mapped.close()
+                return
+
+            self._mmap = mapped
+            self._sections = sections
+
+    def sections(self) -> Dict[str, dict]:
+        """Return the header entries (``offset``, ``length``, ``key``) by name."""
+
+        self._open()
+        return dict(self._sections)
+
+    def load(self, name: str, key: Any) -> Optional[Any]:
+        """Return section *name* if it was built for *key*, else *None*."""
+
+        self._open()
+        entry = self._sections.get(name)
+        if entry is None or self._mmap is None or entry["key"] != _canonical(key):
+            return None
+        view = memoryview(self._mmap)[entry["offset"]:entry["offset"] + entry["length"]]
+        # Unpickling allocates only acyclic containers; letting the collector
+        # walk the (large, post-import) heap meanwhile multiplies the cost.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.loads(view)
+        except Exception as exc:  # noqa: BLE001 – e.g. a renamed class
+            warnings.warn(f"Ignoring tool snapshot section {name!r}: {exc}")
+            return None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            view.release()
+
+    def raw(self, name: str) -> Optional[Tuple[Any, bytes]]:
+        """Return ``(key, pickled bytes)`` of section *name*, or *None* if absent."""
+
+        self._open()
+        entry = self._sections.get(name)
+        if entry is None or self._mmap is None:
+            return None
+        return entry["key"], bytes(self._mmap[entry["offset"]:entry["offset"] + entry["length"]])
+
+    def reload(self) -> None:
+        """Re-read the file on next access (after it was rebuilt)."""
+
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = None
+            self._sections = {}
+            self._opened = False
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+
+def _write_blobs(path: Path, blobs: Dict[str, Tuple[Any, bytes]]) -> None:
+    """Write ``{name: (key, pickled bytes)}`` to *path* atomically."""
+
+    entries, offset = {}, 0
+    for name, (key, blob) in blobs.items():
+        entries[name] = {"offset": offset, "length": len(blob), "key": _canonical(key)}
+        offset += len(blob)
+    header = json.dumps({"sections": entries}, separators=(",", ":")).encode("utf-8")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(_PREAMBLE.pack(_MAGIC, SNAPSHOT_VERSION, len(header)))
+        fh.write(header)
+        for _, blob in blobs.values():
+            fh.write(blob)
+    os.replace(tmp_path, path)
+
+
+def write_snapshot(path: Path, sections: Dict[str, Tuple[Any, Any]]) -> Dict[str, int]:
+    """Write ``{name: (key, value)}`` to *path* atomically; return bytes per section."""
+
+    blobs = {
+        name: (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        for name, (key, value) in sections.items()
+    }
+    _write_blobs(path, blobs)
+    return {name: len(blob) for name, (_, blob) in blobs.items()}
+
+
+def build_snapshot(path: Optional[Path] = None, names: Optional[Sequence[str]] = None) -> Dict[str, int]:
+    """Build the named sections (default: all) from the raw data and write them.
+
+    Sections already in the file that are not rebuilt – not named, or whose
+    builder failed (with a warning) – are carried over byte for byte, so a
+    partial rebuild never drops the others.  Returns bytes per rebuilt section.
+    """
+
+    target = Path(path) if path is not None else _default_path()
+    built: Dict[str, Tuple[Any, bytes]] = {}
+    for name in names or _SECTION_BUILDERS:
+        module_name, func_name = _SECTION_BUILDERS[name].split(":")
+        builder = getattr(importlib.import_module(module_name), func_name)
+        try:
+            key, value = builder()
+        except Exception as exc:  # noqa: BLE001
+            print(f"[WARN] Skipping snapshot section {name!r}: {exc}")
+            continue
+        built[name] = (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    existing = ToolSnapshot(target)
+    blobs: Dict[str, Tuple[Any, bytes]] = {}
+    try:
+        for name in _SECTION_BUILDERS:
+            if name in built:
+                blobs[name] = built[name]
+            else:
+                kept = existing.raw(name)
+                if kept is not None:
+                    blobs[name] = kept
+    finally:
+        existing.reload()  # release the mapping before the file is replaced
+    _write_blobs(target, blobs)
+
+    snapshot = _SNAPSHOT
+    if snapshot is not None and snapshot.path == target:
+        snapshot.reload()
+    return {name: len(blob) for name, (_, blob) in built.items()}
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_SNAPSHOT: Optional[ToolSnapshot] = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def _default_path() -> Path:
+    return Path(os.environ.get("TRANSFERAI_TOOL_SNAPSHOT") or _SNAPSHOT_PATH)
+
+
+def get_tool_snapshot() -> ToolSnapshot:  # noqa: D401
+    """Return the process-wide :class:`ToolSnapshot` (created on first use)."""
+
+    global _SNAPSHOT  # noqa: PLW0603 – intentional module-level singleton
+
+    if _SNAPSHOT is None:
+        with _SNAPSHOT_LOCK:
+            if _SNAPSHOT is None:
+                _SNAPSHOT = ToolSnapshot(_default_path())
+    return _SNAPSHOT
+
+
+__all__ = ["SNAPSHOT_VERSION", "ToolSnapshot", "build_snapshot", "file_signature", "get_tool_snapshot", "write_snapshot"]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    if str(_ROOT) not in sys.path:
+        sys.path.insert(0, str(_ROOT))
+
+    parser = argparse.ArgumentParser(description="Build the compiled tool data snapshot")
+    parser.add_argument("--output", type=Path, default=None, help=f"snapshot path (default {_SNAPSHOT_PATH})")
+    parser.add_argument("--section", action="append", choices=sorted(_SECTION_BUILDERS), help="only rebuild these sections (others are kept)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    built = build_snapshot(args.output, args.section)
+    for name, size in built.items():
+        print(f"  {name:<14} {size / 1024:8.1f} KiB")
+    print(f"Wrote {args.output or _default_path()} ({len(built)} sections rebuilt) in {time.perf_counter() - started:.2f}s")